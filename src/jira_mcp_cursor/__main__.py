@@ -3,6 +3,5 @@
 import asyncio
 from .server import run
 
-
 if __name__ == "__main__":
     asyncio.run(run())
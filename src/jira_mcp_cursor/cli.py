@@ -1,11 +1,13 @@
-"""Command Line Interface for Jira MCP."""
+"""Command Line Interface for Jira MCP.
+
+Subcommand dependencies (encrypted storage, the setup wizard, the Cursor
+installer, the MCP server) are imported inside each command so that
+``jira-mcp serve``, which Cursor spawns on demand, only loads what it needs.
+"""
 
 import click
 import asyncio
 from . import __version__
-from .config.storage import SecureConfig
-from .config.wizard import ConfigWizard
-from .config.cursor_installer import CursorInstaller
 
 
 @click.group()
@@ -18,6 +20,8 @@ def cli():
 @cli.command()
 def configure():
     """Launch configuration wizard"""
+    from .config.wizard import ConfigWizard
+
     wizard = ConfigWizard()
     wizard.run()
 
@@ -30,15 +34,15 @@ def serve(config):
     The server loads credentials from environment variables (JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN).
     These can be set in .cursor/mcp.json or via --config file.
     """
-    import asyncio
     import os
     from .server import run
-    from .config import SecureConfig
 
     click.echo("Starting Jira MCP Server...")
 
     # If config file provided, load and set env vars
     if config and os.path.exists(config):
+        from .config.storage import SecureConfig
+
         storage = SecureConfig()
         jira_config = storage.load()
 
@@ -53,9 +57,95 @@ def serve(config):
     asyncio.run(run())
 
 
+@cli.command()
+@click.option("--project", "projects", multiple=True, help="Project key to sync (repeatable)")
+@click.option("--full", is_flag=True, help="Re-crawl everything instead of fetching changes")
+@click.option("--page-size", type=int, default=None, help="Issues per search page")
+@click.option("--concurrency", type=int, default=None, help="Projects synced in parallel")
+@click.option("--db", default=None, help="Mirror database path")
+def sync(projects, full, page_size, concurrency, db):
+    """Sync the local project mirror
+
+    The first run crawls each project in full; later runs fetch only issues
+    updated since the previous run. An interrupted run resumes where it stopped.
+    """
+    import os
+
+    settings = _load_settings()
+    projects = list(projects) or settings.mirror_projects
+    if not settings.jira_url:
+        click.echo("❌ No configuration found. Please run 'jira-mcp configure' first.")
+        return
+    if not projects:
+        click.echo("❌ No projects to sync. Pass --project or set JIRA_MIRROR_PROJECTS.")
+        return
+
+    results = asyncio.run(
+        run_sync(
+            settings,
+            projects,
+            full=full,
+            page_size=page_size or settings.jira_mirror_page_size,
+            concurrency=concurrency or settings.jira_mirror_concurrency,
+            db=db or os.path.expanduser(settings.jira_mirror_path),
+        )
+    )
+
+    for project, summary in results.items():
+        if "error" in summary:
+            click.echo(f"❌ {project}: {summary['error']}")
+        else:
+            click.echo(
+                f"✅ {project}: {summary['mode']} sync, "
+                f"{summary['fetched']} fetched, {summary['deleted']} deleted"
+            )
+
+
+@cli.command()
+@click.option("--project", "projects", multiple=True, help="Project key to index (repeatable)")
+@click.option("--full", is_flag=True, help="Re-index every issue instead of recent changes")
+@click.option("--page-size", type=int, default=100, help="Issues per search page")
+@click.option("--db", default=None, help="Text index database path")
+def index(projects, full, page_size, db):
+    """Index project tickets for full-text search
+
+    Indexes summaries, descriptions and comments for the search_text tool.
+    Later runs only re-index tickets updated since the previous run.
+    """
+    import os
+
+    settings = _load_settings()
+    projects = list(projects) or settings.mirror_projects
+    if not settings.jira_url:
+        click.echo("❌ No configuration found. Please run 'jira-mcp configure' first.")
+        return
+    if not projects:
+        click.echo("❌ No projects to index. Pass --project or set JIRA_PROJECT_KEY.")
+        return
+
+    results = asyncio.run(
+        run_index(
+            settings,
+            projects,
+            full=full,
+            page_size=page_size,
+            db=db or os.path.expanduser(settings.jira_text_index_path),
+        )
+    )
+
+    for project, indexed in results.items():
+        if isinstance(indexed, Exception):
+            click.echo(f"❌ {project}: {indexed}")
+        else:
+            click.echo(f"✅ {project}: {indexed} tickets indexed")
+
+
 @cli.command()
 def install():
     """Install to Cursor"""
+    from .config.storage import SecureConfig
+    from .config.cursor_installer import CursorInstaller
+
     click.echo("📦 Installing Jira MCP to Cursor...")
 
     # Check if config exists
@@ -76,6 +166,8 @@ def install():
 @cli.command()
 def uninstall():
     """Remove from Cursor"""
+    from .config.cursor_installer import CursorInstaller
+
     click.echo("🗑️  Removing Jira MCP from Cursor...")
 
     installer = CursorInstaller()
@@ -95,6 +187,8 @@ def config_group():
 @config_group.command(name="show")
 def config_show():
     """Show current configuration (sanitized)"""
+    from .config.storage import SecureConfig
+
     storage = SecureConfig()
 
     if not storage.exists():
@@ -121,6 +215,8 @@ def config_show():
 @config_group.command(name="test")
 def config_test():
     """Test current configuration"""
+    from .config.storage import SecureConfig
+
     click.echo("🔍 Testing connection to Jira...")
 
     storage = SecureConfig()
@@ -150,6 +246,8 @@ def config_test():
 @click.confirmation_option(prompt="Are you sure you want to reset configuration?")
 def config_reset():
     """Reset configuration"""
+    from .config.storage import SecureConfig
+
     storage = SecureConfig()
     storage.delete()
     click.echo("✅ Configuration reset")
@@ -166,24 +264,108 @@ async def test_connection(jira_url: str, email: str, api_token: str) -> dict:
     Returns:
         Dict with success status and user info or error
     """
-    import httpx
+    from .server.jira_client import JiraClient
 
+    client = JiraClient(base_url=jira_url, auth=(email, api_token), timeout=10, max_retries=0)
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{jira_url.rstrip('/')}/rest/api/2/myself",
-                auth=(email, api_token),
-                timeout=10,
-            )
+        return await client.check_connection()
+    finally:
+        await client.aclose()
+
 
-            if response.status_code == 200:
-                user_data = response.json()
-                return {"success": True, "user": user_data.get("displayName", email)}
-            else:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+def _load_settings():
+    """Return settings, taking credentials from the encrypted config if the env has none."""
+    import os
+    from .config.settings import reload_settings
 
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    if not os.environ.get("JIRA_URL"):
+        from .config.storage import SecureConfig
+
+        storage = SecureConfig()
+        if storage.exists():
+            jira_config = storage.load()
+            os.environ["JIRA_URL"] = jira_config.get("jira_url", "")
+            os.environ["JIRA_EMAIL"] = jira_config.get("email", "")
+            os.environ["JIRA_API_TOKEN"] = jira_config.get("api_token", "")
+            if jira_config.get("default_project") and not os.environ.get("JIRA_PROJECT_KEY"):
+                os.environ["JIRA_PROJECT_KEY"] = jira_config["default_project"]
+
+    return reload_settings()
+
+
+async def run_sync(
+    settings,
+    projects: list[str],
+    full: bool,
+    page_size: int,
+    concurrency: int,
+    db: str = "",
+) -> dict:
+    """Sync ``projects`` into the mirror database (helper for CLI).
+
+    Returns:
+        Per-project summary from :meth:`MirrorSync.sync`
+    """
+    from .mirror import MirrorStore, MirrorSync, default_mirror_path
+    from .server.jira_client import JiraClient
+
+    store = MirrorStore(db or default_mirror_path())
+    client = JiraClient(
+        base_url=settings.jira_url,
+        auth=settings.get_auth(),
+        timeout=settings.jira_timeout,
+        max_retries=settings.jira_max_retries,
+    )
+    try:
+        mirror_sync = MirrorSync(client, store, page_size=page_size, concurrency=concurrency)
+        return await mirror_sync.sync(projects, full=full)
+    finally:
+        await client.aclose()
+        store.close()
+
+
+async def run_index(
+    settings,
+    projects: list[str],
+    full: bool,
+    page_size: int,
+    db: str = "",
+) -> dict:
+    """Index ``projects`` into the text index database (helper for CLI).
+
+    Returns:
+        Project -> number of tickets indexed, or the exception that stopped it
+    """
+    from .mirror.text_index import TextIndex, default_text_index_path, index_project
+    from .server.jira_client import JiraClient
+
+    text_index = TextIndex(db or default_text_index_path())
+    client = JiraClient(
+        base_url=settings.jira_url,
+        auth=settings.get_auth(),
+        timeout=settings.jira_timeout,
+        max_retries=settings.jira_max_retries,
+    )
+    client.attach_text_index(text_index)
+    results: dict = {}
+    try:
+        for project in projects:
+            try:
+                results[project] = await index_project(
+                    client, text_index, project, page_size=page_size, full=full
+                )
+            except Exception as e:
+                results[project] = e
+        try:
+            from .mirror import similarity
+        except ImportError:
+            pass  # NumPy not installed: find_similar_tickets is unavailable anyway
+        else:
+            await asyncio.to_thread(similarity.rebuild, text_index)
+        return results
+    finally:
+        await client.aclose()
+        text_index.close()
 
 
 if __name__ == "__main__":
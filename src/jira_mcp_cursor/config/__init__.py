@@ -1,8 +1,33 @@
 """Configuration management for Jira MCP."""
 
-from .settings import Settings, settings
-from .storage import SecureConfig
-from .wizard import SetupWizard, ConfigWizard
-from .cursor_installer import CursorInstaller
+# Lazy imports: storage pulls in cryptography and the wizard pulls in http.server,
+# neither of which the MCP server needs at startup.
+__all__ = [
+    "Settings",
+    "get_settings",
+    "reload_settings",
+    "SecureConfig",
+    "SetupWizard",
+    "ConfigWizard",
+    "CursorInstaller",
+]
 
-__all__ = ["Settings", "settings", "SecureConfig", "SetupWizard", "ConfigWizard", "CursorInstaller"]
+_LAZY_ATTRIBUTES = {
+    "Settings": "settings",
+    "get_settings": "settings",
+    "reload_settings": "settings",
+    "SecureConfig": "storage",
+    "SetupWizard": "wizard",
+    "ConfigWizard": "wizard",
+    "CursorInstaller": "cursor_installer",
+}
+
+
+def __getattr__(name):
+    """Lazy import of configuration components."""
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
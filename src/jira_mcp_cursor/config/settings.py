@@ -1,5 +1,6 @@
 """Application settings and configuration."""
 
+import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -16,10 +17,31 @@ class Settings(BaseSettings):
 
     # Optional Configuration
     jira_project_key: Optional[str] = None  # Default project for operations
-    jira_user_domain: Optional[str] = None  # Default domain for user searches (e.g., "@fintama.com")
+    # Default domain for user searches (e.g., "@fintama.com")
+    jira_user_domain: Optional[str] = None
     jira_max_results: int = 50
     jira_timeout: int = 30
     jira_max_retries: int = 3  # Maximum retry attempts for failed requests
+    jira_warmup: bool = True  # Preload connections and project metadata at server start
+
+    # Local mirror (SQLite copy of whole projects, kept current in the background)
+    jira_mirror: bool = False
+    jira_mirror_path: str = ""  # Defaults to ~/.jira-mcp/mirror.db
+    jira_mirror_projects: str = ""  # Comma-separated; defaults to jira_project_key
+    jira_mirror_interval: int = 300  # Seconds between background syncs
+    jira_mirror_max_age: int = 900  # Serve mirrored data only if synced this recently
+    jira_mirror_page_size: int = 100
+    jira_mirror_concurrency: int = 2  # Projects synced in parallel
+
+    # Full-text index (SQLite FTS5) fed by fetched issues, used by search_text.
+    # Opt-in: it stores ticket text unencrypted on local disk.
+    jira_text_index: bool = False
+    jira_text_index_path: str = ""  # Defaults to ~/.jira-mcp/text_index.db
+    jira_duplicate_check: str = "warn"  # off, warn or block; needs the text index
+    jira_duplicate_threshold: float = 0.5  # Minimum similarity reported as a duplicate
+
+    # Planning tools: field holding story points (the id differs between instances)
+    jira_story_points_field: str = "customfield_10016"
 
     # Logging
     log_level: str = "INFO"
@@ -35,6 +57,14 @@ class Settings(BaseSettings):
         """Determine if using Jira Cloud or Server."""
         return self.jira_email is not None and self.jira_api_token is not None
 
+    @property
+    def mirror_projects(self) -> list[str]:
+        """Projects kept in the local mirror."""
+        projects = [p.strip() for p in self.jira_mirror_projects.split(",") if p.strip()]
+        if not projects and self.jira_project_key:
+            projects = [self.jira_project_key]
+        return projects
+
     def get_auth(self) -> tuple[str, str]:
         """Get authentication credentials."""
         if self.is_cloud:
@@ -47,17 +77,48 @@ class Settings(BaseSettings):
             return (self.jira_username, self.jira_password)
 
 
-# Global settings instance (lazy loaded)
-_settings = None
+# Process-wide settings snapshot (lazy loaded)
+_settings: Optional[Settings] = None
+_env_file_mtime: Optional[int] = None
+
+
+def _current_env_file_mtime() -> Optional[int]:
+    """Return the .env file's mtime in nanoseconds, or None if it doesn't exist."""
+    try:
+        return os.stat(str(Settings.model_config["env_file"])).st_mtime_ns
+    except OSError:
+        return None
 
 
 def get_settings() -> Settings:
-    """Get or create settings instance."""
-    global _settings
-    if _settings is None:
+    """Get the process-wide settings snapshot.
+
+    Settings are parsed and validated once. The snapshot is only rebuilt when the
+    .env file's mtime changes (a single stat call per lookup) or on an explicit
+    reload_settings().
+    """
+    global _settings, _env_file_mtime
+    mtime = _current_env_file_mtime()
+    if _settings is None or mtime != _env_file_mtime:
         _settings = Settings()
+        _env_file_mtime = mtime
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Re-read the environment and .env file, replacing the snapshot.
+
+    Call this after changing environment variables in-process (e.g. the CLI
+    exporting credentials from the encrypted config before starting the server).
+    """
+    global _settings, _env_file_mtime
+    _settings = Settings()
+    _env_file_mtime = _current_env_file_mtime()
     return _settings
 
 
-# For backward compatibility
-settings = get_settings()
+def __getattr__(name):
+    """Backward-compatible ``settings`` attribute, resolved on first access."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,6 @@ import json
 from pathlib import Path
 from typing import Any
 import logging
-import httpx
 from urllib.parse import urlparse
 import threading
 
@@ -55,26 +54,13 @@ class SetupWizard:
         Returns:
             Dict with success status and user info or error message
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{jira_url.rstrip('/')}/rest/api/2/myself",
-                    auth=(email, api_token),
-                    timeout=10,
-                )
-
-                if response.status_code == 200:
-                    user_data = response.json()
-                    return {"success": True, "user": user_data.get("displayName", email)}
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Authentication failed (HTTP {response.status_code})",
-                    }
+        from ..server.jira_client import JiraClient
 
-        except Exception as e:
-            logger.error(f"Connection test failed: {e}")
-            return {"success": False, "error": str(e)}
+        client = JiraClient(base_url=jira_url, auth=(email, api_token), timeout=10, max_retries=0)
+        try:
+            return await client.check_connection()
+        finally:
+            await client.aclose()
 
     async def save_config(self, config_data: dict[str, str]) -> dict[str, Any]:
         """Save configuration to encrypted storage.
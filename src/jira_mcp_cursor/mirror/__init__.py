@@ -0,0 +1,31 @@
+"""Local SQLite mirror of Jira projects and full-text index of fetched issues."""
+
+# Lazy imports: the mirror is optional and the MCP server should not load
+# sqlite3 or the sync machinery unless it is enabled.
+__all__ = [
+    "MIRROR_FIELDS",
+    "MirrorStore",
+    "MirrorSync",
+    "TextIndex",
+    "default_mirror_path",
+    "run_periodic_sync",
+]
+
+_LAZY_ATTRIBUTES = {
+    "MIRROR_FIELDS": "store",
+    "MirrorStore": "store",
+    "default_mirror_path": "store",
+    "MirrorSync": "sync",
+    "run_periodic_sync": "sync",
+    "TextIndex": "text_index",
+}
+
+
+def __getattr__(name):
+    """Lazy import of mirror components."""
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
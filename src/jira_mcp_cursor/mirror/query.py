@@ -0,0 +1,379 @@
+"""Evaluate a practical subset of JQL against the local mirror.
+
+:func:`plan_query` parses a query and compiles it to a SQL condition over the
+mirror's ``issues`` table, or raises :class:`UnsupportedQuery` when the query
+uses anything the mirror can't answer faithfully; the caller then sends the
+query to Jira instead. Supported:
+
+- ``=``, ``!=``, ``IN``, ``NOT IN``, ``IS [NOT] EMPTY`` on project, key,
+  status, status category, priority, issue type, resolution, parent, labels,
+  components and the user fields (assignee, reporter, creator)
+- ``~`` / ``!~`` with plain terms on summary and description (every word must
+  occur as a whole word of the visible text; ADF descriptions are flattened
+  first). ``text`` (which also covers comments, environment and custom
+  fields in Jira), wildcards, phrases and other Lucene syntax go to Jira. Jira
+  also stems terms, so "bugs" may match "bug" there but not here
+- ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` on created, updated,
+  resolutiondate and duedate, with dates ("2024-01-31", "2024-01-31 14:00"),
+  relative offsets ("-7d", "-2w", "-4h") and ``now()``/``startOfDay()``/
+  ``endOfDay()``
+- ``currentUser()``, ``AND``/``OR``/``NOT`` and ``ORDER BY`` key, summary and
+  the date fields
+
+Queries must be restricted to one or more projects at the top level (the mirror
+only holds whole projects) and must have an ``ORDER BY``, since Jira's default
+ordering can't be reproduced.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from ..utils.jql import (
+    And,
+    Clause,
+    Function,
+    JQLSyntaxError,
+    Keyword,
+    Node,
+    Not,
+    Or,
+    Raw,
+    Scalar,
+    parse,
+)
+
+# Name-valued fields: JQL name -> SQL expression (matched case-insensitively)
+_NAME_FIELDS = {
+    "project": "project",
+    "status": "status",
+    "statuscategory": "json_extract(data, '$.fields.status.statusCategory.name')",
+    "priority": "priority",
+    "issuetype": "issuetype",
+    "type": "issuetype",
+    "resolution": "json_extract(data, '$.fields.resolution.name')",
+    "parent": "json_extract(data, '$.fields.parent.key')",
+}
+# Columns the store keeps lower-cased (see store._QUERY_COLUMNS)
+_LOWERCASE_COLUMNS = frozenset({"status", "priority", "issuetype"})
+_KEY_FIELDS = ("key", "issuekey", "issue")
+_USER_FIELDS = ("assignee", "reporter", "creator")
+_ARRAY_FIELDS = {"labels": "$.fields.labels", "components": "$.fields.components"}
+_DATE_FIELDS = {
+    "created": "created",
+    "createddate": "created",
+    "updated": "updated",
+    "updateddate": "updated",
+    "resolutiondate": "resolutiondate",
+    "resolved": "resolutiondate",
+    "duedate": "duedate",
+    "due": "duedate",
+}
+# Date fields with a precomputed, indexed epoch column
+_DATE_COLUMNS = {"created": "created_ts", "updated": "updated_ts"}
+# Columns holding each field's words (see ..store.search_words)
+_TEXT_FIELDS = {
+    "summary": ("summary",),
+    "description": ("description",),
+}
+_WORD_COLUMNS = {"summary": "summary_words", "description": "description_words"}
+# Lucene query syntax Jira gives meaning to in ~ terms: wildcards, phrases,
+# fuzzy/proximity, boosts, grouping, field prefixes, exclusions and operators
+_TEXT_SYNTAX = re.compile(r'[*?"~+!(){}\[\]^:\\/]|(?:^|\s)-|&&|\|\||\b(?:AND|OR|NOT)\b')
+
+_RELATIVE = re.compile(r"^([+-]?)((?:\d+[wdhm]\s*)+)$")
+_RELATIVE_PART = re.compile(r"(\d+)([wdhm])")
+_UNITS = {"w": 7 * 86400, "d": 86400, "h": 3600, "m": 60}
+_DATE_FORMATS = ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d")
+_WORD = re.compile(r"\w+")
+
+
+class UnsupportedQuery(Exception):
+    """The query uses syntax or fields the mirror can't evaluate."""
+
+
+@dataclass
+class LocalPlan:
+    """A query compiled for the mirror.
+
+    Attributes:
+        projects: Projects the query is restricted to (all must be fresh)
+        where: SQL condition over the ``issues`` table
+        params: Parameters for ``where``
+        order_by: SQL ``ORDER BY`` terms
+    """
+
+    projects: frozenset[str]
+    where: str
+    params: list[Any] = field(default_factory=list)
+    order_by: str = ""
+
+
+def uses_current_user(jql: str) -> bool:
+    """Return True if ``jql`` may call ``currentUser()`` (cheap textual check)."""
+    return "currentuser" in jql.lower()
+
+
+def plan_query(
+    jql: str,
+    current_user: Optional[str] = None,
+    now: Optional[float] = None,
+) -> LocalPlan:
+    """Compile ``jql`` for the mirror.
+
+    Args:
+        jql: JQL text
+        current_user: accountId ``currentUser()`` stands for
+        now: Reference time for relative dates (defaults to the current time)
+
+    Raises:
+        UnsupportedQuery: If the query can't be answered from the mirror
+    """
+    try:
+        query = parse(jql)
+    except JQLSyntaxError as e:
+        raise UnsupportedQuery(str(e)) from e
+    if query.where is None:
+        raise UnsupportedQuery("query is not restricted to a project")
+    if not query.order_by:
+        raise UnsupportedQuery("query has no ORDER BY")
+
+    compiler = _Compiler(current_user, time.time() if now is None else now)
+    where = compiler.node(query.where)
+    order_by = ", ".join(_order_term(name, direction) for name, direction in query.order_by)
+    return LocalPlan(
+        projects=_projects(query.where),
+        where=where,
+        params=compiler.params,
+        order_by=f"{order_by}, project DESC, number DESC",
+    )
+
+
+def _projects(where: Node) -> frozenset[str]:
+    """Return the projects a top-level ``project =``/``IN`` condition restricts to."""
+    operands = where.operands if isinstance(where, And) else (where,)
+    for operand in operands:
+        if isinstance(operand, Clause) and operand.field.lower() == "project":
+            values = operand.value if isinstance(operand.value, tuple) else (operand.value,)
+            if operand.operator in ("=", "IN") and all(isinstance(v, str) for v in values):
+                return frozenset(str(value).upper() for value in values)
+    raise UnsupportedQuery("query is not restricted to a project")
+
+
+def _order_term(name: str, direction: str) -> str:
+    name = name.lower()
+    if name in _KEY_FIELDS:
+        return f"project {direction}, number {direction}"
+    if name == "summary":
+        return f"lower(json_extract(data, '$.fields.summary')) {direction}"
+    if name in _DATE_FIELDS:
+        return f"{_date_expression(_DATE_FIELDS[name])} {direction}"
+    raise UnsupportedQuery(f"can't order by {name}")
+
+
+def _date_expression(field_id: str) -> str:
+    if field_id in _DATE_COLUMNS:
+        return _DATE_COLUMNS[field_id]
+    return f"jira_ts(json_extract(data, '$.fields.{field_id}'))"
+
+
+def parse_jql_date(value: Scalar, now: float) -> float:
+    """Return the epoch seconds of a JQL date value.
+
+    Absolute dates are read in local time, as Jira reads them in the user's
+    time zone.
+
+    Raises:
+        UnsupportedQuery: For date functions and formats not handled here
+    """
+    if isinstance(value, Function):
+        name = value.name.lower()
+        offset = 0
+        if value.args:
+            arg = value.args[0].strip()
+            # A bare number counts days: startOfDay(-1) is yesterday
+            offset = _relative_seconds(f"{arg}d" if arg.lstrip("+-").isdigit() else arg)
+        if name == "now" and not value.args:
+            return now
+        if name in ("startofday", "endofday"):
+            day = datetime.fromtimestamp(now).replace(hour=0, minute=0, second=0, microsecond=0)
+            day += timedelta(seconds=offset)
+            if name == "endofday":
+                day += timedelta(days=1, microseconds=-1)
+            return day.timestamp()
+        raise UnsupportedQuery(f"unsupported date function {value.name}()")
+    if not isinstance(value, str):
+        raise UnsupportedQuery(f"unsupported date value {value}")
+
+    text = value.strip()
+    if _RELATIVE.match(text):
+        return now + _relative_seconds(text)
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).timestamp()
+        except ValueError:
+            continue
+    raise UnsupportedQuery(f"unsupported date {value!r}")
+
+
+def _relative_seconds(text: str) -> int:
+    match = _RELATIVE.match(text.strip())
+    if match is None:
+        raise UnsupportedQuery(f"unsupported date offset {text!r}")
+    seconds = sum(int(n) * _UNITS[unit] for n, unit in _RELATIVE_PART.findall(match.group(2)))
+    return -seconds if match.group(1) == "-" else seconds
+
+
+class _Compiler:
+    """Turns a condition tree into SQL, collecting parameters."""
+
+    def __init__(self, current_user: Optional[str], now: float):
+        self.current_user = current_user
+        self.now = now
+        self.params: list[Any] = []
+
+    def node(self, node: Node) -> str:
+        if isinstance(node, And):
+            return "(" + " AND ".join(self.node(operand) for operand in node.operands) + ")"
+        if isinstance(node, Or):
+            return "(" + " OR ".join(self.node(operand) for operand in node.operands) + ")"
+        if isinstance(node, Not):
+            return f"NOT {self.node(node.operand)}"
+        if isinstance(node, Raw):
+            raise UnsupportedQuery("unparsed JQL")
+        return self.clause(node)
+
+    def clause(self, clause: Clause) -> str:
+        name = clause.field.lower()
+        operator = clause.operator
+        if operator in ("IS", "IS NOT") or isinstance(clause.value, Keyword):
+            return self.emptiness(name, clause)
+        if name in _DATE_FIELDS:
+            return self.date(name, clause)
+        if operator in ("~", "!~"):
+            return self.text(name, clause)
+        if operator not in ("=", "!=", "IN", "NOT IN"):
+            raise UnsupportedQuery(f"unsupported operator {operator} on {name}")
+
+        values = clause.value if isinstance(clause.value, tuple) else (clause.value,)
+        if any(isinstance(v, Keyword) for v in values):
+            raise UnsupportedQuery("EMPTY inside IN lists is not supported")
+        negate = operator in ("!=", "NOT IN")
+
+        if name in _USER_FIELDS:
+            match = " OR ".join(self.user(name, value) for value in values)
+        elif name in _ARRAY_FIELDS:
+            match = " OR ".join(self.array_contains(name, value) for value in values)
+        elif name in _KEY_FIELDS:
+            match = self.membership("key", [self.string(v).upper() for v in values], nocase=False)
+        elif name in _NAME_FIELDS:
+            strings = [self.string(v) for v in values]
+            if name == "project":
+                strings = [s.upper() for s in strings]
+            match = self.membership(_NAME_FIELDS[name], strings, nocase=name != "project")
+        else:
+            raise UnsupportedQuery(f"field {clause.field!r} is not mirrored")
+
+        if not negate:
+            return f"({match})"
+        # Like Jira, != and NOT IN never match issues where the field is empty
+        return f"({self.present(name)} AND NOT ({match}))"
+
+    def string(self, value: Scalar) -> str:
+        if isinstance(value, Function):
+            raise UnsupportedQuery(f"unsupported function {value.name}()")
+        return str(value)
+
+    def membership(self, expression: str, values: list[str], nocase: bool) -> str:
+        if nocase:
+            if expression not in _LOWERCASE_COLUMNS:
+                expression = f"lower({expression})"
+            values = [value.lower() for value in values]
+        self.params.extend(values)
+        if len(values) == 1:
+            return f"{expression} = ?"
+        return f"{expression} IN ({', '.join('?' * len(values))})"
+
+    def user(self, name: str, value: Scalar) -> str:
+        if isinstance(value, Function):
+            if value.name.lower() != "currentuser" or value.args:
+                raise UnsupportedQuery(f"unsupported function {value.name}()")
+            if self.current_user is None:
+                raise UnsupportedQuery("current user unknown")
+            self.params.append(self.current_user)
+            return f"{self.account_id(name)} = ?"
+        text = str(value)
+        self.params.extend((text, text.lower(), text.lower()))
+        return (
+            f"({self.account_id(name)} = ? "
+            f"OR lower(json_extract(data, '$.fields.{name}.emailAddress')) = ? "
+            f"OR lower(json_extract(data, '$.fields.{name}.displayName')) = ?)"
+        )
+
+    def account_id(self, name: str) -> str:
+        if name == "assignee":
+            return "assignee_id"
+        return f"json_extract(data, '$.fields.{name}.accountId')"
+
+    def array_contains(self, name: str, value: Scalar) -> str:
+        element = "value" if name == "labels" else "json_extract(value, '$.name')"
+        self.params.append(self.string(value).lower())
+        return (
+            f"EXISTS (SELECT 1 FROM json_each(data, '{_ARRAY_FIELDS[name]}') "
+            f"WHERE lower({element}) = ?)"
+        )
+
+    def present(self, name: str) -> str:
+        if name in _ARRAY_FIELDS:
+            return f"coalesce(json_array_length(data, '{_ARRAY_FIELDS[name]}'), 0) > 0"
+        if name in _USER_FIELDS:
+            return f"{self.account_id(name)} IS NOT NULL"
+        if name in _DATE_FIELDS:
+            return f"json_extract(data, '$.fields.{_DATE_FIELDS[name]}') IS NOT NULL"
+        if name in _TEXT_FIELDS:
+            return " AND ".join(
+                f"json_extract(data, '$.fields.{f}') IS NOT NULL" for f in _TEXT_FIELDS[name]
+            )
+        if name in _NAME_FIELDS:
+            return f"{_NAME_FIELDS[name]} IS NOT NULL"
+        if name in _KEY_FIELDS:
+            return "1"
+        raise UnsupportedQuery(f"field {name!r} is not mirrored")
+
+    def emptiness(self, name: str, clause: Clause) -> str:
+        value = clause.value
+        if not (isinstance(value, Keyword) and value.name.lower() in ("empty", "null")):
+            raise UnsupportedQuery(f"unsupported {clause.operator} value {value}")
+        if clause.operator in ("IS", "="):
+            return f"NOT ({self.present(name)})"
+        if clause.operator in ("IS NOT", "!="):
+            return f"({self.present(name)})"
+        raise UnsupportedQuery(f"unsupported operator {clause.operator} with EMPTY")
+
+    def date(self, name: str, clause: Clause) -> str:
+        operator = clause.operator
+        if operator not in ("=", "!=", "<", "<=", ">", ">="):
+            raise UnsupportedQuery(f"unsupported operator {operator} on {name}")
+        if isinstance(clause.value, tuple):
+            raise UnsupportedQuery(f"unsupported value list on {name}")
+        self.params.append(parse_jql_date(clause.value, self.now))
+        return f"{_date_expression(_DATE_FIELDS[name])} {operator} ?"
+
+    def text(self, name: str, clause: Clause) -> str:
+        if name not in _TEXT_FIELDS:
+            raise UnsupportedQuery(f"text search on {name!r} is not supported")
+        if isinstance(clause.value, tuple):
+            raise UnsupportedQuery(f"unsupported value list in text search on {name}")
+        term = self.string(clause.value)
+        if _TEXT_SYNTAX.search(term):
+            raise UnsupportedQuery(f"text search syntax in {term!r} is evaluated by Jira only")
+        words = [w.lower() for w in _WORD.findall(term)]
+        if not words:
+            raise UnsupportedQuery("empty text search")
+        haystack = " || ".join(f"coalesce({_WORD_COLUMNS[f]}, '')" for f in _TEXT_FIELDS[name])
+        # Whole words only, as in Jira: " bug " does not occur in " debug "
+        self.params.extend(f" {word} " for word in words)
+        match = " AND ".join(f"instr({haystack}, ?) > 0" for _ in words)
+        return f"({match})" if clause.operator == "~" else f"NOT ({match})"
@@ -0,0 +1,451 @@
+"""TF-IDF similarity search over indexed issue text (requires NumPy).
+
+Issue vectors use sublinear term frequencies (``1 + log tf``, summary words
+counted twice), smoothed IDF and L2 normalisation, so the dot product of two
+vectors is their cosine similarity.
+
+Vectors are stored column-wise (one postings list per term: document ids and
+weights, CSC layout). Scoring a query touches only the postings of its own
+terms, each accumulated into the score array with one vectorised NumPy
+operation, so cost follows the postings of the query terms rather than the
+number of issues.
+
+An index is saved as plain ``.npy`` arrays plus a JSON manifest and loaded
+memory-mapped, so the server starts without rebuilding or reading it all.
+Every save writes its arrays to a new versioned directory and then swaps the
+manifest in atomically; files a loaded index maps are never rewritten, so a
+rebuild (in this process or in ``jira-mcp index``) cannot pull them from under
+a running query.
+
+An index remembers the text index revision it was built at. Documents changed
+since then are vectorised on their own with the saved vocabulary and IDF and
+scored alongside it (an overlay), hiding their outdated copies, so new and
+edited issues are found without rebuilding. Once the overlay holds more than
+:data:`REBUILD_FRACTION` of the index, a full rebuild runs in a background
+thread while the overlaid index keeps being served.
+
+NumPy is an optional dependency (``pip install 'jira-mcp-cursor[similarity]'``);
+import this module only where similarity search is used.
+"""
+
+import copy
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from .text_index import TextIndex
+
+logger = logging.getLogger(__name__)
+
+# Share of changed documents at which the index is rebuilt in the background
+REBUILD_FRACTION = 0.1
+
+_ARRAYS = ("term_ptr", "doc_ids", "weights", "idf", "doc_project")
+_TOKEN = re.compile(r"[^\W\d_][\w-]*[^\W_]|[^\W\d_]{2,}")
+_STOPWORDS = frozenset(
+    """a an and are as at be but by can do does for from has have if in into is it its
+    not of on or our so that the their then there these this to was we were when which
+    will with you your should would could also been being than them they""".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Return the lower-cased, stopword-free words of ``text``."""
+    return [word for word in _TOKEN.findall(text.lower()) if word not in _STOPWORDS]
+
+
+def _term_counts(document: dict[str, Any]) -> Counter[str]:
+    counts = Counter(tokenize(document.get("summary") or "") * 2)
+    counts.update(tokenize(document.get("description") or ""))
+    counts.update(tokenize(document.get("comments") or ""))
+    return counts
+
+
+class SimilarityIndex:
+    """TF-IDF vectors of indexed issues in a compact column-wise sparse layout.
+
+    Attributes:
+        keys: Issue key of each document id
+        projects: Project key of each project id (see ``doc_project``)
+        built_at: When the index was built (epoch seconds)
+        revision: Text index revision the documents reflect (None if unknown)
+        overlay: Index of the documents changed since the build, if any
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        projects: list[str],
+        vocabulary: list[str],
+        arrays: dict[str, np.ndarray],
+        built_at: float,
+        revision: Optional[int] = None,
+        term_ids: Optional[dict[str, int]] = None,
+    ):
+        self.keys = keys
+        self.projects = projects
+        self.built_at = built_at
+        self.revision = revision
+        self.overlay: Optional[SimilarityIndex] = None
+        self._hidden = np.zeros(0, dtype=np.int64)
+        self._vocabulary = vocabulary
+        if term_ids is None:
+            term_ids = {term: term_id for term_id, term in enumerate(vocabulary)}
+        self._term_ids = term_ids
+        self._key_ids = {key: doc_id for doc_id, key in enumerate(keys)}
+        self._project_ids = {project: project_id for project_id, project in enumerate(projects)}
+        self.term_ptr = arrays["term_ptr"]
+        self.doc_ids = arrays["doc_ids"]
+        self.weights = arrays["weights"]
+        self.idf = arrays["idf"]
+        self.doc_project = arrays["doc_project"]
+
+    @classmethod
+    def build(
+        cls,
+        documents: Iterable[dict[str, Any]],
+        revision: Optional[int] = None,
+        base: Optional["SimilarityIndex"] = None,
+    ) -> "SimilarityIndex":
+        """Vectorise documents (dicts with key, project, summary, description, comments).
+
+        With ``base``, the documents are weighted with its vocabulary and IDF
+        (terms it has never seen are dropped), so their scores can be compared
+        with the base index's.
+        """
+        keys: list[str] = []
+        projects: dict[str, int] = {}
+        doc_project: list[int] = []
+        vocabulary: dict[str, int] = base._term_ids if base is not None else {}
+        term_column: list[int] = []
+        doc_column: list[int] = []
+        tf_column: list[float] = []
+
+        for document in documents:
+            doc_id = len(keys)
+            keys.append(document["key"])
+            doc_project.append(projects.setdefault(document["project"], len(projects)))
+            for term, count in _term_counts(document).items():
+                if base is None:
+                    term_id = vocabulary.setdefault(term, len(vocabulary))
+                elif term in vocabulary:
+                    term_id = vocabulary[term]
+                else:
+                    continue
+                term_column.append(term_id)
+                doc_column.append(doc_id)
+                tf_column.append(1.0 + math.log(count))
+
+        terms = np.asarray(term_column, dtype=np.int32)
+        docs = np.asarray(doc_column, dtype=np.int32)
+        tf = np.asarray(tf_column, dtype=np.float32)
+
+        df = np.bincount(terms, minlength=len(vocabulary)).astype(np.float32)
+        if base is not None:
+            idf = np.asarray(base.idf)
+        else:
+            idf = (np.log((1.0 + len(keys)) / (1.0 + df)) + 1.0).astype(np.float32)
+        weights = tf * idf[terms]
+        norms = np.sqrt(np.bincount(docs, weights=weights * weights, minlength=len(keys)))
+        weights = (weights / np.maximum(norms[docs], 1e-12)).astype(np.float32)
+
+        order = np.argsort(terms, kind="stable")
+        term_ptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(df.astype(np.int64), out=term_ptr[1:])
+        arrays = {
+            "term_ptr": term_ptr,
+            "doc_ids": docs[order],
+            "weights": weights[order],
+            "idf": idf,
+            "doc_project": np.asarray(doc_project, dtype=np.int32),
+        }
+        if base is not None:
+            return cls(
+                keys, list(projects), base._vocabulary, arrays, time.time(), revision, vocabulary
+            )
+        return cls(keys, list(projects), list(vocabulary), arrays, time.time(), revision)
+
+    @classmethod
+    def from_text_index(cls, text_index: TextIndex) -> "SimilarityIndex":
+        """Build an index over every issue in ``text_index``."""
+        # Read the revision first: changes made while building show up as changes
+        revision = text_index.revision()
+        return cls.build(text_index.iter_documents(), revision=revision)
+
+    def with_changes(
+        self, documents: list[dict[str, Any]], deleted: Iterable[str], revision: int
+    ) -> "SimilarityIndex":
+        """Return this index with changed documents overlaid and deleted ones hidden.
+
+        The arrays are shared; only the changed documents are vectorised.
+        """
+        overlaid = copy.copy(self)
+        overlaid.revision = revision
+        overlaid.overlay = SimilarityIndex.build(documents, revision=revision, base=self)
+        stale = [document["key"] for document in documents] + list(deleted)
+        overlaid._hidden = np.asarray(
+            [self._key_ids[key] for key in stale if key in self._key_ids], dtype=np.int64
+        )
+        return overlaid
+
+    def save(self, directory: "str | Path") -> None:
+        """Write the index to ``directory`` (arrays as .npy, the rest as JSON).
+
+        The arrays go to a new ``v<timestamp>`` subdirectory named by the
+        manifest. Only the previous version is kept besides it, for processes
+        that read the old manifest just before it was replaced.
+        """
+        directory = Path(directory)
+        version = f"v{time.time_ns()}-{os.getpid()}"
+        (directory / version).mkdir(parents=True)
+        for name in _ARRAYS:
+            np.save(directory / version / f"{name}.npy", getattr(self, name))
+        manifest = {
+            "keys": self.keys,
+            "projects": self.projects,
+            "vocabulary": self._vocabulary,
+            "built_at": self.built_at,
+            "revision": self.revision,
+            "arrays": version,
+        }
+        manifest_path = directory / "manifest.json"
+        previous = _manifest_arrays(manifest_path)
+        staged = directory / f"manifest.{version}.tmp"
+        staged.write_text(json.dumps(manifest, separators=(",", ":")))
+        # Swapped in last: a version without a manifest pointing at it is not an index
+        os.replace(staged, manifest_path)
+        _remove_stale_versions(directory, keep={version, previous})
+
+    @classmethod
+    def load(cls, directory: "str | Path", mmap: bool = True) -> Optional["SimilarityIndex"]:
+        """Load an index written by :meth:`save`, or return None if there is none."""
+        directory = Path(directory)
+        manifest_path = directory / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        manifest = json.loads(manifest_path.read_text())
+        # Indexes saved before versioning keep their arrays next to the manifest
+        arrays_dir = directory / manifest.get("arrays", "")
+        arrays = {
+            name: np.load(arrays_dir / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in _ARRAYS
+        }
+        return cls(
+            manifest["keys"],
+            manifest["projects"],
+            manifest["vocabulary"],
+            arrays,
+            manifest["built_at"],
+            manifest.get("revision"),
+        )
+
+    def __len__(self) -> int:
+        """Number of live documents (overlaid ones counted once, deleted ones not)."""
+        if self.overlay is None:
+            return len(self.keys)
+        return len(self.keys) - len(self._hidden) + len(self.overlay)
+
+    def query_vector(self, document: dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+        """Return (term ids, weights) of a document's normalised TF-IDF vector.
+
+        Terms the index has never seen are dropped: they match no issue.
+        """
+        counts = _term_counts(document)
+        term_ids = np.asarray(
+            [self._term_ids[term] for term in counts if term in self._term_ids], dtype=np.int64
+        )
+        if not len(term_ids):
+            return term_ids, np.zeros(0, dtype=np.float32)
+        tf = np.asarray(
+            [1.0 + math.log(counts[term]) for term in counts if term in self._term_ids],
+            dtype=np.float32,
+        )
+        weights = tf * self.idf[term_ids]
+        return term_ids, weights / np.linalg.norm(weights)
+
+    def scores(self, term_ids: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Return the cosine similarity of the query vector with every document."""
+        scores = np.zeros(len(self.keys), dtype=np.float32)
+        for term_id, weight in zip(term_ids.tolist(), weights.tolist()):
+            start, end = self.term_ptr[term_id], self.term_ptr[term_id + 1]
+            # Each document appears at most once per postings list
+            scores[self.doc_ids[start:end]] += weight * self.weights[start:end]
+        return scores
+
+    def most_similar(
+        self,
+        document: dict[str, Any],
+        limit: int = 10,
+        project: Optional[str] = None,
+        exclude: Optional[str] = None,
+        min_score: float = 0.05,
+    ) -> list[dict[str, Any]]:
+        """Return the ``limit`` issues most similar to ``document``.
+
+        Args:
+            document: Dict with summary / description / comments text
+            limit: Maximum number of results
+            project: Only rank issues of this project
+            exclude: Issue key to leave out (the issue the query came from)
+            min_score: Drop results below this cosine similarity
+
+        Returns:
+            Results (key, score), best first
+        """
+        term_ids, weights = self.query_vector(document)
+        scores = self._filtered_scores(term_ids, weights, project, exclude)
+        if self.overlay is not None:
+            scores[self._hidden] = 0.0
+            overlay_scores = self.overlay._filtered_scores(term_ids, weights, project, exclude)
+            scores = np.concatenate([scores, overlay_scores])
+        base_count = len(self.keys)
+
+        def key_of(doc_id: int) -> str:
+            if doc_id < base_count:
+                return self.keys[doc_id]
+            return self.overlay.keys[doc_id - base_count]  # type: ignore[union-attr]
+
+        limit = min(limit, len(scores))
+        if limit <= 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {"key": key_of(doc_id), "score": round(float(scores[doc_id]), 3)}
+            for doc_id in top.tolist()
+            if scores[doc_id] >= min_score
+        ]
+
+    def _filtered_scores(
+        self,
+        term_ids: np.ndarray,
+        weights: np.ndarray,
+        project: Optional[str],
+        exclude: Optional[str],
+    ) -> np.ndarray:
+        """Scores of this index's own documents with the project and key filters applied."""
+        scores = self.scores(term_ids, weights)
+        if project is not None:
+            project_id = self._project_ids.get(project.upper())
+            if project_id is None:
+                scores[:] = 0.0
+            else:
+                scores[self.doc_project != project_id] = 0.0
+        if exclude is not None and exclude in self._key_ids:
+            scores[self._key_ids[exclude]] = 0.0
+        return scores
+
+
+def _manifest_arrays(manifest_path: Path) -> Optional[str]:
+    """Return the array directory named by an existing manifest ("" if unversioned)."""
+    try:
+        return str(json.loads(manifest_path.read_text()).get("arrays", ""))
+    except (OSError, ValueError):
+        return None
+
+
+def _remove_stale_versions(directory: Path, keep: set[Optional[str]]) -> None:
+    """Delete array versions other than ``keep`` (best effort).
+
+    Unlinking files another index has memory-mapped is safe: the mapping keeps
+    the data until it is closed. Where the OS refuses, the files are left for
+    the next save.
+    """
+    for path in directory.iterdir():
+        try:
+            if path.is_dir() and path.name.startswith("v") and path.name not in keep:
+                shutil.rmtree(path)
+            elif path.suffix == ".npy" and "" not in keep:
+                path.unlink()
+        except OSError as e:
+            logger.debug(f"Could not remove stale similarity index files {path}: {e}")
+
+
+def similarity_index_path(text_index: TextIndex) -> Optional[Path]:
+    """Return where the similarity index for ``text_index`` is saved (None if in memory)."""
+    if text_index.path == ":memory:":
+        return None
+    return Path(text_index.path).parent / "similarity"
+
+
+def rebuild(text_index: TextIndex) -> SimilarityIndex:
+    """Rebuild the similarity index from ``text_index`` and save it next to it."""
+    index = SimilarityIndex.from_text_index(text_index)
+    path = similarity_index_path(text_index)
+    if path is not None:
+        index.save(path)
+    _loaded[id(text_index)] = index
+    _overlaid.pop(id(text_index), None)
+    return index
+
+
+# Built indexes, and the same with recent changes overlaid, by id() of the
+# text index they come from
+_loaded: dict[int, SimilarityIndex] = {}
+_overlaid: dict[int, SimilarityIndex] = {}
+_rebuilding: set[int] = set()
+_rebuilding_lock = threading.Lock()
+
+
+def _rebuild_in_background(text_index: TextIndex) -> None:
+    """Start a full rebuild in a daemon thread unless one is already running."""
+    with _rebuilding_lock:
+        if id(text_index) in _rebuilding:
+            return
+        _rebuilding.add(id(text_index))
+
+    def run() -> None:
+        try:
+            rebuild(text_index)
+        except Exception as e:
+            logger.warning(f"Failed to rebuild the similarity index: {e}")
+        finally:
+            with _rebuilding_lock:
+                _rebuilding.discard(id(text_index))
+
+    threading.Thread(target=run, name="similarity-rebuild", daemon=True).start()
+
+
+def get_similarity_index(text_index: TextIndex) -> SimilarityIndex:
+    """Return an up-to-date similarity index for ``text_index``.
+
+    The built index is loaded (memory-mapped from disk the first time) and
+    documents changed since its revision are overlaid. Only when there is no
+    index yet is one built before returning; otherwise a large backlog of
+    changes triggers a background rebuild and the overlaid index is served.
+    """
+    key = id(text_index)
+    index = _loaded.get(key)
+    if index is None:
+        path = similarity_index_path(text_index)
+        index = SimilarityIndex.load(path) if path is not None else None
+    if index is None or index.revision is None:
+        return rebuild(text_index)
+    _loaded[key] = index
+
+    revision = text_index.revision()
+    if index.revision == revision:
+        return index
+    overlaid = _overlaid.get(key)
+    if (
+        overlaid is not None
+        and overlaid.revision == revision
+        and overlaid.built_at == index.built_at
+    ):
+        return overlaid
+
+    documents, deleted = text_index.changes_since(index.revision)
+    overlaid = _overlaid[key] = index.with_changes(documents, deleted, revision)
+    if len(documents) + len(deleted) > REBUILD_FRACTION * max(len(index.keys), 1):
+        _rebuild_in_background(text_index)
+    return overlaid
@@ -0,0 +1,450 @@
+"""SQLite storage for the local project mirror."""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ..utils.dates import parse_jira_datetime
+from .text_index import plain_text
+
+# Jira fields kept for every mirrored issue. Reads asking only for these can be
+# answered locally.
+MIRROR_FIELDS: tuple[str, ...] = (
+    "summary",
+    "description",
+    "status",
+    "priority",
+    "assignee",
+    "reporter",
+    "creator",
+    "issuetype",
+    "project",
+    "parent",
+    "labels",
+    "components",
+    "resolution",
+    "resolutiondate",
+    "duedate",
+    "created",
+    "updated",
+    "issuelinks",
+    "subtasks",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    updated TEXT,
+    data TEXT NOT NULL,
+    crawl_id INTEGER NOT NULL DEFAULT 0,
+    stale INTEGER NOT NULL DEFAULT 0,
+    number INTEGER,
+    created_ts REAL,
+    updated_ts REAL,
+    assignee_id TEXT,
+    status TEXT,
+    issuetype TEXT,
+    priority TEXT,
+    summary_words TEXT,
+    description_words TEXT
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    mode TEXT,
+    cursor_key TEXT,
+    window_start REAL,
+    run_started_at REAL,
+    crawl_id INTEGER NOT NULL DEFAULT 0,
+    last_synced_at REAL,
+    last_full_at REAL,
+    last_reconciled_at REAL
+);
+"""
+
+# Query columns extracted from the issue JSON (names lower-cased), with the
+# SQL that backfills them in databases created before they existed
+_QUERY_COLUMNS = {
+    "number": "CAST(substr(key, length(project) + 2) AS INTEGER)",
+    "created_ts": "jira_ts(json_extract(data, '$.fields.created'))",
+    "updated_ts": "jira_ts(updated)",
+    "assignee_id": "json_extract(data, '$.fields.assignee.accountId')",
+    "status": "lower(json_extract(data, '$.fields.status.name'))",
+    "issuetype": "lower(json_extract(data, '$.fields.issuetype.name'))",
+    "priority": "lower(json_extract(data, '$.fields.priority.name'))",
+    "summary_words": "field_words(data, 'summary')",
+    "description_words": "field_words(data, 'description')",
+}
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS issues_by_project ON issues (project, crawl_id);
+CREATE INDEX IF NOT EXISTS issues_by_updated ON issues (project, updated_ts, number);
+CREATE INDEX IF NOT EXISTS issues_by_assignee
+    ON issues (assignee_id, project, updated_ts, number);
+CREATE INDEX IF NOT EXISTS issues_by_status ON issues (project, status);
+CREATE INDEX IF NOT EXISTS issues_by_type ON issues (project, issuetype);
+"""
+
+_STATE_COLUMNS = (
+    "mode",
+    "cursor_key",
+    "window_start",
+    "run_started_at",
+    "crawl_id",
+    "last_synced_at",
+    "last_full_at",
+    "last_reconciled_at",
+)
+
+
+def jira_timestamp(value: Optional[str]) -> Optional[float]:
+    """Convert a Jira date or timestamp ("2024-01-31T09:30:00.000+0000") to epoch seconds.
+
+    Registered as the SQL function ``jira_ts`` so date conditions compare
+    instants rather than strings in mixed time zones. Plain dates (due dates)
+    are read as local midnight, like the dates in JQL conditions.
+    """
+    if not value:
+        return None
+    try:
+        if len(value) == 10:
+            return datetime.strptime(value, "%Y-%m-%d").timestamp()
+        return parse_jira_datetime(value).timestamp()
+    except ValueError:
+        return None
+
+
+_WORD = re.compile(r"\w+")
+
+
+def search_words(value: Any) -> str:
+    """Return the words of a text or ADF field, lower-cased, as " word word ".
+
+    Stored next to each issue so ``~`` conditions match whole words of the
+    visible text (``instr(column, ' bug ')``) rather than substrings of the
+    ADF JSON.
+    """
+    words = _WORD.findall(plain_text(value).lower())
+    return f" {' '.join(words)} " if words else ""
+
+
+def _field_words(data: str, field: str) -> str:
+    """SQL function ``field_words``: :func:`search_words` of a field in the issue JSON."""
+    return search_words((json.loads(data).get("fields") or {}).get(field))
+
+
+def _lower_name(value: Optional[dict[str, Any]]) -> Optional[str]:
+    name = (value or {}).get("name")
+    return name.lower() if name else None
+
+
+def default_mirror_path() -> Path:
+    """Return the default mirror database location (next to the encrypted config)."""
+    return Path.home() / ".jira-mcp" / "mirror.db"
+
+
+def project_of(issue_key: str) -> str:
+    """Return the project key of an issue key ("PROJ-12" -> "PROJ")."""
+    return issue_key.rsplit("-", 1)[0]
+
+
+class MirrorStore:
+    """Mirrored issues and per-project sync progress in a SQLite database.
+
+    Issues are stored as the JSON returned by the search API. Sync progress is
+    committed after every page, so an interrupted sync resumes where it stopped.
+    The connection is shared between the event loop and worker threads, guarded
+    by a lock.
+
+    Attributes:
+        path: Database file (":memory:" for an in-memory mirror)
+        fields: Jira fields mirrored for each issue
+    """
+
+    def __init__(
+        self,
+        path: "str | Path",
+        fields: Iterable[str] = MIRROR_FIELDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = str(path)
+        self.fields = frozenset(fields)
+        self._clock = clock
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.create_function("jira_ts", 1, jira_timestamp, deterministic=True)
+        self._conn.create_function("field_words", 2, _field_words, deterministic=True)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(issues)")}
+            for column, backfill in _QUERY_COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE issues ADD COLUMN {column}")
+                    self._conn.execute(f"UPDATE issues SET {column} = {backfill}")
+            self._conn.executescript(_INDEXES)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Issues
+
+    def upsert_issues(
+        self,
+        project: str,
+        issues: Iterable[dict[str, Any]],
+        crawl_id: Optional[int] = None,
+    ) -> int:
+        """Insert or replace issues, optionally tagging them as seen by ``crawl_id``.
+
+        Returns:
+            Number of issues written
+        """
+        rows = []
+        for issue in issues:
+            fields = issue.get("fields") or {}
+            rows.append(
+                (
+                    issue["key"],
+                    project,
+                    fields.get("updated"),
+                    json.dumps(issue, separators=(",", ":")),
+                    crawl_id or 0,
+                    int(issue["key"].rsplit("-", 1)[1]),
+                    jira_timestamp(fields.get("created")),
+                    jira_timestamp(fields.get("updated")),
+                    (fields.get("assignee") or {}).get("accountId"),
+                    _lower_name(fields.get("status")),
+                    _lower_name(fields.get("issuetype")),
+                    _lower_name(fields.get("priority")),
+                    search_words(fields.get("summary")),
+                    search_words(fields.get("description")),
+                )
+            )
+        columns = ["key", "project", "updated", "data", "crawl_id", *_QUERY_COLUMNS]
+        insert = f"INTO issues ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        with self._lock, self._conn:
+            if crawl_id is None:
+                # Keep the existing crawl tag so reconciliation still sees the issue
+                updates = ", ".join(
+                    f"{column} = excluded.{column}"
+                    for column in columns
+                    if column not in ("key", "crawl_id")
+                )
+                self._conn.executemany(
+                    f"INSERT {insert} ON CONFLICT(key) DO UPDATE SET {updates}, stale = 0",
+                    rows,
+                )
+            else:
+                self._conn.executemany(f"INSERT OR REPLACE {insert}", rows)
+        return len(rows)
+
+    def mark_seen(self, updated_by_key: dict[str, Optional[str]], crawl_id: int) -> list[str]:
+        """Tag mirrored issues as seen by ``crawl_id``.
+
+        Args:
+            updated_by_key: Issue key -> its current ``updated`` timestamp in Jira
+            crawl_id: Crawl the issues were seen in
+
+        Returns:
+            Keys that are missing from the mirror or out of date
+        """
+        if not updated_by_key:
+            return []
+        keys = list(updated_by_key)
+        placeholders = ",".join("?" * len(keys))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE issues SET crawl_id = ? WHERE key = ?",
+                [(crawl_id, key) for key in keys],
+            )
+            mirrored = dict(
+                self._conn.execute(
+                    f"SELECT key, updated FROM issues WHERE key IN ({placeholders}) AND stale = 0",
+                    keys,
+                ).fetchall()
+            )
+        return [
+            key
+            for key, updated in updated_by_key.items()
+            if key not in mirrored or mirrored[key] != updated
+        ]
+
+    def delete_unseen(self, project: str, crawl_id: int) -> int:
+        """Delete issues of ``project`` not seen by ``crawl_id`` (deleted or moved in Jira).
+
+        Returns:
+            Number of issues deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM issues WHERE project = ? AND crawl_id != ?", (project, crawl_id)
+            )
+        return cursor.rowcount
+
+    def delete_issue(self, key: str, subtasks: bool = False) -> list[str]:
+        """Remove an issue (and optionally its subtasks) from the mirror.
+
+        Subtasks are the ones listed on the mirrored issue plus mirrored
+        sub-task issues whose parent is ``key``.
+
+        Returns:
+            Keys removed, ``key`` first
+        """
+        keys = [key]
+        with self._lock, self._conn:
+            if subtasks:
+                row = self._conn.execute("SELECT data FROM issues WHERE key = ?", (key,)).fetchone()
+                listed = (json.loads(row[0]).get("fields") or {}).get("subtasks") if row else None
+                keys.extend(subtask["key"] for subtask in listed or [] if subtask.get("key"))
+                keys.extend(
+                    child
+                    for (child,) in self._conn.execute(
+                        "SELECT key FROM issues WHERE json_extract(data, '$.fields.parent.key') = ? "
+                        "AND json_extract(data, '$.fields.issuetype.subtask') = 1",
+                        (key,),
+                    )
+                )
+                keys = list(dict.fromkeys(keys))
+            self._conn.executemany("DELETE FROM issues WHERE key = ?", [(k,) for k in keys])
+        return keys
+
+    def mark_stale(self, key: str) -> None:
+        """Stop serving ``key`` locally until the next sync refreshes it."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE issues SET stale = 1 WHERE key = ?", (key,))
+
+    def mark_created(self, key: str, fields: Optional[dict[str, Any]] = None) -> None:
+        """Record an issue created outside a sync as stale.
+
+        The mirror does not hold the new issue's full payload yet, so its
+        project stops being served locally (see :meth:`has_stale`) until the
+        next sync stores the real issue.
+
+        Args:
+            key: New issue key
+            fields: Known fields of the new issue (e.g. its parent)
+        """
+        data = json.dumps({"key": key, "fields": fields or {}}, separators=(",", ":"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO issues (key, project, data, stale, number) VALUES (?, ?, ?, 1, ?) "
+                "ON CONFLICT(key) DO UPDATE SET stale = 1",
+                (key, project_of(key), data, int(key.rsplit("-", 1)[1])),
+            )
+
+    def get_issue(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the mirrored issue, or None if missing or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM issues WHERE key = ? AND stale = 0", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_issues(self, project: Optional[str] = None) -> Iterator[dict[str, Any]]:
+        """Yield mirrored issues (all projects, or one), including stale ones."""
+        query = "SELECT data FROM issues"
+        params: tuple[Any, ...] = ()
+        if project is not None:
+            query += " WHERE project = ?"
+            params = (project,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def search(
+        self,
+        where: str,
+        params: Iterable[Any],
+        order_by: str,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Run a compiled query (see :mod:`.query`) over the mirrored issues.
+
+        Returns:
+            (first ``limit`` matching issues in order, total number of matches)
+        """
+        params = list(params)
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM issues WHERE {where}", params
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT data FROM issues WHERE {where} ORDER BY {order_by} LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows], total
+
+    def has_stale(self, projects: Iterable[str]) -> bool:
+        """Return True if any issue of ``projects`` was written since it was synced."""
+        projects = list(projects)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT 1 FROM issues WHERE stale = 1 AND project IN "
+                f"({', '.join('?' * len(projects))}) LIMIT 1",
+                projects,
+            ).fetchone()
+        return row is not None
+
+    def count(self, project: Optional[str] = None) -> int:
+        """Return the number of mirrored issues."""
+        with self._lock:
+            if project is None:
+                return self._conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM issues WHERE project = ?", (project,)
+            ).fetchone()[0]
+
+    # Sync state
+
+    def get_state(self, project: str) -> dict[str, Any]:
+        """Return the sync state of ``project`` (all None/0 if never synced)."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_STATE_COLUMNS)} FROM sync_state WHERE project = ?",
+                (project,),
+            ).fetchone()
+        if row is None:
+            return {column: 0 if column == "crawl_id" else None for column in _STATE_COLUMNS}
+        return dict(zip(_STATE_COLUMNS, row))
+
+    def update_state(self, project: str, **values: Any) -> None:
+        """Update sync state columns for ``project``."""
+        unknown = set(values) - set(_STATE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown sync state columns: {sorted(unknown)}")
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" * len(values))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in values)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO sync_state (project, {columns}) VALUES (?, {placeholders}) "
+                f"ON CONFLICT(project) DO UPDATE SET {updates}",
+                (project, *values.values()),
+            )
+
+    def is_fresh(self, project: str, max_age: float) -> bool:
+        """Return True if ``project`` completed a sync within ``max_age`` seconds."""
+        state = self.get_state(project)
+        return (
+            state["last_full_at"] is not None
+            and state["last_synced_at"] is not None
+            and self._clock() - state["last_synced_at"] <= max_age
+        )
+
+    def covers(self, fields: Optional[Iterable[str]]) -> bool:
+        """Return True if every requested field is mirrored (``None`` means all fields)."""
+        return fields is not None and set(fields) <= self.fields
@@ -0,0 +1,222 @@
+"""Incremental synchronisation of Jira projects into the local mirror.
+
+Each project goes through three kinds of run:
+
+- **full**: crawl every issue of the project, then delete mirrored issues the
+  crawl did not see (deleted or moved in Jira)
+- **delta**: fetch issues updated since the previous run started, with a small
+  overlap to absorb clock skew
+- **reconcile**: crawl only issue keys and ``updated`` stamps to detect
+  deletions without downloading issue data again; issues the mirror is missing
+  or holds an outdated copy of are fetched in full
+
+Crawls page through the project ordered by key using ``key > "<last key>"``
+cursors, and the cursor is committed after every page, so an interrupted run
+resumes from the last page written rather than starting over.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from ..server.jira_client import JiraClient
+from ..utils.jql import Clause, Query, all_of
+from .store import MirrorStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_CONCURRENCY = 2
+
+# Delta windows start this long before the previous run started, so updates
+# that landed while that run was paging are not missed
+DELTA_OVERLAP_SECONDS = 120
+
+# Deletions are invisible to delta runs; look for them this often
+RECONCILE_INTERVAL_SECONDS = 24 * 3600
+
+
+class MirrorSync:
+    """Keeps a :class:`MirrorStore` up to date from a :class:`JiraClient`.
+
+    Attributes:
+        page_size: Issues requested per search page
+        concurrency: Projects synced in parallel
+    """
+
+    def __init__(
+        self,
+        client: JiraClient,
+        store: MirrorStore,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.client = client
+        self.store = store
+        self.page_size = page_size
+        self.concurrency = max(1, concurrency)
+        self._clock = clock
+
+    async def sync(
+        self,
+        projects: Iterable[str],
+        full: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        """Sync several projects, at most ``concurrency`` at a time.
+
+        Failures are logged and reported per project rather than raised, so
+        one inaccessible project does not stop the others.
+
+        Returns:
+            Per-project summary (mode, fetched, deleted, or error)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(project: str) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.sync_project(project, full=full)
+                except Exception as e:
+                    logger.error(f"Mirror sync of {project} failed: {e}")
+                    return {"project": project, "error": str(e)}
+
+        projects = list(dict.fromkeys(projects))
+        results = await asyncio.gather(*(run(project) for project in projects))
+        return dict(zip(projects, results))
+
+    async def sync_project(self, project: str, full: bool = False) -> dict[str, Any]:
+        """Bring one project up to date, resuming an interrupted run if there is one.
+
+        Args:
+            project: Project key
+            full: Force a full crawl (ignored while another run is being resumed)
+
+        Returns:
+            Summary with mode, fetched and deleted counts
+        """
+        state = self.store.get_state(project)
+        now = self._clock()
+
+        if state["mode"] is None:
+            if full or state["last_full_at"] is None:
+                mode = "full"
+            elif now - (state["last_reconciled_at"] or 0) >= RECONCILE_INTERVAL_SECONDS:
+                mode = "reconcile"
+            else:
+                mode = "delta"
+            window_start = (
+                (state["last_synced_at"] or now) - DELTA_OVERLAP_SECONDS
+                if mode == "delta"
+                else None
+            )
+            state = {
+                **state,
+                "mode": mode,
+                "cursor_key": None,
+                "window_start": window_start,
+                "run_started_at": now,
+                "crawl_id": state["crawl_id"] + 1 if mode != "delta" else state["crawl_id"],
+            }
+            self.store.update_state(
+                project,
+                **{
+                    column: state[column]
+                    for column in (
+                        "mode",
+                        "cursor_key",
+                        "window_start",
+                        "run_started_at",
+                        "crawl_id",
+                    )
+                },
+            )
+        else:
+            logger.info(f"Resuming {state['mode']} sync of {project} after {state['cursor_key']}")
+
+        mode = state["mode"]
+        fetched = await self._crawl(project, state)
+        summary: dict[str, Any] = {
+            "project": project,
+            "mode": mode,
+            "fetched": fetched,
+            "deleted": 0,
+        }
+
+        completed: dict[str, Any] = {
+            "mode": None,
+            "cursor_key": None,
+            "window_start": None,
+            "last_synced_at": state["run_started_at"],
+        }
+        if mode in ("full", "reconcile"):
+            summary["deleted"] = self.store.delete_unseen(project, state["crawl_id"])
+            completed["last_reconciled_at"] = state["run_started_at"]
+        if mode == "full":
+            completed["last_full_at"] = state["run_started_at"]
+        self.store.update_state(project, **completed)
+
+        logger.info(
+            f"Mirror {mode} sync of {project}: {fetched} fetched, {summary['deleted']} deleted"
+        )
+        return summary
+
+    async def _crawl(self, project: str, state: dict[str, Any]) -> int:
+        """Page through the run's query, committing the cursor after every page."""
+        mode = state["mode"]
+        cursor_key: Optional[str] = state["cursor_key"]
+        fields = ["updated"] if mode == "reconcile" else sorted(self.store.fields)
+        fetched = 0
+
+        while True:
+            conditions = [Clause("project", "=", project)]
+            if cursor_key:
+                conditions.append(Clause("key", ">", cursor_key))
+            if mode == "delta":
+                minutes = math.ceil((self._clock() - state["window_start"]) / 60)
+                conditions.append(Clause("updated", ">=", f"-{max(minutes, 1)}m"))
+            query = Query(all_of(*conditions), order_by=(("key", "ASC"),))
+
+            result = await self.client.search_issues(
+                str(query), fields=fields, max_results=self.page_size, cache=False
+            )
+            issues = result.get("issues", [])
+
+            if mode == "reconcile":
+                outdated = self.store.mark_seen(
+                    {issue["key"]: issue.get("fields", {}).get("updated") for issue in issues},
+                    state["crawl_id"],
+                )
+                if outdated:
+                    fetched += await self._fetch_keys(project, outdated, state["crawl_id"])
+            else:
+                crawl_id = state["crawl_id"] if mode == "full" else None
+                fetched += self.store.upsert_issues(project, issues, crawl_id=crawl_id)
+
+            if not issues:
+                return fetched
+            cursor_key = issues[-1]["key"]
+            self.store.update_state(project, cursor_key=cursor_key)
+            if len(issues) < self.page_size:
+                return fetched
+
+    async def _fetch_keys(self, project: str, keys: list[str], crawl_id: int) -> int:
+        """Fetch and store specific issues (found by reconciliation to be missing or outdated)."""
+        query = Query(Clause("key", "IN", tuple(keys)))
+        result = await self.client.search_issues(
+            str(query), fields=sorted(self.store.fields), max_results=len(keys), cache=False
+        )
+        return self.store.upsert_issues(project, result.get("issues", []), crawl_id=crawl_id)
+
+
+async def run_periodic_sync(
+    mirror_sync: MirrorSync,
+    projects: list[str],
+    interval: float,
+) -> None:
+    """Sync ``projects`` every ``interval`` seconds until cancelled."""
+    while True:
+        await mirror_sync.sync(projects)
+        await asyncio.sleep(interval)
@@ -0,0 +1,519 @@
+"""Full-text index over issue summaries, descriptions and comments (SQLite FTS5).
+
+Documents live in an ordinary table (``issue_docs``); an external-content FTS5
+table mirrors it through triggers. Issue payloads usually carry only some of
+the indexed fields, so updates merge into the stored document instead of
+replacing it: a search result that only has summaries refreshes the summaries
+and leaves descriptions and comments as they were.
+
+The same documents feed a MinHash/LSH index (see :mod:`..utils.minhash`) over
+summary and description shingles, used to spot near-duplicate issues: band
+buckets live in an indexed table, so finding candidates costs a few index
+lookups however many issues are indexed.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ..utils import minhash
+from ..utils.jql import Clause, Query, all_of
+
+logger = logging.getLogger(__name__)
+
+# Issue fields the index reads; fetch these to index an issue completely
+TEXT_FIELDS = ("summary", "description", "comment", "updated")
+
+# BM25 column weights: summary, description, comments
+_WEIGHTS = (10.0, 3.0, 1.0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issue_docs (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    project TEXT NOT NULL,
+    summary TEXT,
+    description TEXT,
+    comments TEXT,
+    updated TEXT,
+    revision INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS issue_docs_by_project ON issue_docs (project);
+
+CREATE TABLE IF NOT EXISTS deleted_docs (
+    key TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS issue_text USING fts5(
+    summary, description, comments,
+    content='issue_docs', content_rowid='id',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS issue_docs_ai AFTER INSERT ON issue_docs BEGIN
+    INSERT INTO issue_text (rowid, summary, description, comments)
+    VALUES (new.id, new.summary, new.description, new.comments);
+END;
+CREATE TRIGGER IF NOT EXISTS issue_docs_ad AFTER DELETE ON issue_docs BEGIN
+    INSERT INTO issue_text (issue_text, rowid, summary, description, comments)
+    VALUES ('delete', old.id, old.summary, old.description, old.comments);
+END;
+CREATE TRIGGER IF NOT EXISTS issue_docs_au AFTER UPDATE ON issue_docs BEGIN
+    INSERT INTO issue_text (issue_text, rowid, summary, description, comments)
+    VALUES ('delete', old.id, old.summary, old.description, old.comments);
+    INSERT INTO issue_text (rowid, summary, description, comments)
+    VALUES (new.id, new.summary, new.description, new.comments);
+END;
+
+CREATE TABLE IF NOT EXISTS issue_minhash (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issue_lsh (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (band, bucket, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS issue_lsh_by_key ON issue_lsh (key);
+
+CREATE TABLE IF NOT EXISTS index_state (
+    project TEXT PRIMARY KEY,
+    last_indexed_at REAL
+);
+"""
+
+# Run after adding the revision column to databases created before it existed
+_REVISION_INDEX = "CREATE INDEX IF NOT EXISTS issue_docs_by_revision ON issue_docs (revision)"
+
+# ADF node types that end a line of text
+_BLOCK_NODES = frozenset(
+    {"paragraph", "heading", "listItem", "blockquote", "codeBlock", "tableRow", "rule", "panel"}
+)
+_TERM = re.compile(r"\w+\*?")
+
+
+def default_text_index_path() -> Path:
+    """Return the default text index location (next to the encrypted config)."""
+    return Path.home() / ".jira-mcp" / "text_index.db"
+
+
+def plain_text(value: Any) -> str:
+    """Return the text of a plain string or an Atlassian Document Format tree."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    parts: list[str] = []
+    stack: list[Any] = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            parts.append(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        node_type = node.get("type")
+        if node_type == "text":
+            parts.append(node.get("text", ""))
+        elif node_type == "hardBreak":
+            parts.append("\n")
+        elif node_type == "mention":
+            parts.append((node.get("attrs") or {}).get("text", ""))
+        if node_type in _BLOCK_NODES:
+            stack.append("\n")
+        stack.extend(reversed(node.get("content") or []))
+    return "".join(parts).strip()
+
+
+def duplicate_text(summary: Optional[str], description: Any) -> str:
+    """Return the text near-duplicate detection compares (summary and description)."""
+    return f"{summary or ''}\n{plain_text(description)}"
+
+
+def match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, ``word*`` is a prefix.
+
+    Raises:
+        ValueError: If the query contains no words
+    """
+    terms = []
+    for term in _TERM.findall(query):
+        prefix = term.endswith("*")
+        word = term.rstrip("*")
+        terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    if not terms:
+        raise ValueError("Search query must contain at least one word")
+    return " ".join(terms)
+
+
+class TextIndex:
+    """FTS5 index of issue text, updated from whatever issue payloads pass by.
+
+    Every write that changes an issue's text stamps the document (or, for a
+    deletion, a tombstone) with the next revision number, so derived indexes
+    can ask for just the documents changed since the revision they were built at.
+
+    Attributes:
+        path: Database file (":memory:" for an in-memory index)
+    """
+
+    def __init__(self, path: "str | Path", clock: Callable[[], float] = time.time):
+        self.path = str(path)
+        self._clock = clock
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(issue_docs)")}
+            if "revision" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE issue_docs ADD COLUMN revision INTEGER NOT NULL DEFAULT 0"
+                )
+            self._conn.execute(_REVISION_INDEX)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def add_issues(self, issues: Iterable[dict[str, Any]]) -> int:
+        """Index the text fields present in each payload, keeping the others.
+
+        Payloads carrying none of summary, description or comments are ignored.
+
+        Returns:
+            Number of issues written
+        """
+        rows = []
+        for issue in issues:
+            key = issue.get("key")
+            fields = issue.get("fields") or {}
+            if not key or not any(name in fields for name in ("summary", "description", "comment")):
+                continue
+            comments = None
+            if "comment" in fields:
+                comment_list = (fields.get("comment") or {}).get("comments", [])
+                comments = "\n\n".join(plain_text(comment.get("body")) for comment in comment_list)
+            rows.append(
+                (
+                    key,
+                    key.rsplit("-", 1)[0],
+                    fields.get("summary") if "summary" in fields else None,
+                    plain_text(fields.get("description")) if "description" in fields else None,
+                    comments,
+                    fields.get("updated"),
+                    "summary" in fields,
+                    "description" in fields,
+                    comments is not None,
+                )
+            )
+        if not rows:
+            return 0
+        keys = [row[0] for row in rows]
+        with self._lock, self._conn:
+            previous = {
+                key: (summary, description, comments)
+                for key, summary, description, comments in self._conn.execute(
+                    f"SELECT key, summary, description, comments FROM issue_docs "
+                    f"WHERE key IN ({', '.join('?' * len(keys))})",
+                    keys,
+                )
+            }
+            self._conn.executemany(
+                "INSERT INTO issue_docs (key, project, summary, description, comments, updated) "
+                "VALUES (?1, ?2, ?3, ?4, ?5, ?6) ON CONFLICT(key) DO UPDATE SET "
+                "summary = CASE WHEN ?7 THEN excluded.summary ELSE summary END, "
+                "description = CASE WHEN ?8 THEN excluded.description ELSE description END, "
+                "comments = CASE WHEN ?9 THEN excluded.comments ELSE comments END, "
+                "updated = coalesce(excluded.updated, updated)",
+                rows,
+            )
+            # Only re-sign issues whose summary or description text changed
+            changed = [
+                row[0]
+                for row in rows
+                if row[0] not in previous
+                or (row[6] and row[2] != previous[row[0]][0])
+                or (row[7] and row[3] != previous[row[0]][1])
+            ]
+            if changed:
+                self._update_signatures(changed)
+            # Stamp every document whose text changed, for derived indexes
+            rewritten = set(changed) | {
+                row[0]
+                for row in rows
+                if row[0] in previous and row[8] and row[4] != previous[row[0]][2]
+            }
+            if rewritten:
+                self._stamp(sorted(rewritten))
+        return len(rows)
+
+    def _next_revision(self) -> int:
+        """Return the revision number for the next change (lock held)."""
+        latest = self._conn.execute(
+            "SELECT max(coalesce((SELECT max(revision) FROM issue_docs), 0), "
+            "coalesce((SELECT max(revision) FROM deleted_docs), 0))"
+        ).fetchone()[0]
+        return latest + 1
+
+    def _stamp(self, keys: list[str]) -> None:
+        """Mark the documents of ``keys`` as changed in a new revision (lock held)."""
+        revision = self._next_revision()
+        placeholders = ", ".join("?" * len(keys))
+        self._conn.execute(
+            f"UPDATE issue_docs SET revision = ? WHERE key IN ({placeholders})", [revision, *keys]
+        )
+        self._conn.execute(f"DELETE FROM deleted_docs WHERE key IN ({placeholders})", keys)
+
+    def _update_signatures(self, keys: list[str]) -> None:
+        """Recompute MinHash signatures and LSH buckets for ``keys`` (lock held)."""
+        placeholders = ", ".join("?" * len(keys))
+        documents = self._conn.execute(
+            f"SELECT key, project, summary, description FROM issue_docs "
+            f"WHERE key IN ({placeholders})",
+            keys,
+        ).fetchall()
+        self._conn.execute(f"DELETE FROM issue_lsh WHERE key IN ({placeholders})", keys)
+        for key, project, summary, description in documents:
+            sig = minhash.signature(minhash.shingles(duplicate_text(summary, description)))
+            if not sig:
+                self._conn.execute("DELETE FROM issue_minhash WHERE key = ?", (key,))
+                continue
+            self._conn.execute(
+                "INSERT OR REPLACE INTO issue_minhash (key, project, signature) VALUES (?, ?, ?)",
+                (key, project, minhash.pack(sig)),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO issue_lsh (band, bucket, key) VALUES (?, ?, ?)",
+                [(band, bucket, key) for band, bucket in minhash.band_buckets(sig)],
+            )
+
+    def delete_issue(self, key: str) -> None:
+        """Remove an issue from the index."""
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM issue_docs WHERE key = ?", (key,)).rowcount
+            if deleted:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO deleted_docs (key, revision) VALUES (?, ?)",
+                    (key, self._next_revision()),
+                )
+            self._conn.execute("DELETE FROM issue_minhash WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM issue_lsh WHERE key = ?", (key,))
+
+    def find_duplicates(
+        self,
+        summary: str,
+        description: Any = None,
+        project: Optional[str] = None,
+        threshold: float = 0.5,
+        limit: int = 5,
+    ) -> list[dict[str, Any]]:
+        """Return indexed issues whose summary and description resemble the given text.
+
+        Args:
+            summary: Summary of the (new) issue
+            description: Its description (plain text or ADF)
+            project: Only compare with issues of this project
+            threshold: Minimum estimated Jaccard similarity of word shingles
+            limit: Maximum number of issues returned
+
+        Returns:
+            Issues (key, summary, similarity), most similar first
+        """
+        sig = minhash.signature(minhash.shingles(duplicate_text(summary, description)))
+        if not sig:
+            return []
+        buckets = minhash.band_buckets(sig)
+        sql = (
+            "SELECT m.key, m.signature, d.summary FROM issue_minhash m "
+            "JOIN issue_docs d ON d.key = m.key WHERE m.key IN ("
+            "SELECT key FROM issue_lsh WHERE "
+            + " OR ".join("(band = ? AND bucket = ?)" for _ in buckets)
+            + ")"
+        )
+        params: list[Any] = [value for bucket in buckets for value in bucket]
+        if project:
+            sql += " AND m.project = ?"
+            params.append(project.upper())
+        with self._lock:
+            candidates = self._conn.execute(sql, params).fetchall()
+
+        matches = []
+        for key, packed, candidate_summary in candidates:
+            score = minhash.similarity(sig, minhash.unpack(packed))
+            if score >= threshold:
+                matches.append(
+                    {"key": key, "summary": candidate_summary, "similarity": round(score, 3)}
+                )
+        matches.sort(key=lambda match: -match["similarity"])
+        return matches[:limit]
+
+    def search(
+        self,
+        query: str,
+        project: Optional[str] = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Return the best BM25 matches for ``query`` with a highlighted snippet.
+
+        Args:
+            query: Free text; every word must occur (``word*`` matches a prefix)
+            project: Only search this project
+            limit: Maximum number of results
+
+        Returns:
+            Matches (key, summary, snippet, score), best first
+        """
+        sql = (
+            "SELECT d.key, d.summary, "
+            "snippet(issue_text, -1, '**', '**', '…', 16), "
+            f"bm25(issue_text, {', '.join(map(str, _WEIGHTS))}) AS score "
+            "FROM issue_text JOIN issue_docs d ON d.id = issue_text.rowid "
+            "WHERE issue_text MATCH ?"
+        )
+        params: list[Any] = [match_expression(query)]
+        if project:
+            sql += " AND d.project = ?"
+            params.append(project.upper())
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {"key": key, "summary": summary, "snippet": snippet, "score": round(-score, 3)}
+            for key, summary, snippet, score in rows
+        ]
+
+    def get_document(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the indexed text of ``key`` (summary, description, comments), if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, project, summary, description, comments FROM issue_docs WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("key", "project", "summary", "description", "comments"), row))
+
+    def iter_documents(self) -> Iterator[dict[str, Any]]:
+        """Yield the indexed text of every issue, in key order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, project, summary, description, comments FROM issue_docs ORDER BY key"
+            ).fetchall()
+        for row in rows:
+            yield dict(zip(("key", "project", "summary", "description", "comments"), row))
+
+    def revision(self) -> int:
+        """Return the revision of the latest change (0 if nothing was indexed)."""
+        with self._lock:
+            return self._next_revision() - 1
+
+    def changes_since(self, revision: int) -> tuple[list[dict[str, Any]], list[str]]:
+        """Return (documents changed, keys deleted) after ``revision``, in key order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, project, summary, description, comments FROM issue_docs "
+                "WHERE revision > ? ORDER BY key",
+                (revision,),
+            ).fetchall()
+            deleted = [
+                key
+                for (key,) in self._conn.execute(
+                    "SELECT key FROM deleted_docs WHERE revision > ? ORDER BY key", (revision,)
+                )
+            ]
+        documents = [
+            dict(zip(("key", "project", "summary", "description", "comments"), row)) for row in rows
+        ]
+        return documents, deleted
+
+    def count(self, project: Optional[str] = None) -> int:
+        """Return the number of indexed issues."""
+        with self._lock:
+            if project is None:
+                return self._conn.execute("SELECT COUNT(*) FROM issue_docs").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM issue_docs WHERE project = ?", (project.upper(),)
+            ).fetchone()[0]
+
+    def last_indexed_at(self, project: str) -> Optional[float]:
+        """Return when ``project`` was last indexed with :func:`index_project`."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_indexed_at FROM index_state WHERE project = ?", (project,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_indexed_at(self, project: str, when: float) -> None:
+        """Record a completed :func:`index_project` run."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO index_state (project, last_indexed_at) VALUES (?, ?) "
+                "ON CONFLICT(project) DO UPDATE SET last_indexed_at = excluded.last_indexed_at",
+                (project, when),
+            )
+
+
+async def index_project(
+    client: Any,
+    text_index: TextIndex,
+    project: str,
+    page_size: int = 100,
+    full: bool = False,
+) -> int:
+    """Index a project's issues, or only those updated since its last run.
+
+    Pages through the project ordered by key with ``key >`` cursors, like the
+    mirror sync. The client feeds every page into ``text_index`` on its own
+    when the index is attached to it; otherwise pages are added here.
+
+    Args:
+        client: :class:`..server.jira_client.JiraClient`
+        text_index: Index to fill
+        project: Project key
+        page_size: Issues per search page
+        full: Re-index every issue instead of recent changes only
+
+    Returns:
+        Number of issues indexed
+    """
+    started = time.time()
+    since = None if full else text_index.last_indexed_at(project)
+    cursor_key: Optional[str] = None
+    indexed = 0
+    attached = getattr(client, "text_index", None) is text_index
+
+    while True:
+        conditions = [Clause("project", "=", project)]
+        if cursor_key:
+            conditions.append(Clause("key", ">", cursor_key))
+        if since is not None:
+            # Relative window with a two-minute overlap, as in the mirror sync
+            minutes = int((started - since) // 60) + 2
+            conditions.append(Clause("updated", ">=", f"-{minutes}m"))
+        query = Query(all_of(*conditions), order_by=(("key", "ASC"),))
+        result = await client.search_issues(
+            str(query), fields=list(TEXT_FIELDS), max_results=page_size, cache=False
+        )
+        issues = result.get("issues", [])
+        indexed += len(issues) if attached else text_index.add_issues(issues)
+        if len(issues) < page_size:
+            break
+        cursor_key = issues[-1]["key"]
+
+    text_index.set_indexed_at(project, started)
+    logger.info(f"Indexed {indexed} issues of {project}")
+    return indexed
@@ -1,10 +1,19 @@
 """Jira API client for interacting with Jira REST API."""
 
+import hashlib
 import httpx
-from typing import Any, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Coroutine, Optional
 import logging
 import asyncio
-
+import re
+
+from ..utils.cache import SWRCache, TTLCache
+from ..utils.dates import parse_jira_datetime
+from ..utils.jql import Clause, Node, Query
+from ..utils.name_index import INWARD_SYNONYMS, NameIndex, normalize_name
+from ..utils.search_cache import SearchResultCache
+from ..utils.user_directory import UserDirectory
 from .exceptions import (
     JiraAPIError,
     AuthenticationError,
@@ -13,12 +22,74 @@ from .exceptions import (
     ValidationError,
 )
 
+if TYPE_CHECKING:
+    from ..mirror.store import MirrorStore
+    from ..mirror.text_index import TextIndex
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections held open to the Jira host
+MAX_POOLED_CONNECTIONS = 10
+
+# Project metadata (statuses, issue types) changes rarely: serve it fresh for
+# 5 minutes, then for up to an hour more while refreshing in the background
+PROJECT_METADATA_TTL_SECONDS = 300
+PROJECT_METADATA_STALE_SECONDS = 3600
+MAX_METADATA_ENTRIES = 256
+
+# The user directory is larger and changes less often than project metadata
+USER_DIRECTORY_TTL_SECONDS = 900
+USER_DIRECTORY_STALE_SECONDS = 3600
+USER_PAGE_SIZE = 100
+
+# Agents re-run the same list queries within a session; writes through this
+# client invalidate affected entries, the TTL bounds staleness from other writers
+SEARCH_CACHE_TTL_SECONDS = 30
+MAX_CACHED_SEARCHES = 128
+
+# Keys per ``key IN (...)`` search when fetching many issues, and how many of
+# those searches run at once
+ISSUE_BATCH_SIZE = 50
+ISSUE_BATCH_CONCURRENCY = 4
+
+# Keys Jira names when a ``key IN (...)`` search is rejected with 400, e.g.
+# "An issue with key 'X-1' does not exist for field 'key'."
+_REJECTED_ISSUE_KEY = re.compile(r"(?:issue with key|issue key|value) '([^']+)'", re.IGNORECASE)
+
+# Issues per page when paging through every result of a search
+SEARCH_PAGE_SIZE = 100
+
+# Entries per page when paging through an issue's changelog
+CHANGELOG_PAGE_SIZE = 100
+
+# Fields every issue write changes
+_WRITE_FIELDS = frozenset({"updated"})
+
+# /myself per credential set, shared by every client built from the same
+# credentials (server, `config test`, setup wizard)
+IDENTITY_TTL_SECONDS = 3600
+_identity_cache: TTLCache[tuple[str, str, str], dict[str, Any]] = TTLCache(
+    maxsize=8, ttl=IDENTITY_TTL_SECONDS
+)
+
+
+def clear_identity_cache() -> None:
+    """Forget cached ``/myself`` identities (e.g. after credentials change)."""
+    _identity_cache.clear()
+
+
+def _select_fields(issue: dict[str, Any], fields: Optional[list[str]]) -> dict[str, Any]:
+    """Return ``issue`` with only ``fields`` in its field map (as Jira would send it)."""
+    issue_fields = issue.get("fields", {})
+    return {**issue, "fields": {name: issue_fields.get(name) for name in fields or ()}}
+
 
 class JiraClient:
     """Async client for Jira REST API with automatic retry logic.
 
+    Requests share one pooled ``httpx.AsyncClient`` so DNS, TCP and TLS setup is
+    paid once per connection rather than once per request.
+
     Attributes:
         base_url: Jira instance URL
         auth: Authentication credentials (email/token or username/password)
@@ -33,7 +104,52 @@ class JiraClient:
         self.auth = auth
         self.timeout = timeout
         self.max_retries = max_retries
-        self._project_types_cache: dict[str, list[str]] = {}
+        self._http: Optional[httpx.AsyncClient] = None
+        self._credential_key = (
+            self.base_url,
+            auth[0],
+            hashlib.sha256(auth[1].encode()).hexdigest(),
+        )
+        # (kind, project_key) -> metadata, e.g. ("statuses", "PROJ")
+        self._metadata_cache: SWRCache[tuple[str, str], Any] = SWRCache(
+            maxsize=MAX_METADATA_ENTRIES,
+            ttl=PROJECT_METADATA_TTL_SECONDS,
+            stale_ttl=PROJECT_METADATA_STALE_SECONDS,
+        )
+        self._user_directory_cache: SWRCache[str, UserDirectory] = SWRCache(
+            maxsize=1,
+            ttl=USER_DIRECTORY_TTL_SECONDS,
+            stale_ttl=USER_DIRECTORY_STALE_SECONDS,
+        )
+        # Results are per client, i.e. per credential set, so currentUser() in a
+        # cached query always refers to the same account
+        self._search_cache = SearchResultCache(
+            maxsize=MAX_CACHED_SEARCHES, ttl=SEARCH_CACHE_TTL_SECONDS
+        )
+        self._search_inflight: dict[Any, asyncio.Future[dict[str, Any]]] = {}
+        self._mirror: Optional[MirrorStore] = None
+        self._mirror_max_age = 0.0
+        self._text_index: Optional[TextIndex] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                auth=self.auth,
+                timeout=self.timeout,
+                headers={"Accept": "application/json"},
+                limits=httpx.Limits(
+                    max_connections=MAX_POOLED_CONNECTIONS,
+                    max_keepalive_connections=MAX_POOLED_CONNECTIONS,
+                ),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _request(
         self,
@@ -70,81 +186,47 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/{api_version}{endpoint}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    auth=self.auth,
-                    params=params,
-                    json=json,
-                    timeout=self.timeout,
-                    headers={"Accept": "application/json"},
+        client = self._get_http_client()
+        try:
+            response = await client.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json,
+            )
+            response.raise_for_status()
+            return response.json() if response.content else {}
+
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            error_text = e.response.text
+            logger.error(f"HTTP error: {status_code}")
+
+            # Map status codes to specific exceptions
+            if status_code == 401:
+                raise AuthenticationError(
+                    "Authentication failed. Check your credentials.",
+                    status_code=status_code,
+                    details=error_text,
                 )
-                response.raise_for_status()
-                return response.json() if response.content else {}
-
-            except httpx.HTTPStatusError as e:
-                status_code = e.response.status_code
-                error_text = e.response.text
-                logger.error(f"HTTP error: {status_code}")
-
-                # Map status codes to specific exceptions
-                if status_code == 401:
-                    raise AuthenticationError(
-                        "Authentication failed. Check your credentials.",
-                        status_code=status_code,
-                        details=error_text,
-                    )
-                elif status_code == 404:
-                    raise TicketNotFoundError(
-                        "Ticket not found or you don't have permission to view it.",
-                        status_code=status_code,
-                        details=error_text,
-                    )
-                elif status_code == 400:
-                    raise ValidationError(
-                        "Invalid request. Check your parameters.",
-                        status_code=status_code,
-                        details=error_text,
-                    )
-                elif status_code == 429:
-                    # Rate limit - retry with exponential backoff
-                    if retry_count < self.max_retries:
-                        wait_time = 2**retry_count  # 1s, 2s, 4s
-                        logger.warning(
-                            f"Rate limit hit on {endpoint}. Retrying in {wait_time}s (attempt {retry_count + 1}/{self.max_retries})"
-                        )
-                        await asyncio.sleep(wait_time)
-                        return await self._request(
-                            method,
-                            endpoint,
-                            params,
-                            json,
-                            retry_count=retry_count + 1,
-                            api_version=api_version,
-                        )
-                    else:
-                        raise RateLimitError(
-                            "Rate limit exceeded. Please try again later.",
-                            status_code=status_code,
-                            details=error_text,
-                        )
-                else:
-                    raise JiraAPIError(
-                        f"Jira API error: {status_code}",
-                        status_code=status_code,
-                        details=error_text,
-                    )
-
-            except httpx.RequestError as e:
-                # Network errors - retry
-                if retry_count < self.max_retries and isinstance(
-                    e, (httpx.ConnectError, httpx.TimeoutException)
-                ):
-                    wait_time = 2**retry_count
+            elif status_code == 404:
+                raise TicketNotFoundError(
+                    "Ticket not found or you don't have permission to view it.",
+                    status_code=status_code,
+                    details=error_text,
+                )
+            elif status_code == 400:
+                raise ValidationError(
+                    "Invalid request. Check your parameters.",
+                    status_code=status_code,
+                    details=error_text,
+                )
+            elif status_code == 429:
+                # Rate limit - retry with exponential backoff
+                if retry_count < self.max_retries:
+                    wait_time = 2**retry_count  # 1s, 2s, 4s
                     logger.warning(
-                        f"Network error on {endpoint}: {type(e).__name__}. Retrying in {wait_time}s (attempt {retry_count + 1}/{self.max_retries})"
+                        f"Rate limit hit on {endpoint}. Retrying in {wait_time}s (attempt {retry_count + 1}/{self.max_retries})"
                     )
                     await asyncio.sleep(wait_time)
                     return await self._request(
@@ -156,54 +238,380 @@ class JiraClient:
                         api_version=api_version,
                     )
                 else:
-                    logger.error(f"Request error: {str(e)}")
-                    raise JiraAPIError(f"Request failed: {str(e)}")
+                    raise RateLimitError(
+                        "Rate limit exceeded. Please try again later.",
+                        status_code=status_code,
+                        details=error_text,
+                    )
+            else:
+                raise JiraAPIError(
+                    f"Jira API error: {status_code}",
+                    status_code=status_code,
+                    details=error_text,
+                )
+
+        except httpx.RequestError as e:
+            # Network errors - retry
+            if retry_count < self.max_retries and isinstance(
+                e, (httpx.ConnectError, httpx.TimeoutException)
+            ):
+                wait_time = 2**retry_count
+                logger.warning(
+                    f"Network error on {endpoint}: {type(e).__name__}. Retrying in {wait_time}s (attempt {retry_count + 1}/{self.max_retries})"
+                )
+                await asyncio.sleep(wait_time)
+                return await self._request(
+                    method,
+                    endpoint,
+                    params,
+                    json,
+                    retry_count=retry_count + 1,
+                    api_version=api_version,
+                )
+            else:
+                logger.error(f"Request error: {str(e)}")
+                raise JiraAPIError(f"Request failed: {str(e)}")
+
+    async def _request_list(self, method: str, endpoint: str, **kwargs: Any) -> list[Any]:
+        """Like :meth:`_request`, for endpoints that answer with a JSON array."""
+        result: Any = await self._request(method, endpoint, **kwargs)
+        return result if isinstance(result, list) else []
+
+    def attach_mirror(self, store: "MirrorStore", max_age: float) -> None:
+        """Answer reads from a local project mirror while it is fresh.
+
+        Args:
+            store: Mirror kept up to date by :class:`..mirror.sync.MirrorSync`
+            max_age: Seconds since a project's last completed sync within which
+                its mirrored issues are served
+        """
+        self._mirror = store
+        self._mirror_max_age = max_age
+
+    @property
+    def mirror(self) -> Optional["MirrorStore"]:
+        """The attached mirror, if any."""
+        return self._mirror
+
+    def attach_text_index(self, text_index: "TextIndex") -> None:
+        """Feed the text of every issue payload fetched from Jira into ``text_index``."""
+        self._text_index = text_index
+
+    @property
+    def text_index(self) -> Optional["TextIndex"]:
+        """The attached full-text index, if any."""
+        return self._text_index
+
+    async def _index_text(self, issues: list[dict[str, Any]]) -> None:
+        if self._text_index is None or not issues:
+            return
+        try:
+            # FTS5 and MinHash updates are CPU and disk work; keep them off the loop
+            await asyncio.to_thread(self._text_index.add_issues, issues)
+        except Exception as e:
+            # The index is an optimisation; never fail the read because of it
+            logger.warning(f"Failed to update the text index: {e}")
+
+    def _mirrored_issue(
+        self, issue_key: str, fields: Optional[list[str]]
+    ) -> Optional[dict[str, Any]]:
+        """Return ``issue_key`` from the mirror if it can answer this read."""
+        mirror = self._mirror
+        if mirror is None or not mirror.covers(fields):
+            return None
+        if not mirror.is_fresh(issue_key.rsplit("-", 1)[0], self._mirror_max_age):
+            return None
+        issue = mirror.get_issue(issue_key)
+        return _select_fields(issue, fields) if issue is not None else None
+
+    async def _mirrored_search(
+        self, jql: str, fields: Optional[list[str]], max_results: int
+    ) -> Optional[dict[str, Any]]:
+        """Answer a search from the mirror, or return None if Jira must answer it."""
+        mirror = self._mirror
+        if mirror is None or not mirror.covers(fields):
+            return None
+        from ..mirror.query import UnsupportedQuery, plan_query, uses_current_user
+
+        try:
+            current_user = await self.get_current_account_id() if uses_current_user(jql) else None
+            plan = plan_query(jql, current_user=current_user)
+        except (UnsupportedQuery, JiraAPIError) as e:
+            logger.debug(f"Searching Jira instead of the mirror: {e}")
+            return None
+        if mirror.has_stale(plan.projects) or not all(
+            mirror.is_fresh(project, self._mirror_max_age) for project in plan.projects
+        ):
+            return None
+
+        issues, total = mirror.search(plan.where, plan.params, plan.order_by, max_results)
+        return {
+            "issues": [_select_fields(issue, fields) for issue in issues],
+            "total": total,
+            "maxResults": max_results,
+        }
 
     async def search_issues(
         self,
         jql: str,
         fields: Optional[list[str]] = None,
         max_results: int = 50,
+        cache: bool = True,
+        expand: Optional[list[str]] = None,
     ) -> dict[str, Any]:
         """Search for issues using JQL.
 
+        Queries the attached mirror can evaluate (see :mod:`..mirror.query`)
+        are answered locally while it is fresh. Other results are cached
+        briefly by (JQL, fields, max_results) and concurrent identical searches
+        share one request. Build queries with
+        :mod:`..utils.jql` so equivalent queries share a cache entry. Writes
+        made through this client invalidate the entries they may affect.
+
         Args:
             jql: JQL query string
             fields: Fields to include in response
             max_results: Maximum results to return
+            cache: Use the result cache and the mirror (bulk crawls pass False)
+            expand: Extra data to include (e.g. ["changelog"]); bypasses the cache
 
         Returns:
             Dict with 'issues' list and 'total' count
         """
+        if not cache or expand:
+            return await self._search(None, jql, fields, max_results, expand)
+
+        mirrored = await self._mirrored_search(jql, fields, max_results)
+        if mirrored is not None:
+            return mirrored
+
+        key = self._search_cache.make_key(jql, fields, max_results)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Search cache hit: {jql}")
+            return cached
+
+        inflight = self._search_inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._search(key, jql, fields, max_results))
+            self._search_inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._search_inflight.pop(key, None))
+        result = await asyncio.shield(inflight)
+        return {**result, "issues": list(result.get("issues", []))}
+
+    async def _search(
+        self,
+        key: Any,
+        jql: str,
+        fields: Optional[list[str]],
+        max_results: int,
+        expand: Optional[list[str]] = None,
+        page_token: Optional[str] = None,
+    ) -> dict[str, Any]:
         body: dict[str, Any] = {
             "jql": jql,
             "maxResults": max_results,
         }
-        if fields:
-            body["fields"] = fields
+        if page_token:
+            body["nextPageToken"] = page_token
+        if fields is not None:
+            # An empty projection still has to be sent, or Jira returns its defaults
+            body["fields"] = fields or ["key"]
+        if expand:
+            body["expand"] = ",".join(expand)
 
         logger.info(f"Searching issues with JQL: {jql}")
 
+        generation = self._search_cache.generation
         result = await self._request("POST", "/search/jql", json=body, api_version=3)
         if "total" not in result:
             result["total"] = len(result.get("issues", []))
+        await self._index_text(result.get("issues", []))
+        if key is not None:
+            self._search_cache.put(key, result, generation)
         return result
 
+    def _issue_created(self, issue_key: Optional[str], fields: dict[str, Any]) -> None:
+        """Invalidate cached data a new issue may be missing from."""
+        # A new issue can match any cached query
+        self._search_cache.clear()
+        if self._mirror is not None and issue_key:
+            self._mirror.mark_created(issue_key, fields)
+
+    def _issue_written(self, issue_key: str, changed_fields: set[str]) -> None:
+        """Invalidate cached data a write to ``issue_key`` may have made stale."""
+        self._search_cache.invalidate_issue(issue_key, changed_fields | _WRITE_FIELDS)
+        if self._mirror is not None:
+            self._mirror.mark_stale(issue_key)
+
     async def get_issue(
         self,
         issue_key: str,
         fields: Optional[list[str]] = None,
         expand: Optional[list[str]] = None,
     ) -> dict[str, Any]:
-        """Get a single issue by key."""
+        """Get a single issue by key.
+
+        Served from the attached mirror when it is fresh, holds every requested
+        field and no ``expand`` is needed.
+        """
+        if not expand:
+            mirrored = self._mirrored_issue(issue_key, fields)
+            if mirrored is not None:
+                logger.debug(f"Serving {issue_key} from the mirror")
+                return mirrored
+
         params: dict[str, Any] = {}
-        if fields:
-            params["fields"] = ",".join(fields)
+        if fields is not None:
+            params["fields"] = ",".join(fields or ["key"])
         if expand:
             params["expand"] = ",".join(expand)
 
         logger.info(f"Fetching issue: {issue_key}")
-        return await self._request("GET", f"/issue/{issue_key}", params=params)
+        issue = await self._request("GET", f"/issue/{issue_key}", params=params)
+        await self._index_text([issue])
+        return issue
+
+    async def get_issues(
+        self,
+        issue_keys: list[str],
+        fields: Optional[list[str]] = None,
+        batch_size: int = ISSUE_BATCH_SIZE,
+    ) -> list[dict[str, Any]]:
+        """Get many issues with batched ``key IN (...)`` searches.
+
+        Batches run concurrently (at most :data:`ISSUE_BATCH_CONCURRENCY` at a
+        time). Keys that do not exist or are not visible are left out.
+
+        Args:
+            issue_keys: Issue keys; duplicates are fetched once
+            fields: Fields to include in each issue
+            batch_size: Keys per search request
+
+        Returns:
+            Issues in the order of ``issue_keys``, followed by any issues Jira
+            returned under another key (issues moved to a new key)
+        """
+        keys = list(dict.fromkeys(key.upper() for key in issue_keys))
+        semaphore = asyncio.Semaphore(ISSUE_BATCH_CONCURRENCY)
+
+        async def fetch(batch: list[str]) -> list[dict[str, Any]]:
+            # Jira rejects the whole search if one key is missing or hidden:
+            # retry without the keys it names, or key by key if it names none
+            while batch:
+                jql = str(Query(Clause("key", "in", tuple(batch))))
+                try:
+                    async with semaphore:
+                        result = await self.search_issues(
+                            jql, fields=fields, max_results=len(batch)
+                        )
+                except ValidationError as e:
+                    rejected = {key.upper() for key in _REJECTED_ISSUE_KEY.findall(e.details or "")}
+                    remaining = [key for key in batch if key not in rejected]
+                    if len(remaining) < len(batch):
+                        batch = remaining
+                        continue
+                    if len(batch) == 1:
+                        raise
+                    singles = await asyncio.gather(
+                        *(fetch([key]) for key in batch), return_exceptions=True
+                    )
+                    for outcome in singles:
+                        if isinstance(outcome, BaseException) and not isinstance(
+                            outcome, ValidationError
+                        ):
+                            raise outcome
+                    fetched = [issues for issues in singles if isinstance(issues, list)]
+                    if not fetched:
+                        # Every key rejected on its own: the request itself is wrong
+                        raise
+                    return [issue for issues in fetched for issue in issues]
+                return result.get("issues", [])
+            return []
+
+        batches = [keys[i : i + batch_size] for i in range(0, len(keys), batch_size)]
+        found: dict[str, dict[str, Any]] = {}
+        for issues in await asyncio.gather(*(fetch(batch) for batch in batches)):
+            for issue in issues:
+                found[issue.get("key", "").upper()] = issue
+        requested = set(keys)
+        moved = [issue for key, issue in found.items() if key not in requested]
+        return [found[key] for key in keys if key in found] + moved
+
+    async def search_all(
+        self,
+        where: Optional[Node],
+        fields: Optional[list[str]] = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+        max_issues: Optional[int] = None,
+        expand: Optional[list[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """Return every issue matching ``where``, following Jira's ``nextPageToken``.
+
+        Pages are ordered by key, like the mirror sync. Paging with the token
+        rather than ``key >`` cursors stays correct across projects, where key
+        order and key comparison disagree. Pages bypass the result cache.
+
+        Args:
+            where: Condition to match
+            fields: Fields to include in each issue
+            page_size: Issues per search request
+            max_issues: Stop after this many issues
+            expand: Extra data to include with each issue (e.g. ["changelog"])
+        """
+        jql = str(Query(where, order_by=(("key", "ASC"),)))
+        issues: list[dict[str, Any]] = []
+        page_token: Optional[str] = None
+        while max_issues is None or len(issues) < max_issues:
+            limit = page_size if max_issues is None else min(page_size, max_issues - len(issues))
+            result = await self._search(None, jql, fields, limit, expand, page_token)
+            page = result.get("issues", [])
+            issues.extend(page)
+            page_token = result.get("nextPageToken")
+            if not page or not page_token or result.get("isLast"):
+                break
+        return issues
+
+    async def get_changelog(self, issue_key: str, start_at: int = 0) -> list[dict[str, Any]]:
+        """Return an issue's changelog histories from ``start_at`` on, oldest first.
+
+        Searches with ``expand=["changelog"]`` embed only the first entries of
+        long changelogs; this pages through ``/issue/{key}/changelog`` for the rest.
+        """
+        histories: list[dict[str, Any]] = []
+        while True:
+            result = await self._request(
+                "GET",
+                f"/issue/{issue_key}/changelog",
+                params={"startAt": start_at, "maxResults": CHANGELOG_PAGE_SIZE},
+            )
+            page = result.get("values", [])
+            histories.extend(page)
+            start_at += len(page)
+            if not page or result.get("isLast") or start_at >= result.get("total", start_at):
+                return histories
+
+    async def complete_changelogs(self, issues: list[dict[str, Any]]) -> None:
+        """Fetch the full changelog of every issue whose embedded one was truncated.
+
+        Updates ``issue["changelog"]["histories"]`` in place. Fetches run
+        concurrently, at most :data:`ISSUE_BATCH_CONCURRENCY` at a time.
+        """
+        semaphore = asyncio.Semaphore(ISSUE_BATCH_CONCURRENCY)
+
+        async def complete(issue: dict[str, Any]) -> None:
+            changelog = issue["changelog"]
+            async with semaphore:
+                changelog["histories"] = await self.get_changelog(issue["key"])
+            changelog["maxResults"] = changelog["total"] = len(changelog["histories"])
+
+        truncated = [
+            issue
+            for issue in issues
+            if len((issue.get("changelog") or {}).get("histories", []))
+            < (issue.get("changelog") or {}).get("total", 0)
+        ]
+        await asyncio.gather(*(complete(issue) for issue in truncated))
 
     async def update_issue(
         self,
@@ -217,6 +625,7 @@ class JiraClient:
             f"/issue/{issue_key}",
             json={"fields": fields},
         )
+        self._issue_written(issue_key, set(fields))
 
     async def get_transitions(self, issue_key: str) -> list[dict[str, Any]]:
         """Get available transitions for an issue."""
@@ -236,6 +645,10 @@ class JiraClient:
 
         logger.info(f"Transitioning issue {issue_key} to transition {transition_id}")
         await self._request("POST", f"/issue/{issue_key}/transitions", json=payload)
+        changed = {"status", "resolution", "resolutiondate"}
+        if comment:
+            changed.add("comment")
+        self._issue_written(issue_key, changed)
 
     async def add_comment(
         self,
@@ -244,11 +657,82 @@ class JiraClient:
     ) -> dict[str, Any]:
         """Add comment to an issue."""
         logger.info(f"Adding comment to issue: {issue_key}")
-        return await self._request(
+        result = await self._request(
             "POST",
             f"/issue/{issue_key}/comment",
             json={"body": comment},
         )
+        self._issue_written(issue_key, {"comment"})
+        return result
+
+    async def get_comments(
+        self,
+        issue_key: str,
+        start_at: int = 0,
+        max_results: int = 50,
+        order_by: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Get one page of comments from the paginated comment endpoint.
+
+        Args:
+            issue_key: Issue key
+            start_at: Index of the first comment to return
+            max_results: Page size
+            order_by: Sort order, e.g. "created" or "-created" (Jira default: created)
+
+        Returns:
+            Dict with 'comments' list plus 'startAt', 'maxResults' and 'total'
+        """
+        params: dict[str, Any] = {"startAt": start_at, "maxResults": max_results}
+        if order_by:
+            params["orderBy"] = order_by
+
+        logger.info(f"Fetching comments for {issue_key} (startAt={start_at})")
+        return await self._request("GET", f"/issue/{issue_key}/comment", params=params)
+
+    async def iter_comments(
+        self,
+        issue_key: str,
+        order: str = "created",
+        since: Optional[datetime] = None,
+        page_size: int = 50,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream an issue's comments page by page from the comment endpoint.
+
+        Pages are only requested as the caller consumes them, so breaking out of
+        the loop early avoids downloading the rest of the discussion.
+
+        Args:
+            issue_key: Issue key
+            order: "created" (oldest first) or "-created" (newest first)
+            since: Only yield comments created at or after this time. With
+                newest-first ordering, iteration stops at the first older comment.
+            page_size: Comments requested per page
+
+        Yields:
+            Raw comment dicts as returned by Jira
+        """
+        newest_first = order.startswith("-")
+        start_at = 0
+
+        while True:
+            page = await self.get_comments(
+                issue_key, start_at=start_at, max_results=page_size, order_by=order
+            )
+            comments = page.get("comments", [])
+
+            for comment in comments:
+                if since is not None:
+                    created = comment.get("created")
+                    if created and parse_jira_datetime(created) < since:
+                        if newest_first:
+                            return
+                        continue
+                yield comment
+
+            start_at += len(comments)
+            if not comments or start_at >= page.get("total", 0):
+                return
 
     async def create_issue(
         self,
@@ -298,6 +782,11 @@ class JiraClient:
             fields["parent"] = {"key": parent_key}
 
         result = await self._request("POST", "/issue", json={"fields": fields})
+        self._issue_created(result.get("key"), {"parent": fields.get("parent")})
+        if result.get("key"):
+            await self._index_text(
+                [{"key": result["key"], "fields": {"summary": summary, "description": description}}]
+            )
         logger.info(f"Created issue: {result.get('key')}")
         return result
 
@@ -358,6 +847,12 @@ class JiraClient:
             fields["priority"] = {"name": priority}
 
         result = await self._request("POST", "/issue", json={"fields": fields})
+        self._issue_created(
+            result.get("key"), {"parent": {"key": parent_key}, "issuetype": {"subtask": True}}
+        )
+        if self._mirror is not None:
+            # The parent's list of subtasks changed too
+            self._mirror.mark_stale(parent_key)
         logger.info(f"Created subtask: {result.get('key')}")
         return result
 
@@ -418,7 +913,10 @@ class JiraClient:
         if comment:
             payload["comment"] = {"body": comment}
 
-        return await self._request("POST", "/issueLink", json=payload)
+        result = await self._request("POST", "/issueLink", json=payload)
+        self._issue_written(inward_issue, {"issuelinks"})
+        self._issue_written(outward_issue, {"issuelinks", "comment"} if comment else {"issuelinks"})
+        return result
 
     async def assign_issue(
         self,
@@ -444,6 +942,7 @@ class JiraClient:
             f"/issue/{issue_key}/assignee",
             json=payload,
         )
+        self._issue_written(issue_key, {"assignee"})
 
     async def search_users(
         self,
@@ -472,6 +971,87 @@ class JiraClient:
         logger.info(f"Found {len(result)} users")
         return result if isinstance(result, list) else []
 
+    async def _load_user_directory(self) -> UserDirectory:
+        """Page through ``/users/search`` into a fresh directory.
+
+        Instances without the endpoint (or with restricted user browsing) yield
+        an incomplete directory that is filled from individual searches instead.
+        """
+        directory = UserDirectory()
+        start_at = 0
+        try:
+            while True:
+                page = await self._request(
+                    "GET",
+                    "/users/search",
+                    params={"startAt": start_at, "maxResults": USER_PAGE_SIZE},
+                )
+                if not isinstance(page, list) or not page:
+                    break
+                directory.add(page)
+                start_at += len(page)
+                if len(page) < USER_PAGE_SIZE:
+                    break
+        except JiraAPIError as e:
+            logger.warning(f"Could not list users, falling back to per-query search: {e}")
+            return directory
+
+        directory.complete = True
+        logger.info(f"Loaded {len(directory)} users into the user directory")
+        return directory
+
+    async def get_user_directory(self) -> UserDirectory:
+        """Return the cached user directory, loading or refreshing it as needed."""
+        return await self._user_directory_cache.get_or_load("users", self._load_user_directory)
+
+    async def find_users(self, query: str = "", max_results: int = 50) -> list[dict[str, Any]]:
+        """Find users by display name, email or accountId prefix.
+
+        Answered from the local user directory; only falls back to
+        ``/user/search`` when the directory is incomplete and has no match.
+        Remote results are added to the directory for next time.
+
+        Args:
+            query: Case-insensitive prefix (empty lists users)
+            max_results: Maximum number of results
+
+        Returns:
+            List of user data
+        """
+        directory = await self.get_user_directory()
+        users = directory.search(query, limit=max_results)
+        if users or directory.complete:
+            return users
+
+        # Jira requires a query parameter - "." matches most users
+        users = await self.search_users(query=query or ".", max_results=max_results)
+        directory.add(users)
+        return users
+
+    async def resolve_account_id(self, identifier: str) -> str:
+        """Resolve an accountId, email or display name to an accountId.
+
+        Unknown identifiers are passed through unchanged so that Jira can
+        validate them (e.g. accountIds of users hidden from user browsing).
+
+        Raises:
+            ValueError: When the identifier matches more than one user
+        """
+        directory = await self.get_user_directory()
+        matches = directory.resolve(identifier)
+        if not matches and not directory.complete:
+            found = await self.search_users(query=identifier, max_results=10)
+            directory.add(found)
+            matches = directory.resolve(identifier)
+
+        if len(matches) > 1:
+            candidates = [f"{u.get('displayName')} <{u.get('emailAddress')}>" for u in matches]
+            raise ValueError(
+                f"Ambiguous user '{identifier}'. Matches: {candidates}. "
+                "Please specify an email or accountId."
+            )
+        return matches[0]["accountId"] if matches else identifier
+
     async def delete_issue(
         self,
         issue_key: str,
@@ -493,23 +1073,100 @@ class JiraClient:
             params["deleteSubtasks"] = "true"
 
         await self._request("DELETE", f"/issue/{issue_key}", params=params)
+        if delete_subtasks:
+            self._search_cache.clear()
+        else:
+            # Deleting can only remove the issue from result sets
+            self._search_cache.invalidate_issue(issue_key, ())
+        deleted = [issue_key]
+        if self._mirror is not None:
+            deleted = self._mirror.delete_issue(issue_key, subtasks=delete_subtasks)
+        if self._text_index is not None:
+            for key in deleted:
+                await asyncio.to_thread(self._text_index.delete_issue, key)
 
     async def get_project_issue_types(self, project_key: str) -> list[str]:
         """Return the issue type names available in a project (cached per project)."""
-        if project_key in self._project_types_cache:
-            return self._project_types_cache[project_key]
 
-        statuses = await self.get_project_statuses(project_key)
-        types = list(statuses.get("by_issue_type", {}).keys())
-        self._project_types_cache[project_key] = types
-        logger.info(f"Project {project_key} issue types: {types}")
-        return types
+        async def load() -> list[str]:
+            statuses = await self.get_project_statuses(project_key)
+            types = list(statuses.get("by_issue_type", {}).keys())
+            logger.info(f"Project {project_key} issue types: {types}")
+            return types
+
+        return await self._metadata_cache.get_or_load(("issue_types", project_key), load)
+
+    async def _issue_type_index(self, project_key: str) -> NameIndex:
+        async def load() -> NameIndex:
+            return NameIndex(await self.get_project_issue_types(project_key))
+
+        return await self._metadata_cache.get_or_load(("issue_type_index", project_key), load)
+
+    async def _status_index(self, project_key: str) -> NameIndex:
+        async def load() -> NameIndex:
+            statuses = await self.get_project_statuses(project_key)
+            return NameIndex(statuses.get("unique_statuses", []))
+
+        return await self._metadata_cache.get_or_load(("status_index", project_key), load)
+
+    async def _priority_index(self) -> NameIndex:
+        async def load() -> NameIndex:
+            return NameIndex(await self.get_priorities())
+
+        return await self._metadata_cache.get_or_load(("priority_index", ""), load)
+
+    async def _link_type_index(self) -> tuple[NameIndex, dict[str, str]]:
+        """Return the link type name index and the link type name by normalized inward phrase.
+
+        Inward descriptions ("is blocked by") are kept out of the name index for
+        directed link types, since they describe the link from the other side.
+        """
+
+        async def load() -> tuple[NameIndex, dict[str, str]]:
+            link_types = await self.get_issue_link_types()
+            aliases: dict[str, list[str]] = {}
+            inward: dict[str, str] = {}
+            for link_type in link_types:
+                name = link_type["name"]
+                inward_phrase = link_type.get("inward") or ""
+                outward_phrase = link_type.get("outward") or ""
+                aliases[name] = [outward_phrase]
+                if normalize_name(inward_phrase) == normalize_name(outward_phrase):
+                    continue
+                for phrase in (inward_phrase, *INWARD_SYNONYMS.get(normalize_name(name), ())):
+                    inward.setdefault(normalize_name(phrase), name)
+            return NameIndex([link_type["name"] for link_type in link_types], aliases), inward
+
+        return await self._metadata_cache.get_or_load(("link_type_index", ""), load)
+
+    @staticmethod
+    def _resolve_name(index: NameIndex, requested: str, label: str, scope: str = "") -> str:
+        """Resolve ``requested`` through ``index``, raising on ambiguity or no match."""
+        if not index.names:
+            raise ValueError(f"No {label}s found{scope}.")
+
+        matches = index.lookup(requested)
+
+        if len(matches) == 1:
+            return matches[0]
+
+        if len(matches) > 1:
+            raise ValueError(
+                f"Ambiguous {label} '{requested}'{scope}. "
+                f"Matches: {matches}. Please specify exactly."
+            )
+
+        raise ValueError(
+            f"{label.capitalize()} '{requested}' not found{scope}. "
+            f"Available {label}s: {index.names}."
+        )
 
     async def resolve_issue_type(self, requested_type: str, project_key: str) -> str:
         """Resolve a user-provided issue type name against the project's actual types.
 
-        Tries exact match (case-insensitive) first, then falls back to single
-        substring match, and raises on ambiguity or no match.
+        Uses the project's precomputed name index: exact (case- and
+        punctuation-insensitive) match first, then aliases such as "defect" for
+        "Bug", then a single substring match, then the closest spelling.
 
         Args:
             requested_type: The type name the caller asked for (e.g. "epic",
@@ -522,42 +1179,112 @@ class JiraClient:
         Raises:
             ValueError: When the name is ambiguous or unknown in the project.
         """
-        project_types = await self.get_project_issue_types(project_key)
+        index = await self._issue_type_index(project_key)
+        return self._resolve_name(index, requested_type, "issue type", f" in project {project_key}")
 
-        if not project_types:
-            raise ValueError(f"No issue types found in project {project_key}.")
+    async def resolve_status(self, requested_status: str, project_key: str) -> str:
+        """Resolve a user-provided status name against the project's workflow statuses.
 
-        requested_lower = requested_type.lower()
+        Raises:
+            ValueError: When the name is ambiguous or unknown in the project.
+        """
+        index = await self._status_index(project_key)
+        return self._resolve_name(index, requested_status, "status", f" in project {project_key}")
 
-        for t in project_types:
-            if t.lower() == requested_lower:
-                return t
+    async def resolve_priority(self, requested_priority: str) -> str:
+        """Resolve a user-provided priority name (e.g. "critical") to the instance's priority.
 
-        matches = [t for t in project_types if requested_lower in t.lower()]
+        When the priorities cannot be loaded or none matches, the name is
+        passed through unchanged for Jira to validate.
 
-        if len(matches) == 1:
-            return matches[0]
+        Raises:
+            ValueError: When the name is ambiguous.
+        """
+        try:
+            index = await self._priority_index()
+        except JiraAPIError as e:
+            logger.warning(f"Could not load priorities, using '{requested_priority}' as given: {e}")
+            return requested_priority
+        if not index.lookup(requested_priority):
+            return requested_priority
+        return self._resolve_name(index, requested_priority, "priority")
+
+    async def resolve_link_type(self, requested_link_type: str) -> tuple[str, bool]:
+        """Resolve a link type name or its inward/outward description (e.g. "is blocked by").
 
-        if len(matches) > 1:
-            raise ValueError(
-                f"Ambiguous issue type '{requested_type}' in project {project_key}. "
-                f"Matches: {matches}. Please specify exactly."
-            )
+        Returns:
+            Tuple of (link type name, whether an inward description matched). An
+            inward match names the link from the inward issue's side, so the
+            caller must swap the inward and outward issues.
 
-        raise ValueError(
-            f"Issue type '{requested_type}' not found in project {project_key}. "
-            f"Available types: {project_types}."
-        )
+        Raises:
+            ValueError: When the name is ambiguous or unknown.
+        """
+        index, inward = await self._link_type_index()
+        name = inward.get(normalize_name(requested_link_type))
+        if name:
+            return name, True
+        return self._resolve_name(index, requested_link_type, "link type"), False
+
+    async def get_priorities(self) -> list[str]:
+        """Return the priority names configured on the instance (cached)."""
+
+        async def load() -> list[str]:
+            priorities = await self._request_list("GET", "/priority")
+            return [priority["name"] for priority in priorities]
+
+        return await self._metadata_cache.get_or_load(("priorities", ""), load)
+
+    async def get_project_keys(self) -> list[str]:
+        """Return the keys of the projects visible to the user (cached)."""
+
+        async def load() -> list[str]:
+            projects = await self._request_list("GET", "/project")
+            return [project["key"] for project in projects]
+
+        return await self._metadata_cache.get_or_load(("project_keys", ""), load)
+
+    async def get_status_categories(self) -> dict[str, str]:
+        """Return the status category key ("new", "indeterminate", "done") by status id (cached)."""
+
+        async def load() -> dict[str, str]:
+            statuses = await self._request_list("GET", "/status")
+            return {
+                str(status["id"]): (status.get("statusCategory") or {}).get("key", "new")
+                for status in statuses
+            }
+
+        return await self._metadata_cache.get_or_load(("status_categories", ""), load)
+
+    async def get_issue_link_types(self) -> list[dict[str, Any]]:
+        """Return the issue link types (name, inward, outward) on the instance (cached)."""
+
+        async def load() -> list[dict[str, Any]]:
+            result = await self._request("GET", "/issueLinkType")
+            return result.get("issueLinkTypes", [])
+
+        return await self._metadata_cache.get_or_load(("link_types", ""), load)
 
     async def get_project_statuses(self, project_key: str) -> dict[str, Any]:
         """Get all available statuses for a project.
 
+        Served from the metadata cache; stale entries are returned immediately
+        and refreshed in the background so workflow changes show up without a
+        restart.
+
         Args:
             project_key: Project key (e.g., "SWI")
 
         Returns:
             Dict with statuses by issue type
         """
+        return await self._metadata_cache.get_or_load(
+            ("statuses", project_key),
+            lambda: self._fetch_project_statuses(project_key),
+        )
+
+    async def _fetch_project_statuses(self, project_key: str) -> dict[str, Any]:
+        """Fetch and summarise a project's statuses from the API."""
         logger.info(f"Getting statuses for project: {project_key}")
 
         result = await self._request("GET", f"/project/{project_key}/statuses")
@@ -584,6 +1311,54 @@ class JiraClient:
 
         return {
             "project": project_key,
-            "unique_statuses": sorted(list(all_statuses)),
+            "unique_statuses": sorted(all_statuses),
             "by_issue_type": statuses_by_type,
         }
+
+    async def get_current_user(self) -> dict[str, Any]:
+        """Return the authenticated user (``/myself``), cached per credential set."""
+        user = _identity_cache.get(self._credential_key)
+        if user is None:
+            logger.info("Fetching current user")
+            user = await self._request("GET", "/myself")
+            _identity_cache.set(self._credential_key, user)
+        return user
+
+    async def get_current_account_id(self) -> Optional[str]:
+        """Return the authenticated user's accountId (``None`` on Jira Server/DC)."""
+        return (await self.get_current_user()).get("accountId")
+
+    async def check_connection(self) -> dict[str, Any]:
+        """Verify the credentials by resolving the current user.
+
+        Returns:
+            Dict with success status and the user's display name or an error
+        """
+        try:
+            user = await self.get_current_user()
+        except AuthenticationError as e:
+            return {
+                "success": False,
+                "error": f"Authentication failed (HTTP {e.status_code})",
+            }
+        except Exception as e:
+            logger.error(f"Connection test failed: {e}")
+            return {"success": False, "error": str(e)}
+        return {"success": True, "user": user.get("displayName", self.auth[0])}
+
+    async def warm_up(self, project_key: Optional[str] = None) -> None:
+        """Open pooled connections and preload metadata used by the first tool calls.
+
+        Resolves the current user and, when a project is given, its statuses and
+        issue types, concurrently. Failures are logged and swallowed: warm-up is
+        an optimisation and the real tool call will surface any error.
+        """
+        tasks: list[Coroutine[Any, Any, Any]] = [self.get_current_user()]
+        if project_key:
+            tasks.append(self.get_project_issue_types(project_key))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Warm-up request failed: {result}")
+        logger.info("Jira client warm-up complete")
@@ -3,48 +3,112 @@
 from mcp.server import Server, InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, ServerCapabilities, ToolsCapability
+from typing import Any, Awaitable, Callable
+import asyncio
+import importlib
 import logging
+import os
 
-from ..tools import (
-    LIST_MY_TICKETS_TOOL,
-    LIST_TICKETS_TOOL,
-    GET_TICKET_TOOL,
-    GET_HIGHEST_PRIORITY_TICKET_TOOL,
-    ANALYZE_TICKET_TOOL,
-    UPDATE_TICKET_STATUS_TOOL,
-    ADD_TICKET_COMMENT_TOOL,
-    UPDATE_TICKET_DESCRIPTION_TOOL,
-    CREATE_ISSUE_TOOL,
-    CREATE_SUBTASK_TOOL,
-    GET_SUBTASKS_TOOL,
-    ASSIGN_ISSUE_TOOL,
-    LIST_USERS_TOOL,
-    LIST_TICKETS_BY_CREATOR_TOOL,
-    LINK_ISSUES_TOOL,
-    DELETE_ISSUE_TOOL,
-    GET_PROJECT_STATUSES_TOOL,
-    handle_list_my_tickets,
-    handle_list_tickets,
-    handle_get_ticket,
-    handle_get_highest_priority_ticket,
-    handle_analyze_ticket,
-    handle_update_ticket_status,
-    handle_add_ticket_comment,
-    handle_update_ticket_description,
-    handle_create_issue,
-    handle_create_subtask,
-    handle_get_subtasks,
-    handle_assign_issue,
-    handle_list_users,
-    handle_list_tickets_by_creator,
-    handle_link_issues,
-    handle_delete_issue,
-    handle_get_project_statuses,
-)
 from .jira_client import JiraClient
 
 logger = logging.getLogger(__name__)
 
+ToolHandler = Callable[[dict[str, Any], JiraClient], Awaitable[list[TextContent]]]
+
+# Tool name -> (module in jira_mcp_cursor.tools, Tool definition, handler), in the
+# order tools are listed. Tool modules are imported on first use so that the
+# server reaches the MCP handshake without loading every tool.
+TOOL_REGISTRY: dict[str, tuple[str, str, str]] = {
+    # Read operations
+    "list_my_tickets": ("list_tickets", "LIST_MY_TICKETS_TOOL", "handle_list_my_tickets"),
+    "list_tickets": ("list_tickets", "LIST_TICKETS_TOOL", "handle_list_tickets"),
+    "list_tickets_by_creator": (
+        "create_ticket",
+        "LIST_TICKETS_BY_CREATOR_TOOL",
+        "handle_list_tickets_by_creator",
+    ),
+    "get_ticket": ("get_ticket", "GET_TICKET_TOOL", "handle_get_ticket"),
+    "get_highest_priority_ticket": (
+        "get_ticket",
+        "GET_HIGHEST_PRIORITY_TICKET_TOOL",
+        "handle_get_highest_priority_ticket",
+    ),
+    "get_ticket_comments": (
+        "get_ticket",
+        "GET_TICKET_COMMENTS_TOOL",
+        "handle_get_ticket_comments",
+    ),
+    "get_subtasks": ("create_ticket", "GET_SUBTASKS_TOOL", "handle_get_subtasks"),
+    "list_users": ("create_ticket", "LIST_USERS_TOOL", "handle_list_users"),
+    "get_project_statuses": (
+        "create_ticket",
+        "GET_PROJECT_STATUSES_TOOL",
+        "handle_get_project_statuses",
+    ),
+    "search_text": ("search_text", "SEARCH_TEXT_TOOL", "handle_search_text"),
+    "find_similar_tickets": (
+        "find_similar",
+        "FIND_SIMILAR_TICKETS_TOOL",
+        "handle_find_similar_tickets",
+    ),
+    # Analysis
+    "analyze_ticket": ("analyze_ticket", "ANALYZE_TICKET_TOOL", "handle_analyze_ticket"),
+    "analyze_tickets": ("analyze_ticket", "ANALYZE_TICKETS_TOOL", "handle_analyze_tickets"),
+    "dependency_graph": (
+        "dependency_graph",
+        "DEPENDENCY_GRAPH_TOOL",
+        "handle_dependency_graph",
+    ),
+    "epic_critical_path": (
+        "critical_path",
+        "EPIC_CRITICAL_PATH_TOOL",
+        "handle_epic_critical_path",
+    ),
+    "get_epic_tree": ("epic_tree", "GET_EPIC_TREE_TOOL", "handle_get_epic_tree"),
+    "project_flow_metrics": (
+        "flow_metrics",
+        "PROJECT_FLOW_METRICS_TOOL",
+        "handle_project_flow_metrics",
+    ),
+    # Create operations
+    "create_issue": ("create_ticket", "CREATE_ISSUE_TOOL", "handle_create_issue"),
+    "create_subtask": ("create_ticket", "CREATE_SUBTASK_TOOL", "handle_create_subtask"),
+    # Update operations
+    "update_ticket_status": (
+        "update_ticket",
+        "UPDATE_TICKET_STATUS_TOOL",
+        "handle_update_ticket_status",
+    ),
+    "update_ticket_description": (
+        "update_ticket",
+        "UPDATE_TICKET_DESCRIPTION_TOOL",
+        "handle_update_ticket_description",
+    ),
+    "add_ticket_comment": (
+        "update_ticket",
+        "ADD_TICKET_COMMENT_TOOL",
+        "handle_add_ticket_comment",
+    ),
+    "assign_issue": ("create_ticket", "ASSIGN_ISSUE_TOOL", "handle_assign_issue"),
+    "link_issues": ("link_issues", "LINK_ISSUES_TOOL", "handle_link_issues"),
+    # Delete operations
+    "delete_issue": ("create_ticket", "DELETE_ISSUE_TOOL", "handle_delete_issue"),
+}
+
+
+def load_tool(name: str) -> tuple[Tool, ToolHandler]:
+    """Import a tool's module on demand and return its definition and handler.
+
+    Raises:
+        ValueError: If the tool name is not registered
+    """
+    if name not in TOOL_REGISTRY:
+        raise ValueError(f"Unknown tool: {name}")
+    module_name, tool_attr, handler_attr = TOOL_REGISTRY[name]
+    module = importlib.import_module(f"..tools.{module_name}", __package__)
+    return getattr(module, tool_attr), getattr(module, handler_attr)
+
+
 # Create server instance
 app = Server("jira-mcp-server")
 
@@ -56,10 +120,9 @@ def get_jira_client() -> JiraClient:
     """Get or create Jira client instance."""
     global _jira_client
     if _jira_client is None:
-        # Reload settings to pick up env vars set in CLI
-        from ..config.settings import Settings
+        from ..config.settings import get_settings
 
-        current_settings = Settings()
+        current_settings = get_settings()
 
         _jira_client = JiraClient(
             base_url=current_settings.jira_url,
@@ -73,30 +136,7 @@ def get_jira_client() -> JiraClient:
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List available MCP tools."""
-    return [
-        # Read operations
-        LIST_MY_TICKETS_TOOL,
-        LIST_TICKETS_TOOL,
-        LIST_TICKETS_BY_CREATOR_TOOL,
-        GET_TICKET_TOOL,
-        GET_HIGHEST_PRIORITY_TICKET_TOOL,
-        GET_SUBTASKS_TOOL,
-        LIST_USERS_TOOL,
-        GET_PROJECT_STATUSES_TOOL,
-        # Analysis
-        ANALYZE_TICKET_TOOL,
-        # Create operations
-        CREATE_ISSUE_TOOL,
-        CREATE_SUBTASK_TOOL,
-        # Update operations
-        UPDATE_TICKET_STATUS_TOOL,
-        UPDATE_TICKET_DESCRIPTION_TOOL,
-        ADD_TICKET_COMMENT_TOOL,
-        ASSIGN_ISSUE_TOOL,
-        LINK_ISSUES_TOOL,
-        # Delete operations
-        DELETE_ISSUE_TOOL,
-    ]
+    return [load_tool(name)[0] for name in TOOL_REGISTRY]
 
 
 @app.call_tool()
@@ -106,48 +146,8 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
     try:
         client = get_jira_client()
-
-        # Read operations
-        if name == "list_my_tickets":
-            return await handle_list_my_tickets(arguments, client)
-        elif name == "list_tickets":
-            return await handle_list_tickets(arguments, client)
-        elif name == "list_tickets_by_creator":
-            return await handle_list_tickets_by_creator(arguments, client)
-        elif name == "get_ticket":
-            return await handle_get_ticket(arguments, client)
-        elif name == "get_highest_priority_ticket":
-            return await handle_get_highest_priority_ticket(arguments, client)
-        elif name == "get_subtasks":
-            return await handle_get_subtasks(arguments, client)
-        elif name == "list_users":
-            return await handle_list_users(arguments, client)
-        elif name == "get_project_statuses":
-            return await handle_get_project_statuses(arguments, client)
-        # Analysis
-        elif name == "analyze_ticket":
-            return await handle_analyze_ticket(arguments, client)
-        # Create operations
-        elif name == "create_issue":
-            return await handle_create_issue(arguments, client)
-        elif name == "create_subtask":
-            return await handle_create_subtask(arguments, client)
-        # Update operations
-        elif name == "update_ticket_status":
-            return await handle_update_ticket_status(arguments, client)
-        elif name == "update_ticket_description":
-            return await handle_update_ticket_description(arguments, client)
-        elif name == "add_ticket_comment":
-            return await handle_add_ticket_comment(arguments, client)
-        elif name == "assign_issue":
-            return await handle_assign_issue(arguments, client)
-        elif name == "link_issues":
-            return await handle_link_issues(arguments, client)
-        # Delete operations
-        elif name == "delete_issue":
-            return await handle_delete_issue(arguments, client)
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+        _, handler = load_tool(name)
+        return await handler(arguments, client)
     except Exception as e:
         logger.error(f"Error executing tool {name}: {str(e)}")
         error_detail: dict[str, object] = {
@@ -167,10 +167,10 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 async def run() -> None:
     """Run the MCP server."""
-    # Reload settings to pick up env vars
-    from ..config.settings import Settings
+    # Reload settings to pick up env vars set in CLI
+    from ..config.settings import reload_settings
 
-    current_settings = Settings()
+    current_settings = reload_settings()
 
     # Configure logging
     logging.basicConfig(
@@ -182,13 +182,68 @@ async def run() -> None:
     logger.info(f"Jira URL: {current_settings.jira_url}")
     logger.info(f"Auth mode: {'Cloud' if current_settings.is_cloud else 'Server'}")
 
-    # Run server
-    async with stdio_server() as (read_stream, write_stream):
-        init_options = InitializationOptions(
-            server_name="jira-mcp-server",
-            server_version="0.1.0",
-            capabilities=ServerCapabilities(
-                tools=ToolsCapability(listChanged=True),
-            ),
+    # Warm up in the background so the MCP handshake is not delayed
+    client = get_jira_client()
+    warmup_task: asyncio.Task[None] | None = None
+    if current_settings.jira_warmup:
+        warmup_task = asyncio.create_task(client.warm_up(current_settings.jira_project_key))
+
+    text_index = None
+    if current_settings.jira_text_index:
+        from ..mirror.text_index import TextIndex, default_text_index_path
+
+        text_index = TextIndex(
+            os.path.expanduser(current_settings.jira_text_index_path) or default_text_index_path()
         )
-        await app.run(read_stream, write_stream, init_options)
+        client.attach_text_index(text_index)
+
+    mirror_store = None
+    sync_task: asyncio.Task[None] | None = None
+    if current_settings.jira_mirror:
+        from ..mirror import MirrorStore, MirrorSync, default_mirror_path, run_periodic_sync
+
+        mirror_path = os.path.expanduser(current_settings.jira_mirror_path) or default_mirror_path()
+        mirror_store = MirrorStore(mirror_path)
+        client.attach_mirror(mirror_store, current_settings.jira_mirror_max_age)
+        projects = current_settings.mirror_projects
+        if projects:
+            mirror_sync = MirrorSync(
+                client,
+                mirror_store,
+                page_size=current_settings.jira_mirror_page_size,
+                concurrency=current_settings.jira_mirror_concurrency,
+            )
+            sync_task = asyncio.create_task(
+                run_periodic_sync(mirror_sync, projects, current_settings.jira_mirror_interval)
+            )
+        else:
+            logger.warning("Mirror enabled but no projects configured (JIRA_MIRROR_PROJECTS)")
+
+    # Run server
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            init_options = InitializationOptions(
+                server_name="jira-mcp-server",
+                server_version="0.1.0",
+                capabilities=ServerCapabilities(
+                    tools=ToolsCapability(listChanged=True),
+                ),
+            )
+            await app.run(read_stream, write_stream, init_options)
+    finally:
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+        if sync_task is not None:
+            sync_task.cancel()
+            try:
+                await sync_task
+            except asyncio.CancelledError:
+                pass
+        await client.aclose()
+        from ..tools.analyze_ticket import shutdown_parse_executor
+
+        shutdown_parse_executor()
+        if mirror_store is not None:
+            mirror_store.close()
+        if text_index is not None:
+            text_index.close()
@@ -1,46 +1,7 @@
 """MCP tools for Jira operations."""
 
-from .list_tickets import (
-    LIST_MY_TICKETS_TOOL,
-    LIST_TICKETS_TOOL,
-    handle_list_my_tickets,
-    handle_list_tickets,
-)
-from .get_ticket import (
-    GET_TICKET_TOOL,
-    GET_HIGHEST_PRIORITY_TICKET_TOOL,
-    handle_get_ticket,
-    handle_get_highest_priority_ticket,
-)
-from .update_ticket import (
-    UPDATE_TICKET_STATUS_TOOL,
-    ADD_TICKET_COMMENT_TOOL,
-    UPDATE_TICKET_DESCRIPTION_TOOL,
-    handle_update_ticket_status,
-    handle_add_ticket_comment,
-    handle_update_ticket_description,
-)
-from .analyze_ticket import ANALYZE_TICKET_TOOL, handle_analyze_ticket
-from .create_ticket import (
-    CREATE_ISSUE_TOOL,
-    CREATE_SUBTASK_TOOL,
-    GET_SUBTASKS_TOOL,
-    ASSIGN_ISSUE_TOOL,
-    LIST_USERS_TOOL,
-    LIST_TICKETS_BY_CREATOR_TOOL,
-    DELETE_ISSUE_TOOL,
-    GET_PROJECT_STATUSES_TOOL,
-    handle_create_issue,
-    handle_create_subtask,
-    handle_get_subtasks,
-    handle_assign_issue,
-    handle_list_users,
-    handle_list_tickets_by_creator,
-    handle_delete_issue,
-    handle_get_project_statuses,
-)
-from .link_issues import LINK_ISSUES_TOOL, handle_link_issues
-
+# Tool modules are imported on first attribute access so that importing the
+# package (and starting the server) does not load every tool up front.
 __all__ = [
     # Read operations
     "LIST_MY_TICKETS_TOOL",
@@ -51,6 +12,8 @@ __all__ = [
     "handle_get_ticket",
     "GET_HIGHEST_PRIORITY_TICKET_TOOL",
     "handle_get_highest_priority_ticket",
+    "GET_TICKET_COMMENTS_TOOL",
+    "handle_get_ticket_comments",
     "GET_SUBTASKS_TOOL",
     "handle_get_subtasks",
     "LIST_USERS_TOOL",
@@ -59,9 +22,23 @@ __all__ = [
     "handle_list_tickets_by_creator",
     "GET_PROJECT_STATUSES_TOOL",
     "handle_get_project_statuses",
+    "SEARCH_TEXT_TOOL",
+    "handle_search_text",
+    "FIND_SIMILAR_TICKETS_TOOL",
+    "handle_find_similar_tickets",
     # Analysis
     "ANALYZE_TICKET_TOOL",
     "handle_analyze_ticket",
+    "ANALYZE_TICKETS_TOOL",
+    "handle_analyze_tickets",
+    "DEPENDENCY_GRAPH_TOOL",
+    "handle_dependency_graph",
+    "EPIC_CRITICAL_PATH_TOOL",
+    "handle_epic_critical_path",
+    "GET_EPIC_TREE_TOOL",
+    "handle_get_epic_tree",
+    "PROJECT_FLOW_METRICS_TOOL",
+    "handle_project_flow_metrics",
     # Create operations
     "CREATE_ISSUE_TOOL",
     "handle_create_issue",
@@ -83,3 +60,66 @@ __all__ = [
     "DELETE_ISSUE_TOOL",
     "handle_delete_issue",
 ]
+
+_TOOL_MODULES = {
+    "LIST_MY_TICKETS_TOOL": "list_tickets",
+    "LIST_TICKETS_TOOL": "list_tickets",
+    "handle_list_my_tickets": "list_tickets",
+    "handle_list_tickets": "list_tickets",
+    "GET_TICKET_TOOL": "get_ticket",
+    "GET_HIGHEST_PRIORITY_TICKET_TOOL": "get_ticket",
+    "GET_TICKET_COMMENTS_TOOL": "get_ticket",
+    "handle_get_ticket": "get_ticket",
+    "handle_get_highest_priority_ticket": "get_ticket",
+    "handle_get_ticket_comments": "get_ticket",
+    "UPDATE_TICKET_STATUS_TOOL": "update_ticket",
+    "ADD_TICKET_COMMENT_TOOL": "update_ticket",
+    "UPDATE_TICKET_DESCRIPTION_TOOL": "update_ticket",
+    "handle_update_ticket_status": "update_ticket",
+    "handle_add_ticket_comment": "update_ticket",
+    "handle_update_ticket_description": "update_ticket",
+    "ANALYZE_TICKET_TOOL": "analyze_ticket",
+    "handle_analyze_ticket": "analyze_ticket",
+    "ANALYZE_TICKETS_TOOL": "analyze_ticket",
+    "handle_analyze_tickets": "analyze_ticket",
+    "DEPENDENCY_GRAPH_TOOL": "dependency_graph",
+    "handle_dependency_graph": "dependency_graph",
+    "EPIC_CRITICAL_PATH_TOOL": "critical_path",
+    "handle_epic_critical_path": "critical_path",
+    "GET_EPIC_TREE_TOOL": "epic_tree",
+    "handle_get_epic_tree": "epic_tree",
+    "PROJECT_FLOW_METRICS_TOOL": "flow_metrics",
+    "handle_project_flow_metrics": "flow_metrics",
+    "CREATE_ISSUE_TOOL": "create_ticket",
+    "CREATE_SUBTASK_TOOL": "create_ticket",
+    "GET_SUBTASKS_TOOL": "create_ticket",
+    "ASSIGN_ISSUE_TOOL": "create_ticket",
+    "LIST_USERS_TOOL": "create_ticket",
+    "LIST_TICKETS_BY_CREATOR_TOOL": "create_ticket",
+    "DELETE_ISSUE_TOOL": "create_ticket",
+    "GET_PROJECT_STATUSES_TOOL": "create_ticket",
+    "handle_create_issue": "create_ticket",
+    "handle_create_subtask": "create_ticket",
+    "handle_get_subtasks": "create_ticket",
+    "handle_assign_issue": "create_ticket",
+    "handle_list_users": "create_ticket",
+    "handle_list_tickets_by_creator": "create_ticket",
+    "handle_delete_issue": "create_ticket",
+    "handle_get_project_statuses": "create_ticket",
+    "SEARCH_TEXT_TOOL": "search_text",
+    "handle_search_text": "search_text",
+    "FIND_SIMILAR_TICKETS_TOOL": "find_similar",
+    "handle_find_similar_tickets": "find_similar",
+    "LINK_ISSUES_TOOL": "link_issues",
+    "handle_link_issues": "link_issues",
+}
+
+
+def __getattr__(name):
+    """Lazy import of tool definitions and handlers."""
+    if name in _TOOL_MODULES:
+        import importlib
+
+        module = importlib.import_module(f".{_TOOL_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
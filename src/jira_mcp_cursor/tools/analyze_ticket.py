@@ -1,218 +1,86 @@
-"""Analyze ticket tool."""
+"""Analyze ticket tools."""
 
 from mcp.types import Tool, TextContent
 from ..server.jira_client import JiraClient
+from ..utils.adf import issue_markdown
+from ..utils.description_parser import analyze_description, analyze_descriptions
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
 import json
-import re
-from typing import Any
+import multiprocessing
+import os
+import sys
+from typing import Any, Optional
 
-# Regex patterns for extracting structured data from ticket descriptions
-# Pattern: Match markdown headers (1-3 levels) for Requirements section
-REQUIREMENTS_SECTION_PATTERN = re.compile(
-    r"(?:^|\n)#{1,3}\s*(?:Requirements?|Required Features?)\s*\n(.*?)(?:\n#{1,3}|$)",
-    re.MULTILINE | re.DOTALL | re.IGNORECASE,
-)
-
-# Pattern: Match markdown headers for Acceptance Criteria section
-AC_SECTION_PATTERN = re.compile(
-    r"(?:^|\n)#{1,3}\s*(?:Acceptance Criteria|AC|Definition of Done)\s*\n(.*?)(?:\n#{1,3}|$)",
-    re.MULTILINE | re.DOTALL | re.IGNORECASE,
-)
-
-# Pattern: Match markdown headers for Technical Notes section
-TECH_SECTION_PATTERN = re.compile(
-    r"(?:^|\n)#{1,3}\s*(?:Technical Notes?|Implementation Notes?|Tech Details?)\s*\n(.*?)(?:\n#{1,3}|$)",
-    re.MULTILINE | re.DOTALL | re.IGNORECASE,
-)
-
-# Pattern: Match markdown headers for Dependencies section
-DEP_SECTION_PATTERN = re.compile(
-    r"(?:^|\n)#{1,3}\s*(?:Dependencies?|Depends On|Related Tickets?)\s*\n(.*?)(?:\n#{1,3}|$)",
-    re.MULTILINE | re.DOTALL | re.IGNORECASE,
-)
-
-# Pattern: Match Jira ticket keys (e.g., PROJ-123, ABC-456)
-TICKET_KEY_PATTERN = re.compile(r"\b([A-Z]+-\d+)\b")
-
-# Pattern: Match markdown bullet points (-, *, •)
-BULLET_POINT_PATTERN = re.compile(r"(?:^|\n)\s*[-*•]\s*(.+)")
-
-# Pattern: Match numbered list items (1., 2), 3.)
-NUMBERED_LIST_PATTERN = re.compile(r"(?:^|\n)\s*\d+[\.)]\s*(.+)")
-
-# Pattern: Match checkboxes (- [ ] or - [x])
-CHECKBOX_PATTERN = re.compile(r"(?:^|\n)\s*-\s*\[\s*[x ]?\s*\]\s*(.+)", re.MULTILINE)
-
-# Pattern: Match code blocks (```...```)
-CODE_BLOCK_PATTERN = re.compile(r"```[\s\S]*?```")
-
-
-def _extract_requirements(description: str) -> list[str]:
-    """Extract requirements from ticket description.
-
-    Looks for formal "Requirements" section or falls back to checkboxes.
-    Uses markdown bullet points, numbered lists, and task checkboxes.
-
-    Args:
-        description: Ticket description text
-
-    Returns:
-        List of requirement strings (max 10 items)
-    """
-    if not description:
-        return []
-
-    requirements = []
-
-    # Look for formal Requirements section
-    req_section_match = REQUIREMENTS_SECTION_PATTERN.search(description)
-
-    if req_section_match:
-        section_text = req_section_match.group(1)
-        # Extract bullet points
-        items = BULLET_POINT_PATTERN.findall(section_text)
-        requirements.extend([item.strip() for item in items])
-
-        # Also check for numbered lists
-        numbered = NUMBERED_LIST_PATTERN.findall(section_text)
-        requirements.extend([item.strip() for item in numbered])
-
-    # If no formal requirements section, extract from checkboxes
-    if not requirements:
-        checkboxes = CHECKBOX_PATTERN.findall(description)
-        if checkboxes:
-            requirements.extend([item.strip() for item in checkboxes])
-
-    return requirements[:10]  # Limit to 10 requirements
-
-
-def _extract_acceptance_criteria(description: str) -> list[str]:
-    """Extract acceptance criteria from ticket description.
-
-    Searches for "Acceptance Criteria", "AC", or "Definition of Done" sections.
-    Extracts bullet points and checkboxes.
-
-    Args:
-        description: Ticket description text
-
-    Returns:
-        List of acceptance criteria strings (max 10 items)
-    """
-    if not description:
-        return []
-
-    criteria = []
-
-    # Look for AC section using compiled pattern
-    ac_section_match = AC_SECTION_PATTERN.search(description)
-
-    if ac_section_match:
-        section_text = ac_section_match.group(1)
-        # Extract bullet points
-        items = BULLET_POINT_PATTERN.findall(section_text)
-        criteria.extend([item.strip() for item in items])
-
-        # Extract checkboxes
-        checkboxes = CHECKBOX_PATTERN.findall(section_text)
-        criteria.extend([item.strip() for item in checkboxes])
-
-    return criteria[:10]  # Limit to 10 criteria
-
-
-def _extract_technical_notes(description: str) -> str:
-    """Extract technical notes from ticket description.
-
-    Searches for "Technical Notes", "Implementation Notes", or "Tech Details" sections.
-    Falls back to extracting code blocks if no formal section found.
+# Batches smaller than this (total description characters) are parsed inline:
+# below it, handing work to another process costs more than the parsing
+PARALLEL_MIN_CHARS = 256 * 1024
+MAX_PARSE_WORKERS = 4
+MAX_BATCH_TICKETS = 200
 
-    Args:
-        description: Ticket description text
+_parse_executor: Optional[Executor] = None
 
-    Returns:
-        Technical notes text or empty string
-    """
-    if not description:
-        return ""
-
-    # Look for technical notes section using compiled pattern
-    tech_section_match = TECH_SECTION_PATTERN.search(description)
-
-    if tech_section_match:
-        return tech_section_match.group(1).strip()
-
-    # Look for code blocks as technical notes
-    code_blocks = CODE_BLOCK_PATTERN.findall(description)
-    if code_blocks:
-        return "\n\n".join(code_blocks)
-
-    return ""
 
+def _get_parse_executor() -> Executor:
+    """Return the shared executor for description parsing (created on first use).
 
-def _extract_dependencies(description: str) -> list[str]:
-    """Extract dependencies from ticket description.
-
-    Searches for "Dependencies", "Depends On", or "Related Tickets" sections.
-    Extracts Jira ticket keys (format: ABC-123). Falls back to searching
-    entire description if no formal section found.
-
-    Args:
-        description: Ticket description text
-
-    Returns:
-        List of unique ticket keys (max 5 if from general search)
+    Parsing is CPU-bound pure Python, so it needs processes to run in parallel,
+    except on free-threaded builds where threads do and are much cheaper.
+    Workers are started with forkserver (spawn where unavailable): forking the
+    server would copy its event loop, sockets and SQLite connections.
     """
-    if not description:
-        return []
-
-    dependencies = []
-
-    # Look for dependency section using compiled pattern
-    dep_section_match = DEP_SECTION_PATTERN.search(description)
-
-    if dep_section_match:
-        section_text = dep_section_match.group(1)
-        # Extract ticket keys using compiled pattern
-        tickets = TICKET_KEY_PATTERN.findall(section_text)
-        dependencies.extend(tickets)
-
-    # Also look for ticket keys anywhere in description if none found
-    if not dependencies:
-        tickets = TICKET_KEY_PATTERN.findall(description)
-        dependencies.extend(tickets[:5])  # Limit to 5
-
-    return list(set(dependencies))  # Remove duplicates
-
-
-def _estimate_complexity(description: str, summary: str) -> str:
-    """Estimate complexity based on description length and content.
-
-    Uses heuristics:
-    - High: >1000 chars or contains complexity keywords
-    - Medium: >300 chars
-    - Low: <=300 chars
-
-    Args:
-        description: Ticket description text
-        summary: Ticket summary text (not currently used)
-
-    Returns:
-        Complexity estimate: "High", "Medium", or "Low"
+    global _parse_executor
+    if _parse_executor is None:
+        workers = min(MAX_PARSE_WORKERS, os.cpu_count() or 1)
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        if gil_enabled:
+            method = (
+                "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            )
+            _parse_executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(method)
+            )
+        else:
+            _parse_executor = ThreadPoolExecutor(max_workers=workers)
+    return _parse_executor
+
+
+def shutdown_parse_executor() -> None:
+    """Stop the parsing workers, if any were started."""
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(cancel_futures=True)
+        _parse_executor = None
+
+
+async def analyze_many(descriptions: list[str]) -> list[dict[str, Any]]:
+    """Analyze descriptions, fanned out over worker processes when the batch is large.
+
+    Descriptions are split into one contiguous chunk per worker, balanced by
+    length, so each worker receives a single task.
     """
-    if not description:
-        return "Low"
-
-    desc_length = len(description)
-
-    # Check for complexity indicators
-    complex_keywords = ["complex", "multiple", "integration", "architecture", "refactor"]
-    has_complex_keywords = any(keyword in description.lower() for keyword in complex_keywords)
-
-    if desc_length > 1000 or has_complex_keywords:
-        return "High"
-    elif desc_length > 300:
-        return "Medium"
-    else:
-        return "Low"
+    total = sum(len(description) for description in descriptions)
+    if total < PARALLEL_MIN_CHARS or len(descriptions) < 2:
+        return analyze_descriptions(descriptions)
+
+    executor = _get_parse_executor()
+    workers = min(MAX_PARSE_WORKERS, os.cpu_count() or 1, len(descriptions))
+    chunks: list[list[str]] = [[]]
+    target = total / workers
+    size = 0
+    for description in descriptions:
+        if size >= target * len(chunks) and len(chunks) < workers:
+            chunks.append([])
+        chunks[-1].append(description)
+        size += len(description)
+
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(executor, analyze_descriptions, chunk) for chunk in chunks)
+    )
+    return [analysis for chunk in results for analysis in chunk]
 
 
 async def handle_analyze_ticket(
@@ -227,16 +95,13 @@ async def handle_analyze_ticket(
 
     fields = issue.get("fields", {})
     summary = fields.get("summary", "")
-    description = fields.get("description", "") or ""
+    # v3 payloads (e.g. served from search results) carry ADF descriptions
+    description = issue_markdown(issue)
 
-    # Analyze ticket
+    # Analyze ticket (one pass over the description)
     analysis: dict[str, Any] = {
         "type": fields.get("issuetype", {}).get("name", "Unknown"),
-        "complexity": _estimate_complexity(description, summary),
-        "requirements": _extract_requirements(description),
-        "acceptance_criteria": _extract_acceptance_criteria(description),
-        "technical_notes": _extract_technical_notes(description),
-        "dependencies": _extract_dependencies(description),
+        **analyze_description(description),
     }
 
     response = {
@@ -250,6 +115,60 @@ async def handle_analyze_ticket(
     return [TextContent(type="text", text=json.dumps(response, indent=2))]
 
 
+async def handle_analyze_tickets(
+    arguments: dict,
+    jira_client: JiraClient,
+) -> list[TextContent]:
+    """Handle analyze_tickets tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
+    requested = list(dict.fromkeys(key.upper() for key in arguments.get("ticket_keys") or []))
+    if not requested:
+        raise ValueError("ticket_keys must list at least one ticket")
+    if len(requested) > MAX_BATCH_TICKETS:
+        raise ValueError(f"At most {MAX_BATCH_TICKETS} tickets can be analyzed at once")
+
+    issues = await jira_client.get_issues(
+        requested, fields=["summary", "description", "issuetype", "updated"]
+    )
+    # Search results carry descriptions as ADF; parse their Markdown rendering
+    descriptions = [issue_markdown(issue) for issue in issues]
+    analyses = await analyze_many(descriptions)
+
+    tickets = []
+    for issue, analysis in zip(issues, analyses):
+        fields = issue.get("fields", {})
+        tickets.append(
+            {
+                "key": issue.get("key"),
+                "summary": fields.get("summary", ""),
+                "analysis": {
+                    "type": (fields.get("issuetype") or {}).get("name", "Unknown"),
+                    **analysis,
+                },
+            }
+        )
+
+    found = {ticket["key"] for ticket in tickets}
+    dependencies = sorted({key for ticket in tickets for key in ticket["analysis"]["dependencies"]})
+    complexity = Counter(ticket["analysis"]["complexity"] for ticket in tickets)
+    response: dict[str, Any] = {
+        "tickets": tickets,
+        "aggregates": {
+            "analyzed": len(tickets),
+            "complexity": {level: complexity[level] for level in ("High", "Medium", "Low")},
+            "types": dict(Counter(ticket["analysis"]["type"] for ticket in tickets)),
+            "dependencies": dependencies,
+            # Dependencies on tickets outside the analyzed set
+            "external_dependencies": [key for key in dependencies if key not in found],
+        },
+        "not_found": [key for key in requested if key not in found],
+    }
+
+    return [TextContent(type="text", text=render_budgeted(response, "tickets", arguments))]
+
+
 # Tool definition
 ANALYZE_TICKET_TOOL = Tool(
     name="analyze_ticket",
@@ -265,3 +184,25 @@ ANALYZE_TICKET_TOOL = Tool(
         "required": ["ticket_key"],
     },
 )
+
+
+ANALYZE_TICKETS_TOOL = Tool(
+    name="analyze_tickets",
+    description=(
+        "Analyze many tickets at once (e.g. a sprint's worth): the same extraction "
+        "as analyze_ticket for each, plus a complexity histogram, issue type counts "
+        "and the combined set of dependencies"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "ticket_keys": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": f"Jira ticket keys to analyze (at most {MAX_BATCH_TICKETS})",
+            },
+            **BUDGET_PROPERTIES,
+        },
+        "required": ["ticket_keys"],
+    },
+)
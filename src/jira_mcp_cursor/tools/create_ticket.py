@@ -1,10 +1,17 @@
 """Create ticket tools."""
 
+import asyncio
+import logging
 from typing import Any
 from mcp.types import Tool, TextContent
 from ..server.jira_client import JiraClient
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
 import json
 
+logger = logging.getLogger(__name__)
+
+DUPLICATE_CHECK_MODES = ("off", "warn", "block")
+
 
 # Tool Definitions
 CREATE_ISSUE_TOOL = Tool(
@@ -21,7 +28,12 @@ Example uses:
 - Create a bug report
 - Create an epic (supports variants like "Program Epic" or "Portfolio Epic")
 
-If project_key is not specified, uses the default project from configuration.""",
+If project_key is not specified, uses the default project from configuration.
+
+Before creating, the summary and description are compared with already indexed
+issues of the project; likely duplicates are returned as possible_duplicates
+(duplicate_check='warn', the default) or stop the creation ('block'). The check
+is skipped when the local text index is disabled.""",
     inputSchema={
         "type": "object",
         "properties": {
@@ -51,7 +63,7 @@ If project_key is not specified, uses the default project from configuration."""
             },
             "assignee": {
                 "type": "string",
-                "description": "Account ID or email of assignee (optional)",
+                "description": "Account ID, email or display name of assignee (optional)",
             },
             "labels": {
                 "type": "array",
@@ -62,6 +74,15 @@ If project_key is not specified, uses the default project from configuration."""
                 "type": "string",
                 "description": "Parent issue key for creating stories under epics (optional)",
             },
+            "duplicate_check": {
+                "type": "string",
+                "enum": list(DUPLICATE_CHECK_MODES),
+                "description": (
+                    "Near-duplicate check against existing issues: 'warn' reports them, "
+                    "'block' refuses to create, 'off' skips the check "
+                    "(default from JIRA_DUPLICATE_CHECK, normally 'warn')"
+                ),
+            },
         },
         "required": ["summary", "description"],
     },
@@ -94,7 +115,7 @@ Example: Breaking down "Story: Auth Backend" into:
             },
             "assignee": {
                 "type": "string",
-                "description": "Account ID or email of assignee (optional)",
+                "description": "Account ID, email or display name of assignee (optional)",
             },
             "priority": {
                 "type": "string",
@@ -117,6 +138,7 @@ Use this to view existing subtasks before adding more or to check progress.""",
                 "type": "string",
                 "description": "Parent issue key (e.g., 'SWI-501')",
             },
+            **BUDGET_PROPERTIES,
         },
         "required": ["issue_key"],
     },
@@ -136,7 +158,10 @@ Use this to assign tickets to team members.""",
             },
             "assignee": {
                 "type": "string",
-                "description": "Account ID or email of assignee. Use '-1' for automatic, 'null' for unassigned",
+                "description": (
+                    "Account ID, email or display name of assignee. "
+                    "Use '-1' for automatic, 'null' for unassigned"
+                ),
             },
         },
         "required": ["issue_key", "assignee"],
@@ -150,9 +175,9 @@ async def handle_create_issue(
     jira_client: JiraClient,
 ) -> list[TextContent]:
     """Handle create_issue tool call."""
-    from ..config.settings import Settings
+    from ..config.settings import get_settings
 
-    settings = Settings()
+    settings = get_settings()
 
     # Use provided project_key or fall back to default
     project_key = arguments.get("project_key")
@@ -173,6 +198,42 @@ async def handle_create_issue(
     parent_key = arguments.get("parent_key")
 
     issue_type = await jira_client.resolve_issue_type(issue_type, project_key)
+    if priority:
+        priority = await jira_client.resolve_priority(priority)
+    if assignee:
+        assignee = await jira_client.resolve_account_id(assignee)
+
+    duplicate_check = arguments.get("duplicate_check") or settings.jira_duplicate_check
+    if duplicate_check not in DUPLICATE_CHECK_MODES:
+        raise ValueError(
+            f"Invalid duplicate_check '{duplicate_check}'. "
+            f"Use one of: {', '.join(DUPLICATE_CHECK_MODES)}"
+        )
+    duplicates: list[dict[str, Any]] = []
+    text_index = jira_client.text_index
+    if duplicate_check != "off" and text_index is not None:
+        try:
+            duplicates = await asyncio.to_thread(
+                text_index.find_duplicates,
+                summary,
+                description,
+                project=project_key,
+                threshold=settings.jira_duplicate_threshold,
+            )
+        except Exception as e:
+            # The check is advisory; an unusable index must not stop the creation
+            logger.warning(f"Duplicate check skipped: {e}")
+    if duplicates and duplicate_check == "block":
+        blocked = {
+            "success": False,
+            "blocked": True,
+            "message": (
+                "Not created: similar issues already exist. Review them, or retry with "
+                "duplicate_check='warn' to create the issue anyway."
+            ),
+            "possible_duplicates": duplicates,
+        }
+        return [TextContent(type="text", text=json.dumps(blocked, indent=2))]
 
     result = await jira_client.create_issue(
         project_key=project_key,
@@ -197,6 +258,8 @@ async def handle_create_issue(
             "parent": parent_key if parent_key else None,
         },
     }
+    if duplicates:
+        response["possible_duplicates"] = duplicates
 
     return [TextContent(type="text", text=json.dumps(response, indent=2))]
 
@@ -211,6 +274,10 @@ async def handle_create_subtask(
     description = arguments["description"]
     assignee = arguments.get("assignee")
     priority = arguments.get("priority")
+    if priority:
+        priority = await jira_client.resolve_priority(priority)
+    if assignee:
+        assignee = await jira_client.resolve_account_id(assignee)
 
     result = await jira_client.create_subtask(
         parent_key=parent_key,
@@ -240,6 +307,9 @@ async def handle_get_subtasks(
     jira_client: JiraClient,
 ) -> list[TextContent]:
     """Handle get_subtasks tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
     issue_key = arguments["issue_key"]
 
     subtasks = await jira_client.get_subtasks(issue_key)
@@ -272,7 +342,7 @@ async def handle_get_subtasks(
         "total": len(formatted_subtasks),
     }
 
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    return [TextContent(type="text", text=render_budgeted(response, "subtasks", arguments))]
 
 
 async def handle_assign_issue(
@@ -282,6 +352,8 @@ async def handle_assign_issue(
     """Handle assign_issue tool call."""
     issue_key = arguments["issue_key"]
     assignee = arguments["assignee"]
+    if assignee not in ["-1", "null"]:
+        assignee = await jira_client.resolve_account_id(assignee)
 
     await jira_client.assign_issue(issue_key, assignee)
 
@@ -313,6 +385,7 @@ Search by name, email prefix, or partial match. Leave query empty to list all us
                 "description": "Maximum number of results (default: 50)",
                 "default": 50,
             },
+            **BUDGET_PROPERTIES,
         },
     },
 )
@@ -342,6 +415,15 @@ Use this to see all tickets a team member has created.""",
                 "description": "Maximum number of results (default: 50)",
                 "default": 50,
             },
+            "fields": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "Fields to return per ticket (default: summary, status, priority, "
+                    "assignee, issue_type, created, updated). Only these are fetched."
+                ),
+            },
+            **BUDGET_PROPERTIES,
         },
         "required": ["creator"],
     },
@@ -394,14 +476,13 @@ async def handle_list_users(
     jira_client: JiraClient,
 ) -> list[TextContent]:
     """Handle list_users tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
     query = arguments.get("query", "")
     max_results = arguments.get("max_results", 50)
 
-    # Jira requires a query parameter - use a common letter if none provided
-    if not query:
-        query = "."  # Search for users with "." in their info (catches most users)
-
-    users = await jira_client.search_users(query=query, max_results=max_results)
+    users = await jira_client.find_users(query=query, max_results=max_results)
 
     # Format users for response
     formatted_users = []
@@ -417,7 +498,7 @@ async def handle_list_users(
 
     response = {"users": formatted_users, "total": len(formatted_users)}
 
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    return [TextContent(type="text", text=render_budgeted(response, "users", arguments))]
 
 
 async def handle_list_tickets_by_creator(
@@ -425,12 +506,18 @@ async def handle_list_tickets_by_creator(
     jira_client: JiraClient,
 ) -> list[TextContent]:
     """Handle list_tickets_by_creator tool call."""
-    from ..config.settings import Settings
-    from ..utils.ticket_parser import parse_ticket_summary
+    from ..config.settings import get_settings
+    from ..utils.jql import CURRENT_USER, Clause, Query, all_of
+    from ..utils.ticket_parser import SUMMARY_FIELDS, jira_fields_for, parse_ticket_summary
 
-    settings = Settings()
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
+    settings = get_settings()
 
     creator = arguments["creator"]
+    # The JQL function, not a user literally named "currentUser()"
+    reporter = CURRENT_USER if creator.replace(" ", "").lower() == "currentuser()" else creator
     status = arguments.get("status")
     max_results = arguments.get("max_results", 50)
 
@@ -440,25 +527,25 @@ async def handle_list_tickets_by_creator(
         project = settings.jira_project_key
 
     # Build JQL query
-    jql_parts = [f'reporter="{creator}"']
-
-    if project:
-        jql_parts.append(f"project={project}")
-
-    if status:
-        jql_parts.append(f"status='{status}'")
-
-    jql = " AND ".join(jql_parts)
+    query = Query(
+        all_of(
+            Clause("reporter", "=", reporter),
+            Clause("project", "=", project) if project else None,
+            Clause("status", "=", status) if status else None,
+        )
+    )
+    jql = str(query)
 
-    # Search issues
+    # Search issues, fetching only the projected fields
+    fields = arguments.get("fields")
     result = await jira_client.search_issues(
         jql=jql,
         max_results=max_results,
-        fields=["summary", "status", "priority", "assignee", "created", "updated"],
+        fields=jira_fields_for(fields, SUMMARY_FIELDS),
     )
 
     # Parse results
-    tickets = [parse_ticket_summary(issue) for issue in result.get("issues", [])]
+    tickets = [parse_ticket_summary(issue, fields) for issue in result.get("issues", [])]
 
     response = {
         "creator": creator,
@@ -466,7 +553,7 @@ async def handle_list_tickets_by_creator(
         "total": result.get("total", 0),
     }
 
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    return [TextContent(type="text", text=render_budgeted(response, "tickets", arguments))]
 
 
 async def handle_delete_issue(
@@ -494,9 +581,9 @@ async def handle_get_project_statuses(
     jira_client: JiraClient,
 ) -> list[TextContent]:
     """Handle get_project_statuses tool call."""
-    from ..config.settings import Settings
+    from ..config.settings import get_settings
 
-    settings = Settings()
+    settings = get_settings()
 
     # Use provided project or fall back to default
     project_key = arguments.get("project_key")
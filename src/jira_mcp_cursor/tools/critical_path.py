@@ -0,0 +1,182 @@
+"""Critical path and blocker analysis over the "blocks" links inside an epic."""
+
+from typing import Any, Optional
+
+from mcp.types import Tool, TextContent
+
+from ..config.settings import get_settings
+from ..server.jira_client import JiraClient
+from ..utils.issue_graph import (
+    critical_path,
+    dependency_edges,
+    find_cycles,
+    issue_edges,
+    topological_order,
+)
+from ..utils.jql import Clause
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
+
+WEIGHTS = ("story_points", "estimate", "count")
+MAX_EPIC_CHILDREN = 5000
+
+
+def _is_done(fields: dict[str, Any]) -> bool:
+    category = ((fields.get("status") or {}).get("statusCategory") or {}).get("key")
+    return category == "done"
+
+
+def _weight(fields: dict[str, Any], weight: str, story_points_field: str) -> Optional[float]:
+    """Return the ticket's weight, or None when the field is not set."""
+    if weight == "count":
+        return 1.0
+    if weight == "story_points":
+        value = fields.get(story_points_field)
+    else:
+        # Remaining estimate, else the original one (seconds -> hours)
+        seconds = fields.get("timeestimate")
+        if seconds is None:
+            seconds = fields.get("timeoriginalestimate")
+        value = seconds / 3600 if isinstance(seconds, (int, float)) else None
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+async def handle_epic_critical_path(
+    arguments: dict[str, Any],
+    jira_client: JiraClient,
+) -> list[TextContent]:
+    """Handle epic_critical_path tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
+    epic_key = arguments["epic_key"].upper()
+    weight = arguments.get("weight", "story_points")
+    if weight not in WEIGHTS:
+        raise ValueError(f"Unknown weight {weight!r}. Use: {', '.join(WEIGHTS)}")
+    story_points_field = get_settings().jira_story_points_field
+
+    epic = await jira_client.get_issue(epic_key, fields=["summary"])
+    children = await jira_client.search_all(
+        Clause("parent", "=", epic_key),
+        fields=[
+            "summary",
+            "status",
+            "issuelinks",
+            story_points_field,
+            "timeestimate",
+            "timeoriginalestimate",
+        ],
+        max_issues=MAX_EPIC_CHILDREN,
+    )
+
+    keys = [child["key"] for child in children]
+    in_epic = set(keys)
+    done: dict[str, bool] = {}
+    successors: dict[str, list[str]] = {key: [] for key in keys}
+    blockers: dict[str, list[str]] = {key: [] for key in keys}
+
+    for child in children:
+        key = child["key"]
+        done[key] = _is_done(child.get("fields") or {})
+        for link in (child.get("fields") or {}).get("issuelinks") or []:
+            other = link.get("inwardIssue") or link.get("outwardIssue") or {}
+            if other.get("key") and other["key"] not in in_epic:
+                done.setdefault(other["key"], _is_done(other.get("fields") or {}))
+
+    for child in children:
+        key = child["key"]
+        for dependent, dependency in dependency_edges(key, issue_edges(child, ["links"])):
+            if dependent not in in_epic:
+                continue
+            # Each link is listed on both issues; count it once
+            if dependency not in blockers[dependent]:
+                blockers[dependent].append(dependency)
+                if dependency in in_epic:
+                    successors[dependency].append(dependent)
+
+    order, cyclic = topological_order(keys, successors)
+
+    weights: dict[str, float] = {}
+    unestimated: list[str] = []
+    for child in children:
+        key = child["key"]
+        value = _weight(child.get("fields") or {}, weight, story_points_field)
+        if value is None:
+            unestimated.append(key)
+        # Finished work no longer delays anything
+        weights[key] = 0.0 if done[key] else (value or 0.0)
+
+    plan = critical_path(order, successors, weights)
+    blocked = [
+        key
+        for key in keys
+        if not done[key] and any(not done.get(blocker, False) for blocker in blockers[key])
+    ]
+
+    fields_by_key = {child["key"]: child.get("fields") or {} for child in children}
+    tickets = []
+    for key in order + cyclic:
+        fields = fields_by_key[key]
+        entry: dict[str, Any] = {
+            "key": key,
+            "summary": fields.get("summary"),
+            "status": (fields.get("status") or {}).get("name"),
+            "weight": weights[key],
+            "blocked_by": [b for b in blockers[key] if not done.get(b, False)],
+        }
+        schedule = plan["schedule"].get(key)
+        if schedule is None:
+            entry["in_cycle"] = True
+        else:
+            entry.update({name: round(value, 2) for name, value in schedule.items()})
+        tickets.append(entry)
+
+    cyclic_set = set(cyclic)
+    response: dict[str, Any] = {
+        "epic": {
+            "key": epic.get("key", epic_key),
+            "summary": (epic.get("fields") or {}).get("summary"),
+        },
+        "weight": weight,
+        "ticket_count": len(keys),
+        "critical_path": {"keys": plan["path"], "length": round(plan["length"], 2)},
+        "blocked": blocked,
+        "cycles": find_cycles(
+            {key: [s for s in successors[key] if s in cyclic_set] for key in cyclic}
+        ),
+        "unestimated": unestimated if weight != "count" else [],
+        "tickets": tickets,
+    }
+
+    return [TextContent(type="text", text=render_budgeted(response, "tickets", arguments))]
+
+
+EPIC_CRITICAL_PATH_TOOL = Tool(
+    name="epic_critical_path",
+    description=(
+        "Plan an epic from the 'blocks' links between its child tickets: a "
+        "topological order to work in, the critical path (longest chain of "
+        "remaining work, weighted by story points or estimates), the slack of every "
+        "other ticket, and which tickets are currently blocked by unfinished work."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "epic_key": {
+                "type": "string",
+                "description": "Epic key (e.g., 'PROJ-100')",
+            },
+            "weight": {
+                "type": "string",
+                "enum": list(WEIGHTS),
+                "description": (
+                    "How to weigh tickets: story_points (JIRA_STORY_POINTS_FIELD), estimate "
+                    "(remaining time estimate in hours) or count (1 each). Done tickets weigh 0; "
+                    "tickets without a value weigh 0 and are listed as unestimated."
+                ),
+                "default": "story_points",
+            },
+            **BUDGET_PROPERTIES,
+        },
+        "required": ["epic_key"],
+    },
+)
@@ -0,0 +1,167 @@
+"""Dependency graph tool: transitive closure of links, subtasks and mentioned tickets."""
+
+import logging
+from typing import Any
+
+from mcp.types import Tool, TextContent
+
+from ..server.exceptions import AuthenticationError, JiraAPIError
+from ..server.jira_client import JiraClient
+from ..utils.issue_graph import (
+    EDGE_KINDS,
+    GRAPH_FIELDS,
+    crawl,
+    dependency_edges,
+    find_cycles,
+    issue_edges,
+)
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEPTH = 3
+MAX_DEPTH = 10
+DEFAULT_MAX_ISSUES = 300
+MAX_ISSUES = 2000
+
+
+async def handle_dependency_graph(
+    arguments: dict[str, Any],
+    jira_client: JiraClient,
+) -> list[TextContent]:
+    """Handle dependency_graph tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
+    roots = arguments.get("ticket_keys") or (
+        [arguments["ticket_key"]] if arguments.get("ticket_key") else []
+    )
+    if not roots:
+        raise ValueError("Provide ticket_key or ticket_keys")
+    max_depth = min(max(int(arguments.get("max_depth", DEFAULT_DEPTH)), 0), MAX_DEPTH)
+    max_issues = min(int(arguments.get("max_issues", DEFAULT_MAX_ISSUES)), MAX_ISSUES)
+    kinds = arguments.get("include") or list(EDGE_KINDS)
+    unknown = set(kinds) - set(EDGE_KINDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown edge kinds: {', '.join(sorted(unknown))}. Use: {', '.join(EDGE_KINDS)}"
+        )
+
+    # Mentioned keys are followed only into known projects: descriptions are
+    # full of key-shaped tokens such as UTF-8, SHA-256 or ISO-8601
+    projects = {key.upper().rsplit("-", 1)[0] for key in roots}
+    if "mentions" in kinds:
+        try:
+            projects.update(await jira_client.get_project_keys())
+        except JiraAPIError as e:
+            logger.warning(
+                f"Could not list projects; following mentions within the roots' projects: {e}"
+            )
+
+    edges: dict[str, list[dict[str, str]]] = {}
+
+    def neighbours(issue: dict[str, Any]) -> list[str]:
+        projects.add(issue["key"].rsplit("-", 1)[0])
+        edges[issue["key"]] = issue_edges(issue, kinds, projects)
+        return [edge["key"] for edge in edges[issue["key"]]]
+
+    async def fetch(keys: list[str]) -> list[dict[str, Any]]:
+        try:
+            return await jira_client.get_issues(keys, fields=GRAPH_FIELDS)
+        except AuthenticationError:
+            raise
+        except JiraAPIError as e:
+            # Skip the batch: its keys are reported as not found or unexplored
+            logger.warning(f"Failed to fetch {len(keys)} issues for the dependency graph: {e}")
+            return []
+
+    issues, depths, truncated = await crawl(fetch, roots, neighbours, max_depth, max_issues)
+
+    depends_on: dict[str, list[str]] = {}
+    for key in issues:
+        for dependent, dependency in dependency_edges(key, edges[key]):
+            targets = depends_on.setdefault(dependent, [])
+            if dependency not in targets:
+                targets.append(dependency)
+
+    nodes = []
+    for key, depth in sorted(depths.items(), key=lambda item: (item[1], item[0])):
+        issue = issues.get(key)
+        if issue is None:
+            continue
+        fields = issue.get("fields") or {}
+        nodes.append(
+            {
+                "key": key,
+                "depth": depth,
+                "summary": fields.get("summary"),
+                "status": (fields.get("status") or {}).get("name"),
+                "issue_type": (fields.get("issuetype") or {}).get("name"),
+                "edges": edges[key],
+            }
+        )
+
+    # Keys found but not fetched: beyond the depth or issue limit, not visible,
+    # or in a batch that failed
+    unexplored = sorted(key for key, depth in depths.items() if key not in issues and depth > 0)
+    not_found = sorted(key for key, depth in depths.items() if key not in issues and depth == 0)
+    cycles = find_cycles(depends_on)
+
+    response: dict[str, Any] = {
+        "roots": [key.upper() for key in roots],
+        "max_depth": max_depth,
+        "node_count": len(nodes),
+        "nodes": nodes,
+        "cycles": cycles,
+        "has_cycles": bool(cycles),
+        "unexplored": unexplored,
+        "truncated": truncated,
+    }
+    if not_found:
+        response["not_found"] = not_found
+
+    return [TextContent(type="text", text=render_budgeted(response, "nodes", arguments))]
+
+
+DEPENDENCY_GRAPH_TOOL = Tool(
+    name="dependency_graph",
+    description=(
+        "Build the transitive dependency graph of one or more tickets: issue links, "
+        "subtasks and ticket keys mentioned in descriptions, followed breadth-first "
+        "up to a depth limit. Returns each ticket with its outgoing edges (an "
+        "adjacency list) and any dependency cycles (e.g. A blocked by B blocked by A)."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "ticket_key": {
+                "type": "string",
+                "description": "Ticket to start from (e.g., 'PROJ-123')",
+            },
+            "ticket_keys": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Several tickets to start from (instead of ticket_key)",
+            },
+            "max_depth": {
+                "type": "number",
+                "description": f"How many hops to follow (default: {DEFAULT_DEPTH}, max: {MAX_DEPTH})",
+                "default": DEFAULT_DEPTH,
+            },
+            "max_issues": {
+                "type": "number",
+                "description": (
+                    f"Stop after fetching this many tickets (default: {DEFAULT_MAX_ISSUES}, "
+                    f"max: {MAX_ISSUES})"
+                ),
+                "default": DEFAULT_MAX_ISSUES,
+            },
+            "include": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(EDGE_KINDS)},
+                "description": "Edge kinds to follow (default: all)",
+            },
+            **BUDGET_PROPERTIES,
+        },
+    },
+)
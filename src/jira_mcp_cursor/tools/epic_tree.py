@@ -0,0 +1,141 @@
+"""Epic tree tool: an epic's children and subtasks with status rollups."""
+
+from typing import Any
+
+from mcp.types import Tool, TextContent
+
+from ..server.jira_client import ISSUE_BATCH_SIZE, JiraClient
+from ..utils.jql import Clause
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
+
+TREE_FIELDS = ["summary", "status", "issuetype", "parent"]
+DEFAULT_DEPTH = 2
+MAX_DEPTH = 5
+MAX_TREE_ISSUES = 5000
+
+# Jira status categories -> rollup buckets
+_CATEGORY_BUCKETS = {"done": "done", "indeterminate": "in_progress", "new": "todo"}
+
+
+def _node(issue: dict[str, Any]) -> dict[str, Any]:
+    fields = issue.get("fields") or {}
+    status = fields.get("status") or {}
+    category = (status.get("statusCategory") or {}).get("key") or ""
+    return {
+        "key": issue["key"],
+        "summary": fields.get("summary"),
+        "status": status.get("name"),
+        "status_category": _CATEGORY_BUCKETS.get(category, "todo"),
+        "issue_type": (fields.get("issuetype") or {}).get("name"),
+        "children": [],
+    }
+
+
+def _roll_up(nodes: list[dict[str, Any]]) -> None:
+    """Fill in ``progress`` for every node, given in breadth-first order.
+
+    Walking the list backwards visits each node after all of its descendants,
+    so one pass adds every node's counts into its parent. A leaf counts its own
+    status; a node with children counts the leaves under it.
+    """
+    for node in reversed(nodes):
+        counts = {"done": 0, "in_progress": 0, "todo": 0}
+        if node["children"]:
+            for child in node["children"]:
+                for bucket in counts:
+                    counts[bucket] += child["progress"][bucket]
+        else:
+            counts[node["status_category"]] = 1
+        total = sum(counts.values())
+        node["progress"] = {
+            **counts,
+            "total": total,
+            "percent_complete": round(100 * counts["done"] / total, 1) if total else 0.0,
+        }
+
+
+async def handle_get_epic_tree(
+    arguments: dict[str, Any],
+    jira_client: JiraClient,
+) -> list[TextContent]:
+    """Handle get_epic_tree tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
+    epic_key = arguments["epic_key"].upper()
+    max_depth = min(max(int(arguments.get("max_depth", DEFAULT_DEPTH)), 1), MAX_DEPTH)
+
+    root = _node(await jira_client.get_issue(epic_key, fields=TREE_FIELDS))
+    nodes = [root]
+    by_key = {root["key"]: root}
+    frontier = [root["key"]]
+    truncated = False
+
+    # One paginated "parent IN (...)" search per level (split only for very wide levels)
+    for _ in range(max_depth):
+        level: list[dict[str, Any]] = []
+        for start in range(0, len(frontier), ISSUE_BATCH_SIZE):
+            remaining = MAX_TREE_ISSUES - len(nodes) - len(level)
+            if remaining <= 0:
+                truncated = True
+                break
+            level.extend(
+                await jira_client.search_all(
+                    Clause("parent", "IN", tuple(frontier[start : start + ISSUE_BATCH_SIZE])),
+                    fields=TREE_FIELDS,
+                    max_issues=remaining,
+                )
+            )
+        frontier = []
+        for issue in level:
+            parent_key = ((issue.get("fields") or {}).get("parent") or {}).get("key")
+            if issue["key"] in by_key or parent_key not in by_key:
+                continue
+            node = by_key[issue["key"]] = _node(issue)
+            by_key[parent_key]["children"].append(node)
+            nodes.append(node)
+            frontier.append(node["key"])
+        if len(nodes) >= MAX_TREE_ISSUES:
+            truncated = True
+        if not frontier or truncated:
+            break
+
+    _roll_up(nodes)
+
+    response: dict[str, Any] = {
+        "epic": {key: value for key, value in root.items() if key != "children"},
+        "issue_count": len(nodes),
+        "truncated": truncated,
+        "children": root["children"],
+    }
+
+    return [TextContent(type="text", text=render_budgeted(response, "children", arguments))]
+
+
+GET_EPIC_TREE_TOOL = Tool(
+    name="get_epic_tree",
+    description=(
+        "Load an epic's whole tree (epic -> child tickets -> subtasks) in one call, "
+        "with done / in-progress / to-do counts and percent complete rolled up at "
+        "every level. Use this instead of listing children and subtasks one by one."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "epic_key": {
+                "type": "string",
+                "description": "Epic key (e.g., 'PROJ-100')",
+            },
+            "max_depth": {
+                "type": "number",
+                "description": (
+                    f"Levels below the epic to load (default: {DEFAULT_DEPTH} for "
+                    f"children and subtasks, max: {MAX_DEPTH})"
+                ),
+                "default": DEFAULT_DEPTH,
+            },
+            **BUDGET_PROPERTIES,
+        },
+        "required": ["epic_key"],
+    },
+)
@@ -0,0 +1,111 @@
+"""Similar-ticket search backed by a TF-IDF index over the local text index."""
+
+import asyncio
+from typing import Any
+
+from mcp.types import Tool, TextContent
+
+from ..mirror.text_index import plain_text
+from ..server.jira_client import JiraClient
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
+
+
+async def handle_find_similar_tickets(
+    arguments: dict[str, Any],
+    jira_client: JiraClient,
+) -> list[TextContent]:
+    """Handle find_similar_tickets tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
+    text_index = jira_client.text_index
+    if text_index is None:
+        raise ValueError("The full-text index is disabled. Set JIRA_TEXT_INDEX=true to enable it.")
+
+    ticket_key = arguments.get("ticket_key")
+    text = arguments.get("text")
+    if not ticket_key and not text:
+        raise ValueError("Provide either ticket_key or text")
+
+    try:
+        from ..mirror import similarity
+    except ImportError as e:
+        raise ValueError(
+            "Similarity search needs NumPy. Install it with "
+            "'pip install \"jira-mcp-cursor[similarity]\"'."
+        ) from e
+
+    if ticket_key:
+        ticket_key = ticket_key.upper()
+        document = text_index.get_document(ticket_key)
+        if document is None:
+            issue = await jira_client.get_issue(ticket_key, fields=["summary", "description"])
+            fields = issue.get("fields", {})
+            document = {
+                "summary": fields.get("summary") or "",
+                "description": plain_text(fields.get("description")),
+            }
+    else:
+        document = {"summary": text}
+
+    # Loading or (re)building the index reads the whole text index
+    index = await asyncio.to_thread(similarity.get_similarity_index, text_index)
+    results = index.most_similar(
+        document,
+        limit=int(arguments.get("max_results", 10)),
+        project=arguments.get("project"),
+        exclude=ticket_key,
+    )
+
+    summaries = {}
+    for result in results:
+        doc = text_index.get_document(result["key"])
+        summaries[result["key"]] = doc["summary"] if doc else None
+
+    response: dict[str, Any] = {
+        "results": [{**result, "summary": summaries[result["key"]]} for result in results],
+        "indexed_issues": len(index),
+    }
+    if ticket_key:
+        response["ticket_key"] = ticket_key
+    if not len(index):
+        response["hint"] = (
+            "Nothing is indexed yet. Run 'jira-mcp index --project <KEY>' "
+            "or fetch some tickets first."
+        )
+
+    return [TextContent(type="text", text=render_budgeted(response, "results", arguments))]
+
+
+FIND_SIMILAR_TICKETS_TOOL = Tool(
+    name="find_similar_tickets",
+    description=(
+        "Find tickets similar to a given ticket or to a piece of text, ranked by "
+        "TF-IDF cosine similarity of summaries, descriptions and comments. Answered "
+        "from the local index without searching Jira; useful for spotting related "
+        "work, earlier fixes or duplicates."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "ticket_key": {
+                "type": "string",
+                "description": "Find tickets similar to this one (e.g., 'PROJ-123')",
+            },
+            "text": {
+                "type": "string",
+                "description": "Find tickets similar to this text (used when ticket_key is not given)",
+            },
+            "project": {
+                "type": "string",
+                "description": "Only return tickets of this project (optional)",
+            },
+            "max_results": {
+                "type": "number",
+                "description": "Maximum number of results",
+                "default": 10,
+            },
+            **BUDGET_PROPERTIES,
+        },
+    },
+)
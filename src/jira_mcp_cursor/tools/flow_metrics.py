@@ -0,0 +1,117 @@
+"""Flow metrics tool: lead time, cycle time, WIP and throughput from changelogs."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any
+
+from mcp.types import Tool, TextContent
+
+from ..server.jira_client import JiraClient
+from ..utils.jql import Clause, Raw, all_of, strip_order_by
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
+
+DEFAULT_WEEKS = 12
+MAX_WEEKS = 104
+DEFAULT_MAX_ISSUES = 5000
+MAX_ISSUES = 20000
+
+
+async def handle_project_flow_metrics(
+    arguments: dict[str, Any],
+    jira_client: JiraClient,
+) -> list[TextContent]:
+    """Handle project_flow_metrics tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
+    project = arguments.get("project")
+    jql = arguments.get("jql")
+    if not project and not jql:
+        raise ValueError("Provide project or jql")
+    weeks = min(max(int(arguments.get("weeks", DEFAULT_WEEKS)), 1), MAX_WEEKS)
+    max_issues = min(int(arguments.get("max_issues", DEFAULT_MAX_ISSUES)), MAX_ISSUES)
+
+    try:
+        from ..utils import flow_metrics
+    except ImportError as e:
+        raise ValueError(
+            "Flow metrics need NumPy. Install it with "
+            "'pip install \"jira-mcp-cursor[analytics]\"'."
+        ) from e
+
+    # The user's JQL goes to Jira as written, so any valid condition works.
+    # The search pages by key, so its ORDER BY is dropped
+    condition = strip_order_by(jql) if jql else ""
+    where = all_of(
+        Clause("project", "=", project.upper()) if project else None,
+        Raw(condition) if condition else None,
+    )
+    status_categories = await jira_client.get_status_categories()
+    # One issue past the limit tells whether the set was cut short
+    issues = await jira_client.search_all(
+        where,
+        fields=["created", "status"],
+        max_issues=max_issues + 1,
+        expand=["changelog"],
+    )
+    truncated = len(issues) > max_issues
+    del issues[max_issues:]
+    await jira_client.complete_changelogs(issues)
+
+    def compute() -> dict[str, Any]:
+        data = flow_metrics.build_flow_data(issues, status_categories)
+        return flow_metrics.flow_metrics(data, datetime.now(timezone.utc), weeks)
+
+    metrics = await asyncio.to_thread(compute)
+    response: dict[str, Any] = {
+        "project": project.upper() if project else None,
+        "jql": jql,
+        "truncated": truncated,
+        **metrics,
+    }
+
+    return [TextContent(type="text", text=render_budgeted(response, "weekly", arguments))]
+
+
+PROJECT_FLOW_METRICS_TOOL = Tool(
+    name="project_flow_metrics",
+    description=(
+        "Flow metrics from the status history of a project's tickets (or any JQL "
+        "set): lead time (created to done), cycle time (work started to done), "
+        "time spent in each status, and weekly throughput and work in progress. "
+        "Requires NumPy."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project key (e.g., 'PROJ')",
+            },
+            "jql": {
+                "type": "string",
+                "description": (
+                    "JQL condition selecting the tickets, combined with project if both "
+                    "are given (e.g., 'type = Story AND created >= -26w')"
+                ),
+            },
+            "weeks": {
+                "type": "number",
+                "description": (
+                    f"Calendar weeks in the weekly series, ending with the current one "
+                    f"(default: {DEFAULT_WEEKS}, max: {MAX_WEEKS})"
+                ),
+                "default": DEFAULT_WEEKS,
+            },
+            "max_issues": {
+                "type": "number",
+                "description": (
+                    f"Analyze at most this many tickets (default: {DEFAULT_MAX_ISSUES}, "
+                    f"max: {MAX_ISSUES})"
+                ),
+                "default": DEFAULT_MAX_ISSUES,
+            },
+            **BUDGET_PROPERTIES,
+        },
+    },
+)
@@ -1,31 +1,92 @@
 """Get ticket tool."""
 
+from contextlib import aclosing
+
 from mcp.types import Tool, TextContent
 from ..server.jira_client import JiraClient
-from ..utils.ticket_parser import parse_ticket_detail
+from ..utils.dates import parse_jira_datetime
+from ..utils.ticket_parser import (
+    DETAIL_FIELDS,
+    jira_fields_for,
+    parse_comment,
+    parse_ticket_detail,
+)
 import json
 
+DEFAULT_COMMENT_LIMIT = 20
+
+FIELDS_SCHEMA = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": (
+        "Fields to return (default: summary, description, status, priority, assignee, "
+        "reporter, created, updated, labels, components, comments). Raw Jira field ids "
+        "such as 'customfield_10016' are passed through. Only these fields are fetched."
+    ),
+}
+
 
 async def handle_get_ticket(
     arguments: dict,
     jira_client: JiraClient,
 ) -> list[TextContent]:
-    """Handle get_ticket tool call."""
+    """Handle get_ticket tool call.
+
+    Comments are requested through the ``comment`` field projection and sliced to
+    ``comment_limit`` starting at ``comment_start``. When the requested window
+    goes past what Jira embedded in the issue, it is fetched from the paginated
+    comment endpoint instead. Rendered HTML is only requested with
+    ``include_rendered``.
+    """
     ticket_key = arguments["ticket_key"]
+    output_fields = arguments.get("fields")
+    if output_fields is None:
+        output_fields = list(DETAIL_FIELDS)
+    include_comments = arguments.get("include_comments", True) and "comments" in output_fields
+    comment_start = int(arguments.get("comment_start", 0))
+    comment_limit = int(arguments.get("comment_limit", DEFAULT_COMMENT_LIMIT))
 
-    # Determine fields to expand
-    expand = []
-    if arguments.get("include_comments", True):
-        expand.append("renderedFields")
+    detail_fields = [f for f in output_fields if f != "comments"]
+    jira_fields = jira_fields_for(detail_fields, DETAIL_FIELDS)
+    if include_comments:
+        jira_fields.append("comment")
 
     # Fetch issue
     issue = await jira_client.get_issue(
         issue_key=ticket_key,
-        expand=expand if expand else None,
+        fields=jira_fields,
+        expand=["renderedFields"] if arguments.get("include_rendered") else None,
     )
 
     # Parse ticket
-    ticket = parse_ticket_detail(issue)
+    ticket = parse_ticket_detail(issue, detail_fields)
+
+    if include_comments:
+        embedded = issue.get("fields", {}).get("comment") or {}
+        embedded_comments = embedded.get("comments", [])
+        total = embedded.get("total", len(embedded_comments))
+        window_end = comment_start + comment_limit
+
+        if window_end > len(embedded_comments) and total > len(embedded_comments):
+            # Jira truncated the embedded list; page the rest from the comment endpoint
+            page = await jira_client.get_comments(
+                ticket_key, start_at=comment_start, max_results=comment_limit
+            )
+            page_comments = page.get("comments", [])
+            total = page.get("total", total)
+        else:
+            page_comments = embedded_comments[comment_start:window_end]
+
+        ticket["comments"] = [parse_comment(c) for c in page_comments]
+        ticket["comments_total"] = total
+        if comment_start + len(page_comments) < total:
+            ticket["next_comment_start"] = comment_start + len(page_comments)
+
+    if arguments.get("include_rendered"):
+        rendered = issue.get("renderedFields") or {}
+        ticket["rendered"] = {
+            field: html for field, html in rendered.items() if html and field in jira_fields
+        }
 
     return [TextContent(type="text", text=json.dumps(ticket, indent=2))]
 
@@ -44,9 +105,9 @@ async def handle_get_highest_priority_ticket(
         List of TextContent with highest priority ticket details or error
     """
     from ..utils.jql_builder import build_highest_priority_jql
-    from ..config.settings import Settings
+    from ..config.settings import get_settings
 
-    settings = Settings()
+    settings = get_settings()
 
     # Use provided project or fall back to default
     project = arguments.get("project")
@@ -68,10 +129,12 @@ async def handle_get_highest_priority_ticket(
         exclude_statuses=exclude_status,
     )
 
-    # Search for highest priority ticket (limit to 1)
+    # Search for highest priority ticket (limit to 1), fetching only the projected fields
+    fields = arguments.get("fields")
     result = await jira_client.search_issues(
         jql=jql,
         max_results=1,
+        fields=jira_fields_for(fields, DETAIL_FIELDS),
     )
 
     # If no tickets found, return empty result
@@ -79,11 +142,51 @@ async def handle_get_highest_priority_ticket(
         return [TextContent(type="text", text=json.dumps({"error": "No tickets found"}, indent=2))]
 
     # Parse and return the highest priority ticket detail
-    ticket = parse_ticket_detail(result["issues"][0])
+    ticket = parse_ticket_detail(result["issues"][0], fields)
 
     return [TextContent(type="text", text=json.dumps(ticket, indent=2))]
 
 
+async def handle_get_ticket_comments(
+    arguments: dict,
+    jira_client: JiraClient,
+) -> list[TextContent]:
+    """Handle get_ticket_comments tool call.
+
+    Streams comments from the paginated comment endpoint (newest first by default)
+    and stops as soon as ``limit`` comments are collected or, with ``since``, as
+    soon as older comments are reached.
+    """
+    ticket_key = arguments["ticket_key"]
+    limit = int(arguments.get("limit", DEFAULT_COMMENT_LIMIT))
+    newest_first = arguments.get("order", "newest") == "newest"
+    since = parse_jira_datetime(arguments["since"]) if arguments.get("since") else None
+
+    comments: list[dict] = []
+    has_more = False
+    stream = jira_client.iter_comments(
+        ticket_key,
+        order="-created" if newest_first else "created",
+        since=since,
+        page_size=min(limit + 1, 100),
+    )
+    async with aclosing(stream) as comment_stream:
+        async for comment in comment_stream:
+            if len(comments) == limit:
+                has_more = True
+                break
+            comments.append(parse_comment(comment))
+
+    response = {
+        "ticket_key": ticket_key,
+        "comments": comments,
+        "returned": len(comments),
+        "has_more": has_more,
+    }
+
+    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+
+
 # Tool definitions
 GET_TICKET_TOOL = Tool(
     name="get_ticket",
@@ -100,6 +203,25 @@ GET_TICKET_TOOL = Tool(
                 "description": "Include comments in response",
                 "default": True,
             },
+            "comment_limit": {
+                "type": "number",
+                "description": "Maximum number of comments to return (default: 20)",
+                "default": DEFAULT_COMMENT_LIMIT,
+            },
+            "comment_start": {
+                "type": "number",
+                "description": (
+                    "Index of the first comment to return, for paging "
+                    "(use next_comment_start from a previous response)"
+                ),
+                "default": 0,
+            },
+            "include_rendered": {
+                "type": "boolean",
+                "description": "Also return Jira's rendered HTML for the fetched fields",
+                "default": False,
+            },
+            "fields": FIELDS_SCHEMA,
         },
         "required": ["ticket_key"],
     },
@@ -120,6 +242,44 @@ GET_HIGHEST_PRIORITY_TICKET_TOOL = Tool(
                 "type": "string",
                 "description": "Filter by project key (optional, uses default project from config if not specified)",
             },
+            "fields": FIELDS_SCHEMA,
         },
     },
 )
+
+GET_TICKET_COMMENTS_TOOL = Tool(
+    name="get_ticket_comments",
+    description=(
+        "Get a ticket's comments without the rest of the ticket. Returns the newest N "
+        "comments, or only those created since a timestamp, paging through Jira's "
+        "comment endpoint so long discussions are never downloaded in full."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "ticket_key": {
+                "type": "string",
+                "description": "Jira ticket key (e.g., 'PROJ-123')",
+            },
+            "limit": {
+                "type": "number",
+                "description": "Maximum number of comments to return (default: 20)",
+                "default": DEFAULT_COMMENT_LIMIT,
+            },
+            "since": {
+                "type": "string",
+                "description": (
+                    "Only return comments created at or after this ISO timestamp "
+                    "(e.g., '2025-01-31T09:00:00+00:00')"
+                ),
+            },
+            "order": {
+                "type": "string",
+                "enum": ["newest", "oldest"],
+                "description": "Return newest comments first (default) or oldest first",
+                "default": "newest",
+            },
+        },
+        "required": ["ticket_key"],
+    },
+)
@@ -5,7 +5,6 @@ from mcp.types import Tool, TextContent
 from ..server.jira_client import JiraClient
 import json
 
-
 LINK_ISSUES_TOOL = Tool(
     name="link_issues",
     description="""Create a link between two Jira issues.
@@ -23,7 +22,9 @@ The *outward* issue is the "from" side (e.g. the one that blocks),
 and the *inward* issue is the "to" side (e.g. the one that is blocked).
 
 Example: to say PROJ-1 blocks PROJ-2, set outward_issue=PROJ-1 and
-inward_issue=PROJ-2 with link_type="Blocks".""",
+inward_issue=PROJ-2 with link_type="Blocks". An inward description as the
+link type reads from the other side: outward_issue=PROJ-2, inward_issue=PROJ-1
+with link_type="is blocked by" creates the same link.""",
     inputSchema={
         "type": "object",
         "properties": {
@@ -37,7 +38,10 @@ inward_issue=PROJ-2 with link_type="Blocks".""",
             },
             "link_type": {
                 "type": "string",
-                "description": "Name of the link type (e.g. 'Blocks', 'Duplicate', 'Relates'). Default: 'Relates'",
+                "description": (
+                    "Name of the link type (e.g. 'Blocks', 'Duplicate', 'Relates') or its "
+                    "inward/outward description (e.g. 'is blocked by'). Default: 'Relates'"
+                ),
                 "default": "Relates",
             },
             "comment": {
@@ -57,7 +61,12 @@ async def handle_link_issues(
     """Handle link_issues tool call."""
     inward_issue = arguments["inward_issue"]
     outward_issue = arguments["outward_issue"]
-    link_type = arguments.get("link_type", "Relates")
+    link_type, inward_phrase = await jira_client.resolve_link_type(
+        arguments.get("link_type", "Relates")
+    )
+    if inward_phrase:
+        # "A is blocked by B" is the Blocks link with B as the outward issue
+        inward_issue, outward_issue = outward_issue, inward_issue
     comment = arguments.get("comment")
 
     await jira_client.link_issues(
@@ -1,13 +1,24 @@
 """List tickets tools — my tickets and generic listing with fuzzy type resolution."""
 
-import json
 from typing import Any
 
 from mcp.types import Tool, TextContent
 
 from ..server.jira_client import JiraClient
-from ..utils.jql_builder import build_my_tickets_jql
-from ..utils.ticket_parser import parse_ticket_summary
+from ..utils.jql import Clause, Query, all_of
+from ..utils.jql_builder import my_tickets_query
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
+from ..utils.ticket_parser import SUMMARY_FIELDS, jira_fields_for, parse_ticket_summary
+
+FIELDS_SCHEMA = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": (
+        "Fields to return per ticket (default: summary, status, priority, assignee, "
+        "issue_type, created, updated). Raw Jira field ids such as 'customfield_10016' "
+        "are passed through. Only these fields are requested from Jira."
+    ),
+}
 
 
 async def handle_list_my_tickets(
@@ -15,36 +26,43 @@ async def handle_list_my_tickets(
     jira_client: JiraClient,
 ) -> list[TextContent]:
     """Handle list_my_tickets tool call."""
-    from ..config.settings import Settings
+    from ..config.settings import get_settings
+
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
 
-    settings = Settings()
+    settings = get_settings()
 
     # Use provided project or fall back to default
     project = arguments.get("project")
     if not project and settings.jira_project_key:
         project = settings.jira_project_key
 
-    # Build JQL query
-    jql = build_my_tickets_jql(
-        status=arguments.get("status"),
-        project=project,
+    # Build JQL query; an explicit order lets the local mirror answer it
+    jql = str(
+        my_tickets_query(
+            status=arguments.get("status"),
+            project=project,
+            order_by=(("updated", "DESC"),),
+        )
     )
 
-    # Search issues
+    # Search issues, fetching only the projected fields
+    fields = arguments.get("fields")
     result = await jira_client.search_issues(
         jql=jql,
         max_results=arguments.get("max_results", 50),
-        fields=["summary", "status", "priority", "assignee", "created", "updated"],
+        fields=jira_fields_for(fields, SUMMARY_FIELDS),
     )
 
-    tickets = [parse_ticket_summary(issue) for issue in result.get("issues", [])]
+    tickets = [parse_ticket_summary(issue, fields) for issue in result.get("issues", [])]
 
     response = {
         "tickets": tickets,
         "total": result.get("total", 0),
     }
 
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    return [TextContent(type="text", text=render_budgeted(response, "tickets", arguments))]
 
 
 async def handle_list_tickets(
@@ -52,9 +70,12 @@ async def handle_list_tickets(
     jira_client: JiraClient,
 ) -> list[TextContent]:
     """Handle list_tickets tool call."""
-    from ..config.settings import Settings
+    from ..config.settings import get_settings
+
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
 
-    settings = Settings()
+    settings = get_settings()
 
     project = arguments.get("project")
     if not project:
@@ -71,25 +92,25 @@ async def handle_list_tickets(
     if issue_type:
         resolved_type = await jira_client.resolve_issue_type(issue_type, project)
 
-    jql_parts: list[str] = []
-
-    if resolved_type:
-        jql_parts.append(f'issuetype = "{resolved_type}"')
-
-    jql_parts.append(f'project = "{project}"')
-
-    if status := arguments.get("status"):
-        jql_parts.append(f'status = "{status}"')
-
-    jql = " AND ".join(jql_parts) + " ORDER BY updated DESC"
+    status = arguments.get("status")
+    query = Query(
+        all_of(
+            Clause("issuetype", "=", resolved_type) if resolved_type else None,
+            Clause("project", "=", project),
+            Clause("status", "=", status) if status else None,
+        ),
+        order_by=(("updated", "DESC"),),
+    )
+    jql = str(query)
 
+    fields = arguments.get("fields")
     result = await jira_client.search_issues(
         jql=jql,
         max_results=arguments.get("max_results", 50),
-        fields=["summary", "status", "priority", "assignee", "issuetype", "created", "updated"],
+        fields=jira_fields_for(fields, SUMMARY_FIELDS),
     )
 
-    issues = [parse_ticket_summary(issue) for issue in result.get("issues", [])]
+    issues = [parse_ticket_summary(issue, fields) for issue in result.get("issues", [])]
 
     response: dict[str, Any] = {
         "issues": issues,
@@ -98,7 +119,7 @@ async def handle_list_tickets(
     if resolved_type:
         response["resolved_type"] = resolved_type
 
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    return [TextContent(type="text", text=render_budgeted(response, "issues", arguments))]
 
 
 LIST_MY_TICKETS_TOOL = Tool(
@@ -120,6 +141,8 @@ LIST_MY_TICKETS_TOOL = Tool(
                 "description": "Maximum number of results",
                 "default": 50,
             },
+            "fields": FIELDS_SCHEMA,
+            **BUDGET_PROPERTIES,
         },
     },
 )
@@ -157,6 +180,8 @@ LIST_TICKETS_TOOL = Tool(
                 "description": "Maximum number of results",
                 "default": 50,
             },
+            "fields": FIELDS_SCHEMA,
+            **BUDGET_PROPERTIES,
         },
     },
 )
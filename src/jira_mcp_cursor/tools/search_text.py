@@ -0,0 +1,75 @@
+"""Full-text search tool backed by the local FTS5 index."""
+
+from typing import Any
+
+from mcp.types import Tool, TextContent
+
+from ..server.jira_client import JiraClient
+from ..utils.response_budget import BUDGET_PROPERTIES, render_budgeted, render_from_cursor
+
+
+async def handle_search_text(
+    arguments: dict[str, Any],
+    jira_client: JiraClient,
+) -> list[TextContent]:
+    """Handle search_text tool call."""
+    if arguments.get("cursor"):
+        return [TextContent(type="text", text=render_from_cursor(arguments))]
+
+    text_index = jira_client.text_index
+    if text_index is None:
+        raise ValueError("The full-text index is disabled. Set JIRA_TEXT_INDEX=true to enable it.")
+
+    project = arguments.get("project")
+    results = text_index.search(
+        arguments["query"],
+        project=project,
+        limit=int(arguments.get("max_results", 10)),
+    )
+
+    response: dict[str, Any] = {
+        "results": results,
+        "indexed_issues": text_index.count(project),
+    }
+    if not response["indexed_issues"]:
+        response["hint"] = (
+            "Nothing is indexed yet for this scope. Run 'jira-mcp index --project <KEY>' "
+            "or fetch some tickets first."
+        )
+
+    return [TextContent(type="text", text=render_budgeted(response, "results", arguments))]
+
+
+SEARCH_TEXT_TOOL = Tool(
+    name="search_text",
+    description=(
+        "Full-text search over ticket summaries, descriptions and comments, answered "
+        "from a local index without calling Jira. Results are ranked by relevance "
+        "(summary matches weigh most) and include a snippet around the match. The "
+        "index holds tickets this server has fetched plus projects indexed with "
+        "'jira-mcp index'."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": (
+                    "Words to search for; all must occur. End a word with * to match "
+                    "a prefix (e.g. 'auth* timeout')."
+                ),
+            },
+            "project": {
+                "type": "string",
+                "description": "Only search this project (optional)",
+            },
+            "max_results": {
+                "type": "number",
+                "description": "Maximum number of results",
+                "default": 10,
+            },
+            **BUDGET_PROPERTIES,
+        },
+        "required": ["query"],
+    },
+)
@@ -4,9 +4,19 @@ from typing import Any
 from mcp.types import Tool, TextContent
 from ..server.jira_client import JiraClient
 from ..server.exceptions import JiraAPIError
+from ..utils.name_index import normalize_name
 import json
 
 
+def _find_transition(transitions: list[dict[str, Any]], status: str) -> Any:
+    """Return the id of the transition leading to ``status``, if any."""
+    wanted = normalize_name(status)
+    for transition in transitions:
+        if normalize_name(transition["to"]["name"]) == wanted:
+            return transition["id"]
+    return None
+
+
 async def handle_update_ticket_status(
     arguments: dict,
     jira_client: JiraClient,
@@ -22,12 +32,19 @@ async def handle_update_ticket_status(
     # Get available transitions
     transitions = await jira_client.get_transitions(ticket_key)
 
-    # Find transition ID for target status
-    transition_id = None
-    for transition in transitions:
-        if transition["to"]["name"].lower() == target_status.lower():
-            transition_id = transition["id"]
-            break
+    # Find transition ID for target status; names the caller spelled differently
+    # ("done" for "Closed", "in progres") go through the project's status index
+    transition_id = _find_transition(transitions, target_status)
+    if not transition_id:
+        project_key = ticket_key.rsplit("-", 1)[0]
+        try:
+            resolved_status = await jira_client.resolve_status(target_status, project_key)
+        except (ValueError, JiraAPIError):
+            pass
+        else:
+            transition_id = _find_transition(transitions, resolved_status)
+            if transition_id:
+                target_status = resolved_status
 
     if not transition_id:
         available = [t["to"]["name"] for t in transitions]
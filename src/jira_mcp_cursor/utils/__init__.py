@@ -1,11 +1,12 @@
 """Utility functions for Jira MCP."""
 
 from .jql_builder import build_my_tickets_jql, build_highest_priority_jql
-from .ticket_parser import parse_ticket_summary, parse_ticket_detail
+from .ticket_parser import parse_ticket_summary, parse_ticket_detail, jira_fields_for
 
 __all__ = [
     "build_my_tickets_jql",
     "build_highest_priority_jql",
     "parse_ticket_summary",
     "parse_ticket_detail",
+    "jira_fields_for",
 ]
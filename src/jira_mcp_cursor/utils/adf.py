@@ -0,0 +1,371 @@
+"""Atlassian Document Format (ADF) to Markdown conversion.
+
+Jira's v3 API returns rich text (descriptions, comments) as ADF JSON trees.
+:func:`to_markdown` turns a tree into Markdown that the description parser and
+agents can read: headings, nested bullet / numbered / task lists, code blocks,
+quotes, tables and inline marks.
+
+The converter walks the tree with an explicit stack instead of recursion, so
+arbitrarily deep nesting cannot hit the recursion limit, and writes finished
+lines straight into an output buffer. Each line is prefixed with the markers of
+the containers it sits in (list indentation, ``> ``), which are kept on a
+second stack while walking. Table cells are rendered into their own buffer and
+joined into a single Markdown table row.
+
+Conversions of issue fields are memoized by (issue key, ``updated``, field):
+an issue's rich text cannot change without its ``updated`` timestamp moving.
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from .cache import TTLCache
+
+MARKDOWN_CACHE_SIZE = 2048
+MARKDOWN_CACHE_TTL_SECONDS = 3600
+
+_markdown_cache: TTLCache[tuple[str, str, str], str] = TTLCache(
+    maxsize=MARKDOWN_CACHE_SIZE, ttl=MARKDOWN_CACHE_TTL_SECONDS
+)
+
+_TEXT_BLOCKS = frozenset({"paragraph", "heading"})
+_MARK_DELIMITERS = {"strong": "**", "em": "*", "strike": "~~"}
+
+
+class _Container:
+    """A block container on the walker's stack."""
+
+    __slots__ = ("first", "rest", "started", "blocks", "loose", "ordered", "number")
+
+    def __init__(
+        self,
+        first: str = "",
+        rest: str = "",
+        loose: bool = False,
+        ordered: bool = False,
+        number: int = 1,
+    ):
+        self.first = first  # prefix of the container's first line (list marker)
+        self.rest = rest  # prefix of every later line
+        self.started = False
+        self.blocks = 0
+        self.loose = loose
+        self.ordered = ordered
+        self.number = number  # next item number of an ordered list
+
+
+class _Writer:
+    """Line buffer that prefixes lines with the markers of open containers.
+
+    Table cells are written to a fresh buffer with their own container stack,
+    so rendering a cell never consumes the list marker of an enclosing item.
+    """
+
+    def __init__(self) -> None:
+        self.containers: list[_Container] = [_Container(loose=True)]
+        self.buffer: list[str] = []
+        self._saved: list[tuple[list[_Container], list[str]]] = []
+
+    def start_block(self) -> None:
+        """Separate a new block from its predecessor in the same container."""
+        parent = self.containers[-1]
+        if parent.blocks and parent.loose:
+            self.line("")
+        parent.blocks += 1
+
+    def line(self, text: str) -> None:
+        prefix = []
+        for container in self.containers:
+            prefix.append(container.rest if container.started else container.first)
+            container.started = True
+        joined = "".join(prefix)
+        self.buffer.append(joined + text if text else joined.rstrip())
+
+    def lines(self, text: str) -> None:
+        for line in text.split("\n"):
+            self.line(line)
+
+    def open_cell(self) -> None:
+        self._saved.append((self.containers, self.buffer))
+        self.containers, self.buffer = [_Container(loose=True)], []
+
+    def close_cell(self) -> list[str]:
+        lines = self.buffer
+        self.containers, self.buffer = self._saved.pop()
+        return lines
+
+
+def _format_date(timestamp: Any) -> str:
+    try:
+        return datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc).date().isoformat()
+    except (TypeError, ValueError, OverflowError):
+        return str(timestamp)
+
+
+def _marked(text: str, marks: list[dict[str, Any]]) -> str:
+    """Apply inline marks, keeping surrounding whitespace outside the delimiters."""
+    core = text.strip()
+    if not core:
+        return text
+    lead = text[: len(text) - len(text.lstrip())]
+    trail = text[len(text.rstrip()) :]
+    types = {mark.get("type") for mark in marks}
+    if "code" in types:
+        core = f"`{core}`"
+    for mark_type, delimiter in _MARK_DELIMITERS.items():
+        if mark_type in types:
+            core = f"{delimiter}{core}{delimiter}"
+    for mark in marks:
+        if mark.get("type") == "link":
+            href = (mark.get("attrs") or {}).get("href")
+            if href:
+                core = f"[{core}]({href})"
+    return f"{lead}{core}{trail}"
+
+
+def _inline(nodes: list[Any]) -> str:
+    """Render inline content (text, marks, mentions, ...) as one Markdown string."""
+    parts: list[str] = []
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        node_type = node.get("type")
+        attrs = node.get("attrs") or {}
+        if node_type == "text":
+            text = node.get("text", "")
+            marks = node.get("marks")
+            parts.append(_marked(text, marks) if marks else text)
+        elif node_type == "hardBreak":
+            parts.append("\n")
+        elif node_type == "mention":
+            parts.append(attrs.get("text") or f"@{attrs.get('id', '')}")
+        elif node_type == "emoji":
+            parts.append(attrs.get("text") or attrs.get("shortName", ""))
+        elif node_type in ("inlineCard", "blockCard", "embedCard"):
+            url = attrs.get("url")
+            parts.append(f"<{url}>" if url else "")
+        elif node_type == "date":
+            parts.append(_format_date(attrs.get("timestamp")))
+        elif node_type == "status":
+            parts.append(f"[{attrs.get('text', '')}]")
+        elif node_type in ("media", "mediaInline"):
+            parts.append(f"[{attrs.get('alt') or 'attachment'}]")
+        else:
+            stack.extend(reversed(node.get("content") or []))
+    return "".join(parts)
+
+
+def _cell_text(lines: list[str]) -> str:
+    """Collapse a table cell's rendered lines into one Markdown table cell."""
+    text = "<br>".join(line.strip() for line in lines if line.strip())
+    return text.replace("|", "\\|")
+
+
+def to_markdown(value: Any) -> str:
+    """Convert an ADF document (or node) to Markdown; strings are returned unchanged.
+
+    Args:
+        value: ADF tree as returned by the v3 API, a plain string (v2 API), or None
+
+    Returns:
+        Markdown text ("" for None)
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if not isinstance(value, dict):
+        return str(value)
+
+    writer = _Writer()
+    # Entries: ("node", node) to render, or a closing action for a container
+    root = "children" if value.get("type") == "doc" else "node"
+    stack: list[tuple[str, Any]] = [(root, value)]
+    tables: list[list[list[str]]] = []  # rows of rendered cells, per open table
+    header_rows: list[bool] = []  # whether each open table's first row is a header
+
+    while stack:
+        action, item = stack.pop()
+
+        if action == "children":
+            stack.extend(("node", child) for child in reversed(item.get("content") or []))
+            continue
+        if action == "close":
+            writer.containers.pop()
+            continue
+        if action == "close_item":
+            container = writer.containers.pop()
+            if not container.started:
+                # Empty list item: still show its marker
+                writer.containers.append(container)
+                writer.line("")
+                writer.containers.pop()
+            continue
+        if action == "close_cell":
+            tables[-1][-1].append(_cell_text(writer.close_cell()))
+            continue
+        if action == "close_table":
+            rows = tables.pop()
+            has_header = header_rows.pop()
+            width = max((len(row) for row in rows), default=0)
+            if not width:
+                continue
+            writer.start_block()
+            if not has_header:
+                writer.line("| " + " | ".join([" "] * width) + " |")
+                writer.line("|" + " --- |" * width)
+            for index, row in enumerate(rows):
+                row = row + [""] * (width - len(row))
+                writer.line("| " + " | ".join(row) + " |")
+                if index == 0 and has_header:
+                    writer.line("|" + " --- |" * width)
+            continue
+
+        node = item
+        if not isinstance(node, dict):
+            continue
+        node_type = node.get("type")
+        attrs = node.get("attrs") or {}
+        content = node.get("content") or []
+
+        if node_type in _TEXT_BLOCKS:
+            writer.start_block()
+            text = _inline(content)
+            if node_type == "heading":
+                level = min(max(int(attrs.get("level") or 1), 1), 6)
+                text = f"{'#' * level} {text}"
+            writer.lines(text)
+        elif node_type == "codeBlock":
+            writer.start_block()
+            writer.line(f"```{attrs.get('language') or ''}")
+            code = "".join(child.get("text", "") for child in content if isinstance(child, dict))
+            if code:
+                writer.lines(code)
+            writer.line("```")
+        elif node_type == "rule":
+            writer.start_block()
+            writer.line("---")
+        elif node_type in ("bulletList", "orderedList", "taskList", "decisionList"):
+            writer.start_block()
+            writer.containers.append(
+                _Container(ordered=node_type == "orderedList", number=int(attrs.get("order") or 1))
+            )
+            stack.append(("close", None))
+            stack.append(("children", node))
+        elif node_type in ("listItem", "taskItem", "decisionItem"):
+            parent = writer.containers[-1]
+            parent.blocks += 1
+            if node_type == "taskItem":
+                marker = "- [x] " if attrs.get("state") == "DONE" else "- [ ] "
+            elif node_type == "decisionItem":
+                marker = "- "
+            elif parent.ordered:
+                marker = f"{parent.number}. "
+                parent.number += 1
+            else:
+                marker = "- "
+            writer.containers.append(_Container(marker, " " * len(marker)))
+            stack.append(("close_item", None))
+            if node_type in ("taskItem", "decisionItem"):
+                # Task and decision items hold inline content directly, but may
+                # be followed by nested lists
+                inline = [c for c in content if isinstance(c, dict) and c.get("type") not in _LISTS]
+                nested = [c for c in content if isinstance(c, dict) and c.get("type") in _LISTS]
+                stack.extend(("node", child) for child in reversed(nested))
+                writer.containers[-1].blocks = 1
+                writer.lines(_inline(inline))
+            else:
+                stack.append(("children", node))
+        elif node_type in ("blockquote", "panel"):
+            writer.start_block()
+            writer.containers.append(_Container("> ", "> ", loose=True))
+            stack.append(("close", None))
+            stack.append(("children", node))
+        elif node_type in ("expand", "nestedExpand"):
+            writer.start_block()
+            if attrs.get("title"):
+                writer.line(f"**{attrs['title']}**")
+            writer.containers.append(_Container(loose=True))
+            writer.containers[-1].blocks = 1 if attrs.get("title") else 0
+            stack.append(("close", None))
+            stack.append(("children", node))
+        elif node_type == "table":
+            tables.append([])
+            header_rows.append(_first_row_is_header(content))
+            stack.append(("close_table", None))
+            stack.append(("children", node))
+        elif node_type == "tableRow":
+            if tables:
+                tables[-1].append([])
+            stack.append(("children", node))
+        elif node_type in ("tableCell", "tableHeader"):
+            if not tables or not tables[-1]:
+                continue
+            writer.open_cell()
+            stack.append(("close_cell", None))
+            stack.append(("children", node))
+        elif node_type in ("mediaSingle", "mediaGroup", "blockCard", "embedCard"):
+            writer.start_block()
+            writer.lines(_inline([node] if node_type.endswith("Card") else content))
+        elif node_type in _INLINE_NODES:
+            # Inline node at block level (malformed but seen in the wild)
+            writer.start_block()
+            writer.lines(_inline([node]))
+        else:
+            # Unknown container (layouts, extensions): render its children in place
+            writer.start_block()
+            writer.containers.append(_Container(loose=True))
+            stack.append(("close", None))
+            stack.append(("children", node))
+
+    return "\n".join(writer.buffer).strip("\n")
+
+
+_LISTS = frozenset({"bulletList", "orderedList", "taskList", "decisionList"})
+_INLINE_NODES = frozenset(
+    {"text", "hardBreak", "mention", "emoji", "inlineCard", "date", "status", "mediaInline"}
+)
+
+
+def _first_row_is_header(rows: list[Any]) -> bool:
+    if not rows or not isinstance(rows[0], dict):
+        return False
+    cells = rows[0].get("content") or []
+    return bool(cells) and all(
+        isinstance(cell, dict) and cell.get("type") == "tableHeader" for cell in cells
+    )
+
+
+def issue_markdown(issue: dict[str, Any], field: str = "description") -> str:
+    """Return ``issue``'s rich text ``field`` as Markdown, memoized by (key, updated)."""
+    fields = issue.get("fields") or {}
+    value = fields.get(field)
+    if not isinstance(value, dict):
+        return to_markdown(value)
+    key, updated = issue.get("key"), fields.get("updated")
+    if not key or not updated:
+        return to_markdown(value)
+    cache_key = (key, updated, field)
+    markdown = _markdown_cache.get(cache_key)
+    if markdown is None:
+        markdown = to_markdown(value)
+        _markdown_cache.set(cache_key, markdown)
+    return markdown
+
+
+def comment_markdown(comment: dict[str, Any]) -> str:
+    """Return a comment body as Markdown, memoized by (comment id, updated)."""
+    body = comment.get("body")
+    if not isinstance(body, dict):
+        return to_markdown(body)
+    comment_id, updated = comment.get("id"), comment.get("updated") or comment.get("created")
+    if not comment_id or not updated:
+        return to_markdown(body)
+    cache_key = (f"comment:{comment_id}", updated, "body")
+    markdown = _markdown_cache.get(cache_key)
+    if markdown is None:
+        markdown = to_markdown(body)
+        _markdown_cache.set(cache_key, markdown)
+    return markdown
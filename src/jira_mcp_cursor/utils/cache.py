@@ -0,0 +1,176 @@
+"""In-process caching primitives."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Hashable, Iterator, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Expired entries are dropped lazily on access; the least recently used entry
+    is evicted when ``maxsize`` is exceeded.
+
+    Attributes:
+        maxsize: Maximum number of entries kept
+        ttl: Entry lifetime in seconds
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the cached value, or ``default`` if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store ``value`` under ``key``, evicting the LRU entry when full."""
+        self._data[key] = (self._clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Remove ``key`` and return its value (expired entries return ``default``)."""
+        entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= self._clock():
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+    def keys(self) -> list[K]:
+        """Return the keys of unexpired entries, least recently used first."""
+        now = self._clock()
+        return [key for key, (expires_at, _) in self._data.items() if expires_at > now]
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over a snapshot of :meth:`keys`, so entries may be popped meanwhile."""
+        return iter(self.keys())
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > self._clock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SWRCache(Generic[K, V]):
+    """Bounded async cache with stale-while-revalidate semantics.
+
+    Entries are fresh for ``ttl`` seconds. For a further ``stale_ttl`` seconds
+    they are still served immediately while a single background task reloads
+    them; after that they are reloaded inline. Concurrent misses for the same
+    key share one load. The least recently used entry is evicted past ``maxsize``.
+
+    Attributes:
+        maxsize: Maximum number of entries kept
+        ttl: Seconds an entry is served without revalidation
+        stale_ttl: Extra seconds a stale entry may be served while refreshing
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        stale_ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """Return the cached value for ``key``, loading or revalidating as needed.
+
+        Args:
+            key: Cache key
+            loader: Coroutine factory producing a fresh value
+
+        Returns:
+            Fresh or stale-but-usable value
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            loaded_at, value = entry
+            age = self._clock() - loaded_at
+            if age < self.ttl:
+                self._data.move_to_end(key)
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self._data.move_to_end(key)
+                self._start_load(key, loader)
+                return value
+            del self._data[key]
+
+        return await self._start_load(key, loader)
+
+    def _start_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> "asyncio.Task[V]":
+        """Start (or join) the single in-flight load for ``key``."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+        return task
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        try:
+            value = await loader()
+        except Exception as e:
+            if key in self._data:
+                # Only background revalidations have a stale entry to fall back on
+                logger.warning(f"Revalidating cache entry {key!r} failed: {e}")
+                return self._data[key][1]
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self.set(key, value)
+        return value
+
+    def peek(self, key: K) -> Optional[V]:
+        """Return the cached value regardless of age, without loading."""
+        entry = self._data.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: K, value: V) -> None:
+        """Store a freshly loaded value, evicting the LRU entry when full."""
+        self._data[key] = (self._clock(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Drop ``key`` so the next lookup reloads it inline."""
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,18 @@
+"""Date helpers for Jira timestamps."""
+
+from datetime import datetime, timezone
+
+
+def parse_jira_datetime(value: str) -> datetime:
+    """Parse a Jira timestamp (e.g. '2025-01-01T10:00:00.000+0000') or ISO date.
+
+    Values without an explicit offset are treated as UTC so that results are
+    always comparable.
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 date/time
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
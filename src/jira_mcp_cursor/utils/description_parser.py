@@ -0,0 +1,210 @@
+"""Single-pass parser for Markdown-style ticket descriptions.
+
+The description is read once, line by line. Headings open sections (the body of
+a section runs to the next heading of any level), list items are classified as
+they are seen, and fenced code blocks are kept verbatim without looking for
+headings or list items inside them. Every pattern used here is anchored to one
+line, so the cost is linear in the length of the description.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+# Heading titles (lower-cased, trailing colon dropped) -> section name
+SECTION_TITLES = {
+    "requirement": "requirements",
+    "requirements": "requirements",
+    "required feature": "requirements",
+    "required features": "requirements",
+    "acceptance criteria": "acceptance_criteria",
+    "ac": "acceptance_criteria",
+    "definition of done": "acceptance_criteria",
+    "technical note": "technical_notes",
+    "technical notes": "technical_notes",
+    "implementation note": "technical_notes",
+    "implementation notes": "technical_notes",
+    "tech detail": "technical_notes",
+    "tech details": "technical_notes",
+    "dependency": "dependencies",
+    "dependencies": "dependencies",
+    "depends on": "dependencies",
+    "related ticket": "dependencies",
+    "related tickets": "dependencies",
+}
+
+MAX_ITEMS = 10
+MAX_FALLBACK_DEPENDENCIES = 5
+
+# Anchored at the start of a stripped line
+_HEADING = re.compile(r"(#{1,6})(?:\s+|$)")
+_LIST_ITEM = re.compile(r"(?:[-*•]|\d+[.)])\s+(\[[ xX]?\]\s*)?(\S.*)")
+TICKET_KEY_PATTERN = re.compile(r"\b([A-Z][A-Z0-9]*-\d+)\b")
+_COMPLEX_KEYWORDS = re.compile(r"complex|multiple|integration|architecture|refactor", re.I)
+
+
+@dataclass
+class ListItem:
+    """A bullet, numbered or checkbox list item."""
+
+    text: str
+    checkbox: bool = False
+
+
+@dataclass
+class Section:
+    """A recognised section: its raw body lines and the list items in it."""
+
+    lines: list[str] = field(default_factory=list)
+    items: list[ListItem] = field(default_factory=list)
+    ticket_keys: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines).strip()
+
+
+@dataclass
+class ParsedDescription:
+    """Everything the analysis needs, collected in one pass over the description."""
+
+    sections: dict[str, Section] = field(default_factory=dict)
+    checkboxes: list[str] = field(default_factory=list)
+    code_blocks: list[str] = field(default_factory=list)
+    ticket_keys: list[str] = field(default_factory=list)
+    has_complex_keywords: bool = False
+    length: int = 0
+
+
+def _heading_title(line: str) -> Optional[str]:
+    """Return the title of a Markdown heading line, or None if it is not one."""
+    match = _HEADING.match(line)
+    if match is None:
+        return None
+    return line[match.end() :].strip().rstrip("#").strip().rstrip(":").strip()
+
+
+def parse_description(description: str) -> ParsedDescription:
+    """Tokenize ``description`` into sections, list items, code blocks and ticket keys.
+
+    Only the first section with a given name is kept, matching how a reader
+    would treat a repeated heading.
+    """
+    parsed = ParsedDescription(length=len(description))
+    section: Optional[Section] = None
+    fence: Optional[list[str]] = None
+
+    for line in description.splitlines():
+        stripped = line.strip()
+        if not parsed.has_complex_keywords and _COMPLEX_KEYWORDS.search(line):
+            parsed.has_complex_keywords = True
+
+        if fence is not None:
+            fence.append(line)
+            if section is not None:
+                section.lines.append(line)
+            if stripped.startswith("```"):
+                parsed.code_blocks.append("\n".join(fence))
+                fence = None
+            continue
+
+        if stripped.startswith("```"):
+            fence = [line]
+            if stripped.count("```") > 1 and len(stripped) > 3:
+                # Inline ```code``` on one line
+                parsed.code_blocks.append(stripped)
+                fence = None
+            if section is not None:
+                section.lines.append(line)
+            continue
+
+        title = _heading_title(stripped)
+        if title is not None:
+            name = SECTION_TITLES.get(title.lower())
+            if name is not None and name not in parsed.sections:
+                section = parsed.sections[name] = Section()
+            else:
+                section = None
+            continue
+
+        keys = TICKET_KEY_PATTERN.findall(line)
+        parsed.ticket_keys.extend(keys)
+
+        item = _LIST_ITEM.match(stripped)
+        if item is not None:
+            list_item = ListItem(item.group(2).strip(), checkbox=item.group(1) is not None)
+            if list_item.checkbox:
+                parsed.checkboxes.append(list_item.text)
+        else:
+            list_item = None
+
+        if section is not None:
+            section.lines.append(line)
+            section.ticket_keys.extend(keys)
+            if list_item is not None:
+                section.items.append(list_item)
+
+    if fence is not None:
+        # Unterminated fence: keep what was there
+        parsed.code_blocks.append("\n".join(fence))
+    return parsed
+
+
+def _unique(values: list[str]) -> list[str]:
+    return list(dict.fromkeys(values))
+
+
+def estimate_complexity(parsed: ParsedDescription) -> str:
+    """Estimate complexity: "High" for long or complex-sounding text, else "Medium"/"Low"."""
+    if parsed.length > 1000 or parsed.has_complex_keywords:
+        return "High"
+    if parsed.length > 300:
+        return "Medium"
+    return "Low"
+
+
+def analyze_description(description: Optional[str]) -> dict[str, Any]:
+    """Extract complexity, requirements, acceptance criteria, notes and dependencies.
+
+    Args:
+        description: Ticket description text (Markdown-style)
+
+    Returns:
+        Dict with complexity, requirements, acceptance_criteria,
+        technical_notes and dependencies
+    """
+    parsed = parse_description(description or "")
+    sections = parsed.sections
+
+    # Requirements: the Requirements section's list items, else every checkbox
+    req_section = sections.get("requirements")
+    requirements = [item.text for item in req_section.items] if req_section else []
+    if not requirements:
+        requirements = parsed.checkboxes
+
+    ac_section = sections.get("acceptance_criteria")
+    criteria = [item.text for item in ac_section.items] if ac_section else []
+
+    # Technical notes: the section body, else the code blocks
+    tech_section = sections.get("technical_notes")
+    technical_notes = tech_section.text if tech_section else ""
+    if not technical_notes:
+        technical_notes = "\n\n".join(parsed.code_blocks)
+
+    dep_section = sections.get("dependencies")
+    dependencies = dep_section.ticket_keys if dep_section else []
+    if not dependencies:
+        dependencies = parsed.ticket_keys[:MAX_FALLBACK_DEPENDENCIES]
+
+    return {
+        "complexity": estimate_complexity(parsed),
+        "requirements": requirements[:MAX_ITEMS],
+        "acceptance_criteria": criteria[:MAX_ITEMS],
+        "technical_notes": technical_notes,
+        "dependencies": _unique(dependencies),
+    }
+
+
+def analyze_descriptions(descriptions: Sequence[Optional[str]]) -> list[dict[str, Any]]:
+    """Analyze several descriptions (one executor task per chunk of tickets)."""
+    return [analyze_description(description) for description in descriptions]
@@ -0,0 +1,296 @@
+"""Flow metrics from status changelogs: lead time, time in status, WIP and throughput.
+
+Issues are flattened once into columns: one row per issue (created time,
+initial status) and one row per status transition (issue index, time, from
+and to status). Every metric is then computed with NumPy array operations over
+those columns, so the cost per issue is the JSON walk plus a few array
+elements, and tens of thousands of issues take well under a second.
+
+Statuses are mapped to Jira's three status categories: work starts when an
+issue first leaves a "new" status, is in progress (counted as WIP) while its
+status is "indeterminate", and completes when it last entered a "done" status
+(only issues that are still done count as completed).
+
+Requires NumPy (the ``analytics`` extra).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import numpy as np
+
+from .dates import parse_jira_datetime
+
+DAY = 86400.0
+WEEK = 7 * DAY
+
+NEW, IN_PROGRESS, DONE = 0, 1, 2
+_CATEGORY_CODES = {"new": NEW, "indeterminate": IN_PROGRESS, "done": DONE}
+_CATEGORY_NAMES = {NEW: "todo", IN_PROGRESS: "in_progress", DONE: "done"}
+
+
+@dataclass
+class FlowData:
+    """Columnar issue and transition data; status columns hold indexes into ``statuses``."""
+
+    created: np.ndarray  # float64 epoch seconds, per issue
+    initial_status: np.ndarray  # int32, per issue
+    issue: np.ndarray  # int32 issue row, per transition
+    time: np.ndarray  # float64 epoch seconds, per transition
+    from_status: np.ndarray  # int32, per transition
+    to_status: np.ndarray  # int32, per transition
+    statuses: list[str]  # status names
+    categories: np.ndarray  # int8 category code, per status
+
+    @property
+    def issue_count(self) -> int:
+        return len(self.created)
+
+
+def build_flow_data(issues: list[dict[str, Any]], status_categories: dict[str, str]) -> FlowData:
+    """Flatten issues fetched with ``expand=changelog`` into :class:`FlowData`.
+
+    Args:
+        issues: Issues with ``created`` and ``status`` fields and full changelogs
+        status_categories: Status category key by status id
+    """
+    codes: dict[str, int] = {}
+    names: list[str] = []
+    categories: list[int] = []
+
+    def status_code(status_id: Any, name: Optional[str], category: Optional[str] = None) -> int:
+        status_id = str(status_id)
+        code = codes.get(status_id)
+        if code is None:
+            code = codes[status_id] = len(names)
+            names.append(name or status_id)
+            category = category or status_categories.get(status_id, "new")
+            categories.append(_CATEGORY_CODES.get(category, NEW))
+        return code
+
+    created: list[float] = []
+    initial: list[int] = []
+    rows: list[int] = []
+    times: list[float] = []
+    from_status: list[int] = []
+    to_status: list[int] = []
+
+    for row, issue in enumerate(issues):
+        fields = issue.get("fields") or {}
+        status = fields.get("status") or {}
+        current = status_code(
+            status.get("id", status.get("name")),
+            status.get("name"),
+            (status.get("statusCategory") or {}).get("key"),
+        )
+        created.append(parse_jira_datetime(fields["created"]).timestamp())
+        first_from: Optional[int] = None
+        first_time = float("inf")
+        for history in (issue.get("changelog") or {}).get("histories") or []:
+            for item in history.get("items") or []:
+                if item.get("field") != "status":
+                    continue
+                when = parse_jira_datetime(history["created"]).timestamp()
+                source = status_code(item.get("from"), item.get("fromString"))
+                rows.append(row)
+                times.append(when)
+                from_status.append(source)
+                to_status.append(status_code(item.get("to"), item.get("toString")))
+                if when < first_time:
+                    first_time, first_from = when, source
+        initial.append(current if first_from is None else first_from)
+
+    return FlowData(
+        created=np.array(created, dtype=np.float64),
+        initial_status=np.array(initial, dtype=np.int32),
+        issue=np.array(rows, dtype=np.int32),
+        time=np.array(times, dtype=np.float64),
+        from_status=np.array(from_status, dtype=np.int32),
+        to_status=np.array(to_status, dtype=np.int32),
+        statuses=names,
+        categories=np.array(categories, dtype=np.int8),
+    )
+
+
+def _first_per_issue(rows: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """Value of the first row of each issue (rows sorted by issue); NaN where none."""
+    result = np.full(size, np.nan)
+    issues, first = np.unique(rows, return_index=True)
+    result[issues] = values[first]
+    return result
+
+
+def _last_per_issue(rows: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """Value of the last row of each issue (rows sorted by issue); NaN where none."""
+    return _first_per_issue(rows[::-1], values[::-1], size)
+
+
+def _stats(days: np.ndarray) -> dict[str, Any]:
+    if not len(days):
+        return {"count": 0}
+    p50, p85, p95 = np.percentile(days, [50, 85, 95])
+    return {
+        "count": len(days),
+        "mean": round(float(days.mean()), 2),
+        "median": round(float(p50), 2),
+        "p85": round(float(p85), 2),
+        "p95": round(float(p95), 2),
+    }
+
+
+def _group_percentile(
+    values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float
+) -> np.ndarray:
+    """Linear-interpolated percentile ``q`` (0-1) of each sorted group of ``values``."""
+    position = starts + q * (counts - 1)
+    low = np.floor(position).astype(np.int64)
+    high = np.ceil(position).astype(np.int64)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def _time_in_status(
+    data: FlowData,
+    issue: np.ndarray,
+    time: np.ndarray,
+    from_status: np.ndarray,
+    current: np.ndarray,
+    now: float,
+) -> list[dict[str, Any]]:
+    """Days each issue spent in each not-done status (all visits summed), per status."""
+    n = data.issue_count
+    first = np.ones(len(issue), dtype=bool)
+    first[1:] = issue[1:] != issue[:-1]
+    # Each transition closes a stay in its from-status that began at the previous
+    # transition of the issue (or at creation)
+    starts = np.where(first, data.created[issue], np.roll(time, 1))
+    last_time = _last_per_issue(issue, time, n)
+    last_time = np.where(np.isnan(last_time), data.created, last_time)
+
+    # Plus the open stay in the current status
+    seg_issue = np.concatenate([issue, np.arange(n, dtype=np.int32)])
+    seg_status = np.concatenate([from_status, current])
+    seg_days = np.concatenate([time - starts, now - last_time]) / DAY
+    keep = data.categories[seg_status] != DONE
+    seg_issue, seg_status, seg_days = seg_issue[keep], seg_status[keep], seg_days[keep]
+    if not len(seg_issue):
+        return []
+
+    status_count = len(data.statuses)
+    pairs, inverse = np.unique(
+        seg_issue.astype(np.int64) * status_count + seg_status, return_inverse=True
+    )
+    totals = np.maximum(np.bincount(inverse, weights=seg_days), 0.0)
+    pair_status = pairs % status_count
+
+    order = np.lexsort((totals, pair_status))
+    sorted_status, sorted_totals = pair_status[order], totals[order]
+    present, starts_idx, counts = np.unique(sorted_status, return_index=True, return_counts=True)
+    means = np.bincount(sorted_status, weights=sorted_totals)[present] / counts
+    medians = _group_percentile(sorted_totals, starts_idx, counts, 0.5)
+    p85s = _group_percentile(sorted_totals, starts_idx, counts, 0.85)
+
+    report = [
+        {
+            "status": data.statuses[code],
+            "category": _CATEGORY_NAMES[int(data.categories[code])],
+            "issues": int(count),
+            "mean_days": round(float(mean), 2),
+            "median_days": round(float(median), 2),
+            "p85_days": round(float(p85), 2),
+        }
+        for code, count, mean, median, p85 in zip(present, counts, means, medians, p85s)
+    ]
+    return sorted(report, key=lambda entry: (entry["category"] != "todo", entry["status"]))
+
+
+def _week_start(moment: datetime) -> datetime:
+    day = moment.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday())
+
+
+def flow_metrics(data: FlowData, now: datetime, weeks: int) -> dict[str, Any]:
+    """Compute lead time, cycle time, time in status, WIP and weekly throughput.
+
+    Args:
+        data: Columns from :func:`build_flow_data`
+        now: End of the reporting period (open stays run until then)
+        weeks: Number of calendar weeks (Monday to Sunday, UTC) in the weekly series
+
+    Returns:
+        Dict with issue and completion counts, lead_time_days and
+        cycle_time_days statistics (count, mean, median, p85, p95),
+        time_in_status per status and a weekly series of throughput and WIP
+    """
+    n = data.issue_count
+    now_ts = now.timestamp()
+    category = data.categories
+
+    order = np.lexsort((data.time, data.issue))
+    issue = data.issue[order]
+    time = data.time[order]
+    from_status = data.from_status[order]
+    to_status = data.to_status[order]
+
+    last_status = _last_per_issue(issue, to_status, n)
+    current = np.where(np.isnan(last_status), data.initial_status, last_status).astype(np.int32)
+
+    # Completion: last entry into a done status, for issues that are still done
+    entered_done = (category[to_status] == DONE) & (category[from_status] != DONE)
+    completed_at = _last_per_issue(issue[entered_done], time[entered_done], n)
+    is_done = category[current] == DONE
+    # Created straight into a done status: completed on creation
+    completed_at = np.where(np.isnan(completed_at), data.created, completed_at)
+    completed_at = np.where(is_done, completed_at, np.nan)
+
+    # Start: first move out of a to-do status (or creation straight into work)
+    left_new = category[to_status] != NEW
+    left_new &= category[from_status] == NEW
+    started_at = _first_per_issue(issue[left_new], time[left_new], n)
+    started_at = np.where(category[data.initial_status] != NEW, data.created, started_at)
+
+    completed = ~np.isnan(completed_at)
+    lead_days = (completed_at[completed] - data.created[completed]) / DAY
+    cycled = completed & ~np.isnan(started_at)
+    cycle_days = np.maximum(completed_at[cycled] - started_at[cycled], 0.0) / DAY
+
+    # WIP: +1 entering an in-progress status, -1 leaving one, as a step function
+    in_progress = category == IN_PROGRESS
+    delta = in_progress[to_status].astype(np.int32) - in_progress[from_status]
+    born_in_progress = in_progress[data.initial_status]
+    event_time = np.concatenate([data.created[born_in_progress], time[delta != 0]])
+    event_delta = np.concatenate(
+        [np.ones(int(born_in_progress.sum()), dtype=np.int32), delta[delta != 0]]
+    )
+    event_order = np.argsort(event_time, kind="stable")
+    event_time = event_time[event_order]
+    level = np.cumsum(event_delta[event_order])
+
+    first_week = _week_start(now) - timedelta(weeks=weeks - 1)
+    edges = first_week.timestamp() + WEEK * np.arange(weeks + 1)
+    samples = np.minimum(edges[1:], now_ts)
+    index = np.searchsorted(event_time, samples, side="right") - 1
+    level = np.concatenate([[0], level])  # index -1 (before any event) -> 0
+    wip = level[index + 1]
+
+    done_times = completed_at[completed]
+    week = np.floor((done_times - edges[0]) / WEEK).astype(np.int64)
+    in_window = (week >= 0) & (week < weeks)
+    throughput = np.bincount(week[in_window], minlength=weeks)
+
+    return {
+        "issue_count": n,
+        "completed": int(completed.sum()),
+        "in_progress": int(wip[-1]) if weeks else 0,
+        "lead_time_days": _stats(lead_days),
+        "cycle_time_days": _stats(cycle_days),
+        "time_in_status": _time_in_status(data, issue, time, from_status, current, now_ts),
+        "weekly": [
+            {
+                "week_start": (first_week + timedelta(weeks=i)).date().isoformat(),
+                "throughput": int(throughput[i]),
+                "wip": int(wip[i]),
+            }
+            for i in range(weeks)
+        ],
+    }
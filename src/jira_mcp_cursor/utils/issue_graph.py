@@ -0,0 +1,293 @@
+"""Issue dependency graphs: edge extraction, crawling, cycles and scheduling.
+
+Edges come from three sources on an issue payload:
+
+- issue links (``issuelinks``), labelled with the link's phrase as seen from
+  the issue ("blocks", "is blocked by", "relates to", ...)
+- subtasks (``subtasks``), labelled "has subtask"
+- ticket keys mentioned in the description, labelled "mentions" (only keys
+  of known projects, so tokens like UTF-8 or SHA-256 are not taken for tickets)
+
+Only some of those express a dependency. :func:`dependency_edges` orients them
+as "A depends on B": the blocked issue depends on its blocker, a parent on its
+subtasks and an issue on the tickets its description mentions. Symmetric links
+such as "relates to" are kept in the adjacency list but never form cycles.
+
+:func:`crawl` walks the graph breadth-first, one batched fetch per layer.
+:func:`topological_order` and :func:`critical_path` schedule a DAG of blocking
+links; like :func:`find_cycles` they are linear in nodes plus edges.
+"""
+
+from typing import Any, Awaitable, Callable, Collection, Iterable, Optional
+
+from .adf import issue_markdown
+from .description_parser import TICKET_KEY_PATTERN
+
+EDGE_KINDS = ("links", "subtasks", "mentions")
+
+# Fields crawling needs to find every kind of edge
+GRAPH_FIELDS = [
+    "summary",
+    "status",
+    "issuetype",
+    "issuelinks",
+    "subtasks",
+    "description",
+    "updated",
+]
+
+# Link phrases, lower-cased: where the issue holding the link depends on the other
+# issue, and where the other issue depends on it
+_DEPENDS_ON_OTHER = frozenset({"is blocked by", "depends on", "is a subtask of"})
+_OTHER_DEPENDS_ON = frozenset({"blocks", "is depended on by", "is dependency of"})
+
+SUBTASK = "has subtask"
+MENTIONS = "mentions"
+
+
+def issue_edges(
+    issue: dict[str, Any],
+    kinds: Iterable[str] = EDGE_KINDS,
+    projects: Optional[Collection[str]] = None,
+) -> list[dict[str, str]]:
+    """Return the outgoing edges of ``issue`` as {"key", "relation"} dicts (deduplicated).
+
+    With ``projects``, mentioned keys are kept only if their project is one of them.
+    """
+    kinds = set(kinds)
+    key = issue.get("key")
+    fields = issue.get("fields") or {}
+    edges: dict[tuple[str, str], dict[str, str]] = {}
+
+    def add(target: Optional[str], relation: str) -> None:
+        if target and target != key:
+            edges.setdefault((target, relation), {"key": target, "relation": relation})
+
+    if "links" in kinds:
+        for link in fields.get("issuelinks") or []:
+            link_type = link.get("type") or {}
+            if link.get("outwardIssue"):
+                add(link["outwardIssue"].get("key"), link_type.get("outward") or "links to")
+            if link.get("inwardIssue"):
+                add(link["inwardIssue"].get("key"), link_type.get("inward") or "linked from")
+    if "subtasks" in kinds:
+        for subtask in fields.get("subtasks") or []:
+            add(subtask.get("key"), SUBTASK)
+    if "mentions" in kinds and fields.get("description"):
+        for mentioned in TICKET_KEY_PATTERN.findall(issue_markdown(issue)):
+            if projects is None or mentioned.rsplit("-", 1)[0] in projects:
+                add(mentioned, MENTIONS)
+    return list(edges.values())
+
+
+def dependency_edges(key: str, edges: list[dict[str, str]]) -> Iterable[tuple[str, str]]:
+    """Yield (dependent, dependency) pairs for the dependency-bearing edges of ``key``."""
+    for edge in edges:
+        relation = edge["relation"].lower()
+        if relation in _DEPENDS_ON_OTHER or relation in (SUBTASK, MENTIONS):
+            yield key, edge["key"]
+        elif relation in _OTHER_DEPENDS_ON:
+            yield edge["key"], key
+
+
+async def crawl(
+    fetch: Callable[[list[str]], Awaitable[list[dict[str, Any]]]],
+    roots: list[str],
+    neighbours: Callable[[dict[str, Any]], Iterable[str]],
+    max_depth: int,
+    max_issues: int,
+) -> tuple[dict[str, dict[str, Any]], dict[str, int], bool]:
+    """Breadth-first crawl from ``roots``, fetching each layer with one batched call.
+
+    Args:
+        fetch: Fetches issues for a list of keys (e.g. ``JiraClient.get_issues``)
+        roots: Keys to start from (depth 0)
+        neighbours: Keys to visit next from a fetched issue
+        max_depth: Deepest layer to fetch
+        max_issues: Stop expanding once this many issues are fetched
+
+    Returns:
+        (issues by key, depth by key, truncated). Depths include keys that were
+        discovered but not fetched because of the limits; ``truncated`` tells
+        whether ``max_issues`` cut the crawl short.
+    """
+    issues: dict[str, dict[str, Any]] = {}
+    depths: dict[str, int] = {}
+    frontier = list(dict.fromkeys(key.upper() for key in roots))
+    for key in frontier:
+        depths[key] = 0
+    truncated = False
+
+    depth = 0
+    while frontier:
+        if len(issues) + len(frontier) > max_issues:
+            frontier = frontier[: max(max_issues - len(issues), 0)]
+            truncated = True
+        if not frontier:
+            break
+        # Expand every fetched issue, including one returned under a key that
+        # was not asked for (an issue moved to another project keeps answering
+        # to its old key), at the depth it was reached
+        layer: list[str] = []
+        for issue in await fetch(frontier):
+            key = issue["key"]
+            issues[key] = issue
+            depths.setdefault(key, depth)
+            layer.append(key)
+        if depth == max_depth:
+            for key in layer:
+                for neighbour in neighbours(issues[key]):
+                    depths.setdefault(neighbour, depth + 1)
+            break
+
+        next_frontier: list[str] = []
+        for key in layer:
+            for neighbour in neighbours(issues[key]):
+                if neighbour not in depths:
+                    depths[neighbour] = depth + 1
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+        depth += 1
+    return issues, depths, truncated
+
+
+def find_cycles(graph: dict[str, list[str]]) -> list[list[str]]:
+    """Return the cycles of a directed graph as strongly connected components.
+
+    Iterative Tarjan: linear in nodes plus edges and safe on long chains. Each
+    component with more than one node (or a self-loop) is returned with its
+    keys sorted; components are sorted by their first key.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    cycles: list[list[str]] = []
+    counter = 0
+
+    nodes = list(dict.fromkeys([*graph, *(t for targets in graph.values() for t in targets)]))
+    for start in nodes:
+        if start in index:
+            continue
+        work = [(start, iter(graph.get(start, ())))]
+        index[start] = lowlink[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack.add(start)
+        while work:
+            node, targets = work[-1]
+            advanced = False
+            for target in targets:
+                if target not in index:
+                    index[target] = lowlink[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(graph.get(target, ()))))
+                    advanced = True
+                    break
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index[target])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in graph.get(node, ()):
+                    cycles.append(sorted(component))
+    return sorted(cycles)
+
+
+def topological_order(
+    nodes: list[str], successors: dict[str, list[str]]
+) -> tuple[list[str], list[str]]:
+    """Order ``nodes`` so every edge points forward (Kahn's algorithm, linear time).
+
+    Ties are broken by the order of ``nodes``, so the result is deterministic.
+
+    Returns:
+        (ordered nodes, nodes left out because they are on or behind a cycle)
+    """
+    indegree = dict.fromkeys(nodes, 0)
+    for node in nodes:
+        for successor in successors.get(node, ()):
+            indegree[successor] += 1
+
+    ready = [node for node in reversed(nodes) if not indegree[node]]
+    order: list[str] = []
+    while ready:
+        node = ready.pop()
+        order.append(node)
+        released = []
+        for successor in successors.get(node, ()):
+            indegree[successor] -= 1
+            if not indegree[successor]:
+                released.append(successor)
+        ready.extend(reversed(released))
+    placed = set(order)
+    return order, [node for node in nodes if node not in placed]
+
+
+def critical_path(
+    order: list[str],
+    successors: dict[str, list[str]],
+    weights: dict[str, float],
+) -> dict[str, Any]:
+    """Critical path method over a DAG given in topological order.
+
+    A forward pass computes each node's earliest start and finish, a backward
+    pass its latest finish; slack is the difference. The critical path is the
+    chain of zero-slack nodes ending at the latest finish. Both passes are
+    linear in nodes plus edges.
+
+    Returns:
+        Dict with ``path`` (keys), ``length`` (total weight) and per-node
+        ``schedule`` entries (earliest_start, earliest_finish, slack)
+    """
+    position = {node: index for index, node in enumerate(order)}
+    start = dict.fromkeys(order, 0.0)
+    previous: dict[str, Optional[str]] = dict.fromkeys(order)
+    finish: dict[str, float] = {}
+    for node in order:
+        finish[node] = start[node] + weights.get(node, 0.0)
+        for successor in successors.get(node, ()):
+            if successor not in position:
+                continue
+            # Starts are never below 0, so the first predecessor always qualifies
+            if previous[successor] is None or finish[node] > start[successor]:
+                start[successor] = finish[node]
+                previous[successor] = node
+
+    length = max(finish.values(), default=0.0)
+    latest = dict.fromkeys(order, length)
+    for node in reversed(order):
+        for successor in successors.get(node, ()):
+            if successor in position:
+                latest[node] = min(latest[node], latest[successor] - weights.get(successor, 0.0))
+
+    path: list[str] = []
+    # On ties, end at the later node so zero-weight sinks stay on the path
+    current = max(order, key=lambda key: (finish[key], position[key]), default=None)
+    while current is not None:
+        path.append(current)
+        current = previous[current]
+    path.reverse()
+
+    schedule = {
+        node: {
+            "earliest_start": start[node],
+            "earliest_finish": finish[node],
+            "slack": latest[node] - finish[node],
+        }
+        for node in order
+    }
+    return {"path": path, "length": length, "schedule": schedule}
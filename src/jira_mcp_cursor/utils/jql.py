@@ -0,0 +1,424 @@
+"""Small JQL syntax tree with escaping and canonical serialization.
+
+Queries are built from :class:`Clause` nodes combined with :func:`all_of` /
+:func:`any_of` and wrapped in a :class:`Query`. ``str(query)`` renders the
+canonical form:
+
+- field names and operators are normalized (``Project`` -> ``project``,
+  ``in`` -> ``IN``)
+- string values are always double-quoted with ``\\`` and ``"`` escaped
+- ``AND``/``OR`` operands are flattened, de-duplicated and sorted, and ``IN``
+  lists are sorted, since their order does not change the result
+
+Semantically identical queries therefore serialize to the same string, which
+makes the string usable as a cache key. :func:`parse` reads JQL text back into
+the same tree (for the subset the tree can represent); JQL it can't, such as a
+user's own condition, is embedded verbatim as a :class:`Raw` node.
+
+Example:
+    >>> str(Query(all_of(Clause("status", "=", "Done"), Clause("project", "=", "PROJ"))))
+    'project = "PROJ" AND status = "Done"'
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Union
+
+_BARE_FIELD = re.compile(r"^(?:[A-Za-z_][\w.]*|cf\[\d+\])$", re.IGNORECASE)
+
+OPERATORS = frozenset(
+    {"=", "!=", ">", ">=", "<", "<=", "~", "!~", "IN", "NOT IN", "IS", "IS NOT", "WAS", "CHANGED"}
+)
+
+
+@dataclass(frozen=True)
+class Function:
+    """A JQL function call such as ``currentUser()`` or ``startOfDay(-7d)``."""
+
+    name: str
+    args: tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        return f"{self.name}({', '.join(self.args)})"
+
+
+@dataclass(frozen=True)
+class Keyword:
+    """A bare JQL keyword value (``EMPTY``, ``NULL``)."""
+
+    name: str
+
+    def __str__(self) -> str:
+        return self.name.upper()
+
+
+CURRENT_USER = Function("currentUser")
+EMPTY = Keyword("EMPTY")
+
+Scalar = Union[str, int, float, Function, Keyword]
+Value = Union[Scalar, tuple[Scalar, ...]]
+
+
+def quote(value: str) -> str:
+    """Double-quote a JQL string literal, escaping backslashes and quotes."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def format_field(name: str) -> str:
+    """Return the canonical spelling of a field name (lowercase, quoted if needed)."""
+    lowered = name.strip().lower()
+    return lowered if _BARE_FIELD.match(lowered) else quote(lowered)
+
+
+def _format_scalar(value: Scalar) -> str:
+    if isinstance(value, (Function, Keyword)):
+        return str(value)
+    if isinstance(value, bool):
+        raise TypeError("JQL has no boolean literals")
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return quote(value)
+
+
+@dataclass(frozen=True)
+class Clause:
+    """A single ``field operator value`` condition.
+
+    Attributes:
+        field: Field name (e.g. "project", "cf[10016]", "Story Points")
+        operator: JQL operator; case-insensitive (e.g. "=", "in", "is not")
+        value: String, number, :class:`Function`, :class:`Keyword`, or a tuple
+            of those for ``IN``/``NOT IN``
+    """
+
+    field: str
+    operator: str
+    value: Value
+
+    def __post_init__(self) -> None:
+        operator = " ".join(self.operator.upper().split())
+        if operator not in OPERATORS:
+            raise ValueError(f"Unsupported JQL operator: {self.operator!r}")
+        object.__setattr__(self, "operator", operator)
+        value = self.value
+        if operator in ("IN", "NOT IN"):
+            value = tuple(value) if isinstance(value, (list, tuple)) else (value,)
+        elif isinstance(value, (list, tuple)):
+            raise ValueError(f"Operator {operator} takes a single value")
+        object.__setattr__(self, "value", value)
+
+    def __str__(self) -> str:
+        if isinstance(self.value, tuple):
+            items = sorted({_format_scalar(item) for item in self.value})
+            rendered = f"({', '.join(items)})"
+        else:
+            rendered = _format_scalar(self.value)
+        return f"{format_field(self.field)} {self.operator} {rendered}"
+
+
+@dataclass(frozen=True)
+class And:
+    """Conjunction of conditions; build with :func:`all_of`."""
+
+    operands: tuple["Node", ...]
+
+    def __str__(self) -> str:
+        return " AND ".join(_render_operand(operand) for operand in self.operands)
+
+
+@dataclass(frozen=True)
+class Or:
+    """Disjunction of conditions; build with :func:`any_of`."""
+
+    operands: tuple["Node", ...]
+
+    def __str__(self) -> str:
+        return " OR ".join(_render_operand(operand) for operand in self.operands)
+
+
+@dataclass(frozen=True)
+class Not:
+    """Negation of a condition."""
+
+    operand: "Node"
+
+    def __str__(self) -> str:
+        return f"NOT {_render_operand(self.operand, force_parens=True)}"
+
+
+@dataclass(frozen=True)
+class Raw:
+    """JQL condition text passed through as is, parenthesised when combined.
+
+    Not canonicalized: two spellings of the same condition render differently.
+    """
+
+    text: str
+
+    def __str__(self) -> str:
+        return self.text.strip()
+
+
+Node = Union[Clause, And, Or, Not, Raw]
+
+
+def _render_operand(node: Node, force_parens: bool = False) -> str:
+    text = str(node)
+    if isinstance(node, Raw) or (
+        isinstance(node, (And, Or)) and (force_parens or len(node.operands) > 1)
+    ):
+        return f"({text})"
+    return text
+
+
+def _combine(kind: type[Union[And, Or]], nodes: tuple[Optional[Node], ...]) -> Optional[Node]:
+    """Flatten, de-duplicate and sort operands of a commutative operator."""
+    flat: dict[str, Node] = {}
+    for node in nodes:
+        if node is None:
+            continue
+        for operand in node.operands if isinstance(node, kind) else (node,):
+            flat.setdefault(str(operand), operand)
+    if not flat:
+        return None
+    if len(flat) == 1:
+        return next(iter(flat.values()))
+    return kind(tuple(flat[key] for key in sorted(flat)))
+
+
+def all_of(*nodes: Optional[Node]) -> Optional[Node]:
+    """AND the given conditions together (``None`` entries are skipped)."""
+    return _combine(And, nodes)
+
+
+def any_of(*nodes: Optional[Node]) -> Optional[Node]:
+    """OR the given conditions together (``None`` entries are skipped)."""
+    return _combine(Or, nodes)
+
+
+@dataclass(frozen=True)
+class Query:
+    """A complete JQL query: an optional condition plus ``ORDER BY`` terms.
+
+    Attributes:
+        where: Condition tree, or None to match everything
+        order_by: (field, "ASC"/"DESC") pairs, in priority order
+    """
+
+    where: Optional[Node] = None
+    order_by: tuple[tuple[str, str], ...] = ()
+
+    def __post_init__(self) -> None:
+        normalized = []
+        for field, direction in self.order_by:
+            direction = direction.upper()
+            if direction not in ("ASC", "DESC"):
+                raise ValueError(f"Unsupported sort direction: {direction!r}")
+            normalized.append((field, direction))
+        object.__setattr__(self, "order_by", tuple(normalized))
+
+    def __str__(self) -> str:
+        parts = [str(self.where)] if self.where is not None else []
+        if self.order_by:
+            terms = ", ".join(
+                f"{format_field(field)} {direction}" for field, direction in self.order_by
+            )
+            parts.append(f"ORDER BY {terms}")
+        return " ".join(parts)
+
+
+# ORDER BY, with string literals matched first so the words inside them are skipped
+_ORDER_BY = re.compile(
+    r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')""" r"|\border\s+by\b",
+    re.IGNORECASE,
+)
+
+
+def strip_order_by(jql: str) -> str:
+    """Return the condition part of JQL text, without any ``ORDER BY`` clause."""
+    for match in _ORDER_BY.finditer(jql):
+        if match.group(1) is None:
+            return jql[: match.start()].strip()
+    return jql.strip()
+
+
+class JQLSyntaxError(ValueError):
+    """Raised by :func:`parse` for malformed JQL or constructs the tree can't represent."""
+
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<operator>!=|>=|<=|!~|=|>|<|~)
+      | (?P<punct>[(),])
+      | (?P<word>[^\s"'(),=!<>~]+)
+    )""",
+    re.VERBOSE,
+)
+_ESCAPE = re.compile(r"\\(.)")
+_KEYWORDS = frozenset({"and", "or", "not", "in", "is", "order", "by", "empty", "null"})
+
+
+def _tokenize(jql: str) -> list[tuple[str, str]]:
+    """Split JQL into (kind, text) tokens; kind is string/operator/punct/word."""
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    jql = jql.rstrip()
+    while position < len(jql):
+        match = _TOKEN.match(jql, position)
+        if match is None:
+            raise JQLSyntaxError(f"Unexpected character at position {position}: {jql[position:]!r}")
+        kind = match.lastgroup or ""
+        text = match.group(kind)
+        if kind == "string":
+            text = _ESCAPE.sub(lambda m: "\n" if m.group(1) == "n" else m.group(1), text[1:-1])
+        tokens.append((kind, text))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser over :func:`_tokenize` output."""
+
+    def __init__(self, tokens: list[tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> tuple[str, str]:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else ("end", "")
+
+    def next(self) -> tuple[str, str]:
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def at_keyword(self, *words: str, offset: int = 0) -> bool:
+        kind, text = self.peek(offset)
+        return kind == "word" and text.lower() in words
+
+    def expect(self, kind: str, text: str) -> None:
+        token = self.next()
+        if token[0] != kind or token[1].lower() != text:
+            raise JQLSyntaxError(f"Expected {text!r}, found {token[1] or 'end of query'!r}")
+
+    def query(self) -> Query:
+        where = None
+        if self.peek()[0] != "end" and not self.at_keyword("order"):
+            where = self.disjunction()
+        order_by: list[tuple[str, str]] = []
+        if self.at_keyword("order"):
+            self.next()
+            self.expect("word", "by")
+            while True:
+                kind, field = self.next()
+                if kind not in ("word", "string"):
+                    raise JQLSyntaxError(f"Expected a field to order by, found {field!r}")
+                direction = "ASC"
+                if self.at_keyword("asc", "desc"):
+                    direction = self.next()[1]
+                order_by.append((field, direction))
+                if self.peek() != ("punct", ","):
+                    break
+                self.next()
+        if self.peek()[0] != "end":
+            raise JQLSyntaxError(f"Unexpected {self.peek()[1]!r}")
+        return Query(where, order_by=tuple(order_by))
+
+    def disjunction(self) -> Node:
+        operands = [self.conjunction()]
+        while self.at_keyword("or"):
+            self.next()
+            operands.append(self.conjunction())
+        # Never None: there is at least one operand
+        return any_of(*operands) or operands[0]
+
+    def conjunction(self) -> Node:
+        operands = [self.negation()]
+        while self.at_keyword("and"):
+            self.next()
+            operands.append(self.negation())
+        return all_of(*operands) or operands[0]
+
+    def negation(self) -> Node:
+        if self.at_keyword("not"):
+            self.next()
+            return Not(self.negation())
+        if self.peek() == ("punct", "("):
+            self.next()
+            node = self.disjunction()
+            self.expect("punct", ")")
+            return node
+        return self.clause()
+
+    def clause(self) -> Clause:
+        kind, field = self.next()
+        if kind not in ("word", "string") or (kind == "word" and field.lower() in _KEYWORDS):
+            raise JQLSyntaxError(f"Expected a field name, found {field or 'end of query'!r}")
+        kind, text = self.next()
+        if kind == "operator":
+            operator = text
+        elif kind == "word" and text.lower() in ("in", "is"):
+            operator = text.upper()
+            if self.at_keyword("not"):
+                self.next()
+                operator += " NOT"
+        elif kind == "word" and text.lower() == "not" and self.at_keyword("in"):
+            self.next()
+            operator = "NOT IN"
+        else:
+            raise JQLSyntaxError(
+                f"Unsupported operator after {field!r}: {text or 'end of query'!r}"
+            )
+
+        if operator in ("IN", "NOT IN"):
+            self.expect("punct", "(")
+            values = [self.value()]
+            while self.peek() == ("punct", ","):
+                self.next()
+                values.append(self.value())
+            self.expect("punct", ")")
+            return Clause(field, operator, tuple(values))
+        return Clause(field, operator, self.value())
+
+    def value(self) -> Scalar:
+        kind, text = self.next()
+        if kind == "string":
+            return text
+        if kind != "word":
+            raise JQLSyntaxError(f"Expected a value, found {text or 'end of query'!r}")
+        if self.peek() == ("punct", "("):
+            self.next()
+            args: list[str] = []
+            while self.peek() != ("punct", ")"):
+                arg_kind, arg = self.next()
+                if arg_kind not in ("word", "string"):
+                    raise JQLSyntaxError(f"Unexpected {arg or 'end of query'!r} in {text}()")
+                args.append(arg)
+                if self.peek() == ("punct", ","):
+                    self.next()
+            self.next()
+            return Function(text, tuple(args))
+        if text.lower() in ("empty", "null"):
+            return Keyword(text)
+        return text
+
+
+def parse(jql: str) -> Query:
+    """Parse JQL text into a :class:`Query`.
+
+    Supports conditions joined by ``AND``/``OR``/``NOT`` and parentheses, the
+    operators in :data:`OPERATORS` except ``WAS``/``CHANGED`` (whose history
+    predicates the tree can't hold), function calls and ``ORDER BY``. Unquoted
+    values are read as strings.
+
+    Raises:
+        JQLSyntaxError: If the query is malformed or uses unsupported syntax
+    """
+    try:
+        return _Parser(_tokenize(jql)).query()
+    except JQLSyntaxError:
+        raise
+    except ValueError as e:
+        raise JQLSyntaxError(str(e)) from e
@@ -2,26 +2,41 @@
 
 from typing import Optional
 
+from .jql import CURRENT_USER, Clause, Query, all_of
 
-def build_my_tickets_jql(
+
+def my_tickets_query(
     status: Optional[str] = None,
     project: Optional[str] = None,
     exclude_statuses: Optional[list[str]] = None,
-) -> str:
-    """Build JQL query for user's assigned tickets."""
-    parts = ["assignee = currentUser()"]
-
-    if status:
-        parts.append(f'status = "{status}"')
-
-    if project:
-        parts.append(f'project = "{project}"')
+    order_by: tuple[tuple[str, str], ...] = (),
+) -> Query:
+    """Build the query for the user's assigned tickets.
+
+    Args:
+        status: Only include tickets in this status
+        project: Only include tickets in this project
+        exclude_statuses: Statuses to leave out
+        order_by: (field, direction) sort terms
+    """
+    return Query(
+        all_of(
+            Clause("assignee", "=", CURRENT_USER),
+            Clause("status", "=", status) if status else None,
+            Clause("project", "=", project) if project else None,
+            *(Clause("status", "!=", excluded) for excluded in exclude_statuses or []),
+        ),
+        order_by=order_by,
+    )
 
-    if exclude_statuses:
-        for status_item in exclude_statuses:
-            parts.append(f'status != "{status_item}"')
 
-    return " AND ".join(parts)
+def build_my_tickets_jql(
+    status: Optional[str] = None,
+    project: Optional[str] = None,
+    exclude_statuses: Optional[list[str]] = None,
+) -> str:
+    """Build JQL query for user's assigned tickets (see :func:`my_tickets_query`)."""
+    return str(my_tickets_query(status, project, exclude_statuses))
 
 
 def build_highest_priority_jql(
@@ -29,5 +44,10 @@ def build_highest_priority_jql(
     exclude_statuses: Optional[list[str]] = None,
 ) -> str:
     """Build JQL query for highest priority ticket."""
-    jql = build_my_tickets_jql(project=project, exclude_statuses=exclude_statuses)
-    return f"{jql} ORDER BY priority DESC"
+    return str(
+        my_tickets_query(
+            project=project,
+            exclude_statuses=exclude_statuses,
+            order_by=(("priority", "DESC"),),
+        )
+    )
@@ -0,0 +1,163 @@
+"""Fuzzy name resolution for Jira metadata (issue types, statuses, priorities, link types).
+
+A :class:`NameIndex` is built once per metadata load and answers lookups in
+tiers, stopping at the first tier that matches:
+
+1. exact match on the normalized name (case, spaces and punctuation ignored)
+2. alias match (e.g. "defect" -> "Bug", "duplicates" -> "Duplicate")
+3. substring match, narrowed through a trigram index
+4. typo tolerance: smallest edit distance among trigram-sharing candidates
+"""
+
+import re
+from typing import Iterable, Mapping, Optional
+
+# Synonyms commonly used for Jira's default names. A group applies when one of
+# its members is an actual name in the index; the others become aliases of it.
+SYNONYM_GROUPS: tuple[tuple[str, ...], ...] = (
+    ("bug", "defect", "fault"),
+    ("story", "user story"),
+    ("improvement", "enhancement"),
+    ("epic", "feature epic"),
+    ("to do", "todo", "open", "backlog", "new"),
+    ("in progress", "doing", "wip", "started"),
+    ("in review", "review", "code review"),
+    ("done", "closed", "resolved", "complete", "completed"),
+    ("highest", "critical", "blocker", "urgent"),
+    ("lowest", "trivial"),
+    ("relates", "relates to", "related"),
+    ("duplicate", "duplicates"),
+    ("cloners", "clones"),
+)
+
+# Inward phrasings of Jira's default link types, by normalized link type name.
+# They name the link from the other side, so they are not plain aliases: a
+# caller matching one has to swap the inward and outward issues.
+INWARD_SYNONYMS: dict[str, tuple[str, ...]] = {
+    "blocks": ("blocked by", "is blocked by"),
+    "duplicate": ("duplicated by", "is duplicated by"),
+    "cloners": ("cloned by", "is cloned by"),
+}
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize_name(name: str) -> str:
+    """Case-fold ``name`` and drop whitespace and punctuation ("Sub-task" -> "subtask")."""
+    return _SEPARATORS.sub("", name.casefold())
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or ``limit + 1`` once it exceeds ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class NameIndex:
+    """Precomputed lookup structure over a set of canonical names.
+
+    Attributes:
+        names: Canonical names, in the order given
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        aliases: Optional[Mapping[str, Iterable[str]]] = None,
+    ):
+        """Build the index.
+
+        Args:
+            names: Canonical names (e.g. a project's issue types)
+            aliases: Extra aliases per canonical name (e.g. a link type's
+                inward/outward descriptions)
+        """
+        self.names: list[str] = list(dict.fromkeys(names))
+        self._exact: dict[str, list[str]] = {}
+        self._aliases: dict[str, list[str]] = {}
+        self._trigrams: dict[str, set[str]] = {}
+
+        for name in self.names:
+            self._exact.setdefault(normalize_name(name), []).append(name)
+
+        for name in self.names:
+            key = normalize_name(name)
+            extra = [normalize_name(alias) for alias in (aliases or {}).get(name, ())]
+            for group in SYNONYM_GROUPS:
+                members = [normalize_name(member) for member in group]
+                if key in members:
+                    extra.extend(members)
+            for alias in extra:
+                if alias and alias not in self._exact:
+                    targets = self._aliases.setdefault(alias, [])
+                    if name not in targets:
+                        targets.append(name)
+
+        for key in (*self._exact, *self._aliases):
+            for gram in _trigrams(key):
+                self._trigrams.setdefault(gram, set()).add(key)
+
+    def _names_for(self, key: str) -> list[str]:
+        return list(self._exact.get(key) or self._aliases.get(key, []))
+
+    def _substring_matches(self, query: str) -> list[str]:
+        if len(query) >= 3:
+            grams = [query[i : i + 3] for i in range(len(query) - 2)]
+            postings = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+            candidates = set.intersection(*postings) if postings else set()
+        else:
+            candidates = set(self._exact)
+        keys = {key for key in candidates if key in self._exact and query in key}
+        return [name for name in self.names if normalize_name(name) in keys]
+
+    def _closest_matches(self, query: str) -> list[str]:
+        limit = max(1, len(query) // 4)
+        candidates: set[str] = set()
+        for gram in _trigrams(query):
+            candidates |= self._trigrams.get(gram, set())
+
+        best = limit + 1
+        best_keys: list[str] = []
+        for key in candidates:
+            distance = _edit_distance(query, key, limit)
+            if distance < best:
+                best, best_keys = distance, [key]
+            elif distance == best:
+                best_keys.append(key)
+        if best > limit:
+            return []
+
+        matches: list[str] = []
+        for key in best_keys:
+            for name in self._names_for(key):
+                if name not in matches:
+                    matches.append(name)
+        return [name for name in self.names if name in matches]
+
+    def lookup(self, query: str) -> list[str]:
+        """Return the canonical names matching ``query`` at the best matching tier.
+
+        An empty list means no match; more than one means the query is ambiguous.
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+        return self._names_for(key) or self._substring_matches(key) or self._closest_matches(key)
@@ -0,0 +1,158 @@
+"""Response size budgets and continuation cursors for list tools.
+
+When a caller passes ``max_bytes`` or ``max_tokens``, list responses are
+truncated item by item so the serialized JSON stays within the budget. The
+items that did not fit are kept in a server-side cache under an opaque cursor,
+so the next page is served without re-running the JQL query or re-downloading
+issues.
+"""
+
+import json
+import secrets
+from typing import Any, Optional
+
+from .cache import TTLCache
+
+# Rough size of one LLM token in bytes of JSON, used to convert max_tokens
+BYTES_PER_TOKEN = 4
+
+CURSOR_TTL_SECONDS = 600
+MAX_CURSORS = 128
+
+BUDGET_PROPERTIES: dict[str, Any] = {
+    "max_bytes": {
+        "type": "number",
+        "description": (
+            "Maximum response size in bytes. Results beyond the budget are returned "
+            "on the next page via next_cursor."
+        ),
+    },
+    "max_tokens": {
+        "type": "number",
+        "description": "Maximum response size in tokens (approx. 4 bytes each)",
+    },
+    "cursor": {
+        "type": "string",
+        "description": (
+            "next_cursor from a previous truncated response. Returns the next page "
+            "from the server-side cache; other filters are ignored."
+        ),
+    },
+}
+
+_COMPACT = (",", ":")
+
+
+class ResultCursorStore:
+    """Server-side cache of result remainders, keyed by opaque cursor tokens."""
+
+    def __init__(self, maxsize: int = MAX_CURSORS, ttl: float = CURSOR_TTL_SECONDS):
+        self._entries: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def put(self, entry: dict[str, Any]) -> str:
+        """Store a continuation entry and return its cursor token."""
+        cursor = secrets.token_urlsafe(16)
+        self._entries.set(cursor, entry)
+        return cursor
+
+    def get(self, cursor: str) -> Optional[dict[str, Any]]:
+        """Return the continuation entry for ``cursor``, or None if unknown/expired."""
+        return self._entries.get(cursor)
+
+
+_cursor_store: Optional[ResultCursorStore] = None
+
+
+def get_cursor_store() -> ResultCursorStore:
+    """Get or create the process-wide cursor store."""
+    global _cursor_store
+    if _cursor_store is None:
+        _cursor_store = ResultCursorStore()
+    return _cursor_store
+
+
+def resolve_budget(arguments: dict[str, Any]) -> Optional[int]:
+    """Return the byte budget requested by the tool arguments, if any."""
+    if arguments.get("max_bytes"):
+        return int(arguments["max_bytes"])
+    if arguments.get("max_tokens"):
+        return int(arguments["max_tokens"]) * BYTES_PER_TOKEN
+    return None
+
+
+def _paginate(
+    base: dict[str, Any],
+    items_key: str,
+    items: list[Any],
+    budget: int,
+) -> str:
+    """Emit as many items as fit in ``budget`` and park the rest behind a cursor.
+
+    Sizes are measured on compact JSON, which is also what gets emitted, so the
+    cut-off is exact and deterministic. At least one item is always returned so
+    that paging makes progress.
+    """
+    # Size of the envelope including the cursor fields that may be added
+    envelope = {
+        **base,
+        items_key: [],
+        "returned": len(items),
+        "truncated": True,
+        "next_cursor": "x" * 22,
+    }
+    used = len(json.dumps(envelope, separators=_COMPACT).encode())
+
+    count = 0
+    for item in items:
+        size = len(json.dumps(item, separators=_COMPACT).encode()) + (1 if count else 0)
+        if count and used + size > budget:
+            break
+        used += size
+        count += 1
+
+    response = {**base, items_key: items[:count], "returned": count}
+    remaining = items[count:]
+    if remaining:
+        response["truncated"] = True
+        response["next_cursor"] = get_cursor_store().put(
+            {"base": base, "items_key": items_key, "items": remaining, "budget": budget}
+        )
+
+    return json.dumps(response, separators=_COMPACT)
+
+
+def render_budgeted(
+    response: dict[str, Any],
+    items_key: str,
+    arguments: dict[str, Any],
+) -> str:
+    """Serialize a list response, applying the caller's size budget if one was given.
+
+    Args:
+        response: Full response dict
+        items_key: Key of the list to truncate (e.g. "tickets")
+        arguments: Tool arguments (max_bytes / max_tokens)
+
+    Returns:
+        JSON text; truncated responses carry ``next_cursor``
+    """
+    budget = resolve_budget(arguments)
+    if budget is None:
+        return json.dumps(response, indent=2)
+
+    base = {key: value for key, value in response.items() if key != items_key}
+    return _paginate(base, items_key, response[items_key], budget)
+
+
+def render_from_cursor(arguments: dict[str, Any]) -> str:
+    """Serve the next page of a truncated response from the cursor store.
+
+    Raises:
+        ValueError: If the cursor is unknown or has expired
+    """
+    entry = get_cursor_store().get(arguments["cursor"])
+    if entry is None:
+        raise ValueError("Cursor is unknown or has expired. Re-run the query without a cursor.")
+
+    budget = resolve_budget(arguments) or entry["budget"]
+    return _paginate(entry["base"], entry["items_key"], entry["items"], budget)
@@ -0,0 +1,187 @@
+"""Short-lived cache of JQL search results with write-aware invalidation.
+
+A result set is stored as the ordered list of issue keys plus the response
+metadata; the issues themselves are stored once per (projection, key), so an
+issue appearing in several cached queries is invalidated in one place.
+
+When a write touches an issue, every cached query containing it is dropped,
+as is every query whose conditions reference a field the write changed (the
+issue may have entered or left that result set). Writes whose effect cannot be
+scoped (issue creation) clear the cache.
+"""
+
+import re
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from .cache import TTLCache
+
+# Marks a query whose conditions can't be analysed: any write may affect it
+ANY_FIELD = "*"
+
+# Search key: (canonical JQL, field projection, page size)
+SearchKey = tuple[str, Optional[tuple[str, ...]], int]
+
+# JQL names that map onto other (or several) REST field ids
+_JQL_FIELD_ALIASES: dict[str, frozenset[str]] = {
+    "type": frozenset({"issuetype"}),
+    "statuscategory": frozenset({"status"}),
+    "text": frozenset({"summary", "description", "comment", "environment"}),
+    "issue": frozenset(),
+    "issuekey": frozenset(),
+    "key": frozenset(),
+    "id": frozenset(),
+}
+
+# JQL functions whose result does not depend on other issues' data (and
+# keywords that can precede a parenthesis)
+_STABLE_FUNCTIONS = frozenset(
+    {
+        "in",
+        "and",
+        "or",
+        "not",
+        "currentuser",
+        "now",
+        "startofday",
+        "endofday",
+        "startofweek",
+        "endofweek",
+        "startofmonth",
+        "endofmonth",
+        "startofyear",
+        "endofyear",
+        "membersof",
+    }
+)
+
+_STRING_LITERAL = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'')
+_ORDER_BY = re.compile(r"\border\s+by\b.*$", re.IGNORECASE | re.DOTALL)
+_FUNCTION = re.compile(r"([A-Za-z_]\w*)\s*\(")
+_CONDITION_FIELD = re.compile(
+    r'(""|cf\[\d+\]|[A-Za-z_][\w.]*)\s*'
+    r"(?:!=|>=|<=|=|>|<|!~|~|\bnot\s+in\b|\bin\b|\bis\s+not\b|\bis\b|\bwas\b|\bchanged\b)",
+    re.IGNORECASE,
+)
+
+
+def condition_fields(jql: str) -> frozenset[str]:
+    """Return the REST field ids referenced by the conditions of ``jql``.
+
+    ``ORDER BY`` terms are ignored: re-ordering only matters for issues already
+    in the result set. Quoted field names and functions over other issues'
+    data (``linkedIssues``, ``issueHistory``, ...) yield :data:`ANY_FIELD`.
+    """
+    where = _ORDER_BY.sub("", _STRING_LITERAL.sub('""', jql))
+    fields: set[str] = set()
+
+    for function in _FUNCTION.findall(where):
+        if function.lower() not in _STABLE_FUNCTIONS:
+            fields.add(ANY_FIELD)
+
+    for name in _CONDITION_FIELD.findall(where):
+        name = name.lower()
+        if name == '""':
+            fields.add(ANY_FIELD)
+        elif name.startswith("cf["):
+            fields.add(f"customfield_{name[3:-1]}")
+        else:
+            fields.update(_JQL_FIELD_ALIASES.get(name, {name}))
+    return frozenset(fields)
+
+
+class _CachedSearch:
+    __slots__ = ("fields", "issue_keys", "meta")
+
+    def __init__(self, meta: dict[str, Any], issue_keys: list[str], fields: frozenset[str]):
+        self.meta = meta
+        self.issue_keys = issue_keys
+        self.fields = fields
+
+
+class SearchResultCache:
+    """Cache of search responses keyed by canonical JQL, projection and page size.
+
+    Attributes:
+        generation: Incremented on every invalidation; a search that started
+            before an invalidation must not be stored (see :meth:`put`)
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._searches: TTLCache[SearchKey, _CachedSearch] = TTLCache(maxsize, ttl, clock)
+        # (projection, issue key) -> issue
+        self._issues: TTLCache[tuple[Optional[tuple[str, ...]], str], dict[str, Any]] = TTLCache(
+            maxsize * 50, ttl, clock
+        )
+        self.generation = 0
+
+    @staticmethod
+    def make_key(jql: str, fields: Optional[list[str]], max_results: int) -> SearchKey:
+        """Build the cache key for a search."""
+        return (jql.strip(), tuple(sorted(fields)) if fields is not None else None, max_results)
+
+    def get(self, key: SearchKey) -> Optional[dict[str, Any]]:
+        """Return a copy of the cached response, or None if missing or incomplete."""
+        cached = self._searches.get(key)
+        if cached is None:
+            return None
+        issues = []
+        for issue_key in cached.issue_keys:
+            issue = self._issues.get((key[1], issue_key))
+            if issue is None:
+                self._searches.pop(key)
+                return None
+            issues.append(issue)
+        return {**cached.meta, "issues": issues}
+
+    def put(self, key: SearchKey, result: dict[str, Any], generation: int) -> None:
+        """Store a response, unless the cache was invalidated since ``generation``."""
+        if generation != self.generation:
+            return
+        issues = result.get("issues", [])
+        meta = {name: value for name, value in result.items() if name != "issues"}
+        for issue in issues:
+            self._issues.set((key[1], issue.get("key")), issue)
+        self._searches.set(
+            key,
+            _CachedSearch(meta, [issue.get("key") for issue in issues], condition_fields(key[0])),
+        )
+
+    def invalidate_issue(self, issue_key: str, changed_fields: Iterable[str]) -> None:
+        """Drop cached data that a write to ``issue_key`` may have made stale.
+
+        Args:
+            issue_key: Issue that was written
+            changed_fields: REST field ids the write changed
+        """
+        self.generation += 1
+        # Cached issues carry Jira's upper-case keys; callers may pass "proj-1"
+        issue_key = issue_key.upper()
+        changed = set(changed_fields)
+        for search_key in self._searches:
+            cached = self._searches.get(search_key)
+            if cached is None:
+                continue
+            if (
+                issue_key in cached.issue_keys
+                or ANY_FIELD in cached.fields
+                or not cached.fields.isdisjoint(changed)
+            ):
+                self._searches.pop(search_key)
+        for issue_entry in self._issues:
+            if issue_entry[1] == issue_key:
+                self._issues.pop(issue_entry)
+
+    def clear(self) -> None:
+        """Drop everything (for writes that may affect any result set)."""
+        self.generation += 1
+        self._searches.clear()
+        self._issues.clear()
+
+    def __len__(self) -> int:
+        return len(self._searches)
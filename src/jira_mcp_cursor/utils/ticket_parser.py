@@ -1,65 +1,152 @@
 """Utilities for parsing Jira ticket data."""
 
-from typing import Any
+from typing import Any, Callable, Optional
 
+from .adf import comment_markdown, issue_markdown
 
-def parse_ticket_summary(issue: dict[str, Any]) -> dict[str, Any]:
-    """Parse issue into summary format."""
+
+def _raw(value: Any) -> Any:
+    """Return the field value unchanged."""
+    return value
+
+
+def _list(value: Any) -> list[Any]:
+    """Return the field value, or an empty list when unset."""
+    return value or []
+
+
+def _name(value: Any) -> Optional[str]:
+    """Return the ``name`` attribute of a Jira object field (status, priority, ...)."""
+    return value.get("name") if value else None
+
+
+def _display_name(value: Any) -> Optional[str]:
+    """Return the ``displayName`` attribute of a Jira user field."""
+    return value.get("displayName") if value else None
+
+
+def _comments(value: Any) -> list[dict[str, Any]]:
+    """Flatten the embedded ``comment`` field into author/body/created dicts."""
+    return [parse_comment(comment) for comment in (value or {}).get("comments", [])]
+
+
+def _components(value: Any) -> list[Optional[str]]:
+    """Return component names."""
+    return [c.get("name") for c in value or []]
+
+
+# Output key -> (Jira field id, extractor). The Jira field id is what gets pushed
+# down into the request's ``fields`` projection.
+FieldSpec = tuple[str, Callable[[Any], Any]]
+
+SUMMARY_FIELDS: dict[str, FieldSpec] = {
+    "summary": ("summary", _raw),
+    "status": ("status", _name),
+    "priority": ("priority", _name),
+    "assignee": ("assignee", _display_name),
+    "issue_type": ("issuetype", _name),
+    "created": ("created", _raw),
+    "updated": ("updated", _raw),
+}
+
+DETAIL_FIELDS: dict[str, FieldSpec] = {
+    "summary": ("summary", _raw),
+    "description": ("description", _raw),
+    "status": ("status", _name),
+    "priority": ("priority", _name),
+    "assignee": ("assignee", _display_name),
+    "reporter": ("reporter", _display_name),
+    "created": ("created", _raw),
+    "updated": ("updated", _raw),
+    "labels": ("labels", _list),
+    "components": ("components", _components),
+    "comments": ("comment", _comments),
+}
+
+
+def jira_fields_for(
+    requested: Optional[list[str]],
+    specs: dict[str, FieldSpec],
+) -> list[str]:
+    """Translate requested output keys into the Jira field ids to fetch.
+
+    Output keys unknown to ``specs`` are treated as raw Jira field ids
+    (e.g. ``customfield_10016``) and passed through unchanged.
+
+    Args:
+        requested: Output keys the caller asked for, or None for the default set
+        specs: Field table (SUMMARY_FIELDS or DETAIL_FIELDS)
+
+    Returns:
+        De-duplicated list of Jira field ids, in request order
+    """
+    keys = list(specs) if requested is None else requested
+    jira_fields: list[str] = []
+    for key in keys:
+        jira_field = specs[key][0] if key in specs else key
+        if key != "key" and jira_field not in jira_fields:
+            jira_fields.append(jira_field)
+    return jira_fields
+
+
+def _project(
+    issue: dict[str, Any],
+    specs: dict[str, FieldSpec],
+    requested: Optional[list[str]],
+) -> dict[str, Any]:
+    """Build the output dict for ``issue`` containing only the requested keys."""
     fields = issue.get("fields", {})
+    result: dict[str, Any] = {"key": issue.get("key")}
+    for key in specs if requested is None else requested:
+        if key == "key":
+            continue
+        if key in specs:
+            jira_field, extract = specs[key]
+            result[key] = extract(fields.get(jira_field))
+        else:
+            result[key] = fields.get(key)
+    return result
+
 
+def parse_comment(comment: dict[str, Any]) -> dict[str, Any]:
+    """Parse a single Jira comment (ADF bodies become Markdown)."""
+    body = comment.get("body")
     return {
-        "key": issue.get("key"),
-        "summary": fields.get("summary"),
-        "status": fields.get("status", {}).get("name"),
-        "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
-        "assignee": (
-            fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None
-        ),
-        "issue_type": (
-            fields.get("issuetype", {}).get("name") if fields.get("issuetype") else None
-        ),
-        "created": fields.get("created"),
-        "updated": fields.get("updated"),
+        "author": (comment.get("author") or {}).get("displayName"),
+        "body": comment_markdown(comment) if isinstance(body, dict) else body,
+        "created": comment.get("created"),
     }
 
 
-def parse_ticket_detail(issue: dict[str, Any]) -> dict[str, Any]:
-    """Parse issue into detailed format."""
-    fields = issue.get("fields", {})
+def parse_ticket_summary(
+    issue: dict[str, Any],
+    fields: Optional[list[str]] = None,
+) -> dict[str, Any]:
+    """Parse issue into summary format.
 
-    # Parse comments
-    comments = []
-    comment_data = fields.get("comment", {})
-    for comment in comment_data.get("comments", []):
-        comments.append(
-            {
-                "author": comment.get("author", {}).get("displayName"),
-                "body": comment.get("body"),
-                "created": comment.get("created"),
-            }
-        )
+    Args:
+        issue: Raw issue from the Jira API
+        fields: Output keys to include (default: all summary keys). ``key`` is
+            always included.
+    """
+    return _project(issue, SUMMARY_FIELDS, fields)
 
-    # Parse labels
-    labels = fields.get("labels", [])
 
-    # Parse components
-    components = [c.get("name") for c in fields.get("components", [])]
+def parse_ticket_detail(
+    issue: dict[str, Any],
+    fields: Optional[list[str]] = None,
+) -> dict[str, Any]:
+    """Parse issue into detailed format.
 
-    return {
-        "key": issue.get("key"),
-        "summary": fields.get("summary"),
-        "description": fields.get("description"),
-        "status": fields.get("status", {}).get("name"),
-        "priority": fields.get("priority", {}).get("name"),
-        "assignee": (
-            fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None
-        ),
-        "reporter": (
-            fields.get("reporter", {}).get("displayName") if fields.get("reporter") else None
-        ),
-        "created": fields.get("created"),
-        "updated": fields.get("updated"),
-        "labels": labels,
-        "components": components,
-        "comments": comments,
-    }
+    Rich text from the v3 API (ADF) is returned as Markdown, so v2 and v3
+    payloads parse to the same shape.
+
+    Args:
+        issue: Raw issue from the Jira API
+        fields: Output keys to include (default: all detail keys). ``key`` is
+            always included.
+    """
+    detail = _project(issue, DETAIL_FIELDS, fields)
+    if isinstance(detail.get("description"), dict):
+        detail["description"] = issue_markdown(issue)
+    return detail
@@ -0,0 +1,126 @@
+"""Local Jira user directory with a prefix index for name/email lookups."""
+
+from bisect import bisect_left
+from typing import Any, Iterable, Optional
+
+
+def _terms(user: dict[str, Any]) -> set[str]:
+    """Return the case-folded strings a user can be found by.
+
+    Display names are indexed whole and per word ("jane", "doe", "jane doe"),
+    emails whole and by local part.
+    """
+    terms: set[str] = set()
+    display_name = (user.get("displayName") or "").casefold()
+    if display_name:
+        terms.add(display_name)
+        terms.update(display_name.split())
+    email = (user.get("emailAddress") or "").casefold()
+    if email:
+        terms.add(email)
+        terms.add(email.split("@", 1)[0])
+    account_id = (user.get("accountId") or "").casefold()
+    if account_id:
+        terms.add(account_id)
+    return terms
+
+
+class UserDirectory:
+    """In-memory directory of Jira users, filled incrementally page by page.
+
+    Search terms are kept in a sorted list so prefix queries are a binary search
+    followed by a short scan, rather than an API round trip.
+
+    Attributes:
+        complete: True once every page of the instance's users has been loaded
+    """
+
+    def __init__(self, users: Optional[Iterable[dict[str, Any]]] = None):
+        self._users: dict[str, dict[str, Any]] = {}
+        self._index: list[tuple[str, str]] = []  # (term, accountId), sorted
+        self.complete = False
+        if users:
+            self.add(users)
+
+    def add(self, users: Iterable[dict[str, Any]]) -> None:
+        """Add or replace users (keyed by accountId) and index their search terms.
+
+        The index is updated once per call, so reloading a whole page of known
+        users costs one pass over the index rather than one per user.
+        """
+        added: dict[str, dict[str, Any]] = {}
+        for user in users:
+            account_id = user.get("accountId")
+            if account_id:
+                added[account_id] = user
+        if not added:
+            return
+
+        replaced = added.keys() & self._users.keys()
+        if replaced:
+            self._index = [entry for entry in self._index if entry[1] not in replaced]
+        self._users.update(added)
+        # Sorting the already sorted index plus the new run is close to linear
+        self._index.extend(
+            (term, account_id) for account_id, user in added.items() for term in _terms(user)
+        )
+        self._index.sort()
+
+    def get(self, account_id: str) -> Optional[dict[str, Any]]:
+        """Return the user with ``account_id``, if known."""
+        return self._users.get(account_id)
+
+    def users(self) -> list[dict[str, Any]]:
+        """Return all known users, in load order."""
+        return list(self._users.values())
+
+    def search(self, query: str, limit: int = 50) -> list[dict[str, Any]]:
+        """Return users with a display name word, email or accountId starting with ``query``.
+
+        Args:
+            query: Case-insensitive prefix
+            limit: Maximum number of users returned
+
+        Returns:
+            Matching users, ordered by the matched term
+        """
+        prefix = query.casefold().strip()
+        if not prefix:
+            return self.users()[:limit]
+
+        matches: dict[str, dict[str, Any]] = {}
+        position = bisect_left(self._index, (prefix, ""))
+        while position < len(self._index) and len(matches) < limit:
+            term, account_id = self._index[position]
+            if not term.startswith(prefix):
+                break
+            matches.setdefault(account_id, self._users[account_id])
+            position += 1
+        return list(matches.values())
+
+    def resolve(self, identifier: str) -> list[dict[str, Any]]:
+        """Return users whose accountId, email or display name equals ``identifier``.
+
+        Only exact (case-insensitive) matches count: the result picks users for
+        writes such as assignment, so a fragment must never stand for whoever
+        happens to start with it. Use :meth:`search` for prefix lookups.
+        """
+        if identifier in self._users:
+            return [self._users[identifier]]
+
+        wanted = identifier.casefold().strip()
+        if not wanted:
+            return []
+        exact = [
+            user
+            for user in self.search(wanted, limit=len(self._users))
+            if wanted
+            in {
+                (user.get("emailAddress") or "").casefold(),
+                (user.get("displayName") or "").casefold(),
+            }
+        ]
+        return exact
+
+    def __len__(self) -> int:
+        return len(self._users)
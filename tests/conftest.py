@@ -19,6 +19,16 @@ def mock_env():
     yield
 
 
+@pytest.fixture(autouse=True)
+def clear_identity_cache():
+    """Keep cached /myself identities from leaking between tests."""
+    from jira_mcp_cursor.server.jira_client import clear_identity_cache
+
+    clear_identity_cache()
+    yield
+    clear_identity_cache()
+
+
 @pytest.fixture
 def sample_issue():
     """Sample Jira issue data for testing."""
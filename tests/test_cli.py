@@ -27,7 +27,7 @@ def test_configure_command():
     """Test configure command launches wizard."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.ConfigWizard") as mock_wizard_class:
+    with patch("jira_mcp_cursor.config.wizard.ConfigWizard") as mock_wizard_class:
         mock_wizard = MagicMock()
         mock_wizard_class.return_value = mock_wizard
 
@@ -43,12 +43,14 @@ def test_install_command_success(tmp_path):
     """Test install command with successful installation."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.SecureConfig") as mock_config_class:
+    with patch("jira_mcp_cursor.config.storage.SecureConfig") as mock_config_class:
         mock_config = MagicMock()
         mock_config.exists.return_value = True
         mock_config_class.return_value = mock_config
 
-        with patch("jira_mcp_cursor.cli.CursorInstaller") as mock_installer_class:
+        with patch(
+            "jira_mcp_cursor.config.cursor_installer.CursorInstaller"
+        ) as mock_installer_class:
             mock_installer = MagicMock()
             mock_installer.install.return_value = True
             mock_installer_class.return_value = mock_installer
@@ -64,12 +66,14 @@ def test_install_command_failure():
     """Test install command with installation failure."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.SecureConfig") as mock_config_class:
+    with patch("jira_mcp_cursor.config.storage.SecureConfig") as mock_config_class:
         mock_config = MagicMock()
         mock_config.exists.return_value = True
         mock_config_class.return_value = mock_config
 
-        with patch("jira_mcp_cursor.cli.CursorInstaller") as mock_installer_class:
+        with patch(
+            "jira_mcp_cursor.config.cursor_installer.CursorInstaller"
+        ) as mock_installer_class:
             mock_installer = MagicMock()
             mock_installer.install.return_value = False
             mock_installer_class.return_value = mock_installer
@@ -83,7 +87,7 @@ def test_uninstall_command():
     """Test uninstall command."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.CursorInstaller") as mock_installer_class:
+    with patch("jira_mcp_cursor.config.cursor_installer.CursorInstaller") as mock_installer_class:
         mock_installer = MagicMock()
         mock_installer.uninstall.return_value = True
         mock_installer_class.return_value = mock_installer
@@ -98,7 +102,7 @@ def test_config_show_command():
     """Test config show command."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.SecureConfig") as mock_config_class:
+    with patch("jira_mcp_cursor.config.storage.SecureConfig") as mock_config_class:
         mock_config = MagicMock()
         mock_config.load.return_value = {
             "jira_url": "https://test.atlassian.net",
@@ -120,7 +124,7 @@ def test_config_test_command_success():
     """Test config test command with valid config."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.SecureConfig") as mock_config_class:
+    with patch("jira_mcp_cursor.config.storage.SecureConfig") as mock_config_class:
         mock_config = MagicMock()
         mock_config.exists.return_value = True
         mock_config.load.return_value = {
@@ -151,7 +155,7 @@ def test_config_test_command_failure():
     """Test config test command with invalid config."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.SecureConfig") as mock_config_class:
+    with patch("jira_mcp_cursor.config.storage.SecureConfig") as mock_config_class:
         mock_config = MagicMock()
         mock_config.exists.return_value = True
         mock_config.load.return_value = {
@@ -173,7 +177,7 @@ def test_config_reset_command():
     """Test config reset command with confirmation."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.SecureConfig") as mock_config_class:
+    with patch("jira_mcp_cursor.config.storage.SecureConfig") as mock_config_class:
         mock_config = MagicMock()
         mock_config_class.return_value = mock_config
 
@@ -188,12 +192,14 @@ def test_install_without_config():
     """Error case: Install without config should show helpful error."""
     runner = CliRunner()
 
-    with patch("jira_mcp_cursor.cli.SecureConfig") as mock_config_class:
+    with patch("jira_mcp_cursor.config.storage.SecureConfig") as mock_config_class:
         mock_config = MagicMock()
         mock_config.exists.return_value = False
         mock_config_class.return_value = mock_config
 
-        with patch("jira_mcp_cursor.cli.CursorInstaller") as mock_installer_class:
+        with patch(
+            "jira_mcp_cursor.config.cursor_installer.CursorInstaller"
+        ) as mock_installer_class:
             mock_installer = MagicMock()
             mock_installer.install.return_value = False
             mock_installer_class.return_value = mock_installer
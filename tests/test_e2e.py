@@ -145,3 +145,16 @@ def test_server_graceful_shutdown():
     # Server object should exist (graceful shutdown is part of runtime, not testable here)
     assert hasattr(app, "name")
     assert isinstance(app.name, str)
+
+
+def test_tool_registry_loads_every_tool():
+    """E2E: Every registered tool loads lazily with a matching definition and handler."""
+    from jira_mcp_cursor.server.server import TOOL_REGISTRY, load_tool
+
+    for name in TOOL_REGISTRY:
+        tool, handler = load_tool(name)
+        assert tool.name == name
+        assert callable(handler)
+
+    with pytest.raises(ValueError, match="Unknown tool"):
+        load_tool("does_not_exist")
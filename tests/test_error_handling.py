@@ -99,7 +99,7 @@ async def test_retry_on_network_error():
     with patch("httpx.AsyncClient") as mock_client_class:
         mock_client_instance = AsyncMock()
         mock_client_instance.request = mock_request_method
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_class.return_value = mock_client_instance
 
         result = await client.get_issue("TEST-123")
 
@@ -149,7 +149,7 @@ async def test_retry_on_rate_limit():
     with patch("httpx.AsyncClient") as mock_client_class:
         mock_client_instance = AsyncMock()
         mock_client_instance.request = mock_request_method
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_class.return_value = mock_client_instance
 
         # Mock asyncio.sleep to avoid waiting
         with patch("asyncio.sleep", new=AsyncMock()):
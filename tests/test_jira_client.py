@@ -77,6 +77,26 @@ async def test_get_issue():
         assert result["fields"]["summary"] == "Test ticket"
 
 
+@pytest.mark.asyncio
+async def test_empty_field_projection_is_sent_to_jira():
+    """fields=[] asks Jira for the key only instead of falling back to every field."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    mock_request = AsyncMock(return_value={"key": "TEST-123", "issues": []})
+    with patch.object(client, "_request", new=mock_request):
+        await client.get_issue("TEST-123", fields=[])
+        assert mock_request.call_args.kwargs["params"] == {"fields": "key"}
+
+        await client.search_issues("project = TEST", fields=[], cache=False)
+        assert mock_request.call_args.kwargs["json"]["fields"] == ["key"]
+
+        await client.get_issue("TEST-123")
+        assert mock_request.call_args.kwargs["params"] == {}
+
+
 @pytest.mark.asyncio
 async def test_update_issue():
     """Test updating issue fields."""
@@ -273,6 +293,26 @@ async def test_get_project_issue_types():
         client.get_project_statuses.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_project_statuses_served_from_metadata_cache():
+    """Project statuses are fetched once and shared across repeated lookups."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    mock_response = [{"name": "Story", "statuses": [{"name": "To Do"}, {"name": "Done"}]}]
+    with patch.object(client, "_request", new=AsyncMock(return_value=mock_response)) as mock_request:
+        first = await client.get_project_statuses("PROJ")
+        second = await client.get_project_statuses("PROJ")
+        types = await client.get_project_issue_types("PROJ")
+
+    assert first == second
+    assert first["unique_statuses"] == ["Done", "To Do"]
+    assert types == ["Story"]
+    mock_request.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_resolve_issue_type_exact_match():
     """Exact case-insensitive match takes priority, works across projects."""
@@ -280,8 +320,8 @@ async def test_resolve_issue_type_exact_match():
         base_url="https://test.atlassian.net",
         auth=("test@example.com", "token"),
     )
-    client._project_types_cache["PROJ"] = ["Epic", "Program Epic", "Story", "Bug"]
-    client._project_types_cache["SP"] = ["Program epic", "Feature", "Story"]
+    client._metadata_cache.set(("issue_types", "PROJ"), ["Epic", "Program Epic", "Story", "Bug"])
+    client._metadata_cache.set(("issue_types", "SP"), ["Program epic", "Feature", "Story"])
 
     assert await client.resolve_issue_type("epic", "PROJ") == "Epic"
     assert await client.resolve_issue_type("EPIC", "PROJ") == "Epic"
@@ -296,7 +336,7 @@ async def test_resolve_issue_type_single_substring_match():
         base_url="https://test.atlassian.net",
         auth=("test@example.com", "token"),
     )
-    client._project_types_cache["PROJ"] = ["Program Epic", "Story", "Bug"]
+    client._metadata_cache.set(("issue_types", "PROJ"), ["Program Epic", "Story", "Bug"])
 
     assert await client.resolve_issue_type("program", "PROJ") == "Program Epic"
 
@@ -308,10 +348,449 @@ async def test_resolve_issue_type_ambiguous_or_missing():
         base_url="https://test.atlassian.net",
         auth=("test@example.com", "token"),
     )
-    client._project_types_cache["PROJ"] = ["Program Epic", "Portfolio Epic", "Story"]
+    client._metadata_cache.set(("issue_types", "PROJ"), ["Program Epic", "Portfolio Epic", "Story"])
 
     with pytest.raises(ValueError, match="Ambiguous"):
         await client.resolve_issue_type("epic", "PROJ")
 
     with pytest.raises(ValueError, match="not found"):
         await client.resolve_issue_type("initiative", "PROJ")
+
+
+@pytest.mark.asyncio
+async def test_resolve_priority_and_link_type_use_cached_indexes():
+    """Priorities and link types are fetched once and resolved through name indexes."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    responses = {
+        "/priority": [{"name": "Highest"}, {"name": "High"}, {"name": "Low"}],
+        "/issueLinkType": {
+            "issueLinkTypes": [
+                {"name": "Blocks", "inward": "is blocked by", "outward": "blocks"},
+                {"name": "Relates", "inward": "relates to", "outward": "relates to"},
+            ]
+        },
+    }
+
+    async def fake_request(method, endpoint, **kwargs):
+        return responses[endpoint]
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)) as mock_request:
+        assert await client.resolve_priority("critical") == "Highest"
+        assert await client.resolve_priority("low") == "Low"
+        assert await client.resolve_link_type("blocks") == ("Blocks", False)
+        assert await client.resolve_link_type("is blocked by") == ("Blocks", True)
+        assert await client.resolve_link_type("blocked by") == ("Blocks", True)
+        assert await client.resolve_link_type("relates") == ("Relates", False)
+        assert await client.resolve_link_type("relates to") == ("Relates", False)
+
+        with pytest.raises(ValueError, match="not found"):
+            await client.resolve_link_type("supersedes")
+
+    assert mock_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_priority_passes_name_through_when_lookup_fails():
+    """A failed or unmatched priority lookup leaves validation to Jira."""
+    from jira_mcp_cursor.server.exceptions import JiraAPIError
+
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    failing = AsyncMock(side_effect=JiraAPIError("Forbidden", status_code=403))
+    with patch.object(client, "_request", new=failing):
+        assert await client.resolve_priority("critical") == "critical"
+
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+    with patch.object(client, "_request", new=AsyncMock(return_value=[{"name": "High"}])):
+        assert await client.resolve_priority("P1") == "P1"
+        assert await client.resolve_priority("high") == "High"
+
+
+@pytest.mark.asyncio
+async def test_resolve_status_uses_project_statuses():
+    """Status aliases resolve against the project's workflow statuses."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+    client._metadata_cache.set(
+        ("statuses", "PROJ"),
+        {"project": "PROJ", "unique_statuses": ["Closed", "In Progress", "Open"], "by_issue_type": {}},
+    )
+
+    assert await client.resolve_status("done", "PROJ") == "Closed"
+    assert await client.resolve_status("in progres", "PROJ") == "In Progress"
+
+
+@pytest.mark.asyncio
+async def test_user_directory_loaded_once_and_resolves_emails(monkeypatch):
+    """Users are paged into the directory once; lookups and resolution are local."""
+    import jira_mcp_cursor.server.jira_client as jira_client_module
+
+    monkeypatch.setattr(jira_client_module, "USER_PAGE_SIZE", 2)
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    pages = [
+        [
+            {"accountId": "a1", "displayName": "Jane Doe", "emailAddress": "jane@example.com"},
+            {"accountId": "a2", "displayName": "John Doe", "emailAddress": "john@example.com"},
+        ],
+        [{"accountId": "a3", "displayName": "Alex Poe"}],
+    ]
+
+    async def fake_request(method, endpoint, params=None, **kwargs):
+        assert endpoint == "/users/search"
+        return pages[params["startAt"] // 2]
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)) as mock_request:
+        assert [u["accountId"] for u in await client.find_users("j")] == ["a1", "a2"]
+        assert await client.resolve_account_id("jane@example.com") == "a1"
+        assert await client.resolve_account_id("Alex Poe") == "a3"
+        assert await client.resolve_account_id("unknown-id") == "unknown-id"
+        # A fragment is not a user: it goes to Jira as given instead of a guess
+        assert await client.resolve_account_id("doe") == "doe"
+
+    assert mock_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_find_users_falls_back_to_search_when_listing_unavailable():
+    """Without /users/search, lookups use /user/search and remember the results."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    async def fake_request(method, endpoint, params=None, **kwargs):
+        if endpoint == "/users/search":
+            raise JiraAPIError("Not found", status_code=404)
+        return [{"accountId": "a1", "displayName": "Jane Doe", "emailAddress": "jane@example.com"}]
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)) as mock_request:
+        assert [u["accountId"] for u in await client.find_users("jane")] == ["a1"]
+        assert await client.resolve_account_id("jane@example.com") == "a1"
+
+    # Listing attempt + one remote search; the resolution was answered locally
+    assert mock_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_current_user_cached_per_credential_set():
+    """/myself is fetched once per credential set, even across client instances."""
+    me = {"accountId": "abc", "displayName": "Me"}
+    first = JiraClient(base_url="https://test.atlassian.net", auth=("me@example.com", "token"))
+    second = JiraClient(base_url="https://test.atlassian.net/", auth=("me@example.com", "token"))
+    other = JiraClient(base_url="https://test.atlassian.net", auth=("me@example.com", "other"))
+
+    with patch.object(JiraClient, "_request", new=AsyncMock(return_value=me)) as mock_request:
+        assert await first.get_current_account_id() == "abc"
+        assert (await second.get_current_user())["displayName"] == "Me"
+        assert mock_request.call_count == 1
+
+        await other.get_current_user()
+        assert mock_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_results_cached_until_relevant_write():
+    """Repeated searches hit the cache; writes invalidate the results they affect."""
+    import asyncio
+
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+    search_response = {"issues": [{"key": "PROJ-1", "fields": {"summary": "One"}}], "total": 1}
+
+    async def fake_request(method, endpoint, **kwargs):
+        if endpoint == "/search/jql":
+            await asyncio.sleep(0)
+            return dict(search_response)
+        return {}
+
+    jql = 'assignee = currentUser() AND status != "Done"'
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)) as mock_request:
+        # Concurrent identical searches share one request
+        results = await asyncio.gather(
+            client.search_issues(jql, fields=["summary"]),
+            client.search_issues(jql, fields=["summary"]),
+        )
+        assert results[0] == results[1] == search_response
+        await client.search_issues(jql, fields=["summary"])
+        assert mock_request.call_count == 1
+
+        # Commenting on an unrelated issue doesn't affect a status/assignee query
+        await client.add_comment("PROJ-9", "note")
+        await client.search_issues(jql, fields=["summary"])
+        assert mock_request.call_count == 2
+
+        # A transition elsewhere may change membership of a status-filtered query
+        await client.transition_issue("PROJ-9", "31")
+        await client.search_issues(jql, fields=["summary"])
+        assert mock_request.call_count == 4
+
+        # Creating an issue clears everything
+        await client.create_issue("PROJ", "New", "Body")
+        await client.search_issues(jql, fields=["summary"])
+        assert mock_request.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_get_comments_uses_paginated_endpoint():
+    """get_comments requests one page from /issue/{key}/comment."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+    page = {"comments": [], "startAt": 20, "maxResults": 10, "total": 25}
+
+    with patch.object(client, "_request", new=AsyncMock(return_value=page)) as mock_req:
+        result = await client.get_comments("TEST-1", start_at=20, max_results=10)
+
+    mock_req.assert_called_once_with(
+        "GET", "/issue/TEST-1/comment", params={"startAt": 20, "maxResults": 10}
+    )
+    assert result["total"] == 25
+
+
+@pytest.mark.asyncio
+async def test_iter_comments_pages_and_stops_at_since():
+    """iter_comments pages lazily and stops at the first comment older than since."""
+    from jira_mcp_cursor.utils.dates import parse_jira_datetime
+
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+    pages = [
+        {
+            "comments": [
+                {"id": "3", "created": "2025-01-03T00:00:00.000+0000"},
+                {"id": "2", "created": "2025-01-02T00:00:00.000+0000"},
+            ],
+            "total": 3,
+        },
+        {"comments": [{"id": "1", "created": "2025-01-01T00:00:00.000+0000"}], "total": 3},
+    ]
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=pages)) as mock_req:
+        all_ids = [c["id"] async for c in client.iter_comments("T-1", "-created", page_size=2)]
+        assert all_ids == ["3", "2", "1"]
+        assert mock_req.call_args_list[1][1]["params"]["startAt"] == 2
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=pages)) as mock_req:
+        since = parse_jira_datetime("2025-01-02T12:00:00+00:00")
+        recent = [
+            c["id"]
+            async for c in client.iter_comments("T-1", "-created", since=since, page_size=2)
+        ]
+        assert recent == ["3"]
+        mock_req.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_pooled_http_client():
+    """All requests go through one pooled httpx.AsyncClient until aclose()."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    class MockResponse:
+        content = b"{}"
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {}
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value.request = AsyncMock(return_value=MockResponse())
+        mock_client_class.return_value.aclose = AsyncMock()
+
+        await client.get_issue("TEST-1")
+        await client.get_issue("TEST-2")
+        mock_client_class.assert_called_once()
+        assert mock_client_class.return_value.request.call_count == 2
+
+        await client.aclose()
+        mock_client_class.return_value.aclose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_preloads_user_and_project_metadata():
+    """warm_up resolves /myself and project statuses so later calls hit the cache."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    async def fake_request(method, endpoint, **kwargs):
+        if endpoint == "/myself":
+            return {"accountId": "abc", "displayName": "Me"}
+        return [{"name": "Story", "statuses": [{"name": "To Do"}]}]
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)) as mock_req:
+        await client.warm_up("PROJ")
+        assert mock_req.call_count == 2
+
+        assert (await client.get_current_user())["accountId"] == "abc"
+        assert (await client.get_project_statuses("PROJ"))["unique_statuses"] == ["To Do"]
+        assert await client.get_project_issue_types("PROJ") == ["Story"]
+        assert mock_req.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_up_swallows_errors():
+    """A failing warm-up never raises; the real tool call reports the error."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    with patch.object(
+        client, "_request", new=AsyncMock(side_effect=JiraAPIError("Request failed: offline"))
+    ):
+        await client.warm_up("PROJ")
+
+
+@pytest.mark.asyncio
+async def test_get_issues_fetches_in_key_batches():
+    """get_issues splits keys into key IN (...) searches and keeps the requested order."""
+    import re
+
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+
+    async def fake_request(method, endpoint, json=None, **kwargs):
+        keys = re.findall(r'"([A-Z]+-\d+)"', json["jql"])
+        moved = {"PROJ-3": "NEW-3"}
+        return {"issues": [{"key": moved.get(key, key), "fields": {}} for key in keys]}
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)) as mock_req:
+        keys = [f"proj-{n}" for n in range(5, 0, -1)] + ["PROJ-5"]
+        issues = await client.get_issues(keys, fields=["summary"], batch_size=2)
+
+    # PROJ-3 was moved: Jira answers for its old key with NEW-3, listed last
+    assert [issue["key"] for issue in issues] == ["PROJ-5", "PROJ-4", "PROJ-2", "PROJ-1", "NEW-3"]
+    assert mock_req.call_count == 3
+    first = mock_req.call_args_list[0].kwargs["json"]
+    assert first["jql"] == 'key IN ("PROJ-4", "PROJ-5")'
+    assert first["fields"] == ["summary"]
+
+
+@pytest.mark.asyncio
+async def test_get_issues_skips_keys_jira_rejects():
+    """A missing or hidden key makes Jira reject the batch; the other keys are still fetched."""
+    import json as json_module
+    import re
+
+    from jira_mcp_cursor.server.exceptions import ValidationError
+
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+    missing = {"PROJ-404", "PROJ-405"}
+
+    async def fake_request(method, endpoint, json=None, **kwargs):
+        keys = re.findall(r'"([A-Z]+-\d+)"', json["jql"])
+        rejected = [key for key in keys if key in missing]
+        if rejected:
+            messages = [f"An issue with key '{key}' does not exist for field 'key'." for key in rejected]
+            details = json_module.dumps({"errorMessages": messages, "errors": {}})
+            raise ValidationError("Invalid request.", status_code=400, details=details)
+        if "PROJ-403" in keys:
+            # Hidden issues may be rejected without naming the key
+            raise ValidationError("Invalid request.", status_code=400, details="{}")
+        return {"issues": [{"key": key, "fields": {}} for key in keys]}
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)):
+        issues = await client.get_issues(
+            ["PROJ-1", "PROJ-404", "PROJ-2", "PROJ-405", "PROJ-3", "PROJ-403", "PROJ-4"],
+            batch_size=4,
+        )
+        assert [issue["key"] for issue in issues] == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4"]
+
+        # A 400 that every key gets on its own is a real error
+        with pytest.raises(ValidationError):
+            await client.get_issues(["PROJ-403"])
+
+
+@pytest.mark.asyncio
+async def test_search_all_follows_next_page_tokens():
+    """search_all pages with Jira's nextPageToken, which holds across projects."""
+    from jira_mcp_cursor.utils.jql import Clause
+
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+    # Jira orders keys by project, then number: "A-10" > "B-1" as strings
+    # would have made a key > cursor skip or repeat issues here
+    matches = ["A-9", "A-10", "B-1", "B-2", "B-10"]
+
+    async def fake_request(method, endpoint, json=None, **kwargs):
+        start = int(json.get("nextPageToken", "0"))
+        end = start + json["maxResults"]
+        page = {"issues": [{"key": key} for key in matches[start:end]]}
+        if end < len(matches):
+            page["nextPageToken"] = str(end)
+        else:
+            page["isLast"] = True
+        return page
+
+    where = Clause("project", "in", ("A", "B"))
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)) as mock_req:
+        issues = await client.search_all(where, page_size=2)
+
+    assert [issue["key"] for issue in issues] == matches
+    bodies = [call.kwargs["json"] for call in mock_req.call_args_list]
+    assert [body.get("nextPageToken") for body in bodies] == [None, "2", "4"]
+    assert {body["jql"] for body in bodies} == {'project IN ("A", "B") ORDER BY key ASC'}
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=fake_request)) as mock_req:
+        issues = await client.search_all(where, page_size=2, max_issues=3)
+    assert [issue["key"] for issue in issues] == ["A-9", "A-10", "B-1"]
+    assert mock_req.call_args_list[-1].kwargs["json"]["maxResults"] == 1
+
+
+@pytest.mark.asyncio
+async def test_complete_changelogs_pages_truncated_changelogs():
+    """Only issues whose embedded changelog is truncated are paged in full."""
+    client = JiraClient(
+        base_url="https://test.atlassian.net",
+        auth=("test@example.com", "token"),
+    )
+    issues = [
+        {"key": "P-1", "changelog": {"total": 1, "histories": [{"id": "1"}]}},
+        {"key": "P-2", "changelog": {"total": 3, "histories": [{"id": "1"}]}},
+    ]
+    pages = [
+        {"values": [{"id": "1"}, {"id": "2"}], "total": 3, "isLast": False},
+        {"values": [{"id": "3"}], "total": 3, "isLast": True},
+    ]
+
+    with patch.object(client, "_request", new=AsyncMock(side_effect=pages)) as mock_req:
+        await client.complete_changelogs(issues)
+
+    assert [h["id"] for h in issues[1]["changelog"]["histories"]] == ["1", "2", "3"]
+    assert len(issues[0]["changelog"]["histories"]) == 1
+    assert [call.args[1] for call in mock_req.call_args_list] == ["/issue/P-2/changelog"] * 2
+    assert mock_req.call_args_list[1].kwargs["params"]["startAt"] == 2
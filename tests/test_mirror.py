@@ -0,0 +1,681 @@
+"""Tests for the local project mirror and its sync."""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from jira_mcp_cursor.mirror.query import UnsupportedQuery, plan_query
+from jira_mcp_cursor.mirror.store import MirrorStore
+from jira_mcp_cursor.mirror.sync import MirrorSync
+from jira_mcp_cursor.mirror.text_index import TextIndex, index_project
+from jira_mcp_cursor.server.jira_client import JiraClient
+from jira_mcp_cursor.utils.jql_builder import my_tickets_query
+from jira_mcp_cursor.utils.ticket_parser import SUMMARY_FIELDS, jira_fields_for
+
+
+def _issue(number: int, updated: str = "2024-01-01T00:00:00.000+0000", **fields):
+    return {
+        "key": f"PROJ-{number}",
+        "id": str(10000 + number),
+        "fields": {"summary": f"Issue {number}", "updated": updated, **fields},
+    }
+
+
+class FakeJira:
+    """Serves search_issues from an in-memory project, ordered by issue number."""
+
+    def __init__(self, issues):
+        self.issues = {issue["key"]: issue for issue in issues}
+        self.queries: list[str] = []
+        self.fail_after: int | None = None
+
+    async def search_issues(self, jql, fields=None, max_results=50, cache=True):
+        assert cache is False
+        self.queries.append(jql)
+        if self.fail_after is not None and len(self.queries) > self.fail_after:
+            raise RuntimeError("connection reset")
+
+        number = lambda key: int(key.rsplit("-", 1)[1])
+        issues = sorted(self.issues.values(), key=lambda issue: number(issue["key"]))
+        in_match = re.search(r"key IN \(([^)]*)\)", jql)
+        if in_match:
+            wanted = set(re.findall(r'"([^"]+)"', in_match.group(1)))
+            issues = [issue for issue in issues if issue["key"] in wanted]
+        cursor = re.search(r'key > "([^"]+)"', jql)
+        if cursor:
+            issues = [issue for issue in issues if number(issue["key"]) > number(cursor.group(1))]
+        page = issues[:max_results]
+        if fields == ["updated"]:
+            page = [
+                {"key": i["key"], "id": i["id"], "fields": {"updated": i["fields"]["updated"]}}
+                for i in page
+            ]
+        return {"issues": page, "total": len(page)}
+
+
+@pytest.fixture
+def store():
+    now = [1_000_000.0]
+    mirror = MirrorStore(":memory:", clock=lambda: now[0])
+    mirror.now = now
+    yield mirror
+    mirror.close()
+
+
+def test_store_upsert_mark_seen_and_delete_unseen(store):
+    """Crawl tags drive deletion; mark_seen reports missing and outdated issues."""
+    store.upsert_issues("PROJ", [_issue(1), _issue(2)], crawl_id=1)
+    assert store.count("PROJ") == 2
+
+    outdated = store.mark_seen(
+        {
+            "PROJ-1": "2024-01-01T00:00:00.000+0000",
+            "PROJ-2": "2024-02-01T00:00:00.000+0000",
+            "PROJ-3": "2024-01-01T00:00:00.000+0000",
+        },
+        crawl_id=2,
+    )
+    assert outdated == ["PROJ-2", "PROJ-3"]
+
+    store.upsert_issues("PROJ", [_issue(4)], crawl_id=1)
+    assert store.delete_unseen("PROJ", 2) == 1
+    assert store.get_issue("PROJ-4") is None
+    assert store.get_issue("PROJ-1")["fields"]["summary"] == "Issue 1"
+
+
+def test_store_stale_issues_not_served(store):
+    """A locally written issue is hidden until the next sync refreshes it."""
+    store.upsert_issues("PROJ", [_issue(1)], crawl_id=1)
+    store.mark_stale("PROJ-1")
+    assert store.get_issue("PROJ-1") is None
+
+    store.upsert_issues("PROJ", [_issue(1)])
+    assert store.get_issue("PROJ-1") is not None
+
+
+def test_store_state_and_freshness(store):
+    """Freshness requires a completed full sync within max_age."""
+    assert store.get_state("PROJ")["crawl_id"] == 0
+    assert not store.is_fresh("PROJ", 900)
+
+    store.update_state("PROJ", last_full_at=store.now[0], last_synced_at=store.now[0])
+    assert store.is_fresh("PROJ", 900)
+    store.now[0] += 901
+    assert not store.is_fresh("PROJ", 900)
+
+    with pytest.raises(ValueError):
+        store.update_state("PROJ", bogus=1)
+
+
+def test_store_adds_query_columns_to_existing_database(tmp_path):
+    """Databases created before the query columns existed are migrated in place."""
+    path = tmp_path / "mirror.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE issues (key TEXT PRIMARY KEY, project TEXT NOT NULL, updated TEXT, "
+        "data TEXT NOT NULL, crawl_id INTEGER NOT NULL DEFAULT 0, stale INTEGER NOT NULL DEFAULT 0)"
+    )
+    issue = _issue(7, status={"name": "In Progress"})
+    conn.execute(
+        "INSERT INTO issues (key, project, updated, data) VALUES (?, ?, ?, ?)",
+        ("PROJ-7", "PROJ", issue["fields"]["updated"], json.dumps(issue)),
+    )
+    conn.commit()
+    conn.close()
+
+    store = MirrorStore(path)
+    try:
+        plan = plan_query('project = PROJ AND status = "in progress" ORDER BY key', now=0)
+        issues, total = store.search(plan.where, plan.params, plan.order_by, 10)
+        assert total == 1 and issues[0]["key"] == "PROJ-7"
+    finally:
+        store.close()
+
+
+async def test_full_sync_pages_by_key_cursor(store):
+    """First sync is a full crawl paged with key cursors."""
+    jira = FakeJira([_issue(n) for n in range(1, 6)])
+    summary = await MirrorSync(jira, store, page_size=2, clock=lambda: store.now[0]).sync_project(
+        "PROJ"
+    )
+
+    assert summary == {"project": "PROJ", "mode": "full", "fetched": 5, "deleted": 0}
+    assert store.count("PROJ") == 5
+    assert jira.queries[0] == 'project = "PROJ" ORDER BY key ASC'
+    assert 'key > "PROJ-2"' in jira.queries[1]
+    assert 'key > "PROJ-4"' in jira.queries[2]
+    state = store.get_state("PROJ")
+    assert state["mode"] is None and state["last_full_at"] == store.now[0]
+
+
+async def test_interrupted_sync_resumes_from_cursor(store):
+    """A crawl that fails mid-way resumes after the last committed page."""
+    jira = FakeJira([_issue(n) for n in range(1, 6)])
+    mirror_sync = MirrorSync(jira, store, page_size=2, clock=lambda: store.now[0])
+
+    jira.fail_after = 1
+    with pytest.raises(RuntimeError):
+        await mirror_sync.sync_project("PROJ")
+    assert store.get_state("PROJ")["cursor_key"] == "PROJ-2"
+
+    jira.fail_after = None
+    jira.queries.clear()
+    summary = await mirror_sync.sync_project("PROJ")
+
+    assert summary["mode"] == "full"
+    assert 'key > "PROJ-2"' in jira.queries[0]
+    assert store.count("PROJ") == 5
+    assert summary["deleted"] == 0
+
+
+async def test_delta_sync_fetches_recent_updates(store):
+    """Later syncs only ask for issues updated since the previous run."""
+    jira = FakeJira([_issue(1), _issue(2)])
+    mirror_sync = MirrorSync(jira, store, page_size=10, clock=lambda: store.now[0])
+    await mirror_sync.sync_project("PROJ")
+    store.update_state("PROJ", last_reconciled_at=store.now[0])
+
+    store.now[0] += 600
+    jira.issues["PROJ-2"] = _issue(2, updated="2024-03-01T00:00:00.000+0000")
+    jira.queries.clear()
+    summary = await mirror_sync.sync_project("PROJ")
+
+    assert summary["mode"] == "delta"
+    assert 'updated >= "-12m"' in jira.queries[0]
+    assert store.get_issue("PROJ-2")["fields"]["updated"].startswith("2024-03-01")
+
+
+async def test_reconcile_removes_deleted_issues(store):
+    """Reconciliation deletes issues gone from Jira and refetches outdated ones."""
+    jira = FakeJira([_issue(1), _issue(2), _issue(3)])
+    mirror_sync = MirrorSync(jira, store, page_size=10, clock=lambda: store.now[0])
+    await mirror_sync.sync_project("PROJ")
+
+    store.now[0] += 2 * 24 * 3600
+    del jira.issues["PROJ-3"]
+    jira.issues["PROJ-1"] = _issue(1, updated="2024-05-01T00:00:00.000+0000")
+    summary = await mirror_sync.sync_project("PROJ")
+
+    assert summary == {"project": "PROJ", "mode": "reconcile", "fetched": 1, "deleted": 1}
+    assert store.get_issue("PROJ-3") is None
+    assert store.get_issue("PROJ-1")["fields"]["updated"].startswith("2024-05-01")
+
+
+async def test_sync_reports_errors_per_project(store):
+    """One failing project does not stop the others."""
+    jira = FakeJira([_issue(1)])
+    jira.fail_after = 0
+    results = await MirrorSync(jira, store).sync(["PROJ"])
+    assert results["PROJ"] == {"project": "PROJ", "error": "connection reset"}
+
+
+async def test_client_serves_fresh_mirror_reads(store):
+    """get_issue answers from a fresh mirror and stops after a local write."""
+    store.upsert_issues("PROJ", [_issue(1, status={"name": "To Do"})], crawl_id=1)
+    store.update_state("PROJ", last_full_at=store.now[0], last_synced_at=store.now[0])
+    client = JiraClient(base_url="https://test.atlassian.net", auth=("a@b.c", "token"))
+    client.attach_mirror(store, max_age=900)
+
+    with patch.object(client, "_request", new=AsyncMock(return_value={"key": "PROJ-1"})) as req:
+        issue = await client.get_issue("PROJ-1", fields=["summary", "status"])
+        assert issue["fields"] == {"summary": "Issue 1", "status": {"name": "To Do"}}
+        req.assert_not_called()
+
+        # Fields outside the mirror go to Jira
+        await client.get_issue("PROJ-1", fields=["customfield_10016"])
+        assert req.call_count == 1
+
+        req.return_value = {}
+        await client.update_issue("PROJ-1", {"summary": "Renamed"})
+        await client.get_issue("PROJ-1", fields=["summary"])
+        assert req.call_count == 3
+
+
+def _seed_fresh(store, issues):
+    store.upsert_issues("PROJ", issues, crawl_id=1)
+    store.update_state("PROJ", last_full_at=store.now[0], last_synced_at=store.now[0])
+
+
+def _local(store, jql, current_user="me", limit=50):
+    plan = plan_query(jql, current_user=current_user, now=store.now[0])
+    issues, total = store.search(plan.where, plan.params, plan.order_by, limit)
+    return [issue["key"] for issue in issues], total
+
+
+def test_offline_jql_evaluation(store):
+    """The evaluator handles =, !=, IN, ~, dates, currentUser() and ORDER BY."""
+    me = {"accountId": "me", "displayName": "Me Myself", "emailAddress": "me@x.io"}
+    other = {"accountId": "other", "displayName": "Jane Doe"}
+    _seed_fresh(
+        store,
+        [
+            _issue(
+                1,
+                updated="1970-01-12T13:00:00.000+0000",
+                assignee=me,
+                status={"name": "In Progress"},
+                labels=["backend"],
+                summary="Fix login bug",
+            ),
+            _issue(
+                2,
+                updated="1970-01-12T12:00:00.000+0000",
+                assignee=me,
+                status={"name": "Done"},
+                labels=[],
+            ),
+            _issue(
+                3,
+                updated="1970-01-01T00:00:00.000+0000",
+                assignee=other,
+                status={"name": "To Do"},
+                labels=["Backend", "ui"],
+                summary="Login page",
+            ),
+            _issue(10, updated="1970-01-12T13:30:00.000+0000", status={"name": "To Do"}),
+        ],
+    )
+
+    assert _local(store, "assignee = currentUser() AND project = PROJ ORDER BY updated DESC") == (
+        ["PROJ-1", "PROJ-2"],
+        2,
+    )
+    assert _local(store, 'project = "PROJ" AND status != Done ORDER BY key DESC')[0] == [
+        "PROJ-10",
+        "PROJ-3",
+        "PROJ-1",
+    ]
+    assert _local(store, 'project = PROJ AND status in ("to do", "In Progress") ORDER BY key')[
+        0
+    ] == ["PROJ-1", "PROJ-3", "PROJ-10"]
+    # != never matches empty fields, like in Jira
+    assert _local(store, "project = PROJ AND assignee != currentUser() ORDER BY key")[0] == [
+        "PROJ-3"
+    ]
+    assert _local(store, "project = PROJ AND assignee is EMPTY ORDER BY key")[0] == ["PROJ-10"]
+    assert _local(store, 'project = PROJ AND assignee = "jane doe" ORDER BY key')[0] == ["PROJ-3"]
+    assert _local(store, "project = PROJ AND summary ~ login ORDER BY key")[0] == [
+        "PROJ-1",
+        "PROJ-3",
+    ]
+    assert _local(store, 'project = PROJ AND summary ~ "login bug" ORDER BY key')[0] == ["PROJ-1"]
+    assert _local(store, "project = PROJ AND labels = backend ORDER BY key")[0] == [
+        "PROJ-1",
+        "PROJ-3",
+    ]
+    assert _local(store, "project = PROJ AND updated >= -1h ORDER BY key")[0] == [
+        "PROJ-1",
+        "PROJ-10",
+    ]
+    assert _local(store, 'project = PROJ AND updated < "1970-01-05" ORDER BY key')[0] == ["PROJ-3"]
+    assert _local(store, "project = PROJ AND NOT status = Done ORDER BY key", limit=1) == (
+        ["PROJ-1"],
+        3,
+    )
+
+
+def test_offline_text_search_matches_whole_words_of_adf(store):
+    """~ matches words of the visible text, not ADF node names or substrings."""
+    adf = {
+        "type": "doc",
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Add debug logs"}]}],
+    }
+    _seed_fresh(
+        store,
+        [_issue(1, description=adf), _issue(2, summary="Crash bug", description="plain text")],
+    )
+
+    assert _local(store, "project = PROJ AND description ~ paragraph ORDER BY key")[0] == []
+    assert _local(store, "project = PROJ AND description ~ content ORDER BY key")[0] == []
+    assert _local(store, "project = PROJ AND summary ~ bug ORDER BY key")[0] == ["PROJ-2"]
+    assert _local(store, "project = PROJ AND description ~ debug ORDER BY key")[0] == ["PROJ-1"]
+    assert _local(store, "project = PROJ AND description !~ debug ORDER BY key")[0] == ["PROJ-2"]
+
+
+@pytest.mark.parametrize(
+    "jql",
+    [
+        "assignee = currentUser() ORDER BY updated DESC",  # not scoped to a project
+        "project = PROJ AND assignee = currentUser()",  # no ORDER BY
+        "project = PROJ AND status WAS Done ORDER BY key",
+        "project = PROJ AND issue in linkedIssues(PROJ-1) ORDER BY key",
+        "project = PROJ AND cf[10016] > 3 ORDER BY key",
+        "project = PROJ ORDER BY priority DESC",
+        "project = PROJ AND created > startOfMonth() ORDER BY key",
+        # Jira's text search covers more fields and syntax than the mirror
+        "project = PROJ AND text ~ login ORDER BY key",
+        'project = PROJ AND summary ~ "log*" ORDER BY key',
+        'project = PROJ AND summary ~ "\\"login bug\\"" ORDER BY key',
+        'project = PROJ AND summary ~ "login~" ORDER BY key',
+        'project = PROJ AND summary ~ "login -bug" ORDER BY key',
+        'project = PROJ AND description ~ "login OR bug" ORDER BY key',
+    ],
+)
+def test_planner_rejects_unsupported_queries(jql):
+    """Anything outside the supported subset goes to Jira."""
+    with pytest.raises(UnsupportedQuery):
+        plan_query(jql, current_user="me")
+
+
+async def test_client_search_uses_mirror_and_falls_back(store):
+    """search_issues answers supported queries locally and sends the rest to Jira."""
+    _seed_fresh(store, [_issue(1, status={"name": "To Do"}), _issue(2, status={"name": "Done"})])
+    client = JiraClient(base_url="https://test.atlassian.net", auth=("a@b.c", "token"))
+    client.attach_mirror(store, max_age=900)
+
+    remote = {"issues": [], "total": 0}
+    with patch.object(client, "_request", new=AsyncMock(return_value=remote)) as req:
+        result = await client.search_issues(
+            'project = PROJ AND status = "To Do" ORDER BY updated DESC', fields=["summary"]
+        )
+        assert result["total"] == 1
+        assert result["issues"][0] == {
+            "key": "PROJ-1",
+            "id": "10001",
+            "fields": {"summary": "Issue 1"},
+        }
+        req.assert_not_called()
+
+        await client.search_issues(
+            "project = PROJ AND status WAS Done ORDER BY key", fields=["summary"]
+        )
+        assert req.call_count == 1
+
+        # A local write hides the project until the next sync
+        await client.assign_issue("PROJ-2", "abc")
+        await client.search_issues("project = PROJ ORDER BY key", fields=["summary"])
+        assert req.call_count == 3
+
+
+async def test_created_issue_is_listed_before_next_sync(store):
+    """Creating an issue hides the mirror until a sync stores it; deletes drop subtasks."""
+    subtask_type = {"name": "Sub-task", "subtask": True}
+    _seed_fresh(
+        store,
+        [
+            _issue(1, status={"name": "To Do"}, subtasks=[{"key": "PROJ-2"}]),
+            _issue(2, status={"name": "To Do"}, parent={"key": "PROJ-1"}, issuetype=subtask_type),
+            _issue(3, status={"name": "To Do"}, parent={"key": "PROJ-1"}, issuetype=subtask_type),
+        ],
+    )
+    client = JiraClient(base_url="https://test.atlassian.net", auth=("a@b.c", "token"))
+    client.attach_mirror(store, max_age=900)
+    jql = "project = PROJ ORDER BY key"
+
+    listed = {"issues": [_issue(n) for n in (1, 2, 3, 4)], "total": 4}
+    with patch.object(client, "_request", new=AsyncMock(return_value={"key": "PROJ-4"})) as req:
+        assert (await client.search_issues(jql, fields=["summary"]))["total"] == 3
+        req.assert_not_called()
+
+        await client.create_issue("PROJ", "New", "Body")
+        req.return_value = listed
+        result = await client.search_issues(jql, fields=["summary"])
+        assert [issue["key"] for issue in result["issues"]][-1] == "PROJ-4"
+        assert req.call_count == 2
+
+    # The next sync stores the real issue and the mirror answers again
+    store.upsert_issues("PROJ", [_issue(4, status={"name": "To Do"})])
+    with patch.object(client, "_request", new=AsyncMock(return_value={})) as req:
+        assert (await client.search_issues(jql, fields=["summary"]))["total"] == 4
+        req.assert_not_called()
+
+        await client.delete_issue("PROJ-1", delete_subtasks=True)
+    assert store.count("PROJ") == 1
+    assert store.get_issue("PROJ-4") is not None
+
+
+async def test_list_my_tickets_from_mirror_is_fast(store):
+    """list_my_tickets is answered from the mirror in well under a millisecond."""
+    me = {"accountId": "me", "displayName": "Me"}
+    _seed_fresh(
+        store,
+        [
+            _issue(
+                n,
+                assignee=me if n % 4 == 0 else None,
+                status={"name": "To Do"},
+                priority={"name": "High"},
+                issuetype={"name": "Task"},
+            )
+            for n in range(1, 2001)
+        ],
+    )
+    client = JiraClient(base_url="https://test.atlassian.net", auth=("a@b.c", "token"))
+    client.attach_mirror(store, max_age=900)
+    client.get_current_account_id = AsyncMock(return_value="me")
+
+    with patch.object(client, "_request", new=AsyncMock()) as req:
+        jql = str(my_tickets_query(project="PROJ", order_by=(("updated", "DESC"),)))
+        fields = jira_fields_for(None, SUMMARY_FIELDS)
+        await client.search_issues(jql, fields=fields, max_results=20)
+
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            result = await client.search_issues(jql, fields=fields, max_results=20)
+            timings.append(time.perf_counter() - start)
+        req.assert_not_called()
+
+    assert result["total"] == 500 and len(result["issues"]) == 20
+    assert sorted(timings)[len(timings) // 2] < 0.001
+
+
+def _adf(text):
+    return {
+        "type": "doc",
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
+
+def test_text_index_ranks_and_merges_partial_payloads():
+    """BM25 favours summary matches; partial payloads keep the other fields."""
+    index = TextIndex(":memory:")
+    index.add_issues(
+        [
+            {
+                "key": "PROJ-1",
+                "fields": {
+                    "summary": "Login timeout on mobile",
+                    "description": _adf("Users are logged out"),
+                },
+            },
+            {
+                "key": "PROJ-2",
+                "fields": {
+                    "summary": "Billing page",
+                    "comment": {"comments": [{"body": _adf("login timeout seen here too")}]},
+                },
+            },
+            {"key": "OPS-1", "fields": {"summary": "Login timeouts in staging"}},
+        ]
+    )
+
+    # Summary hits (stemmed: "timeouts" matches) outrank the comment hit
+    results = index.search("login timeout")
+    assert {r["key"] for r in results[:2]} == {"PROJ-1", "OPS-1"}
+    assert results[2]["key"] == "PROJ-2"
+    assert "**timeout**" in results[2]["snippet"]
+    assert [r["key"] for r in index.search("timeout", project="proj")] == ["PROJ-1", "PROJ-2"]
+    assert [r["key"] for r in index.search("bill*")] == ["PROJ-2"]
+
+    # A summary-only payload leaves the indexed description alone
+    index.add_issues([{"key": "PROJ-1", "fields": {"summary": "Session expiry"}}])
+    assert [r["key"] for r in index.search("logged")] == ["PROJ-1"]
+    assert [r["key"] for r in index.search("login timeout")] == ["OPS-1", "PROJ-2"]
+
+    index.delete_issue("OPS-1")
+    assert index.count() == 2
+    with pytest.raises(ValueError):
+        index.search("   ")
+    index.close()
+
+
+async def test_client_feeds_text_index_and_index_project_is_incremental():
+    """Fetched payloads are indexed; index_project only asks for recent changes later."""
+    index = TextIndex(":memory:")
+    client = JiraClient(base_url="https://test.atlassian.net", auth=("a@b.c", "token"))
+    client.attach_text_index(index)
+
+    page = {"issues": [{"key": "PROJ-1", "fields": {"summary": "Flaky deploy script"}}]}
+    with patch.object(client, "_request", new=AsyncMock(return_value=page)) as req:
+        assert await index_project(client, index, "PROJ") == 1
+        assert index.search("deploy")[0]["key"] == "PROJ-1"
+        first_jql = req.call_args.kwargs["json"]["jql"]
+        assert "updated" not in first_jql
+
+        await index_project(client, index, "PROJ")
+        assert 'updated >= "-' in req.call_args.kwargs["json"]["jql"]
+
+        req.return_value = {"key": "PROJ-2", "fields": {"summary": "Deploy docs"}}
+        await client.get_issue("PROJ-2", fields=["summary"])
+    assert {r["key"] for r in index.search("deploy")} == {"PROJ-1", "PROJ-2"}
+    index.close()
+
+
+def test_similarity_index_ranks_persists_and_filters(tmp_path):
+    """TF-IDF cosine ranks related issues; a saved index loads memory-mapped."""
+    similarity = pytest.importorskip("jira_mcp_cursor.mirror.similarity")
+    index = TextIndex(tmp_path / "text_index.db")
+    index.add_issues(
+        [
+            {
+                "key": "PROJ-1",
+                "fields": {
+                    "summary": "Checkout payment times out",
+                    "description": _adf("Stripe payment request hangs at checkout"),
+                },
+            },
+            {"key": "PROJ-2", "fields": {"summary": "Payment checkout timeout on mobile"}},
+            {"key": "PROJ-3", "fields": {"summary": "Update onboarding docs"}},
+            {"key": "OPS-1", "fields": {"summary": "Checkout payment hangs in staging"}},
+        ]
+    )
+
+    built = similarity.rebuild(index)
+    results = built.most_similar(index.get_document("PROJ-1"), exclude="PROJ-1")
+    assert {r["key"] for r in results} == {"PROJ-2", "OPS-1"}
+    assert results[0]["score"] >= results[1]["score"] > 0
+    assert [r["key"] for r in built.most_similar({"summary": "payment"}, project="ops")] == [
+        "OPS-1"
+    ]
+    assert built.most_similar({"summary": "payment"}, project="NOPE") == []
+    assert built.most_similar({"summary": "unrelated words"}) == []
+
+    loaded = similarity.SimilarityIndex.load(tmp_path / "similarity")
+    assert isinstance(loaded.weights, similarity.np.memmap)
+    assert loaded.most_similar({"summary": "checkout payment"}) == built.most_similar(
+        {"summary": "checkout payment"}
+    )
+
+    index.close()
+
+
+def test_similarity_rebuild_leaves_loaded_index_intact(tmp_path):
+    """Saving a rebuilt index never rewrites the files a loaded index has mapped."""
+    similarity = pytest.importorskip("jira_mcp_cursor.mirror.similarity")
+    index = TextIndex(tmp_path / "text_index.db")
+    index.add_issues(
+        [
+            {"key": f"PROJ-{n}", "fields": {"summary": f"Checkout payment case {n}"}}
+            for n in range(1, 21)
+        ]
+    )
+    similarity.rebuild(index)
+    loaded = similarity.SimilarityIndex.load(tmp_path / "similarity")
+    expected = loaded.most_similar({"summary": "checkout payment"}, limit=20)
+
+    index.add_issues(
+        [{"key": f"OPS-{n}", "fields": {"summary": f"Deploy pipeline {n}"}} for n in range(1, 200)]
+    )
+    rebuilder = threading.Thread(target=lambda: [similarity.rebuild(index) for _ in range(5)])
+    rebuilder.start()
+    while rebuilder.is_alive():
+        assert loaded.most_similar({"summary": "checkout payment"}, limit=20) == expected
+    rebuilder.join()
+    assert loaded.most_similar({"summary": "checkout payment"}, limit=20) == expected
+
+    reloaded = similarity.SimilarityIndex.load(tmp_path / "similarity")
+    assert len(reloaded) == 219
+    versions = [path for path in (tmp_path / "similarity").iterdir() if path.is_dir()]
+    assert len(versions) == 2
+    index.close()
+
+
+def test_similarity_index_overlays_changes_instead_of_rebuilding(tmp_path, monkeypatch):
+    """New, edited and deleted issues are served from an overlay; big backlogs rebuild later."""
+    similarity = pytest.importorskip("jira_mcp_cursor.mirror.similarity")
+    index = TextIndex(tmp_path / "text_index.db")
+    index.add_issues(
+        [
+            {"key": f"PROJ-{n}", "fields": {"summary": f"Checkout payment case {n}"}}
+            for n in range(1, 11)
+        ]
+        + [{"key": "PROJ-11", "fields": {"summary": "Update onboarding docs"}}]
+    )
+    built = similarity.rebuild(index)
+
+    rebuilds = []
+    monkeypatch.setattr(similarity, "REBUILD_FRACTION", 0.3)
+    monkeypatch.setattr(similarity, "rebuild", lambda text_index: rebuilds.append("sync"))
+    monkeypatch.setattr(
+        similarity, "_rebuild_in_background", lambda text_index: rebuilds.append("background")
+    )
+    assert similarity.get_similarity_index(index) is built
+
+    index.add_issues(
+        [
+            {"key": "PROJ-12", "fields": {"summary": "Payment refund fails"}},
+            {"key": "PROJ-11", "fields": {"summary": "Onboarding payment docs"}},
+        ]
+    )
+    index.delete_issue("PROJ-1")
+    current = similarity.get_similarity_index(index)
+    assert rebuilds == []
+    assert current.weights is built.weights and len(current) == 11
+    keys = {r["key"] for r in current.most_similar({"summary": "payment"}, limit=20)}
+    assert {"PROJ-11", "PROJ-12"} <= keys and "PROJ-1" not in keys
+    assert similarity.get_similarity_index(index) is current
+
+    # Past REBUILD_FRACTION of the index, a rebuild starts in the background
+    index.add_issues([{"key": "PROJ-13", "fields": {"summary": "Payment retries"}}])
+    similarity.get_similarity_index(index)
+    assert rebuilds == ["background"]
+    index.close()
+
+
+def test_similarity_top_k_over_100k_issues_is_fast():
+    """Top-k over 100k synthetic issues stays well under 100ms."""
+    similarity = pytest.importorskip("jira_mcp_cursor.mirror.similarity")
+    np = similarity.np
+    rng = np.random.default_rng(7)
+    vocabulary = [
+        f"term{chr(97 + i % 26)}{chr(97 + i // 26 % 26)}{chr(97 + i // 676)}" for i in range(5000)
+    ]
+    # Zipf-like word frequencies, as in real ticket text
+    probabilities = 1.0 / np.arange(1, len(vocabulary) + 1)
+    probabilities /= probabilities.sum()
+    words = rng.choice(len(vocabulary), size=(100_000, 12), p=probabilities)
+    index = similarity.SimilarityIndex.build(
+        {
+            "key": f"PROJ-{n}",
+            "project": "PROJ",
+            "summary": " ".join(vocabulary[w] for w in row[:6]),
+            "description": " ".join(vocabulary[w] for w in row[6:]),
+        }
+        for n, row in enumerate(words.tolist())
+    )
+
+    query = {"summary": " ".join(vocabulary[w] for w in words[42, :6].tolist())}
+    timings = []
+    for _ in range(20):
+        started = time.perf_counter()
+        results = index.most_similar(query, limit=10, project="PROJ")
+        timings.append(time.perf_counter() - started)
+
+    assert results[0]["key"] == "PROJ-42"
+    assert sorted(timings)[len(timings) // 2] < 0.05
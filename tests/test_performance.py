@@ -97,3 +97,200 @@ async def test_server_startup_time():
 
     # Server should initialize quickly
     assert duration < 5.0
+
+
+def test_settings_snapshot_removes_per_call_overhead():
+    """Benchmark: get_settings() is much cheaper than constructing Settings()."""
+    from jira_mcp_cursor.config.settings import Settings, get_settings, reload_settings
+
+    reload_settings()
+    iterations = 200
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Settings()
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        get_settings()
+    snapshot = time.perf_counter() - start
+
+    # Snapshot lookup is a single stat() call; parsing re-reads env + .env and validates
+    assert snapshot * 10 < construct
+
+
+def _import_profile(module: str) -> dict[str, int]:
+    """Import ``module`` in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        Mapping of every imported module to its cumulative import time in µs
+    """
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+# Generous ceiling: `click` alone is ~50ms; the old eager imports took ~200ms
+CLI_IMPORT_BUDGET_US = 400_000
+
+
+def test_cli_import_time_budget():
+    """Importing the CLI must not load crypto, the wizard, the installer or the server."""
+    profile = _import_profile("jira_mcp_cursor.cli")
+
+    heavy = {"cryptography", "http.server", "webbrowser", "httpx", "mcp", "pydantic_settings"}
+    assert heavy.isdisjoint(profile), heavy & set(profile)
+    assert not any(name.startswith("jira_mcp_cursor.config.") for name in profile)
+    assert profile["jira_mcp_cursor.cli"] < CLI_IMPORT_BUDGET_US
+
+
+def test_serve_path_does_not_import_tools_or_config_extras():
+    """The server module defers tool modules and never loads wizard/crypto code."""
+    profile = _import_profile("jira_mcp_cursor.server.server")
+
+    assert not any(name.startswith("jira_mcp_cursor.tools.") for name in profile)
+    assert {"cryptography", "http.server", "webbrowser"}.isdisjoint(profile)
+
+
+def test_description_parser_is_linear_on_large_descriptions():
+    """Benchmark: analysis time grows linearly up to 1 MB, including adversarial input."""
+    from jira_mcp_cursor.utils.description_parser import analyze_description
+
+    section = (
+        "## Requirements\n- Support OAuth2 login\n1. Rotate keys AUTH-12\n"
+        "## Acceptance Criteria\n- [ ] Tokens expire\n```\ncode()\n```\nPlain prose line.\n"
+    )
+    # Inputs that make lazy DOTALL section patterns rescan: heading-like lines that
+    # never match, long whitespace runs and unterminated fences
+    adversarial = (
+        "#" + " " * 200 + "\n# Requirements" + "\t" * 200 + "\n- [ " + "x" * 100 + "\n```\n"
+    )
+
+    def best_time(text: str) -> float:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            analyze_description(text)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    for unit in (section, adversarial):
+        small = unit * (256 * 1024 // len(unit))
+        large = unit * (1024 * 1024 // len(unit))
+        small_time, large_time = best_time(small), best_time(large)
+
+        # 4x the input: allow headroom for noise, but far below quadratic (16x)
+        assert large_time < small_time * 8
+        assert large_time < 2.0
+
+
+def test_adf_conversion_handles_deep_nesting_and_large_tables():
+    """Benchmark: ADF conversion is iterative and scales linearly with table size."""
+    import sys
+
+    from jira_mcp_cursor.utils.adf import to_markdown
+
+    def paragraph(text):
+        return {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+
+    # Deeper than the recursion limit: a recursive converter would fail here
+    depth = sys.getrecursionlimit() + 500
+    node = {"type": "bulletList", "content": [{"type": "listItem", "content": [paragraph("leaf")]}]}
+    for level in range(depth):
+        node = {
+            "type": "bulletList",
+            "content": [{"type": "listItem", "content": [paragraph(f"level {level}"), node]}],
+        }
+    markdown = to_markdown({"type": "doc", "content": [node]})
+    assert markdown.count("\n") == depth
+    assert markdown.rstrip().endswith("- leaf")
+
+    def table(rows):
+        cell = {
+            "type": "tableCell",
+            "content": [
+                paragraph("x"),
+                {
+                    "type": "bulletList",
+                    "content": [{"type": "listItem", "content": [paragraph("y")]}],
+                },
+            ],
+        }
+        row = {"type": "tableRow", "content": [cell] * 10}
+        return {"type": "doc", "content": [{"type": "table", "content": [row] * rows}]}
+
+    def best_time(doc):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            to_markdown(doc)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    small, large = best_time(table(250)), best_time(table(1000))
+    assert large < small * 8
+    assert large < 1.0
+
+
+def test_flow_metrics_over_20k_issues():
+    """Benchmark: flow metrics for 20k issues with full changelogs take seconds at most."""
+    flow = pytest.importorskip("jira_mcp_cursor.utils.flow_metrics")
+    from datetime import datetime, timedelta, timezone
+
+    workflow = [("1", "To Do"), ("3", "In Progress"), ("4", "Review"), ("5", "Done")]
+    categories = {"1": "new", "3": "indeterminate", "4": "indeterminate", "5": "done"}
+    origin = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def stamp(moment):
+        return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+    issues = []
+    for n in range(20_000):
+        created = origin + timedelta(hours=n)
+        steps = 1 + n % 3
+        histories = [
+            {
+                "created": stamp(created + timedelta(days=step + 1)),
+                "items": [
+                    {
+                        "field": "status",
+                        "from": workflow[step][0],
+                        "fromString": workflow[step][1],
+                        "to": workflow[step + 1][0],
+                        "toString": workflow[step + 1][1],
+                    }
+                ],
+            }
+            for step in range(steps)
+        ]
+        issues.append(
+            {
+                "key": f"P-{n}",
+                "fields": {"created": stamp(created), "status": {"id": workflow[steps][0]}},
+                "changelog": {"histories": histories},
+            }
+        )
+
+    start = time.perf_counter()
+    data = flow.build_flow_data(issues, categories)
+    metrics = flow.flow_metrics(data, origin + timedelta(days=900), weeks=104)
+    duration = time.perf_counter() - start
+
+    assert metrics["issue_count"] == 20_000
+    assert metrics["completed"] == 6_666
+    assert metrics["cycle_time_days"]["median"] == 2
+    assert duration < 5.0
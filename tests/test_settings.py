@@ -0,0 +1,44 @@
+"""Tests for the settings snapshot."""
+
+import os
+
+import pytest
+
+from jira_mcp_cursor.config.settings import get_settings, reload_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot():
+    """Start and finish each test with a snapshot of the real environment."""
+    reload_settings()
+    yield
+    reload_settings()
+
+
+def test_get_settings_returns_cached_snapshot():
+    """Repeated lookups return the same validated instance."""
+    assert get_settings() is get_settings()
+
+
+def test_reload_settings_picks_up_environment_changes(monkeypatch):
+    """Environment changes are only visible after an explicit reload."""
+    monkeypatch.setenv("JIRA_PROJECT_KEY", "SNAP")
+
+    assert get_settings().jira_project_key != "SNAP"
+    assert reload_settings().jira_project_key == "SNAP"
+    assert get_settings().jira_project_key == "SNAP"
+
+
+def test_get_settings_reloads_when_env_file_changes(tmp_path, monkeypatch):
+    """Touching the .env file invalidates the snapshot."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("JIRA_PROJECT_KEY", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("JIRA_PROJECT_KEY=FIRST\n")
+    assert reload_settings().jira_project_key == "FIRST"
+
+    env_file.write_text("JIRA_PROJECT_KEY=SECOND\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert get_settings().jira_project_key == "SECOND"
@@ -1,7 +1,7 @@
 """Tests for MCP tool handlers."""
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from jira_mcp_cursor.tools import (
     handle_list_my_tickets,
     handle_get_ticket,
@@ -15,6 +15,7 @@ from jira_mcp_cursor.tools.list_tickets import handle_list_tickets
 from jira_mcp_cursor.server.jira_client import JiraClient
 from jira_mcp_cursor.server.exceptions import JiraAPIError
 import json
+import sqlite3
 
 
 @pytest.mark.asyncio
@@ -360,6 +361,7 @@ async def test_update_status_invalid_transition():
     mock_client.get_transitions.return_value = [
         {"id": "21", "name": "In Progress", "to": {"name": "In Progress"}},
     ]
+    mock_client.resolve_status.return_value = "Closed"
 
     arguments = {
         "ticket_key": "TEST-123",
@@ -374,6 +376,28 @@ async def test_update_status_invalid_transition():
     assert "In Progress" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_update_status_resolves_status_alias():
+    """update_ticket_status falls back to the project's status index for aliases."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issue.return_value = {
+        "key": "TEST-123",
+        "fields": {"status": {"name": "In Progress"}},
+    }
+    mock_client.get_transitions.return_value = [
+        {"id": "31", "name": "Close", "to": {"name": "Closed"}},
+    ]
+    mock_client.resolve_status.return_value = "Closed"
+
+    result = await handle_update_ticket_status(
+        {"ticket_key": "TEST-123", "status": "done"}, mock_client
+    )
+
+    mock_client.resolve_status.assert_called_once_with("done", "TEST")
+    mock_client.transition_issue.assert_called_once_with("TEST-123", "31", comment=None)
+    assert json.loads(result[0].text)["new_status"] == "Closed"
+
+
 @pytest.mark.asyncio
 async def test_add_ticket_comment_handler():
     """Test add_ticket_comment handler."""
@@ -647,7 +671,7 @@ async def test_list_tickets_by_creator_quotes_creator_with_spaces():
     )
 
     jql = mock_client.search_issues.call_args[1]["jql"]
-    assert 'reporter="John Doe"' in jql, (
+    assert 'reporter = "John Doe"' in jql, (
         f"Expected quoted reporter in JQL, got: {jql}"
     )
 
@@ -664,11 +688,26 @@ async def test_list_tickets_by_creator_quotes_account_id():
     )
 
     jql = mock_client.search_issues.call_args[1]["jql"]
-    assert 'reporter="abc123def456"' in jql, (
+    assert 'reporter = "abc123def456"' in jql, (
         f"Expected quoted account ID in JQL, got: {jql}"
     )
 
 
+@pytest.mark.asyncio
+async def test_list_tickets_by_creator_current_user_is_not_quoted():
+    """currentUser() is emitted as the JQL function, not a quoted user name."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.search_issues.return_value = {"issues": [], "total": 0}
+
+    await handle_list_tickets_by_creator(
+        {"creator": "currentUser()", "project": "TEST"},
+        mock_client,
+    )
+
+    jql = mock_client.search_issues.call_args[1]["jql"]
+    assert "reporter = currentUser()" in jql, f"Expected unquoted currentUser(), got: {jql}"
+
+
 @pytest.mark.asyncio
 async def test_list_tickets_by_creator_quotes_email():
     """Email addresses with special characters must be quoted in JQL."""
@@ -681,11 +720,26 @@ async def test_list_tickets_by_creator_quotes_email():
     )
 
     jql = mock_client.search_issues.call_args[1]["jql"]
-    assert 'reporter="john@example.com"' in jql, (
+    assert 'reporter = "john@example.com"' in jql, (
         f"Expected quoted email in JQL, got: {jql}"
     )
 
 
+@pytest.mark.asyncio
+async def test_list_tickets_by_creator_quotes_project_and_status():
+    """Project and status use the same double-quoted, escaped form as other tools."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.search_issues.return_value = {"issues": [], "total": 0}
+
+    await handle_list_tickets_by_creator(
+        {"creator": 'Jane "JD" Doe', "project": "TEST", "status": "In Progress"},
+        mock_client,
+    )
+
+    jql = mock_client.search_issues.call_args[1]["jql"]
+    assert jql == 'project = "TEST" AND reporter = "Jane \\"JD\\" Doe" AND status = "In Progress"'
+
+
 @pytest.mark.asyncio
 @pytest.mark.ci_critical
 async def test_list_tickets_with_type_filter():
@@ -747,6 +801,7 @@ async def test_list_tickets_without_type_filter():
 async def test_create_issue_resolves_epic_type():
     """create_issue with an epic-like issue_type resolves it via the client."""
     mock_client = AsyncMock(spec=JiraClient)
+    mock_client.text_index = None
     mock_client.resolve_issue_type.return_value = "Program Epic"
     mock_client.create_issue.return_value = {"key": "PROJ-42", "id": "42", "self": "..."}
 
@@ -768,6 +823,7 @@ async def test_create_issue_resolves_epic_type():
 async def test_create_issue_resolves_non_epic_type():
     """create_issue resolves all types, not just epics."""
     mock_client = AsyncMock(spec=JiraClient)
+    mock_client.text_index = None
     mock_client.resolve_issue_type.return_value = "Feature"
     mock_client.create_issue.return_value = {"key": "PROJ-43", "id": "43", "self": "..."}
 
@@ -780,6 +836,73 @@ async def test_create_issue_resolves_non_epic_type():
     assert mock_client.create_issue.call_args[1]["issue_type"] == "Feature"
 
 
+@pytest.mark.asyncio
+async def test_create_issue_reports_or_blocks_near_duplicates():
+    """Similar indexed issues are returned as possible duplicates, or stop creation."""
+    from jira_mcp_cursor.mirror.text_index import TextIndex
+
+    index = TextIndex(":memory:")
+    index.add_issues(
+        [
+            {"key": "PROJ-7", "fields": {
+                "summary": "Login page times out on slow mobile connections",
+                "description": "After 30 seconds the spinner stops and the user is logged out."}},
+            {"key": "PROJ-8", "fields": {"summary": "Export invoices as CSV", "description": ""}},
+        ]
+    )
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.text_index = index
+    mock_client.resolve_issue_type.return_value = "Bug"
+    mock_client.create_issue.return_value = {"key": "PROJ-9", "id": "9", "self": "..."}
+    arguments = {
+        "project_key": "PROJ",
+        "issue_type": "Bug",
+        "summary": "Login page times out on slow mobile connection",
+        "description": "After 30 seconds the spinner stops and the user is logged out.",
+    }
+
+    data = json.loads((await handle_create_issue(arguments, mock_client))[0].text)
+    assert data["success"] is True
+    assert [d["key"] for d in data["possible_duplicates"]] == ["PROJ-7"]
+    assert data["possible_duplicates"][0]["similarity"] > 0.6
+
+    mock_client.create_issue.reset_mock()
+    blocked = json.loads(
+        (await handle_create_issue({**arguments, "duplicate_check": "block"}, mock_client))[0].text
+    )
+    assert blocked["blocked"] is True
+    mock_client.create_issue.assert_not_called()
+
+    data = json.loads(
+        (await handle_create_issue({**arguments, "duplicate_check": "off"}, mock_client))[0].text
+    )
+    assert "possible_duplicates" not in data
+    index.close()
+
+
+@pytest.mark.asyncio
+async def test_create_issue_skips_duplicate_check_without_usable_index():
+    """With the text index disabled or failing, the issue is still created."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.text_index = None
+    mock_client.resolve_issue_type.return_value = "Task"
+    mock_client.create_issue.return_value = {"key": "PROJ-9", "id": "9", "self": "..."}
+    arguments = {"project_key": "PROJ", "summary": "A task", "description": "desc"}
+
+    for duplicate_check in ("warn", "block"):
+        data = json.loads(
+            (await handle_create_issue({**arguments, "duplicate_check": duplicate_check}, mock_client))[0].text
+        )
+        assert data["success"] is True
+        assert "possible_duplicates" not in data
+
+    mock_client.text_index = MagicMock()
+    mock_client.text_index.find_duplicates.side_effect = sqlite3.OperationalError("database is locked")
+    data = json.loads((await handle_create_issue(arguments, mock_client))[0].text)
+    assert data["success"] is True
+    assert mock_client.create_issue.call_count == 3
+
+
 # ── link_issues tests ──────────────────────────────────────────────
 
 
@@ -791,6 +914,7 @@ async def test_link_issues_basic():
 
     mock_client = AsyncMock(spec=JiraClient)
     mock_client.link_issues.return_value = {}
+    mock_client.resolve_link_type.return_value = ("Relates", False)
 
     arguments = {
         "inward_issue": "PROJ-2",
@@ -821,11 +945,12 @@ async def test_link_issues_with_type_and_comment():
 
     mock_client = AsyncMock(spec=JiraClient)
     mock_client.link_issues.return_value = {}
+    mock_client.resolve_link_type.return_value = ("Blocks", False)
 
     arguments = {
         "inward_issue": "PROJ-2",
         "outward_issue": "PROJ-1",
-        "link_type": "Blocks",
+        "link_type": "blocks",
         "comment": "Blocking due to API dependency",
     }
 
@@ -847,12 +972,43 @@ async def test_link_issues_with_type_and_comment():
     assert "PROJ-2" in data["message"]
 
 
+@pytest.mark.asyncio
+async def test_link_issues_inward_description_swaps_issues():
+    """An inward link description ("is blocked by") creates the link the other way round."""
+    from jira_mcp_cursor.tools.link_issues import handle_link_issues
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.link_issues.return_value = {}
+    mock_client.resolve_link_type.return_value = ("Blocks", True)
+
+    arguments = {
+        "outward_issue": "PROJ-2",
+        "inward_issue": "PROJ-1",
+        "link_type": "is blocked by",
+    }
+
+    result = await handle_link_issues(arguments, mock_client)
+
+    mock_client.link_issues.assert_called_once_with(
+        inward_issue="PROJ-2",
+        outward_issue="PROJ-1",
+        link_type="Blocks",
+        comment=None,
+    )
+
+    data = json.loads(result[0].text)
+    assert data["outward_issue"] == "PROJ-1"
+    assert data["inward_issue"] == "PROJ-2"
+    assert data["message"] == "PROJ-1 now 'Blocks' PROJ-2"
+
+
 @pytest.mark.asyncio
 async def test_link_issues_propagates_api_error():
     """Test that API errors from link_issues bubble up correctly."""
     from jira_mcp_cursor.tools.link_issues import handle_link_issues
 
     mock_client = AsyncMock(spec=JiraClient)
+    mock_client.resolve_link_type.return_value = ("Relates", False)
     mock_client.link_issues.side_effect = JiraAPIError(
         "Issue Does Not Exist", status_code=404
     )
@@ -866,3 +1022,633 @@ async def test_link_issues_propagates_api_error():
         await handle_link_issues(arguments, mock_client)
 
     assert exc_info.value.status_code == 404
+
+
+# ── field projection tests ─────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_list_tickets_pushes_field_projection(sample_issue):
+    """Requested fields are pushed down into the search and the response."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.search_issues.return_value = {"issues": [sample_issue], "total": 1}
+
+    result = await handle_list_tickets(
+        {"project": "PROJ", "fields": ["summary", "status"]}, mock_client
+    )
+
+    assert mock_client.search_issues.call_args[1]["fields"] == ["summary", "status"]
+    data = json.loads(result[0].text)
+    assert data["issues"][0] == {
+        "key": "TEST-123",
+        "summary": "Implement user authentication",
+        "status": "To Do",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_highest_priority_ticket_requests_explicit_fields(sample_issue):
+    """get_highest_priority_ticket never downloads every field."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.search_issues.return_value = {"issues": [sample_issue], "total": 1}
+
+    await handle_get_highest_priority_ticket({}, mock_client)
+    assert "summary" in mock_client.search_issues.call_args[1]["fields"]
+
+    result = await handle_get_highest_priority_ticket({"fields": ["priority"]}, mock_client)
+    assert mock_client.search_issues.call_args[1]["fields"] == ["priority"]
+    assert json.loads(result[0].text) == {"key": "TEST-123", "priority": "High"}
+
+
+# ── get_ticket comment paging tests ────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_projects_comments_without_rendered_fields(sample_issue):
+    """Comments come from the field projection; rendered HTML is opt-in."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issue.return_value = sample_issue
+
+    result = await handle_get_ticket({"ticket_key": "TEST-123"}, mock_client)
+
+    call_args = mock_client.get_issue.call_args[1]
+    assert call_args["expand"] is None
+    assert "comment" in call_args["fields"]
+    mock_client.get_comments.assert_not_called()
+
+    data = json.loads(result[0].text)
+    assert data["comments_total"] == 1
+    assert "next_comment_start" not in data
+    assert "rendered" not in data
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_comments_only_projection(sample_issue):
+    """fields=["comments"] fetches and returns only the key and the comments."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issue.return_value = sample_issue
+
+    result = await handle_get_ticket(
+        {"ticket_key": "TEST-123", "fields": ["comments"]}, mock_client
+    )
+
+    assert mock_client.get_issue.call_args[1]["fields"] == ["comment"]
+    data = json.loads(result[0].text)
+    assert set(data) == {"key", "comments", "comments_total"}
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_pages_truncated_comments(sample_issue):
+    """A comment window beyond the embedded list is fetched from the comment endpoint."""
+    mock_client = AsyncMock(spec=JiraClient)
+    issue = {**sample_issue, "fields": {**sample_issue["fields"]}}
+    embedded = [{"author": {"displayName": "A"}, "body": f"c{i}"} for i in range(5)]
+    issue["fields"]["comment"] = {"comments": embedded, "total": 30}
+    mock_client.get_issue.return_value = issue
+    mock_client.get_comments.return_value = {
+        "comments": [{"author": {"displayName": "B"}, "body": f"c{i}"} for i in range(10, 20)],
+        "startAt": 10,
+        "total": 30,
+    }
+
+    result = await handle_get_ticket(
+        {"ticket_key": "TEST-123", "comment_start": 10, "comment_limit": 10}, mock_client
+    )
+
+    mock_client.get_comments.assert_called_once_with("TEST-123", start_at=10, max_results=10)
+    data = json.loads(result[0].text)
+    assert [c["body"] for c in data["comments"]] == [f"c{i}" for i in range(10, 20)]
+    assert data["comments_total"] == 30
+    assert data["next_comment_start"] == 20
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_include_rendered(sample_issue):
+    """include_rendered expands renderedFields and returns the HTML."""
+    mock_client = AsyncMock(spec=JiraClient)
+    issue = {**sample_issue, "renderedFields": {"description": "<p>OAuth2</p>", "summary": None}}
+    mock_client.get_issue.return_value = issue
+
+    result = await handle_get_ticket(
+        {"ticket_key": "TEST-123", "include_comments": False, "include_rendered": True},
+        mock_client,
+    )
+
+    call_args = mock_client.get_issue.call_args[1]
+    assert call_args["expand"] == ["renderedFields"]
+    assert "comment" not in call_args["fields"]
+    data = json.loads(result[0].text)
+    assert data["rendered"] == {"description": "<p>OAuth2</p>"}
+    assert "comments" not in data
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_comments_returns_newest_n():
+    """get_ticket_comments stops streaming once the limit is reached."""
+    from jira_mcp_cursor.tools.get_ticket import handle_get_ticket_comments
+
+    mock_client = AsyncMock(spec=JiraClient)
+    consumed = []
+
+    async def fake_iter_comments(issue_key, order, since, page_size):
+        assert order == "-created"
+        for i in range(10, 0, -1):
+            consumed.append(i)
+            yield {"author": {"displayName": "A"}, "body": f"c{i}", "created": "2025-01-01"}
+
+    mock_client.iter_comments = fake_iter_comments
+
+    result = await handle_get_ticket_comments({"ticket_key": "TEST-1", "limit": 3}, mock_client)
+
+    data = json.loads(result[0].text)
+    assert [c["body"] for c in data["comments"]] == ["c10", "c9", "c8"]
+    assert data["has_more"] is True
+    assert len(consumed) == 4
+
+
+@pytest.mark.asyncio
+async def test_list_my_tickets_cursor_does_not_requery(sample_issue):
+    """Continuation pages are served from the cursor cache without hitting Jira."""
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.search_issues.return_value = {"issues": [sample_issue] * 10, "total": 10}
+
+    first = json.loads((await handle_list_my_tickets({"max_tokens": 150}, mock_client))[0].text)
+    assert first["truncated"] is True
+    assert first["returned"] < 10
+
+    second = json.loads(
+        (await handle_list_my_tickets({"cursor": first["next_cursor"]}, mock_client))[0].text
+    )
+    assert mock_client.search_issues.call_count == 1
+    assert second["returned"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_assign_issue_resolves_email_to_account_id():
+    """assign_issue resolves emails/names but passes '-1'/'null' through."""
+    from jira_mcp_cursor.tools.create_ticket import handle_assign_issue
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.resolve_account_id.return_value = "acc-1"
+
+    await handle_assign_issue({"issue_key": "PROJ-1", "assignee": "jane@example.com"}, mock_client)
+    mock_client.assign_issue.assert_called_once_with("PROJ-1", "acc-1")
+
+    mock_client.reset_mock()
+    await handle_assign_issue({"issue_key": "PROJ-1", "assignee": "null"}, mock_client)
+    mock_client.resolve_account_id.assert_not_called()
+    mock_client.assign_issue.assert_called_once_with("PROJ-1", "null")
+
+
+@pytest.mark.asyncio
+async def test_list_users_uses_local_directory():
+    """list_users is answered through find_users rather than a raw search."""
+    from jira_mcp_cursor.tools.create_ticket import handle_list_users
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.find_users.return_value = [
+        {"accountId": "a1", "displayName": "Jane Doe", "emailAddress": "jane@example.com"}
+    ]
+
+    result = await handle_list_users({"query": "jan", "max_results": 5}, mock_client)
+
+    mock_client.find_users.assert_called_once_with(query="jan", max_results=5)
+    mock_client.search_users.assert_not_called()
+    data = json.loads(result[0].text)
+    assert data["total"] == 1
+    assert data["users"][0]["accountId"] == "a1"
+
+
+@pytest.mark.asyncio
+async def test_list_users_unknown_cursor_raises():
+    """An expired or unknown cursor is reported instead of silently re-querying."""
+    from jira_mcp_cursor.tools.create_ticket import handle_list_users
+
+    mock_client = AsyncMock(spec=JiraClient)
+
+    with pytest.raises(ValueError, match="Cursor"):
+        await handle_list_users({"cursor": "does-not-exist"}, mock_client)
+
+    mock_client.search_users.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_text_uses_local_index():
+    """search_text ranks matches from the local index without calling Jira."""
+    from jira_mcp_cursor.mirror.text_index import TextIndex
+    from jira_mcp_cursor.tools.search_text import handle_search_text
+
+    index = TextIndex(":memory:")
+    index.add_issues(
+        [
+            {"key": "PROJ-1", "fields": {"summary": "Checkout fails with timeout"}},
+            {"key": "PROJ-2", "fields": {"summary": "Update docs"}},
+        ]
+    )
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.text_index = index
+
+    result = await handle_search_text({"query": "timeout", "project": "PROJ"}, mock_client)
+
+    data = json.loads(result[0].text)
+    assert [r["key"] for r in data["results"]] == ["PROJ-1"]
+    assert data["indexed_issues"] == 2
+    mock_client.search_issues.assert_not_called()
+
+    mock_client.text_index = None
+    with pytest.raises(ValueError, match="JIRA_TEXT_INDEX"):
+        await handle_search_text({"query": "timeout"}, mock_client)
+    index.close()
+
+
+@pytest.mark.asyncio
+async def test_find_similar_tickets_ranks_from_local_index():
+    """find_similar_tickets ranks indexed tickets by text similarity to a key."""
+    pytest.importorskip("numpy")
+    from jira_mcp_cursor.mirror.text_index import TextIndex
+    from jira_mcp_cursor.tools.find_similar import handle_find_similar_tickets
+
+    index = TextIndex(":memory:")
+    index.add_issues(
+        [
+            {"key": "PROJ-1", "fields": {"summary": "Checkout fails with payment timeout"}},
+            {"key": "PROJ-2", "fields": {"summary": "Payment timeout during checkout"}},
+            {"key": "PROJ-3", "fields": {"summary": "Update docs"}},
+        ]
+    )
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.text_index = index
+
+    result = await handle_find_similar_tickets({"ticket_key": "proj-1"}, mock_client)
+
+    data = json.loads(result[0].text)
+    assert data["ticket_key"] == "PROJ-1"
+    assert [r["key"] for r in data["results"]] == ["PROJ-2"]
+    assert data["results"][0]["summary"] == "Payment timeout during checkout"
+    mock_client.get_issue.assert_not_called()
+
+    # Keys missing from the index are fetched for their text
+    mock_client.get_issue.return_value = {"fields": {"summary": "Docs update", "description": None}}
+    result = await handle_find_similar_tickets({"ticket_key": "PROJ-9"}, mock_client)
+    assert [r["key"] for r in json.loads(result[0].text)["results"]] == ["PROJ-3"]
+
+    with pytest.raises(ValueError, match="ticket_key or text"):
+        await handle_find_similar_tickets({}, mock_client)
+    index.close()
+
+
+@pytest.mark.asyncio
+async def test_analyze_tickets_batches_and_aggregates(monkeypatch):
+    """analyze_tickets fetches in one batch call and aggregates complexity and dependencies."""
+    from jira_mcp_cursor.tools import analyze_ticket
+    from jira_mcp_cursor.tools.analyze_ticket import handle_analyze_tickets
+
+    def issue(key, description, issue_type="Story"):
+        return {
+            "key": key,
+            "fields": {"summary": key, "description": description, "issuetype": {"name": issue_type}},
+        }
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issues.return_value = [
+        issue("PROJ-1", "Depends on PROJ-2 and AUTH-7"),
+        issue("PROJ-2", "Refactor the integration layer", "Bug"),
+    ]
+
+    result = await handle_analyze_tickets({"ticket_keys": ["proj-1", "PROJ-2", "PROJ-9"]}, mock_client)
+
+    data = json.loads(result[0].text)
+    mock_client.get_issues.assert_called_once()
+    assert mock_client.get_issues.call_args.args[0] == ["PROJ-1", "PROJ-2", "PROJ-9"]
+    assert [t["key"] for t in data["tickets"]] == ["PROJ-1", "PROJ-2"]
+    aggregates = data["aggregates"]
+    assert aggregates["complexity"] == {"High": 1, "Medium": 0, "Low": 1}
+    assert aggregates["types"] == {"Story": 1, "Bug": 1}
+    assert aggregates["dependencies"] == ["AUTH-7", "PROJ-2"]
+    assert aggregates["external_dependencies"] == ["AUTH-7"]
+    assert data["not_found"] == ["PROJ-9"]
+
+    # Large batches are parsed in worker processes with the same results
+    monkeypatch.setattr(analyze_ticket, "PARALLEL_MIN_CHARS", 0)
+    descriptions = [f"# Requirements\n- Item {n}\nSee PROJ-{n}" for n in range(8)]
+    analyses = await analyze_ticket.analyze_many(descriptions)
+    assert [a["requirements"] for a in analyses] == [[f"Item {n}"] for n in range(8)]
+    assert [a["dependencies"] for a in analyses] == [[f"PROJ-{n}"] for n in range(8)]
+    analyze_ticket.shutdown_parse_executor()
+    assert analyze_ticket._parse_executor is None
+
+    with pytest.raises(ValueError, match="at least one"):
+        await handle_analyze_tickets({"ticket_keys": []}, mock_client)
+
+
+@pytest.mark.asyncio
+async def test_analyze_ticket_reads_adf_descriptions():
+    """v3 (ADF) descriptions are analyzed like Markdown without a v2 re-fetch."""
+    def text(value):
+        return {"type": "text", "text": value}
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issue.return_value = {
+        "key": "TEST-321",
+        "fields": {
+            "summary": "ADF ticket",
+            "updated": "2025-01-01T00:00:00.000+0000",
+            "description": {
+                "type": "doc",
+                "content": [
+                    {"type": "heading", "attrs": {"level": 2}, "content": [text("Acceptance Criteria")]},
+                    {"type": "taskList", "content": [
+                        {"type": "taskItem", "attrs": {"state": "TODO"}, "content": [text("Works")]},
+                    ]},
+                ],
+            },
+        },
+    }
+
+    result = await handle_analyze_ticket({"ticket_key": "TEST-321"}, mock_client)
+
+    analysis = json.loads(result[0].text)["analysis"]
+    assert analysis["acceptance_criteria"] == ["Works"]
+    mock_client.get_issue.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_dependency_graph_crawls_layers_and_reports_cycles():
+    """dependency_graph fetches one batch per layer, stops at max_depth and finds cycles."""
+    from jira_mcp_cursor.tools.dependency_graph import handle_dependency_graph
+
+    blocks = {"name": "Blocks", "inward": "is blocked by", "outward": "blocks"}
+
+    def issue(key, blocked_by=(), description=None):
+        return {
+            "key": key,
+            "fields": {
+                "summary": f"Summary {key}",
+                "status": {"name": "To Do"},
+                "issuelinks": [{"type": blocks, "inwardIssue": {"key": k}} for k in blocked_by],
+                "description": description,
+            },
+        }
+
+    graph = {
+        "P-1": issue("P-1", blocked_by=["P-2"], description="See P-3"),
+        "P-2": issue("P-2", blocked_by=["P-1"]),
+        "P-3": issue("P-3", blocked_by=["P-4"]),
+        "P-4": issue("P-4", blocked_by=["P-5"]),
+    }
+    batches = []
+
+    async def get_issues(keys, fields=None):
+        batches.append(sorted(keys))
+        return [graph[key] for key in keys if key in graph]
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issues.side_effect = get_issues
+
+    result = await handle_dependency_graph({"ticket_key": "p-1", "max_depth": 2}, mock_client)
+
+    data = json.loads(result[0].text)
+    assert batches == [["P-1"], ["P-2", "P-3"], ["P-4"]]
+    assert [(n["key"], n["depth"]) for n in data["nodes"]] == [("P-1", 0), ("P-2", 1), ("P-3", 1), ("P-4", 2)]
+    assert data["nodes"][0]["edges"] == [
+        {"key": "P-2", "relation": "is blocked by"},
+        {"key": "P-3", "relation": "mentions"},
+    ]
+    assert data["cycles"] == [["P-1", "P-2"]]
+    assert data["unexplored"] == ["P-5"]
+    assert data["truncated"] is False
+
+    with pytest.raises(ValueError, match="ticket_key"):
+        await handle_dependency_graph({}, mock_client)
+
+
+@pytest.mark.asyncio
+async def test_dependency_graph_follows_moved_issues():
+    """An issue returned under a new key (moved project) is expanded under that key."""
+    from jira_mcp_cursor.tools.dependency_graph import handle_dependency_graph
+
+    moved = {"key": "NEW-7", "fields": {"summary": "Moved", "subtasks": [{"key": "NEW-8"}]}}
+    subtask = {"key": "NEW-8", "fields": {"summary": "Subtask"}}
+
+    async def get_issues(keys, fields=None):
+        return [{"P-1": moved, "NEW-8": subtask}[key] for key in keys]
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issues.side_effect = get_issues
+
+    result = await handle_dependency_graph({"ticket_key": "P-1"}, mock_client)
+
+    data = json.loads(result[0].text)
+    assert [(n["key"], n["depth"]) for n in data["nodes"]] == [("NEW-7", 0), ("NEW-8", 1)]
+    assert data["nodes"][0]["edges"] == [{"key": "NEW-8", "relation": "has subtask"}]
+
+
+@pytest.mark.asyncio
+async def test_dependency_graph_skips_unknown_projects_and_failed_batches():
+    """Key-shaped tokens outside known projects are not crawled; failed batches are reported."""
+    from jira_mcp_cursor.tools.dependency_graph import handle_dependency_graph
+
+    root = {
+        "key": "P-1",
+        "fields": {
+            "summary": "Root",
+            "description": "Store as UTF-8, sign with SHA-256, see P-2 and OPS-3",
+            "subtasks": [{"key": "P-4"}],
+        },
+    }
+    fetched = []
+
+    async def get_issues(keys, fields=None):
+        fetched.append(sorted(keys))
+        if keys == ["P-1"]:
+            return [root]
+        raise JiraAPIError("Jira API error: 503", status_code=503)
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_project_keys.return_value = ["P", "OPS"]
+    mock_client.get_issues.side_effect = get_issues
+
+    result = await handle_dependency_graph({"ticket_key": "P-1"}, mock_client)
+
+    data = json.loads(result[0].text)
+    assert fetched == [["P-1"], ["OPS-3", "P-2", "P-4"]]
+    assert [edge["key"] for edge in data["nodes"][0]["edges"]] == ["P-4", "P-2", "OPS-3"]
+    assert data["unexplored"] == ["OPS-3", "P-2", "P-4"]
+
+    # A failed root batch leaves the roots not found
+    result = await handle_dependency_graph({"ticket_key": "X-9"}, mock_client)
+    assert json.loads(result[0].text)["not_found"] == ["X-9"]
+
+
+@pytest.mark.asyncio
+async def test_epic_critical_path_orders_children_and_finds_blocked():
+    """epic_critical_path schedules the epic's blocks links and lists blocked tickets."""
+    from jira_mcp_cursor.tools.critical_path import handle_epic_critical_path
+
+    blocks = {"name": "Blocks", "inward": "is blocked by", "outward": "blocks"}
+    done = {"name": "Done", "statusCategory": {"key": "done"}}
+    todo = {"name": "To Do", "statusCategory": {"key": "new"}}
+
+    def child(key, points, status=todo, blocks_keys=(), blocked_by=()):
+        links = [{"type": blocks, "outwardIssue": {"key": k}} for k in blocks_keys]
+        links += [{"type": blocks, "inwardIssue": {"key": k, "fields": {"status": todo}}}
+                  for k in blocked_by]
+        return {
+            "key": key,
+            "fields": {
+                "summary": f"Summary {key}",
+                "status": status,
+                "issuelinks": links,
+                "customfield_10016": points,
+            },
+        }
+
+    children = [
+        child("E-1", 3, status=done, blocks_keys=["E-2", "E-3"]),
+        child("E-2", 5, blocks_keys=["E-4"]),
+        child("E-3", 2, blocks_keys=["E-4"]),
+        child("E-4", None, blocked_by=["X-9"]),
+        child("E-5", 1),
+    ]
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issue.return_value = {"key": "E-0", "fields": {"summary": "Epic"}}
+    mock_client.search_all.return_value = children
+
+    result = await handle_epic_critical_path({"epic_key": "e-0"}, mock_client)
+
+    data = json.loads(result[0].text)
+    where = mock_client.search_all.call_args.args[0]
+    assert str(where) == 'parent = "E-0"'
+    assert data["epic"] == {"key": "E-0", "summary": "Epic"}
+    assert [t["key"] for t in data["tickets"]] == ["E-1", "E-2", "E-3", "E-4", "E-5"]
+    assert data["critical_path"] == {"keys": ["E-1", "E-2", "E-4"], "length": 5}
+    assert data["unestimated"] == ["E-4"]
+    # E-1 is done, so only E-4 (waiting on E-2, E-3 and X-9) is blocked
+    assert data["blocked"] == ["E-4"]
+    tickets = {t["key"]: t for t in data["tickets"]}
+    assert tickets["E-1"]["weight"] == 0
+    assert tickets["E-4"]["blocked_by"] == ["E-2", "E-3", "X-9"]
+    assert tickets["E-3"]["slack"] == 3
+    assert data["cycles"] == []
+
+    with pytest.raises(ValueError, match="weight"):
+        await handle_epic_critical_path({"epic_key": "E-0", "weight": "bogus"}, mock_client)
+
+
+@pytest.mark.asyncio
+async def test_get_epic_tree_loads_levels_and_rolls_up_progress():
+    """get_epic_tree runs one parent IN search per level and rolls statuses up."""
+    from jira_mcp_cursor.tools.epic_tree import handle_get_epic_tree
+
+    categories = {"done": "Done", "indeterminate": "In Progress", "new": "To Do"}
+
+    def issue(key, category, parent=None):
+        return {
+            "key": key,
+            "fields": {
+                "summary": f"Summary {key}",
+                "status": {"name": categories[category], "statusCategory": {"key": category}},
+                "issuetype": {"name": "Sub-task" if parent and parent != "E-0" else "Story"},
+                "parent": {"key": parent} if parent else None,
+            },
+        }
+
+    levels = {
+        ("E-0",): [issue("E-1", "indeterminate", "E-0"), issue("E-2", "done", "E-0")],
+        ("E-1", "E-2"): [
+            issue("E-3", "done", "E-1"),
+            issue("E-4", "indeterminate", "E-1"),
+            issue("E-5", "new", "E-1"),
+        ],
+    }
+    searches = []
+
+    async def search_all(where, fields=None, max_issues=None):
+        searches.append(str(where))
+        return levels.get(tuple(sorted(where.value)), [])
+
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_issue.return_value = issue("E-0", "indeterminate")
+    mock_client.search_all.side_effect = search_all
+
+    result = await handle_get_epic_tree({"epic_key": "e-0"}, mock_client)
+
+    data = json.loads(result[0].text)
+    assert searches == ['parent IN ("E-0")', 'parent IN ("E-1", "E-2")']
+    assert data["issue_count"] == 6
+    assert data["epic"]["progress"] == {
+        "done": 2, "in_progress": 1, "todo": 1, "total": 4, "percent_complete": 50.0,
+    }
+    story = data["children"][0]
+    assert [child["key"] for child in story["children"]] == ["E-3", "E-4", "E-5"]
+    assert story["progress"]["percent_complete"] == 33.3
+    assert data["children"][1]["progress"] == {
+        "done": 1, "in_progress": 0, "todo": 0, "total": 1, "percent_complete": 100.0,
+    }
+    assert data["truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_project_flow_metrics_fetches_changelogs():
+    """project_flow_metrics searches with expand=changelog and completes truncated logs."""
+    pytest.importorskip("numpy")
+    from jira_mcp_cursor.tools.flow_metrics import handle_project_flow_metrics
+
+    issues = [
+        {
+            "key": "P-1",
+            "fields": {
+                "created": "2026-01-05T00:00:00.000+0000",
+                "status": {"id": "5", "name": "Done", "statusCategory": {"key": "done"}},
+            },
+            "changelog": {
+                "total": 2,
+                "histories": [
+                    {
+                        "created": "2026-01-06T00:00:00.000+0000",
+                        "items": [{"field": "status", "from": "1", "fromString": "To Do",
+                                   "to": "3", "toString": "In Progress"}],
+                    },
+                    {
+                        "created": "2026-01-08T00:00:00.000+0000",
+                        "items": [{"field": "status", "from": "3", "fromString": "In Progress",
+                                   "to": "5", "toString": "Done"}],
+                    },
+                ],
+            },
+        }
+    ]
+    mock_client = AsyncMock(spec=JiraClient)
+    mock_client.get_status_categories.return_value = {"1": "new", "3": "indeterminate", "5": "done"}
+    mock_client.search_all.return_value = issues
+
+    result = await handle_project_flow_metrics(
+        {"project": "p", "jql": "type = Story ORDER BY created", "weeks": 4}, mock_client
+    )
+
+    data = json.loads(result[0].text)
+    where = mock_client.search_all.call_args.args[0]
+    assert str(where) == 'project = "P" AND (type = Story)'
+    assert mock_client.search_all.call_args.kwargs["expand"] == ["changelog"]
+    mock_client.complete_changelogs.assert_awaited_once_with(issues)
+    assert data["completed"] == 1
+    assert data["lead_time_days"]["median"] == 3
+    assert data["cycle_time_days"]["median"] == 2
+    assert len(data["weekly"]) == 4
+    assert data["truncated"] is False
+
+    # JQL the local parser can't read still goes to Jira as written
+    jql = 'status WAS "In Progress" DURING (startOfMonth(), now()) order by rank'
+    result = await handle_project_flow_metrics({"jql": jql, "max_issues": 1}, mock_client)
+    where = mock_client.search_all.call_args.args[0]
+    assert str(where) == 'status WAS "In Progress" DURING (startOfMonth(), now())'
+    assert mock_client.search_all.call_args.kwargs["max_issues"] == 2
+    assert json.loads(result[0].text)["truncated"] is False
+
+    mock_client.search_all.return_value = issues * 2
+    result = await handle_project_flow_metrics({"project": "P", "max_issues": 1}, mock_client)
+    assert json.loads(result[0].text)["truncated"] is True
+    assert mock_client.complete_changelogs.call_args.args[0] == issues
+
+    with pytest.raises(ValueError, match="project or jql"):
+        await handle_project_flow_metrics({}, mock_client)
@@ -1,10 +1,12 @@
 """Tests for utility functions."""
 
+import pytest
 from jira_mcp_cursor.utils import (
     build_my_tickets_jql,
     build_highest_priority_jql,
     parse_ticket_summary,
     parse_ticket_detail,
+    jira_fields_for,
 )
 
 
@@ -33,6 +35,88 @@ def test_build_highest_priority_jql():
     assert jql.endswith("ORDER BY priority DESC")
 
 
+def test_jql_canonical_serialization():
+    """Equivalent queries serialize identically; values are quoted and escaped."""
+    from jira_mcp_cursor.utils.jql import EMPTY, Clause, Query, all_of, any_of
+
+    first = Query(
+        all_of(
+            Clause("Status", "in", ["Done", "Closed"]),
+            Clause("project", "=", "PROJ"),
+            any_of(Clause("labels", "is", EMPTY), Clause("labels", "=", "ops")),
+        ),
+        order_by=(("updated", "desc"),),
+    )
+    second = Query(
+        all_of(
+            any_of(Clause("labels", "=", "ops"), Clause("labels", "IS", EMPTY)),
+            all_of(Clause("project", "=", "PROJ"), Clause("status", "IN", ("Closed", "Done"))),
+            Clause("project", "=", "PROJ"),
+        ),
+        order_by=(("Updated", "DESC"),),
+    )
+
+    assert (
+        str(first)
+        == str(second)
+        == (
+            '(labels = "ops" OR labels IS EMPTY) AND project = "PROJ" '
+            'AND status IN ("Closed", "Done") ORDER BY updated DESC'
+        )
+    )
+    assert str(Clause("summary", "~", 'say "hi" \\ bye')) == 'summary ~ "say \\"hi\\" \\\\ bye"'
+    assert str(Clause("Story Points", ">=", 3)) == '"story points" >= 3'
+
+
+def test_jql_rejects_invalid_clauses():
+    """Unknown operators and list values for scalar operators are rejected."""
+    from jira_mcp_cursor.utils.jql import Clause
+
+    with pytest.raises(ValueError):
+        Clause("status", "==", "Done")
+    with pytest.raises(ValueError):
+        Clause("status", "=", ["Done", "Closed"])
+
+
+def test_jql_parse_round_trips_to_canonical_form():
+    """Parsed JQL serializes to the same string as the equivalent built query."""
+    from jira_mcp_cursor.utils.jql import CURRENT_USER, Clause, Query, all_of, any_of, parse
+
+    built = Query(
+        all_of(
+            Clause("assignee", "=", CURRENT_USER),
+            Clause("project", "=", "PROJ"),
+            any_of(Clause("status", "IN", ("Done", "To Do")), Clause("summary", "~", 'say "hi"')),
+        ),
+        order_by=(("updated", "DESC"),),
+    )
+    parsed = parse(
+        'Project = PROJ and (summary ~ "say \\"hi\\"" OR status in ("To Do", Done)) '
+        "AND assignee = currentUser() order by updated desc"
+    )
+    assert str(parsed) == str(built)
+
+
+def test_jql_parse_rejects_unsupported_syntax():
+    """Malformed queries and history operators raise JQLSyntaxError."""
+    from jira_mcp_cursor.utils.jql import JQLSyntaxError, parse
+
+    for jql in ("status = ", "status WAS Done", "(project = A", "project = A ORDER updated"):
+        with pytest.raises(JQLSyntaxError):
+            parse(jql)
+
+
+def test_raw_jql_is_parenthesised_and_order_by_stripped():
+    """Raw JQL passes through as written; strip_order_by ignores quoted ORDER BY."""
+    from jira_mcp_cursor.utils.jql import Clause, Query, Raw, all_of, strip_order_by
+
+    where = all_of(Clause("project", "=", "A"), Raw("status WAS Done OR labels = x"))
+    assert str(Query(where)) == 'project = "A" AND (status WAS Done OR labels = x)'
+    assert str(Query(Raw(" type = Bug "))) == "type = Bug"
+    assert strip_order_by('summary ~ "order by" ORDER BY created DESC') == 'summary ~ "order by"'
+    assert strip_order_by("order by rank") == ""
+
+
 def test_parse_ticket_summary():
     """Test parsing ticket summary."""
     issue = {
@@ -196,3 +280,635 @@ def test_parse_ticket_with_empty_description():
 
     assert result["key"] == "TEST-789"
     assert result["description"] is None
+
+
+def test_parse_ticket_summary_with_projection():
+    """Only the requested fields (plus key) are emitted, raw field ids pass through."""
+    issue = {
+        "key": "TEST-123",
+        "fields": {
+            "summary": "Test ticket",
+            "status": {"name": "To Do"},
+            "customfield_10016": 5,
+        },
+    }
+
+    result = parse_ticket_summary(issue, ["status", "customfield_10016"])
+
+    assert result == {"key": "TEST-123", "status": "To Do", "customfield_10016": 5}
+
+
+def test_jira_fields_for_maps_output_keys_to_jira_fields():
+    """Output keys are translated to Jira field ids and de-duplicated."""
+    from jira_mcp_cursor.utils.ticket_parser import DETAIL_FIELDS, SUMMARY_FIELDS
+
+    assert jira_fields_for(["key", "issue_type", "status", "status"], SUMMARY_FIELDS) == [
+        "issuetype",
+        "status",
+    ]
+    assert jira_fields_for(["comments", "customfield_10016"], DETAIL_FIELDS) == [
+        "comment",
+        "customfield_10016",
+    ]
+    assert "issuetype" in jira_fields_for(None, SUMMARY_FIELDS)
+    # Only key requested: nothing beyond it is fetched
+    assert jira_fields_for(["key"], SUMMARY_FIELDS) == []
+    assert jira_fields_for([], DETAIL_FIELDS) == []
+
+
+def test_parse_ticket_summary_with_key_only_projection():
+    """An empty projection emits only the key; None means the default set."""
+    issue = {"key": "TEST-123", "fields": {"summary": "Test ticket"}}
+
+    assert parse_ticket_summary(issue, ["key"]) == {"key": "TEST-123"}
+    assert parse_ticket_summary(issue, []) == {"key": "TEST-123"}
+    assert parse_ticket_summary(issue)["summary"] == "Test ticket"
+
+
+def test_ttl_cache_expires_and_evicts_lru():
+    """TTLCache drops expired entries and evicts the least recently used one."""
+    from jira_mcp_cursor.utils.cache import TTLCache
+
+    now = [0.0]
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+
+    now[0] = 11
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+async def test_swr_cache_serves_stale_and_refreshes_in_background():
+    """SWRCache returns stale values immediately and revalidates once in the background."""
+    import asyncio
+
+    from jira_mcp_cursor.utils.cache import SWRCache
+
+    now = [0.0]
+    calls = []
+
+    async def loader():
+        calls.append(now[0])
+        return len(calls)
+
+    cache: SWRCache[str, int] = SWRCache(maxsize=2, ttl=10, stale_ttl=50, clock=lambda: now[0])
+    assert await cache.get_or_load("a", loader) == 1
+    assert await cache.get_or_load("a", loader) == 1  # fresh hit
+    assert len(calls) == 1
+
+    now[0] = 15
+    # Stale: served immediately, two lookups share a single refresh
+    assert await cache.get_or_load("a", loader) == 1
+    assert await cache.get_or_load("a", loader) == 1
+    await asyncio.sleep(0)
+    assert len(calls) == 2
+    assert await cache.get_or_load("a", loader) == 2
+
+    now[0] = 100
+    # Past the stale window: reloaded inline
+    assert await cache.get_or_load("a", loader) == 3
+
+
+async def test_swr_cache_coalesces_misses_and_keeps_stale_on_failure():
+    """Concurrent misses share one load; a failed refresh keeps the stale value."""
+    import asyncio
+
+    from jira_mcp_cursor.utils.cache import SWRCache
+
+    now = [0.0]
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0)
+        if len(calls) > 1:
+            raise RuntimeError("boom")
+        return "value"
+
+    cache: SWRCache[str, str] = SWRCache(maxsize=1, ttl=10, stale_ttl=50, clock=lambda: now[0])
+    results = await asyncio.gather(*(cache.get_or_load("a", loader) for _ in range(5)))
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+    now[0] = 15
+    assert await cache.get_or_load("a", loader) == "value"
+    await asyncio.sleep(0.01)
+    assert cache.peek("a") == "value"
+
+    # Bounded: a second key evicts the first
+    cache.set("b", "other")
+    assert len(cache) == 1
+    assert cache.peek("a") is None
+
+
+def test_name_index_resolution_tiers():
+    """NameIndex resolves exact, alias, substring and misspelled names."""
+    from jira_mcp_cursor.utils.name_index import NameIndex
+
+    index = NameIndex(["Bug", "Story", "Sub-task", "Program Epic", "Portfolio Epic"])
+
+    assert index.lookup("STORY") == ["Story"]
+    assert index.lookup("subtask") == ["Sub-task"]
+    assert index.lookup("defect") == ["Bug"]
+    assert index.lookup("program") == ["Program Epic"]
+    assert index.lookup("epic") == ["Program Epic", "Portfolio Epic"]
+    assert index.lookup("stroy") == ["Story"]
+    assert index.lookup("initiative") == []
+    assert index.lookup("") == []
+
+
+def test_name_index_explicit_aliases():
+    """Explicit aliases (link type descriptions) resolve to their canonical name."""
+    from jira_mcp_cursor.utils.name_index import NameIndex
+
+    index = NameIndex(
+        ["Blocks", "Cloners"],
+        aliases={"Blocks": ["is blocked by", "blocks"], "Cloners": ["is cloned by", "clones"]},
+    )
+
+    assert index.lookup("is blocked by") == ["Blocks"]
+    assert index.lookup("clones") == ["Cloners"]
+
+
+def test_user_directory_prefix_search_and_resolve():
+    """UserDirectory answers prefix searches and resolves emails/names to users."""
+    from jira_mcp_cursor.utils.user_directory import UserDirectory
+
+    directory = UserDirectory(
+        [
+            {"accountId": "a1", "displayName": "Jane Doe", "emailAddress": "jane@example.com"},
+            {"accountId": "a2", "displayName": "John Doe", "emailAddress": "john@example.com"},
+        ]
+    )
+    directory.add([{"accountId": "a3", "displayName": "Janet Roe"}])
+
+    assert [u["accountId"] for u in directory.search("jan")] == ["a1", "a3"]
+    assert [u["accountId"] for u in directory.search("DOE")] == ["a1", "a2"]
+    assert directory.search("zed") == []
+    assert [u["accountId"] for u in directory.resolve("john@example.com")] == ["a2"]
+    assert [u["accountId"] for u in directory.resolve("Jane Doe")] == ["a1"]
+    assert [u["accountId"] for u in directory.resolve("a3")] == ["a3"]
+    # Fragments never resolve, even to a single user
+    assert directory.resolve("j") == []
+    assert directory.resolve("janet") == []
+    directory.add([{"accountId": "a4", "displayName": "jane doe"}])
+    assert [u["accountId"] for u in directory.resolve("Jane Doe")] == ["a1", "a4"]
+
+    # Re-adding a user replaces its index entries
+    directory.add([{"accountId": "a3", "displayName": "Janet Smith"}])
+    assert directory.search("roe") == []
+    assert len(directory) == 4
+
+    # A bulk refresh re-indexes every user in one pass
+    directory.add([{"accountId": f"b{n}", "displayName": f"Sam Lee {n}"} for n in range(20)])
+    directory.add([{"accountId": f"b{n}", "displayName": f"Sam Ray {n}"} for n in range(20)])
+    assert directory.search("lee") == []
+    assert len(directory.search("ray", limit=100)) == 20
+    assert len(directory) == 24
+
+
+def test_search_cache_condition_fields():
+    """Only fields in the WHERE part are tracked; unanalysable queries match any write."""
+    from jira_mcp_cursor.utils.search_cache import ANY_FIELD, condition_fields
+
+    assert condition_fields(
+        'assignee = currentUser() AND status IN ("Done", "In Progress") ORDER BY updated DESC'
+    ) == {"assignee", "status"}
+    assert condition_fields('cf[10016] > 3 AND type = "Bug"') == {"customfield_10016", "issuetype"}
+    assert condition_fields('issue in linkedIssues("PROJ-1")') == {ANY_FIELD}
+
+
+def test_search_cache_invalidates_selectively():
+    """Writes drop results containing the issue or filtering on a changed field."""
+    from jira_mcp_cursor.utils.search_cache import SearchResultCache
+
+    cache = SearchResultCache(maxsize=8, ttl=30)
+    by_status = cache.make_key('status = "Done"', ["summary"], 50)
+    by_label = cache.make_key('labels = "ops"', ["summary"], 50)
+
+    cache.put(by_status, {"issues": [{"key": "A-1"}], "total": 1}, cache.generation)
+    cache.put(by_label, {"issues": [{"key": "A-2"}], "total": 1}, cache.generation)
+    assert cache.get(by_status) == {"issues": [{"key": "A-1"}], "total": 1}
+
+    # A-3 changes status: it may now be Done, but the labels query is unaffected
+    cache.invalidate_issue("A-3", {"status", "updated"})
+    assert cache.get(by_status) is None
+    assert cache.get(by_label) is not None
+
+    # Any write to A-2 drops the query containing it and its cached issue,
+    # whatever the case of the key the write was made with
+    cache.invalidate_issue("a-2", {"comment", "updated"})
+    assert cache.get(by_label) is None
+    assert [entry[1] for entry in cache._issues] == ["A-1"]
+
+    # A search that started before an invalidation is not stored
+    generation = cache.generation
+    cache.invalidate_issue("A-9", set())
+    cache.put(by_label, {"issues": [], "total": 0}, generation)
+    assert cache.get(by_label) is None
+
+
+def test_render_budgeted_truncates_deterministically_and_resumes():
+    """Pages never exceed the byte budget and the cursor walks through every item."""
+    import json
+
+    from jira_mcp_cursor.utils.response_budget import render_budgeted, render_from_cursor
+
+    items = [{"key": f"TEST-{i}", "summary": "x" * 40} for i in range(20)]
+    response = {"tickets": items, "total": 20}
+
+    first = render_budgeted(response, "tickets", {"max_bytes": 400})
+    assert len(first.encode()) <= 400
+    again = json.loads(render_budgeted(response, "tickets", {"max_bytes": 400}))
+    assert again["tickets"] == json.loads(first)["tickets"]
+
+    seen = []
+    page = json.loads(first)
+    while True:
+        seen.extend(t["key"] for t in page["tickets"])
+        assert page["total"] == 20
+        if not page.get("truncated"):
+            break
+        page = json.loads(render_from_cursor({"cursor": page["next_cursor"]}))
+
+    assert seen == [f"TEST-{i}" for i in range(20)]
+
+
+def test_render_budgeted_without_budget_returns_everything():
+    """Without max_bytes/max_tokens the response is returned whole."""
+    import json
+
+    from jira_mcp_cursor.utils.response_budget import render_budgeted
+
+    response = {"users": [{"accountId": "1"}], "total": 1}
+    assert json.loads(render_budgeted(response, "users", {})) == response
+
+
+def test_minhash_similarity_and_lsh_buckets():
+    """Near-identical texts share LSH buckets and score high; unrelated ones don't."""
+    from jira_mcp_cursor.utils import minhash
+
+    a = minhash.signature(minhash.shingles("Login page times out on slow mobile connections"))
+    b = minhash.signature(minhash.shingles("login page times out on slow mobile connection"))
+    c = minhash.signature(minhash.shingles("Export invoices as CSV for the finance team"))
+
+    assert len(a) == minhash.NUM_PERM
+    assert minhash.similarity(a, a) == 1.0
+    assert minhash.similarity(a, b) > 0.5
+    assert minhash.similarity(a, c) < 0.2
+    assert set(minhash.band_buckets(a)) & set(minhash.band_buckets(b))
+    assert minhash.unpack(minhash.pack(a)) == a
+    assert minhash.signature(minhash.shingles("")) == ()
+
+
+def test_description_parser_reads_whole_sections_in_one_pass():
+    """Sections run to the next heading; list items, fences and keys are classified once."""
+    from jira_mcp_cursor.utils.description_parser import analyze_description
+
+    analysis = analyze_description(
+        "Intro mentioning OPS-9\n"
+        "# Requirements\n"
+        "- Create endpoint\n"
+        "1. Support pagination\n"
+        "  * Nested bullet\n"
+        "\n"
+        "## Acceptance Criteria:\n"
+        "- [ ] Returns list\n"
+        "- [x] Paginates\n"
+        "## Technical Notes\n"
+        "```python\n"
+        "# not a heading\n"
+        "- not an item\n"
+        "```\n"
+        "### Dependencies\n"
+        "Blocked by AUTH-123 and DB-456, see AUTH-123\n"
+    )
+
+    assert analysis["requirements"] == ["Create endpoint", "Support pagination", "Nested bullet"]
+    assert analysis["acceptance_criteria"] == ["Returns list", "Paginates"]
+    assert analysis["technical_notes"] == "```python\n# not a heading\n- not an item\n```"
+    assert analysis["dependencies"] == ["AUTH-123", "DB-456"]
+    assert analysis["complexity"] == "Low"
+
+
+def test_description_parser_fallbacks():
+    """Without sections: checkboxes become requirements, code blocks notes, any key a dependency."""
+    from jira_mcp_cursor.utils.description_parser import analyze_description
+
+    analysis = analyze_description(
+        "Refactor the auth flow, see AUTH-1.\n- [ ] Keep sessions\n```\nrun()\n```"
+    )
+
+    assert analysis["requirements"] == ["Keep sessions"]
+    assert analysis["acceptance_criteria"] == []
+    assert analysis["technical_notes"] == "```\nrun()\n```"
+    assert analysis["dependencies"] == ["AUTH-1"]
+    assert analysis["complexity"] == "High"
+    assert analyze_description(None)["complexity"] == "Low"
+
+
+def _adf_text(text, *marks):
+    node = {"type": "text", "text": text}
+    if marks:
+        node["marks"] = list(marks)
+    return node
+
+
+def _adf_paragraph(*content):
+    return {"type": "paragraph", "content": list(content)}
+
+
+def test_adf_to_markdown_blocks_lists_tables_and_marks():
+    """ADF trees become Markdown with nested list indentation, tables and inline marks."""
+    from jira_mcp_cursor.utils.adf import to_markdown
+
+    item = lambda *content: {"type": "listItem", "content": list(content)}
+    doc = {
+        "type": "doc",
+        "content": [
+            {"type": "heading", "attrs": {"level": 2}, "content": [_adf_text("Requirements")]},
+            {
+                "type": "bulletList",
+                "content": [
+                    item(
+                        _adf_paragraph(
+                            _adf_text("Create "), _adf_text("endpoint", {"type": "strong"})
+                        ),
+                        {
+                            "type": "orderedList",
+                            "attrs": {"order": 3},
+                            "content": [item(_adf_paragraph(_adf_text("nested")))],
+                        },
+                    ),
+                ],
+            },
+            _adf_paragraph(
+                _adf_text("docs", {"type": "link", "attrs": {"href": "https://example.com"}}),
+                {"type": "hardBreak"},
+                {"type": "mention", "attrs": {"text": "@Ann"}},
+            ),
+            {"type": "codeBlock", "attrs": {"language": "py"}, "content": [_adf_text("a = 1")]},
+            {
+                "type": "taskList",
+                "content": [
+                    {
+                        "type": "taskItem",
+                        "attrs": {"state": "DONE"},
+                        "content": [_adf_text("done")],
+                    },
+                    {
+                        "type": "taskItem",
+                        "attrs": {"state": "TODO"},
+                        "content": [_adf_text("todo")],
+                    },
+                ],
+            },
+            {
+                "type": "table",
+                "content": [
+                    {
+                        "type": "tableRow",
+                        "content": [
+                            {"type": "tableHeader", "content": [_adf_paragraph(_adf_text("A"))]},
+                            {"type": "tableHeader", "content": [_adf_paragraph(_adf_text("B|C"))]},
+                        ],
+                    },
+                    {
+                        "type": "tableRow",
+                        "content": [
+                            {
+                                "type": "tableCell",
+                                "content": [
+                                    _adf_paragraph(_adf_text("1")),
+                                    _adf_paragraph(_adf_text("2")),
+                                ],
+                            },
+                            {"type": "tableCell", "content": []},
+                        ],
+                    },
+                ],
+            },
+            {"type": "blockquote", "content": [_adf_paragraph(_adf_text("quoted"))]},
+        ],
+    }
+
+    assert to_markdown(doc) == (
+        "## Requirements\n"
+        "\n"
+        "- Create **endpoint**\n"
+        "  3. nested\n"
+        "\n"
+        "[docs](https://example.com)\n"
+        "@Ann\n"
+        "\n"
+        "```py\n"
+        "a = 1\n"
+        "```\n"
+        "\n"
+        "- [x] done\n"
+        "- [ ] todo\n"
+        "\n"
+        "| A | B\\|C |\n"
+        "| --- | --- |\n"
+        "| 1<br>2 |  |\n"
+        "\n"
+        "> quoted"
+    )
+    assert to_markdown("already text") == "already text"
+    assert to_markdown(None) == ""
+
+
+def test_parse_ticket_detail_converts_adf_once_per_update():
+    """v3 descriptions and comments parse to Markdown, memoized by key and updated."""
+    from unittest.mock import patch
+
+    from jira_mcp_cursor.utils import adf
+
+    description = {
+        "type": "doc",
+        "content": [
+            {"type": "heading", "attrs": {"level": 1}, "content": [_adf_text("Requirements")]},
+            {
+                "type": "bulletList",
+                "content": [
+                    {"type": "listItem", "content": [_adf_paragraph(_adf_text("OAuth2"))]},
+                ],
+            },
+        ],
+    }
+    issue = {
+        "key": "TEST-5",
+        "fields": {
+            "description": description,
+            "updated": "2025-01-02T00:00:00.000+0000",
+            "comment": {
+                "comments": [
+                    {
+                        "id": "10",
+                        "body": {
+                            "type": "doc",
+                            "content": [_adf_paragraph(_adf_text("LGTM", {"type": "em"}))],
+                        },
+                        "created": "2025-01-02",
+                    }
+                ]
+            },
+        },
+    }
+
+    with patch.object(adf, "to_markdown", wraps=adf.to_markdown) as convert:
+        first = parse_ticket_detail(issue, ["description", "comments"])
+        again = parse_ticket_detail(issue, ["description", "comments"])
+        assert convert.call_count == 2  # description + comment, once each
+
+        issue["fields"]["updated"] = "2025-01-03T00:00:00.000+0000"
+        parse_ticket_detail(issue, ["description"])
+        assert convert.call_count == 3
+
+    assert first == again
+    assert first["description"] == "# Requirements\n\n- OAuth2"
+    assert first["comments"][0]["body"] == "*LGTM*"
+
+
+def test_issue_graph_edges_and_cycles():
+    """Links, subtasks and mentions become edges; dependency cycles are found iteratively."""
+    from jira_mcp_cursor.utils.issue_graph import dependency_edges, find_cycles, issue_edges
+
+    blocks = {"name": "Blocks", "inward": "is blocked by", "outward": "blocks"}
+    relates = {"name": "Relates", "inward": "relates to", "outward": "relates to"}
+    issue = {
+        "key": "A-1",
+        "fields": {
+            "issuelinks": [
+                {"type": blocks, "inwardIssue": {"key": "A-2"}},
+                {"type": blocks, "outwardIssue": {"key": "A-3"}},
+                {"type": relates, "outwardIssue": {"key": "A-4"}},
+            ],
+            "subtasks": [{"key": "A-5"}],
+            "description": "Needs A-6 (and A-1 itself)",
+        },
+    }
+
+    edges = issue_edges(issue)
+    assert [(e["key"], e["relation"]) for e in edges] == [
+        ("A-2", "is blocked by"),
+        ("A-3", "blocks"),
+        ("A-4", "relates to"),
+        ("A-5", "has subtask"),
+        ("A-6", "mentions"),
+    ]
+    assert [e["key"] for e in issue_edges(issue, ["subtasks"])] == ["A-5"]
+    issue["fields"]["description"] = "Needs A-6, encode as UTF-8 and hash with SHA-256"
+    assert [e["key"] for e in issue_edges(issue, ["mentions"], projects={"A"})] == ["A-6"]
+    assert sorted(dependency_edges("A-1", edges)) == [
+        ("A-1", "A-2"),
+        ("A-1", "A-5"),
+        ("A-1", "A-6"),
+        ("A-3", "A-1"),
+    ]
+
+    assert find_cycles({"A": ["B"], "B": ["C"], "C": ["A"], "D": ["A"], "E": ["E"]}) == [
+        ["A", "B", "C"],
+        ["E"],
+    ]
+    chain = {f"N{i}": [f"N{i + 1}"] for i in range(50_000)}
+    assert find_cycles(chain) == []
+    chain["N50000"] = ["N0"]
+    assert len(find_cycles(chain)[0]) == 50_001
+
+
+def test_topological_order_and_critical_path():
+    """Kahn order is deterministic, cycles are left out, CPM finds the longest chain."""
+    from jira_mcp_cursor.utils.issue_graph import critical_path, topological_order
+
+    successors = {"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": []}
+    order, cyclic = topological_order(["A", "B", "C", "D"], successors)
+    assert order == ["A", "B", "C", "D"]
+    assert cyclic == []
+
+    plan = critical_path(order, successors, {"A": 1, "B": 5, "C": 2, "D": 1})
+    assert plan["path"] == ["A", "B", "D"]
+    assert plan["length"] == 7
+    assert plan["schedule"]["C"] == {"earliest_start": 1, "earliest_finish": 3, "slack": 3}
+    assert plan["schedule"]["D"]["slack"] == 0
+
+    order, cyclic = topological_order(
+        ["X", "Y", "Z", "W"], {"X": ["Y"], "Y": ["X"], "Z": ["X"], "W": []}
+    )
+    assert order == ["Z", "W"]
+    assert cyclic == ["X", "Y"]
+
+    chain = [f"N{i}" for i in range(50_000)]
+    links = {node: [chain[i + 1]] for i, node in enumerate(chain[:-1])}
+    order, _ = topological_order(chain, links)
+    assert critical_path(order, links, dict.fromkeys(chain, 1.0))["length"] == 50_000
+
+
+def _status_change(when, source, target):
+    names = {"1": "To Do", "3": "In Progress", "4": "Review", "5": "Done"}
+    return {
+        "created": f"2026-10-{when:02d}T00:00:00.000+0000",
+        "items": [
+            {"field": "assignee", "from": None, "to": "abc"},
+            {
+                "field": "status",
+                "from": source,
+                "fromString": names[source],
+                "to": target,
+                "toString": names[target],
+            },
+        ],
+    }
+
+
+def test_flow_metrics_from_changelogs():
+    """Lead/cycle time, time in status, WIP and throughput from status transitions."""
+    flow = pytest.importorskip("jira_mcp_cursor.utils.flow_metrics")
+    from datetime import datetime, timezone
+
+    def issue(created, status, *changes):
+        return {
+            "key": f"P-{created}",
+            "fields": {
+                "created": f"2026-10-{created:02d}T00:00:00.000+0000",
+                "status": {"id": status, "name": "?"},
+            },
+            "changelog": {"histories": list(reversed(changes))},
+        }
+
+    issues = [
+        issue(
+            5,
+            "5",
+            _status_change(6, "1", "3"),
+            _status_change(8, "3", "4"),
+            _status_change(9, "4", "5"),
+        ),
+        issue(12, "3", _status_change(14, "1", "3")),
+        issue(13, "1"),
+    ]
+    categories = {"1": "new", "3": "indeterminate", "4": "indeterminate", "5": "done"}
+
+    data = flow.build_flow_data(issues, categories)
+    assert len(data.issue) == 4
+    metrics = flow.flow_metrics(data, datetime(2026, 10, 21, tzinfo=timezone.utc), weeks=3)
+
+    assert metrics["completed"] == 1
+    assert metrics["lead_time_days"]["median"] == 4
+    assert metrics["cycle_time_days"]["median"] == 3
+    assert [(s["status"], s["issues"], s["median_days"]) for s in metrics["time_in_status"]] == [
+        ("To Do", 3, 2.0),
+        ("In Progress", 2, 4.5),
+        ("Review", 1, 1.0),
+    ]
+    assert metrics["weekly"] == [
+        {"week_start": "2026-10-05", "throughput": 1, "wip": 0},
+        {"week_start": "2026-10-12", "throughput": 0, "wip": 1},
+        {"week_start": "2026-10-19", "throughput": 0, "wip": 1},
+    ]
+    assert metrics["in_progress"] == 1
@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from jira_mcp_cursor.config.wizard import SetupWizard
+from jira_mcp_cursor.server.exceptions import AuthenticationError, JiraAPIError
+from jira_mcp_cursor.server.jira_client import JiraClient
 
 
 @pytest.mark.asyncio
@@ -11,15 +13,9 @@ async def test_wizard_test_connection_valid():
     wizard = SetupWizard()
 
     # Mock successful Jira connection
-    with patch("jira_mcp_cursor.config.wizard.httpx.AsyncClient") as mock_client:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"displayName": "John Doe"}
-
-        mock_instance = AsyncMock()
-        mock_instance.get.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = mock_instance
-
+    with patch.object(
+        JiraClient, "_request", new=AsyncMock(return_value={"displayName": "John Doe"})
+    ) as mock_request:
         result = await wizard.test_connection(
             jira_url="https://test.atlassian.net",
             email="test@example.com",
@@ -29,6 +25,7 @@ async def test_wizard_test_connection_valid():
         assert result["success"] is True
         assert "user" in result
         assert result["user"] == "John Doe"
+        mock_request.assert_called_once_with("GET", "/myself")
 
 
 @pytest.mark.asyncio
@@ -37,15 +34,11 @@ async def test_wizard_test_connection_invalid():
     wizard = SetupWizard()
 
     # Mock 401 auth failure
-    with patch("jira_mcp_cursor.config.wizard.httpx.AsyncClient") as mock_client:
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = Exception("401 Unauthorized")
-
-        mock_instance = AsyncMock()
-        mock_instance.get.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = mock_instance
-
+    with patch.object(
+        JiraClient,
+        "_request",
+        new=AsyncMock(side_effect=AuthenticationError("Unauthorized", status_code=401)),
+    ):
         result = await wizard.test_connection(
             jira_url="https://test.atlassian.net",
             email="test@example.com",
@@ -54,6 +47,7 @@ async def test_wizard_test_connection_invalid():
 
         assert result["success"] is False
         assert "error" in result
+        assert "401" in result["error"]
 
 
 @pytest.mark.asyncio
@@ -96,11 +90,11 @@ async def test_wizard_network_error_during_test():
     wizard = SetupWizard()
 
     # Mock network error
-    with patch("jira_mcp_cursor.config.wizard.httpx.AsyncClient") as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.get.side_effect = Exception("Connection refused")
-        mock_client.return_value.__aenter__.return_value = mock_instance
-
+    with patch.object(
+        JiraClient,
+        "_request",
+        new=AsyncMock(side_effect=JiraAPIError("Request failed: Connection refused")),
+    ):
         result = await wizard.test_connection(
             jira_url="https://test.atlassian.net",
             email="test@example.com",